@@ -0,0 +1,231 @@
+"""
+bench_hfapi.py
+
+Offline benchmarks of the HumanFirst API clients against the local mock server
+
+Each scenario calls one family of endpoints - predict, batch predict, conversation query,
+query export, conversation files and triggers - in each mode:
+    sequential  HFAPI with keep_alive=False, a new connection per call
+    pooled      one keep-alive HFAPI reusing its connection
+    threaded    one HFAPI shared by a pool of concurrency threads
+    async       AsyncHFAPI with concurrency requests in flight
+and reports throughput and the p50/p99 latency of a call.
+
+The mock server injects --latency, --jitter and --error-rate so the retry and
+pooling paths are measured too. Use the same arguments to compare two revisions:
+    python benchmarks/bench_hfapi.py --requests 500 --concurrency 16 --latency 0.005 --json before.json
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# make the checkout importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# custom imports
+import humanfirst # pylint: disable=wrong-import-position
+from mock_server import MockHumanFirstServer # pylint: disable=wrong-import-position,wrong-import-order,import-error
+
+NAMESPACE = "bench"
+PLAYBOOK = "playbook-bench"
+BATCH_SIZE = 32
+QUERY_PAGE_SIZE = 10
+
+SCENARIOS = ("predict", "batch_predict", "query", "export", "files", "triggers")
+MODES = ("sequential", "pooled", "threaded", "async")
+
+UTTERANCES = [f"how do I reset the password on account {i}" for i in range(BATCH_SIZE)]
+
+
+def call(hf_api: "humanfirst.apis.HFAPI", scenario: str):
+    """One call of the scenario with the sync client"""
+    if scenario == "predict":
+        return hf_api.predict(UTTERANCES[0], namespace=NAMESPACE, playbook=PLAYBOOK)
+    if scenario == "batch_predict":
+        return hf_api.batchPredict(UTTERANCES, namespace=NAMESPACE, playbook=PLAYBOOK)
+    if scenario == "query":
+        return list(hf_api.iter_query_conversation_set(namespace=NAMESPACE, workspace=PLAYBOOK,
+                                                       page_size=QUERY_PAGE_SIZE, prefetch=False))
+    if scenario == "export":
+        return hf_api.export_query_conversation_inputs(namespace=NAMESPACE, playbook_id=PLAYBOOK)
+    if scenario == "files":
+        return hf_api.list_conversation_src_files(namespace=NAMESPACE, conversation_set_src_id="src-bench")
+    if scenario == "triggers":
+        return hf_api.describe_trigger(namespace=NAMESPACE, trigger_id="trig-bench")
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+async def acall(hf_api: "humanfirst.async_apis.AsyncHFAPI", scenario: str):
+    """One call of the scenario with the async client"""
+    if scenario == "predict":
+        return await hf_api.predict(UTTERANCES[0], namespace=NAMESPACE, playbook=PLAYBOOK)
+    if scenario == "batch_predict":
+        return await hf_api.batchPredict(UTTERANCES, namespace=NAMESPACE, playbook=PLAYBOOK)
+    if scenario == "query":
+        return [result async for result in hf_api.iter_query_conversation_set(
+            namespace=NAMESPACE, workspace=PLAYBOOK, page_size=QUERY_PAGE_SIZE, prefetch=False)]
+    if scenario == "export":
+        return await hf_api.export_query_conversation_inputs(namespace=NAMESPACE, playbook_id=PLAYBOOK)
+    if scenario == "files":
+        return await hf_api.list_conversation_src_files(namespace=NAMESPACE, conversation_set_src_id="src-bench")
+    if scenario == "triggers":
+        return await hf_api.describe_trigger(namespace=NAMESPACE, trigger_id="trig-bench")
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def timed(function, *args) -> tuple:
+    """Seconds taken by one call and whether it failed once retries ran out"""
+    start = time.perf_counter()
+    try:
+        function(*args)
+        failed = False
+    except humanfirst.apis.HFAPIResponseValidationException:
+        failed = True
+    return time.perf_counter() - start, failed
+
+
+async def atimed(function, *args) -> tuple:
+    """Seconds taken by one awaited call and whether it failed once retries ran out"""
+    start = time.perf_counter()
+    try:
+        await function(*args)
+        failed = False
+    except humanfirst.apis.HFAPIResponseValidationException:
+        failed = True
+    return time.perf_counter() - start, failed
+
+
+def run_sync(scenario: str, mode: str, requests: int, concurrency: int, retry_policy) -> tuple:
+    """(latency, failed) of each of requests calls with HFAPI, the elapsed time and the retries made"""
+    hf_api = humanfirst.apis.HFAPI(api_key="bench", environment="test",
+                                   keep_alive=mode != "sequential",
+                                   pool_maxsize=max(concurrency, 1),
+                                   retry_policy=retry_policy)
+    with hf_api:
+        # one untimed call to open the connection and warm the client up
+        timed(call, hf_api, scenario)
+        start = time.perf_counter()
+        if mode == "threaded":
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                calls = list(executor.map(lambda _: timed(call, hf_api, scenario), range(requests)))
+        else:
+            calls = [timed(call, hf_api, scenario) for _ in range(requests)]
+        elapsed = time.perf_counter() - start
+        retries = hf_api.transport.counters.snapshot().get("retries", 0)
+    return calls, elapsed, retries
+
+
+async def run_async(scenario: str, requests: int, concurrency: int, retry_policy) -> tuple:
+    """(latency, failed) of each of requests calls with AsyncHFAPI, the elapsed time and the retries made"""
+    async with humanfirst.async_apis.AsyncHFAPI(api_key="bench", environment="test",
+                                                max_connections=concurrency,
+                                                max_keepalive_connections=concurrency,
+                                                retry_policy=retry_policy) as hf_api:
+        await atimed(acall, hf_api, scenario)
+        start = time.perf_counter()
+        calls = await asyncio.gather(*[atimed(acall, hf_api, scenario) for _ in range(requests)])
+        elapsed = time.perf_counter() - start
+        retries = hf_api.counters.snapshot().get("retries", 0)
+    return list(calls), elapsed, retries
+
+
+def percentile(ordered: list, fraction: float) -> float:
+    """Nearest rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def summarise(scenario: str, mode: str, calls: list, elapsed: float, retries: int) -> dict:
+    """One row of results"""
+    ordered = sorted(latency for latency, _ in calls)
+    return {
+        "scenario": scenario,
+        "mode": mode,
+        "requests": len(ordered),
+        "failures": sum(1 for _, failed in calls if failed),
+        "retries": retries,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+def run(scenarios: list, modes: list, requests: int, concurrency: int,
+        latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+        backoff: float = 0.0, seed: int = 0) -> dict:
+    """Run every scenario in every mode against a fresh mock server, returns the results document"""
+    retry_policy = humanfirst.transport.RetryPolicy(backoff=backoff)
+    results = []
+    with MockHumanFirstServer(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed) as server:
+        os.environ["BASE_URL_TEST"] = server.url
+        for scenario in scenarios:
+            for mode in modes:
+                if mode == "async":
+                    calls, elapsed, retries = asyncio.run(run_async(scenario, requests, concurrency, retry_policy))
+                else:
+                    calls, elapsed, retries = run_sync(scenario, mode, requests, concurrency, retry_policy)
+                results.append(summarise(scenario, mode, calls, elapsed, retries))
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"requests": requests, "concurrency": concurrency, "latency": latency,
+                     "jitter": jitter, "error_rate": error_rate, "backoff": backoff, "seed": seed},
+        "results": results,
+    }
+
+
+def print_table(document: dict):
+    """Print the results as a fixed width table"""
+    columns = ["scenario", "mode", "requests", "failures", "retries", "throughput_rps", "p50_ms", "p99_ms", "max_ms"]
+    print("  ".join(f"{column:>14}" for column in columns))
+    for row in document["results"]:
+        print("  ".join(f"{row[column]:>14}" for column in columns))
+
+
+def main():
+    """Parse the arguments, run the benchmarks and report"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma separated scenarios to run")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma separated modes to run")
+    parser.add_argument("--requests", type=int, default=200, help="timed calls per scenario and mode")
+    parser.add_argument("--concurrency", type=int, default=8, help="threads or async tasks in flight")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the server adds to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many random seconds added")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 and 429 responses")
+    parser.add_argument("--backoff", type=float, default=0.0, help="retry backoff, 0 retries immediately")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="", help="also write the results to this file, - for stdout only")
+    args = parser.parse_args()
+
+    scenarios = [scenario for scenario in args.scenarios.split(",") if scenario]
+    modes = [mode for mode in args.modes.split(",") if mode]
+    for name, chosen, known in (("scenario", scenarios, SCENARIOS), ("mode", modes, MODES)):
+        unknown = set(chosen) - set(known)
+        if unknown:
+            parser.error(f"unknown {name}: {', '.join(sorted(unknown))} - choose from {', '.join(known)}")
+
+    document = run(scenarios, modes, args.requests, args.concurrency, latency=args.latency, jitter=args.jitter,
+                   error_rate=args.error_rate, backoff=args.backoff, seed=args.seed)
+    if args.json == "-":
+        print(json.dumps(document, indent=2))
+        return
+    print_table(document)
+    if args.json:
+        with open(args.json, mode="w", encoding="utf8") as file_out:
+            json.dump(document, file_out, indent=2)
+
+
+if __name__ == "__main__":
+    main()
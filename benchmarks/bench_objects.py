@@ -0,0 +1,325 @@
+"""
+bench_objects.py
+
+Micro-benchmarks of the objects.py data model
+
+For each workspace size builds a synthetic workspace with a deep intent hierarchy and times:
+    hash_string      hashing every example text into an id
+    build            HFWorkspace.intent for every intent path and HFWorkspace.example for every example
+    build_bulk       the same workspace from HFWorkspace.intents_from_paths and examples_from_columns
+    intent_index     HFWorkspace.get_intent_index
+    get_hf_json      HFWorkspace.get_hf_json
+    write_json       HFWorkspace.write_json to a file
+    from_json        reading that file back with json.load and HFWorkspace.from_json
+    from_json_stream reading that file back with HFWorkspace.from_json_stream
+    write_csv        HFWorkspace.write_csv to a file
+    write_parquet    HFWorkspace.write_parquet to a directory, skipped without pyarrow
+    read_parquet     reading those files back with HFWorkspace.read_parquet, skipped without pyarrow
+Each operation is timed --repeat times keeping the fastest, then run once more under tracemalloc
+for its peak memory and the memory its result keeps, reported per example - for build, from_json and
+from_json_stream that is the size of the workspace objects. tracemalloc slows the run several times
+over so memory is only measured up to --memory-max-size examples.
+The input data is generated with HFGEN outside the timings.
+
+Results are written as JSON with the settings, python version and git revision, and
+--compare prints the change against an earlier results file:
+    python benchmarks/bench_objects.py --sizes 10000,100000 --json objects-main.json
+    python benchmarks/bench_objects.py --sizes 10000,100000 --compare objects-main.json
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# make the checkout importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# custom imports
+import humanfirst # pylint: disable=wrong-import-position
+
+SIZES = (10000, 100000, 1000000)
+OPERATIONS = ("hash_string", "build", "build_bulk", "intent_index", "get_hf_json", "write_json", "from_json",
+              "from_json_stream", "write_csv", "write_parquet", "read_parquet")
+PARQUET_OPERATIONS = ("write_parquet", "read_parquet")
+DELIMITER = "-"
+WARM_UP_SIZE = 100
+
+
+def generate_inputs(n_examples: int, n_intents: int, depth: int, branching: int, n_tags: int, seed: int) -> dict:
+    """Plain python inputs for the build: intent paths, tag names and example fields"""
+    generator = humanfirst.generators.HFGEN(seed=seed)
+    intents = generator.generate_intents(n_intents, depth=depth, branching=branching)
+    tags = generator.generate_tags(n_tags)
+    paths = {}
+    for intent in intents:
+        parent_intent_id = intent.get("parent_intent_id")
+        paths[intent["id"]] = paths[parent_intent_id] + [intent["name"]] if parent_intent_id else [intent["name"]]
+    tag_names = {tag["id"]: tag["name"] for tag in tags}
+
+    examples = []
+    for chunk in generator.iter_examples(n_examples, intents=intents, tags=tags, labelled_fraction=1.0,
+                                         tag_fraction=0.2):
+        for example in chunk:
+            examples.append((example["text"],
+                             datetime.datetime.fromisoformat(example["created_at"].rstrip("Z")),
+                             [paths[intent["intent_id"]] for intent in example["intents"]],
+                             [tag_names[tag["id"]] for tag in example["tags"]]))
+    return {"paths": list(paths.values()), "tags": [tag["name"] for tag in tags], "examples": examples}
+
+
+def op_hash_string(state: dict):
+    """Hash every example text"""
+    hash_string = humanfirst.objects.hash_string
+    return [hash_string(text, "ex") for text, _, _, _ in state["inputs"]["examples"]]
+
+
+def op_build(state: dict):
+    """Build the workspace through the public HFWorkspace methods"""
+    workspace = humanfirst.objects.HFWorkspace()
+    workspace.delimiter = DELIMITER
+    for path in state["inputs"]["paths"]:
+        workspace.intent(path)
+    for tag in state["inputs"]["tags"]:
+        workspace.tag(tag)
+    for text, created_at, intent_paths, tag_names in state["inputs"]["examples"]:
+        workspace.example(text,
+                          created_at=created_at,
+                          intents=[workspace.intent(path) for path in intent_paths],
+                          tags=[workspace.tag(tag) for tag in tag_names])
+    state["workspace"] = workspace
+    return workspace
+
+
+def op_build_bulk(state: dict):
+    """Build the workspace with the bulk HFWorkspace methods"""
+    workspace = humanfirst.objects.HFWorkspace()
+    workspace.delimiter = DELIMITER
+    workspace.intents_from_paths(state["inputs"]["paths"])
+    for tag in state["inputs"]["tags"]:
+        workspace.tag(tag)
+    texts, created_at, intent_paths, tag_names = zip(*state["inputs"]["examples"])
+    workspace.examples_from_columns(texts,
+                                    intents=[paths[0] if paths else None for paths in intent_paths],
+                                    tags=tag_names,
+                                    created_at=created_at)
+    return workspace
+
+
+def op_intent_index(state: dict):
+    """Fully qualified names of every intent"""
+    return state["workspace"].get_intent_index(DELIMITER)
+
+
+def op_get_hf_json(state: dict):
+    """The workspace as a HF JSON dict"""
+    return state["workspace"].get_hf_json()
+
+
+def op_write_json(state: dict):
+    """Write the workspace as HF JSON"""
+    with open(state["json_path"], mode="w", encoding="utf8") as file_out:
+        state["workspace"].write_json(file_out)
+
+
+def op_from_json(state: dict):
+    """Read the HF JSON file back into a workspace"""
+    with open(state["json_path"], mode="r", encoding="utf8") as file_in:
+        return humanfirst.objects.HFWorkspace.from_json(json.load(file_in), DELIMITER)
+
+
+def op_from_json_stream(state: dict):
+    """Stream the HF JSON file back into a workspace"""
+    return humanfirst.objects.HFWorkspace.from_json_stream(state["json_path"], DELIMITER)
+
+
+def op_write_csv(state: dict):
+    """Write the workspace as CSV"""
+    state["workspace"].write_csv(state["csv_path"], delimiter=DELIMITER)
+
+
+def op_write_parquet(state: dict):
+    """Write the workspace as Parquet"""
+    state["workspace"].write_parquet(state["parquet_path"])
+
+
+def op_read_parquet(state: dict):
+    """Read the Parquet files back into a workspace"""
+    return humanfirst.objects.HFWorkspace.read_parquet(state["parquet_path"], DELIMITER)
+
+
+def has_pyarrow() -> bool:
+    """Whether pyarrow is installed for the Parquet operations"""
+    try:
+        import pyarrow # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        return False
+    return True
+
+
+def measure(operation, state: dict, repeat: int, memory: bool) -> tuple:
+    """Fastest time in seconds of repeat runs of operation, its peak memory in bytes and the bytes
+    still allocated while its result is held, both None if not measured"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = operation(state)
+        elapsed = time.perf_counter() - start
+        del result
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = retained = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = operation(state)
+            gc.collect()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+    return best, peak, retained
+
+
+def run_size(size: int, operations: list, directory: str, n_intents: int, depth: int, branching: int,
+             n_tags: int, repeat: int, memory: bool, seed: int) -> list:
+    """Result rows of the operations on a workspace of size examples"""
+    state = {
+        "inputs": generate_inputs(size, n_intents, depth, branching, n_tags, seed),
+        "json_path": os.path.join(directory, f"workspace-{size}.json"),
+        "csv_path": os.path.join(directory, f"workspace-{size}.csv"),
+        "parquet_path": os.path.join(directory, f"workspace-{size}"),
+    }
+    rows = []
+    for name in OPERATIONS:
+        if name not in operations or (name in PARQUET_OPERATIONS and not has_pyarrow()):
+            continue
+        # everything after the build needs the workspace, and from_json needs the written file
+        if name not in ("hash_string", "build", "build_bulk") and "workspace" not in state:
+            op_build(state)
+        if name.startswith("from_json") and not os.path.exists(state["json_path"]):
+            op_write_json(state)
+        if name == "read_parquet" and not os.path.exists(state["parquet_path"]):
+            op_write_parquet(state)
+        seconds, peak, retained = measure(globals()[f"op_{name}"], state, repeat, memory)
+        rows.append({
+            "operation": name,
+            "examples": size,
+            "seconds": round(seconds, 4),
+            "us_per_example": round(seconds * 1e6 / size, 3) if size else 0.0,
+            "peak_mb": round(peak / 2 ** 20, 2) if peak is not None else None,
+            "bytes_per_example": round(retained / size) if retained is not None and size else None,
+        })
+    return rows
+
+
+def run(sizes: list, operations: list, n_intents: int = 1000, depth: int = 5, branching: int = 4,
+        n_tags: int = 20, repeat: int = 1, memory_max_size: int = 100000, seed: int = 0) -> dict:
+    """Run the operations on a workspace of each size, returns the results document"""
+    settings = {"n_intents": n_intents, "depth": depth, "branching": branching, "n_tags": n_tags, "seed": seed}
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        # an untimed round on a small workspace so imports and caches don't count against the first size
+        run_size(WARM_UP_SIZE, operations, directory, repeat=1, memory=False, **settings)
+        for size in sizes:
+            results.extend(run_size(size, operations, directory, repeat=repeat, memory=size <= memory_max_size,
+                                    **settings))
+    return {
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"sizes": list(sizes), "intents": n_intents, "depth": depth, "branching": branching,
+                     "tags": n_tags, "repeat": repeat, "memory_max_size": memory_max_size, "seed": seed},
+        "results": results,
+    }
+
+
+def git_revision() -> str:
+    """Short hash of the checked out commit, empty outside a git checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return result.stdout.strip()
+
+
+def print_table(document: dict, baseline: dict = None):
+    """Print the results, with the ratio to the baseline results when given"""
+    previous = {}
+    if baseline:
+        previous = {(row["operation"], row["examples"]): row for row in baseline["results"]}
+    columns = ["operation", "examples", "seconds", "us_per_example", "peak_mb", "bytes_per_example"]
+    if previous:
+        columns = columns + ["time_ratio", "memory_ratio"]
+    print("  ".join(f"{column:>14}" for column in columns))
+    for row in document["results"]:
+        row = dict(row)
+        before = previous.get((row["operation"], row["examples"]))
+        if before:
+            row["time_ratio"] = ratio(row["seconds"], before["seconds"])
+            row["memory_ratio"] = ratio(row["peak_mb"], before["peak_mb"])
+        print("  ".join(f"{'' if row.get(column) is None else row[column]:>14}" for column in columns))
+
+
+def ratio(now: float, before: float) -> str:
+    """now as a multiple of before"""
+    if now is None or not before:
+        return ""
+    return f"{now / before:.2f}x"
+
+
+def main():
+    """Parse the arguments, run the benchmarks and report"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES),
+                        help="comma separated numbers of examples")
+    parser.add_argument("--operations", default=",".join(OPERATIONS), help="comma separated operations to run")
+    parser.add_argument("--intents", type=int, default=1000, help="intents in the hierarchy")
+    parser.add_argument("--depth", type=int, default=5, help="levels in the intent hierarchy")
+    parser.add_argument("--branching", type=int, default=4, help="growth in intents from one level to the next")
+    parser.add_argument("--tags", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs of each operation, the fastest is kept")
+    parser.add_argument("--memory-max-size", type=int, default=100000,
+                        help="largest size to measure peak memory for, 0 to skip")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="", help="also write the results to this file, - for stdout only")
+    parser.add_argument("--compare", default="", help="results file of an earlier run to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    operations = [operation for operation in args.operations.split(",") if operation]
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operation: {', '.join(sorted(unknown))} - choose from {', '.join(OPERATIONS)}")
+
+    document = run(sizes, operations, n_intents=args.intents, depth=args.depth, branching=args.branching,
+                   n_tags=args.tags, repeat=max(args.repeat, 1), memory_max_size=args.memory_max_size, seed=args.seed)
+    if args.json == "-":
+        print(json.dumps(document, indent=2))
+        return
+    baseline = None
+    if args.compare:
+        with open(args.compare, mode="r", encoding="utf8") as file_in:
+            baseline = json.load(file_in)
+    print_table(document, baseline)
+    if args.json:
+        with open(args.json, mode="w", encoding="utf8") as file_out:
+            json.dump(document, file_out, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+mock_server.py
+
+A local stand in for the HumanFirst API used by the benchmarks
+
+Serves the endpoints exercised by bench_hfapi.py with canned responses:
+predict, batch predict, conversation query, query export and download, conversation files and triggers.
+Latency, jitter and an error rate can be injected, errors are 503s and 429s with Retry-After: 0
+so retries are exercised without slowing the run down.
+
+Run on its own to point any client at it:
+    python benchmarks/mock_server.py --port 8888 --latency 0.02
+    BASE_URL_TEST=http://127.0.0.1:8888 HF_ENVIRONMENT=test HF_API_KEY=bench python my_script.py
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import collections
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# number of pages returned by the conversation query before the page token runs out
+QUERY_PAGES = 5
+
+# utterances in the export download
+EXPORT_RECORDS = 1000
+
+ROUTES = [
+    ("POST", re.compile(r"^/v1alpha1/nlu/predict/[^/]+/[^/]+/batch$"), "batch_predict"),
+    ("POST", re.compile(r"^/v1alpha1/nlu/predict/[^/]+/[^/]+$"), "predict"),
+    ("POST", re.compile(r"^/v1alpha1/conversations/query/inputs/export$"), "export"),
+    ("POST", re.compile(r"^/v1alpha1/conversations/[^/]+/[^/]+/query$"), "query"),
+    ("GET", re.compile(r"^/downloads/[^/]+$"), "download"),
+    ("GET", re.compile(r"^/v1alpha1/files/[^/]+/[^/]+$"), "list_files"),
+    ("GET", re.compile(r"^/v1alpha1/triggers/[^/]+/[^/]+$"), "describe_trigger"),
+]
+
+
+class MockHumanFirstServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server answering like the HumanFirst API
+
+    latency    - seconds added to every response
+    jitter     - up to this many extra seconds added at random
+    error_rate - fraction of requests answered with a 503 or 429
+    seed       - seed for the jitter and errors so runs are reproducible"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 seed: int = 0):
+        super().__init__((host, port), MockHumanFirstHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.export_body = json.dumps({"examples": [
+            {"id": f"example-{i}", "text": f"synthetic export utterance number {i}"}
+            for i in range(EXPORT_RECORDS)
+        ]}).encode("utf8")
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        """Base url to set as BASE_URL_TEST"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockHumanFirstServer":
+        """Serve from a daemon thread"""
+        self.thread = threading.Thread(target=self.serve_forever, name="mock-humanfirst", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def draw(self) -> tuple:
+        """The delay for a request and the error status to answer it with, None if it succeeds"""
+        with self.lock:
+            delay = self.latency + self.random.uniform(0, self.jitter) if self.jitter else self.latency
+            status = None
+            if self.error_rate and self.random.random() < self.error_rate:
+                status = self.random.choice([429, 503])
+        return delay, status
+
+
+class MockHumanFirstHandler(BaseHTTPRequestHandler):
+    """Routes requests to canned HumanFirst responses"""
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes, without this keep-alive clients wait on delayed ACKs
+    disable_nagle_algorithm = True
+    server: MockHumanFirstServer
+
+    def do_GET(self): # pylint: disable=invalid-name
+        """Handle a GET"""
+        self._handle("GET")
+
+    def do_POST(self): # pylint: disable=invalid-name
+        """Handle a POST"""
+        self._handle("POST")
+
+    def log_message(self, format, *args): # pylint: disable=redefined-builtin
+        """Keep the benchmark output quiet"""
+
+    def _handle(self, method: str):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        path = self.path.split("?")[0]
+        for route_method, pattern, name in ROUTES:
+            if route_method == method and pattern.match(path):
+                break
+        else:
+            self._send(404, {"error": f"no mock route for {method} {path}"})
+            return
+
+        delay, status = self.server.draw()
+        with self.server.lock:
+            self.server.counts[name] += 1
+            if status:
+                self.server.counts[f"{name}_{status}"] += 1
+        if delay:
+            time.sleep(delay)
+        if status:
+            self._send(status, {"error": "injected failure"}, {"Retry-After": "0"})
+            return
+
+        payload = json.loads(body) if body and method == "POST" else {}
+        if name == "download":
+            self._send(200, self.server.export_body)
+        else:
+            self._send(200, getattr(self, f"_{name}")(path, payload))
+
+    def _send(self, status: int, body, headers: dict = None):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def _matches(utterance: str) -> dict:
+        return {
+            "input": utterance,
+            "matches": [{"id": f"intent-{i}", "name": f"intent_{i}", "score": round(0.9 / (i + 1), 4)}
+                        for i in range(3)],
+            "hierMatches": [{"id": "intent-0", "name": "intent_0", "score": 0.9}]
+        }
+
+    def _predict(self, _path: str, payload: dict) -> dict:
+        return self._matches(payload.get("input_utterance", ""))
+
+    def _batch_predict(self, _path: str, payload: dict) -> dict:
+        return {"predictions": [self._matches(utterance) for utterance in payload.get("input_utterances", [])]}
+
+    def _query(self, _path: str, payload: dict) -> dict:
+        tokens = [predicate["PageTokenData"]["PageToken"]
+                  for predicate in payload.get("predicates", []) if "PageTokenData" in predicate]
+        page = int(tokens[0]) if tokens else 0
+        size = payload.get("pageSize", 10)
+        results = {"results": [{"conversation": {"id": f"convo-{page}-{i}",
+                                                 "inputs": [{"text": f"turn {t}", "role": "client"}
+                                                            for t in range(4)]}}
+                               for i in range(size)]}
+        if page + 1 < QUERY_PAGES:
+            results["nextPageToken"] = str(page + 1)
+        return results
+
+    def _export(self, _path: str, _payload: dict) -> dict:
+        return {"exportUrlPath": "/downloads/export.json"}
+
+    def _list_files(self, _path: str, _payload: dict) -> dict:
+        return {"files": [{"name": f"file-{i}.json", "size": 1024 * i} for i in range(20)]}
+
+    def _describe_trigger(self, path: str, _payload: dict) -> dict:
+        return {"triggerState": {"trigger": {"triggerId": path.rsplit("/", 1)[-1], "message": "done"},
+                                 "status": "TRIGGER_STATUS_COMPLETED"}}
+
+
+def main():
+    """Run the mock server until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many random seconds added")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 and 429 responses")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockHumanFirstServer(host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+                                  error_rate=args.error_rate, seed=args.seed)
+    print(f"Mock HumanFirst API on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
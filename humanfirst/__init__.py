@@ -1,9 +1,39 @@
 """
 __init__.py
+
+Submodules are imported on first use so import humanfirst stays fast,
+humanfirst.apis only loads what a call to the API needs.
 """
 
-from humanfirst import objects
-from humanfirst import apis
-from humanfirst import nlg
-from humanfirst import authorization
-from humanfirst import generators
+import importlib
+
+# available as humanfirst.<name>
+_SUBMODULES = (
+    "objects",
+    "schema",
+    "serialisation",
+    "records",
+    "apis",
+    "nlg",
+    "authorization",
+    "generators",
+    "transport",
+    "ratelimit",
+    "metrics",
+    "async_apis",
+    "logging_config",
+)
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
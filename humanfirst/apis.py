@@ -14,24 +14,27 @@ import datetime
 import os
 from configparser import ConfigParser
 import logging
-import logging.config
 import time # pylint: disable=unused-import
 import math
 import io
 import gzip
-import csv
+import codecs
+import threading
+import concurrent.futures
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, Union
 
 # third party imports
 import requests
-import requests_toolbelt
 from dotenv import load_dotenv, find_dotenv
-from google.protobuf.field_mask_pb2 import FieldMask # pylint: disable=no-name-in-module
-from google.protobuf.json_format import MessageToDict
 
 # custom imports
 from .authorization import Authorization
+from .logging_config import configure_logging
+from .transport import HFTransport, RetryPolicy, POOL_CONNECTIONS, POOL_MAXSIZE, resolve_retry_policy
+from .transport import retry_policy as use_retry_policy
+from .ratelimit import RateLimiter
+from .records import DOWNLOAD_CHUNK_SIZE, _record_stream
 
 # locate where we are
 here = os.path.abspath(os.path.dirname(__file__))
@@ -45,6 +48,10 @@ CLOCK_SYNC_DRIFT_AMBIGUITY = 0
 FIREBASE = "firebase"
 API_KEY = "api_key"
 
+# conversation query response fields
+QUERY_RESULTS_FIELD = "results"
+QUERY_NEXT_PAGE_TOKEN_FIELD = "nextPageToken"
+
 # constants need type conversion from str to int
 TIMEOUT = float(constants.get("humanfirst.CONSTANTS","TIMEOUT"))
 EXPIRY_ADDITION = int(constants.get("humanfirst.CONSTANTS","EXPIRY_ADDITION"))
@@ -61,6 +68,12 @@ TRIGGER_STATUS_COMPLETED = constants.get("humanfirst.CONSTANTS","TRIGGER_STATUS_
 TRIGGER_STATUS_FAILED = constants.get("humanfirst.CONSTANTS","TRIGGER_STATUS_FAILED")
 TRIGGER_STATUS_CANCELLED = constants.get("humanfirst.CONSTANTS","TRIGGER_STATUS_CANCELLED")
 
+# chunked batch prediction
+BATCH_PREDICT_CHUNK_SIZE = int(constants.get("humanfirst.CONSTANTS","BATCH_PREDICT_CHUNK_SIZE"))
+BATCH_PREDICT_MAX_WORKERS = int(constants.get("humanfirst.CONSTANTS","BATCH_PREDICT_MAX_WORKERS"))
+BATCH_PREDICT_MAX_RETRIES = int(constants.get("humanfirst.CONSTANTS","BATCH_PREDICT_MAX_RETRIES"))
+BATCH_PREDICT_RETRY_WAIT = float(constants.get("humanfirst.CONSTANTS","BATCH_PREDICT_RETRY_WAIT"))
+
 # BASE_URL_TEST must be set by environment variable expected of the form BASE_URL_TEST=http://172.17.0.3:8888
 BASE_URL_PROD = constants.get("humanfirst.CONSTANTS","BASE_URL_PROD")
 BASE_URL_STAGING = constants.get("humanfirst.CONSTANTS","BASE_URL_STAGING")
@@ -78,77 +91,8 @@ PRE_PROD_SIGN_IN_API_KEY = constants.get("humanfirst.CONSTANTS","PRE_PROD_SIGN_I
 # others
 PREEMPTIVE_REFRESH_SECONDS_DEFAULT = int(constants.get("humanfirst.CONSTANTS","PREEMPTIVE_REFRESH_SECONDS_DEFAULT"))
 
-# locate where we are
-path_to_log_config_file = os.path.join(here,'config','logging.conf')
-
-# Get the current date and time
-current_datetime = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-# Create the log file name with the current datetime
-log_filename = f"log_{current_datetime}.log"
-
-# Decide whether to save logs in a file or not
-log_file_enable = os.environ.get("HF_LOG_FILE_ENABLE")
-
-log_handler_list = []
-
-if log_file_enable == "TRUE":
-    log_handler_list.append('rotatingFileHandler')
-elif log_file_enable == "FALSE" or log_file_enable is None:
-    pass
-else:
-    raise RuntimeError("Incorrect HF_LOG_FILE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
-
-log_defaults = {}
-
-# get log directory if going to save the logs
-if log_file_enable == "TRUE":
-    log_dir = os.environ.get("HF_LOG_DIR")
-    if log_dir:
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        path_to_save_log = os.path.join(log_dir,log_filename)
-    else:
-        raise RuntimeError("Require Log directory environment variable set up - HF_LOG_DIR")
-else:
-    # avoid logging to a file
-    path_to_save_log = '/dev/null'  # On Linux/MacOS, this discards logs (Windows: NUL) pylint:disable=invalid-name
-log_defaults['HF_LOG_FILE_PATH'] = path_to_save_log
-
-
-# Decide whether to print the logs in the console or not
-log_console_enable = os.environ.get("HF_LOG_CONSOLE_ENABLE")
-
-if log_console_enable == "TRUE":
-    log_handler_list.append('consoleHandler')
-elif log_console_enable == "FALSE" or log_console_enable is None:
-    pass
-else:
-    raise RuntimeError("Incorrect HF_LOG_CONSOLE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
-
-if log_handler_list:
-    log_defaults['HF_LOG_HANDLER'] = ",".join(log_handler_list)
-else:
-    log_defaults['HF_LOG_HANDLER'] = "nullHandler"
-
-
-# Set log levels
-log_level = os.environ.get("HF_LOG_LEVEL")
-if log_level is not None:
-    # set log level
-    if log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-        raise RuntimeError("Incorrect log level. Should be - 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'")
-
-    log_defaults['HF_LOG_LEVEL'] = log_level
-else:
-    log_defaults['HF_LOG_LEVEL'] = 'INFO' # default level
-
-
-# Load logging configuration
-logging.config.fileConfig(
-    path_to_log_config_file,
-    defaults=log_defaults
-)
+# configure logging for the SDK - only the first module imported does this
+configure_logging()
 
 # create logger
 logger = logging.getLogger('humanfirst.apis')
@@ -199,8 +143,8 @@ class HFEnvironmentException(Exception):
 # API class containing API call methods
 # *********************************************************************************************************************
 
-class HFAPI:
-    """HumanFirst API"""
+class HFAPIBase:
+    """Environment, authorization and response handling shared by HFAPI and AsyncHFAPI"""
 
     bearer_token: dict
 
@@ -211,32 +155,16 @@ class HFAPI:
                  environment: str = "",
                  api_version: str = "",
                  min_expires_in_seconds: int = PREEMPTIVE_REFRESH_SECONDS_DEFAULT,
-                 timeout: float = TIMEOUT):
+                 timeout: float = TIMEOUT,
+                 session: requests.Session = None,
+                 background_token_refresh: bool = False,
+                 token_cache_path: str = "",
+                 hooks: list = None):
         """
-        Initializes bearertoken
+        Resolves the environment and authentication, see HFAPI for the description of the arguments
 
-        Recommended to store the credentials only as environment variables
-        There are 2 ways of authentication
-        1. Using HumanFirst API Key
-        2. Using Firebase (HumanFirst username and password)
-        
-        1. Using HumanFirst API Key
-            This is the recommended authentication
-            Steps to get API key - TODO: get prod link https://api-keys.humanfirst-docs.pages.dev/docs/api/
-            There are 3 ways api key is passed onto the object
-            1.1. HF_API_KEY can be set as environment variables
-                1.1.1. Using CLI
-                1.1.2. A .env file be placed in the root directory of the project.
-            1.2. api_key can be passed while instantiating the object.
-        2. Using Firebase (HumanFirst username and password)
-            There are 4 ways username and password is passed onto the object
-            2.1. HF_USERNAME and HF_PASSWORD can be set as environment variables.
-                2.1.1. Using CLI
-                2.1.2. A .env file be placed in the root directory of the project.
-            2.2. username and password can be passed while instantiating the object.
-            
-        min_expires_in_seconds can be used to set how long on the token is expected to remain
-        it defaults to 1800s which is half the total expiry window 3600
+        session is the requests.Session used for firebase authentication calls
+        hooks get on_token_refresh for every firebase sign in and refresh
         """
 
         dotenv_path = find_dotenv(usecwd=True)
@@ -299,18 +227,24 @@ class HFAPI:
             # this automatically checks if the api_key variable is available in CLI first
             # and then checks the .env varaiables
             api_key = os.environ.get("HF_API_KEY")
-            if api_key is None:
-                logger.info("Authentication is available using HumanFirst API key in env variable HF_API_KEY")
-                # TODO: link to docs for how to use
-                self.auth_type = FIREBASE
-                self.firebase_auth = Authorization(username=username,
-                                                  password=password,
-                                                  environment=self.studio_environment,
-                                                  min_expires_in_seconds=min_expires_in_seconds,
-                                                  timeout=self.timeout)
-            else:
-                self.auth_type = API_KEY
-                self.api_key = api_key
+
+        if api_key is None:
+            logger.info("Authentication is available using HumanFirst API key in env variable HF_API_KEY")
+            # TODO: link to docs for how to use
+            self.auth_type = FIREBASE
+            self.firebase_auth = Authorization(username=username,
+                                               password=password,
+                                               environment=self.studio_environment,
+                                               min_expires_in_seconds=min_expires_in_seconds,
+                                               timeout=self.timeout,
+                                               session=session,
+                                               token_cache_path=token_cache_path,
+                                               hooks=hooks)
+            if background_token_refresh:
+                self.firebase_auth.start_background_refresh()
+        else:
+            self.auth_type = API_KEY
+            self.api_key = api_key
 
     def _validate_response(self,
                            response: requests.Response,
@@ -347,7 +281,7 @@ class HFAPI:
             # Check for the passed field or return the full object
             try:
                 candidate = response.json()
-            except requests.JSONDecodeError as e:
+            except (requests.JSONDecodeError, json.JSONDecodeError) as e:
                 logging.error('Response Status code: %s \nResponse_text: %s \nError: %s',
                               response.status_code,
                               response.text,
@@ -361,6 +295,978 @@ class HFAPI:
             else:
                 return {}
 
+    # *****************************************************************************************************************
+    # Authorisation
+    # *****************************************************************************************************************
+
+    def  _get_headers(self) -> dict:
+        """Produce the necessary header"""
+
+        if self.auth_type == FIREBASE:
+            # validate the token
+            self.firebase_auth.validate_jwt()
+        return self._bearer_headers()
+
+    def _bearer_headers(self) -> dict:
+        """Produce the header from the current token without validating it"""
+
+        if self.auth_type == FIREBASE:
+            bearer_string = f'Bearer {self.firebase_auth.bearer_token_dict["token"]}'
+        elif self.auth_type == API_KEY:
+            logger.debug('Using passed bearer string')
+            bearer_string = f'Bearer {self.api_key}'
+        else:
+            raise HFAPIAuthenticationTypeException("Authentication type is neither firebase not api_key")
+
+        headers = {}
+        headers = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Accept': 'application/json',
+            'Authorization': bearer_string
+        }
+
+        return headers
+
+
+# ******************************************************************************************************************120
+# Request builders shared by HFAPI and AsyncHFAPI
+# *********************************************************************************************************************
+
+def _import_intents_payload(namespace: str, playbook: str,
+                            workspace_as_dict: dict,
+                            format_int: int,
+                            hierarchical_intent_name_disabled: bool,
+                            hierarchical_delimiter: str,
+                            zip_encoding: bool,
+                            gzip_encoding: bool,
+                            include_negative_phrases: bool,
+                            skip_empty_intents: bool,
+                            clear_intents: bool,
+                            clear_entities: bool,
+                            clear_tags: bool,
+                            merge_intents: bool,
+                            merge_entities: bool,
+                            merge_tags: bool,
+                            override_metadata: bool,
+                            override_name: bool) -> str:
+    """Body for import_intents - the workspace is embedded base64 encoded in the data field"""
+
+    assert isinstance(workspace_as_dict,dict)
+
+    payload = {
+        'namespace': namespace,
+        'playbook_id': playbook,
+        'format': format_int, #', # or 7?
+        'format_options': {
+            'hierarchical_intent_name_disabled': hierarchical_intent_name_disabled,
+            'hierarchical_delimiter': hierarchical_delimiter,
+            'zip_encoding': zip_encoding,
+            'gzip_encoding': gzip_encoding,
+            'include_negative_phrases': include_negative_phrases,
+            # intent_tag_predicate: {},
+            # phrase_tag_predicate: {},
+            'skip_empty_intents': skip_empty_intents
+        },
+        'import_options': {
+            'clear_intents': clear_intents,
+            'clear_entities': clear_entities,
+            'clear_tags': clear_tags,
+            'merge_intents': merge_intents,
+            'merge_entities': merge_entities,
+            'merge_tags': merge_tags,
+            # 'extra_intent_tags': extra_intent_tags,
+            # 'extra_phrase_tags': extra_phrase_tags,
+            'override_metadata': override_metadata,
+            'override_name': override_name
+        },
+        'data':''
+    }
+
+    # The payload needs to be string encoded with the field information - ' turns into "
+    payload = json.dumps(payload,indent=2)
+
+    # then the data needs to be bytes to be parsed but stored as string in the URL call
+    data_encoded_string = base64.urlsafe_b64encode(json.dumps(workspace_as_dict,indent=2).encode('utf-8')).decode('utf-8') # pylint: disable=line-too-long
+    payload = payload.replace('\"data\": \"\"',f'\"data\": \"{data_encoded_string}\"')
+    return payload
+
+
+def _train_nlu_payload(namespace: str, playbook: str, nlu_id: str,
+                       force_train: bool, skip_train: bool,
+                       force_infer: bool, skip_infer: bool,
+                       auto: bool) -> dict:
+    """Body for trigger_train_nlu"""
+
+    payload = {
+        "namespace": namespace,
+        "playbook_id": playbook,
+        "parameters": {
+            "engines": [
+                {
+                    "nlu_id": nlu_id, # Unique identifier of the NLU engine to train.
+                    "force_train": force_train, # Force training an on-demand NLU engine.
+                    "skip_train": skip_train, # Skip training of an NLU engine even if it's not on-demand.
+                    "force_infer": force_infer, # Force inference of an on-demand NLU engine.
+                    "skip_infer": skip_infer # Skip inference of an NLU engine even if it's not on-demand.
+                }
+            ],
+            "auto": auto # If true, signals that the training is an automatic run.
+        }
+    }
+    return payload
+
+
+def _predict_payload(sentence: str, model_id: str = None, revision_id: str = None) -> dict:
+    """Body for predict, validates that model_id and revision_id are passed together"""
+
+    payload = {
+        "namespace": "string",
+        "playbook_id": "string",
+        "input_utterance": sentence
+    }
+
+    if model_id or revision_id:
+        if not model_id or not revision_id:
+            raise HFAPIParameterException(
+                "If either specified both model_id and revision_id are required")
+
+    if model_id:
+        payload["model_id"] = model_id
+    if revision_id:
+        payload["revision_id"] = model_id
+    return payload
+
+
+def _create_prompt_payload(namespace: str,
+                           playbook_id: str,
+                           contents: str,
+                           name: str,
+                           temperature: float,
+                           top_p: float,
+                           max_tokens: int,
+                           stop_sequences: List[str],
+                           frequency_penalty: float,
+                           presence_penalty: float,
+                           post_processing: int,
+                           run_mode: int,
+                           parent_id: Optional[str],
+                           position: Optional[int],
+                           metadata: Optional[Dict[str, Any]],
+                           source: Optional[Dict[str, Any]],
+                           post_processing_delimiter: Optional[str],
+                           parameters: Optional[List[Dict[str, Any]]],
+                           nlg_timeout: Optional[str]) -> dict:
+    """Body for create_prompt, see HFAPI.create_prompt for the arguments"""
+
+    if stop_sequences is None:
+        stop_sequences = []
+
+    if name == "Prompt":
+        iso_timestamp = datetime.datetime.now().isoformat(timespec='seconds').replace(":", "-")
+        name = f"{name}_{iso_timestamp}"
+
+    prompt_payload = {
+        "name": name,
+        "contents": contents,
+        "nlg_model_parameters": {
+            "temperature": temperature,
+            "top_p": top_p,
+            "max_tokens": max_tokens,
+            "stop_sequences": stop_sequences,
+            "frequency_penalty": frequency_penalty,
+            "presence_penalty": presence_penalty,
+        },
+        "post_processing": post_processing,
+        "run_mode": run_mode
+    }
+
+    # Optional fields
+    if parent_id:
+        prompt_payload["parent_id"] = parent_id
+    if position is not None:
+        prompt_payload["position"] = position
+    if metadata:
+        prompt_payload["metadata"] = metadata
+    if source:
+        prompt_payload["source"] = source
+    if post_processing_delimiter:
+        prompt_payload["post_processing_delimiter"] = post_processing_delimiter
+    if parameters:
+        prompt_payload["parameters"] = parameters
+    if nlg_timeout:
+        prompt_payload["nlg_timeout"] = nlg_timeout
+
+    payload = {
+        "namespace": namespace,
+        "playbook_id": playbook_id,
+        "prompt": prompt_payload,
+    }
+
+    if position is not None:
+        payload["position"] = position
+    return payload
+
+
+def _update_prompt_payload(namespace: str,
+                           playbook_id: str,
+                           prompt_id: str,
+                           update_mask: List[str],
+                           contents: Optional[str],
+                           name: Optional[str],
+                           temperature: float,
+                           top_p: float,
+                           max_tokens: int,
+                           stop_sequences: List[str],
+                           frequency_penalty: float,
+                           presence_penalty: float,
+                           post_processing: int,
+                           run_mode: int,
+                           parent_id: Optional[str],
+                           position: Optional[int],
+                           metadata: Optional[Dict[str, Any]],
+                           source: Optional[Dict[str, Any]],
+                           post_processing_delimiter: Optional[str],
+                           parameters: Optional[List[Dict[str, Any]]],
+                           nlg_timeout: Optional[str]) -> dict:
+    """Body for update_prompt, validates the update_mask, see HFAPI.update_prompt for the arguments"""
+
+    if stop_sequences is None:
+        stop_sequences = []
+
+    if not update_mask:
+        raise ValueError("update_mask must be provided as list of strings and cannot be empty.")
+    if not isinstance(update_mask, list):
+        raise ValueError("update_mask must be a list of field paths to update.")
+
+    # Define allowed fields and nested parameters
+    allowed_fields = {
+        "name",
+        "contents",
+        "nlg_model_parameters.temperature",
+        "nlg_model_parameters.top_p",
+        "nlg_model_parameters.max_tokens",
+        "nlg_model_parameters.stop_sequences",
+        "nlg_model_parameters.frequency_penalty",
+        "nlg_model_parameters.presence_penalty",
+        "post_processing",
+        "run_mode",
+        "parent_id",
+        "position",
+        "metadata",
+        "source",
+        "post_processing_delimiter",
+        "parameters",
+        "nlg_timeout",
+    }
+    # Check each path
+    invalid = [field for field in update_mask if field not in allowed_fields]
+    if invalid:
+        raise ValueError(f"Invalid update_mask field(s): {invalid}. Valid fields are: {sorted(allowed_fields)}")
+
+    # Always include ID
+    prompt_payload = {
+        "id": prompt_id,
+    }
+
+    # Optional fields added only if they are present in update_mask
+    if update_mask is None or "name" in update_mask:
+        if name:
+            prompt_payload["name"] = name
+
+    if update_mask is None or "contents" in update_mask:
+        if contents is not None:
+            prompt_payload["contents"] = contents
+
+    if update_mask is None or any(k.startswith("nlg_model_parameters") for k in update_mask):
+        prompt_payload["nlg_model_parameters"] = {}
+        if "nlg_model_parameters.temperature" in update_mask:
+            prompt_payload["nlg_model_parameters"]["temperature"] = temperature
+        if "nlg_model_parameters.top_p" in update_mask:
+            prompt_payload["nlg_model_parameters"]["top_p"] = top_p
+        if "nlg_model_parameters.max_tokens" in update_mask:
+            prompt_payload["nlg_model_parameters"]["max_tokens"] = max_tokens
+        if "nlg_model_parameters.stop_sequences" in update_mask:
+            prompt_payload["nlg_model_parameters"]["stop_sequences"] = stop_sequences
+        if "nlg_model_parameters.frequency_penalty" in update_mask:
+            prompt_payload["nlg_model_parameters"]["frequency_penalty"] = frequency_penalty
+        if "nlg_model_parameters.presence_penalty" in update_mask:
+            prompt_payload["nlg_model_parameters"]["presence_penalty"] = presence_penalty
+
+    # Only add nlg_model_parameters if it's not empty
+    if "nlg_model_parameters" in prompt_payload and not prompt_payload["nlg_model_parameters"]:
+        del prompt_payload["nlg_model_parameters"]
+
+    # Only include if listed in update_mask
+    if update_mask is None or "post_processing" in update_mask:
+        prompt_payload["post_processing"] = post_processing
+
+    if update_mask is None or "run_mode" in update_mask:
+        prompt_payload["run_mode"] = run_mode
+
+    if update_mask is None or "parent_id" in update_mask:
+        if parent_id:
+            prompt_payload["parent_id"] = parent_id
+
+    if update_mask is None or "position" in update_mask:
+        if position is not None:
+            prompt_payload["position"] = position
+
+    if update_mask is None or "metadata" in update_mask:
+        if metadata:
+            prompt_payload["metadata"] = metadata
+
+    if update_mask is None or "source" in update_mask:
+        if source:
+            prompt_payload["source"] = source
+
+    if update_mask is None or "post_processing_delimiter" in update_mask:
+        if post_processing_delimiter:
+            prompt_payload["post_processing_delimiter"] = post_processing_delimiter
+
+    if update_mask is None or "parameters" in update_mask:
+        if parameters:
+            prompt_payload["parameters"] = parameters
+
+    if update_mask is None or "nlg_timeout" in update_mask:
+        if nlg_timeout:
+            prompt_payload["nlg_timeout"] = nlg_timeout
+
+    # protobuf, requests_toolbelt and pandas are imported where used to keep import humanfirst fast
+    from google.protobuf.field_mask_pb2 import FieldMask # pylint: disable=no-name-in-module,import-outside-toplevel
+    from google.protobuf.json_format import MessageToDict # pylint: disable=import-outside-toplevel
+
+    mask = FieldMask(paths=update_mask)  # pylint: disable=no-value-for-parameter
+    mask_json = MessageToDict(mask, preserving_proto_field_name=True)
+
+    payload = {
+        "namespace": namespace,
+        "playbook_id": playbook_id,
+        "prompt": prompt_payload,
+        "update_mask": mask_json
+    }
+    return payload
+
+
+def _json_upload_encoder(upload_name: str,
+                         fqfp: str,
+                         no_trigger: bool) -> "requests_toolbelt.multipart.encoder.MultipartEncoder":
+    """Multipart body for upload_json_file_to_conversation_source - gzips the file if it isn't already"""
+
+    # Read raw file bytes
+    with open(fqfp, 'rb') as f:
+        raw = f.read()
+
+    # Gzip if not already
+    lower = fqfp.lower()
+    if lower.endswith('.gz') or lower.endswith('.json.gz'):
+        gzipped_bytes = raw
+    else:
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb') as gz:
+            gz.write(raw)
+        gzipped_bytes = buf.getvalue()
+
+    # Normalize upload filename to .json.gz
+    base, ext = os.path.splitext(upload_name)
+    if ext.lower() in ('.gz', '.json.gz'):
+        fname = upload_name
+    elif ext.lower() == '.json':
+        fname = f"{base}.json.gz"
+    else:
+        fname = f"{upload_name}.json.gz"
+
+    if no_trigger:
+        str_no_trigger = "true"
+    else:
+        str_no_trigger = "false"
+    import requests_toolbelt # pylint: disable=import-outside-toplevel
+    payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
+    fields={
+        'format': 'IMPORT_FORMAT_HUMANFIRST_JSON',
+        'no_trigger': str_no_trigger,
+        # seem to remember there is a problem with encoding multiple fields
+        # in the toolbelt multipart encoder but this seems effective during testing
+        # if I remember correctly this is present where the values are subobjects,
+        # but this is top level so seems OK?
+        'file': (fname, io.BytesIO(gzipped_bytes), 'application/gzip')}
+    )
+    return payload
+
+
+def _csv_upload_encoder(upload_name: str,
+                        fqfp: str,
+                        header_included: bool,
+                        import_as_utterances: bool,
+                        id_column: int,
+                        date_column: int,
+                        date_format: str,
+                        source_column: int,
+                        client_name: str,
+                        agent_name: str,
+                        text_column: int,
+                        metadata_columns: list,
+                        delimiter: str,
+                        no_trigger: bool) -> "requests_toolbelt.multipart.encoder.MultipartEncoder":
+    """Multipart body for upload_csv_file_to_conversation_source, see that method for the arguments"""
+
+    timestamp_dict = {
+        'UNIX_TIMESTAMP_MS': 0,
+        'UNIX_TIMESTAMP_SEC': 1,
+        'DATE_TIME_YEAR_FIRST': 2,
+        'DATE_TIME_MONTH_FIRST': 3,
+        'DATE_TIME_SLASH_MONTH_FIRST': 4,
+        'RFC3339': 5
+    }
+
+    # Read the input file bytes and determine if it's already gzipped
+    with open(fqfp, 'rb') as f:
+        raw = f.read()
+
+    if fqfp.lower().endswith('.gz'):
+        # already gzipped
+        gzipped_bytes = raw
+        # decompress to get CSV text for header parsing
+        with gzip.GzipFile(fileobj=io.BytesIO(raw)) as gz:
+            csv_bytes = gz.read()
+    else:
+        # plain CSV: keep raw for header parsing, and gzip it for upload
+        csv_bytes = raw
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb') as gz:
+            gz.write(raw)
+        gzipped_bytes = buf.getvalue()
+
+    if no_trigger:
+        str_no_trigger = "true"
+    else:
+        str_no_trigger = "false"
+
+    # Auto-derive metadata_columns if not provided
+    if metadata_columns is None:
+        # read just the first line
+        header_line = csv_bytes.split(b'\n', 1)[0].decode('utf-8')
+        cols = header_line.split(delimiter)
+        used = {
+            idx for idx in (
+                id_column, date_column, source_column, text_column
+            ) if isinstance(idx, int)
+        }
+        metadata_columns = [
+            i for i in range(len(cols)) if i not in used
+        ]
+
+    # 3) Build the column_mapper_options dict
+    if import_as_utterances:
+        column_mapper_options = {
+            "header_included": header_included,
+            "import_as_utterances": True,
+            "text_column": text_column,
+            "id_column": None,
+            "date_column": None,
+            "date_format": timestamp_dict[date_format],
+            "source_column": None,
+            "client_name": "",
+            "agent_name": "",
+            "tag_columns": [],
+            "tag_list_column": None,
+            "metadata_columns": [{"index": i} for i in metadata_columns],
+            "delimiter": delimiter
+        }
+    else:
+        column_mapper_options = {
+            "header_included": header_included,
+            "import_as_utterances": False,
+            "id_column": {"value": id_column} if id_column is not None else None,
+            "date_column": {"value": date_column} if date_column is not None else None,
+            "date_format": timestamp_dict[date_format],
+            "source_column": {"value": source_column} if source_column is not None else None,
+            "client_name": client_name,
+            "agent_name": agent_name,
+            "text_column": text_column if text_column is not None else None,
+            "tag_columns": [],
+            "tag_list_column": None,
+            "metadata_columns": [{"index": i} for i in metadata_columns],
+            "delimiter": delimiter
+        }
+
+    # 4) Normalize filename to .csv.gz
+    base, ext = os.path.splitext(upload_name)
+    if ext.lower() in ['.gz', '.csv.gz']:
+        fname = upload_name
+    elif ext.lower() == '.csv':
+        fname = f"{base}.csv.gz"
+    else:
+        fname = f"{upload_name}.csv.gz"
+
+    import requests_toolbelt # pylint: disable=import-outside-toplevel
+    payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
+    fields={
+        'format': 'IMPORT_FORMAT_SIMPLE_CSV',
+        'no_trigger': str_no_trigger,
+        # seem to remember there is a problem with encoding multiple fields in the
+        # toolbelt multipart encoder but this seems effective during testing
+        # this is present where the values are subobjects, but this is top level so seems OK?
+        'file': (fname, io.BytesIO(gzipped_bytes), 'application/gzip'),
+        "column_mapper_options": json.dumps(column_mapper_options)}
+    )
+    return payload
+
+
+def _query_conversation_set_payload(search_text: str,
+                                    page_size: int,
+                                    convsetsource: str,
+                                    next_page_token: str,
+                                    start_isodate: str,
+                                    end_isodate: str) -> dict:
+    """Body for query_conversation_set"""
+
+    predicates = []
+    if search_text and search_text != '':
+        predicates.append({"inputMatch": {"text": search_text}})
+    if start_isodate and end_isodate and start_isodate != '' and end_isodate != '':
+        predicates.append(
+            {
+                "timeRange": {
+                    "start": start_isodate,
+                    "end": end_isodate
+                }
+            }
+        )
+    predicates.append({"conversation_type": {"type": 0}})
+    if convsetsource and convsetsource != "":
+        predicates.append(
+            {"conversationSet": {"conversationSetIds": [convsetsource]}})
+    if next_page_token and next_page_token != "":
+        predicates.append({"PageTokenData":{"PageToken":next_page_token}})
+
+    if len(predicates) == 0:
+        raise HFAPIParameterException(
+            "Must have either text or start and end date predicates." +
+            f"search_text: {search_text} start_isodate: {start_isodate} end_isodate: {end_isodate}")
+
+    payload = {
+        "predicates": predicates,
+        "pageSize": page_size
+    }
+    # TODO: this gives an error if passed - proto doesn't like PageTokenData\
+    # if next_page_token and next_page_token != "":
+    #     payload["page_token"] = next_page_token
+    return payload
+
+
+def _export_query_conversation_inputs_payload(namespace: str,
+                                              playbook_id: str,
+                                              pipeline_id: str,
+                                              pipeline_step_id: str,
+                                              exists_filter_key_name: str,
+                                              metadata_predicate: list,
+                                              download_format: int,
+                                              prompt_id: str,
+                                              generation_run_id: str,
+                                              order_by: int,
+                                              order_direction_asc: bool,
+                                              dedup_by_hash: bool,
+                                              dedup_by_convo: bool,
+                                              exclude_phrase_objects: bool,
+                                              source_kind: int,
+                                              source: int) -> dict:
+    """Body for export_query_conversation_inputs, see that method for the arguments"""
+
+    if metadata_predicate is None:
+        metadata_predicate = []
+
+    # operator 0 EQUALS filter types
+    metadata_keys = [
+        "pipelineId",
+        "pipelineStepId",
+        "promptId",
+        "generationRunId",
+    ]
+    metadata_values = [
+        pipeline_id,
+        pipeline_step_id,
+        prompt_id,
+        generation_run_id
+    ]
+    metadata_filters = []
+    for i,_ in enumerate(metadata_keys):
+        if metadata_values[i] != "":
+            metadata_filters.append({
+                "key": metadata_keys[i],
+                "operator": 0, # EQUALS
+                "value": metadata_values[i]
+            })
+    # operator 4 exists -- older implementation
+    if exists_filter_key_name != "":
+        exists_filter = {
+            "key": exists_filter_key_name,
+            "operator": 4, # EXISTS
+            "optional": False,
+            "value": ""
+        }
+        metadata_filters.append(exists_filter)
+
+    #Condition dict for filtering
+    condition_dict = {
+            "EQUALS": 0,
+            "NOT_EQUALS": 1,
+            "CONTAINS": 2,
+            "NOT_CONTAINS": 3,
+            "KEY_EXISTS": 4,
+            "KEY_NOT_EXISTS": 5,
+            "KEY_MATCHES": 6,
+            "ANY": 7
+    }
+
+    #Map the metadata filters passed in via object
+    if len(metadata_predicate) > 0:
+        for _, metadata_field in enumerate(metadata_predicate):
+
+            try:
+                #Find matching numerical operator
+                numerical_operator = condition_dict[metadata_field["operator"]]
+            except Exception as _:
+                logging.error("Invalid operator %s. Please choose from: "
+                        "EQUALS, NOT_EQUALS, CONTAINS, NOT_CONTAINS, "
+                        "KEY_EXISTS, KEY_NOT_EXISTS, KEY_MATCHES, ANY", metadata_field['operator'])
+                raise
+
+            #Support for OR query
+            if metadata_field.get("optional"):
+                metadata_filters.append({
+                    "key": metadata_field['key'],
+                    "operator": numerical_operator,
+                    "value": metadata_field['value'],
+                    "optional": metadata_field['optional'],
+                })
+            else:
+                metadata_filters.append({
+                    "key": metadata_field['key'],
+                    "operator": numerical_operator,
+                    "value": metadata_field['value']
+                })
+
+
+    if order_direction_asc:
+        order_direction = 1
+    else:
+        order_direction = 2
+    payload = {
+        "namespace": namespace,
+        "playbook_id": playbook_id,
+        "input_predicates": [
+            {
+                "metadata":{
+                    "conditions": metadata_filters
+                }
+            },
+            {
+                "deduping": {
+                    "by_hash": dedup_by_hash,
+                    "by_conversation": dedup_by_convo
+                }
+            },
+            {
+                "trainingPhrase":
+                    {
+                        "excludePhraseObjects": exclude_phrase_objects
+                    }
+            }
+        ],
+        "format": download_format,
+        "conversation_predicates": [
+            {
+                "conversation_source": {
+                    "source_kind": source_kind
+                }
+            }
+        ],
+        "order_by_value": {
+            "value": order_by
+        },
+        "order_direction": order_direction
+    }
+
+    if source != -1:
+        payload["input_predicates"].append(
+            {
+                "source": {
+                    "source": source 
+                }
+            }
+        )
+    return payload
+
+
+def _df_cx_import_payload(namespace: str,
+                          playbook: str,
+                          integration_id: str,
+                          integration_workspace_id: str,
+                          project: str,
+                          region: str,
+                          integration_language: str,
+                          bidirectional_merge: bool,
+                          hierarchical_intent_name_disabled: bool,
+                          hierarchical_delimiter: str,
+                          zip_encoding: bool,
+                          gzip_encoding: bool,
+                          include_negative_phrases: bool,
+                          skip_empty_intents: bool,
+                          clear_intents: bool,
+                          clear_entities: bool,
+                          clear_tags: bool,
+                          merge_intents: bool,
+                          merge_entities: bool,
+                          merge_tags: bool,
+                          extra_intent_tags: list,
+                          extra_phrase_tags: list) -> dict:
+    """Body for trigger_import_from_df_cx_integration"""
+
+    if extra_intent_tags is None:
+        extra_intent_tags = []
+    if extra_phrase_tags is None:
+        extra_phrase_tags = []
+
+    payload = {
+        "namespace": namespace,
+        "playbook_id": playbook,
+        "integration_id": integration_id,
+        "integration_workspace_id": integration_workspace_id,
+        "integration_location": {
+            "project": project,
+            "region": region
+        },
+        "bidirectional_merge": bidirectional_merge,
+        "intent_options": {
+            "hierarchical_intent_name_disabled": hierarchical_intent_name_disabled,
+            "hierarchical_delimiter": hierarchical_delimiter,
+            "zip_encoding": zip_encoding,
+            "gzip_encoding": gzip_encoding,
+            "include_negative_phrases": include_negative_phrases,
+            "skip_empty_intents": skip_empty_intents
+        },
+        "import_options": {
+            "clear_intents": clear_intents,
+            "clear_entities": clear_entities,
+            "clear_tags": clear_tags,
+            "merge_intents": merge_intents,
+            "merge_entities": merge_entities,
+            "merge_tags": merge_tags,
+            "extra_intent_tags": extra_intent_tags,
+            "extra_phrase_tags": extra_phrase_tags
+        },
+        "integration_language": integration_language
+    }
+    return payload
+
+
+def _trigger_summary(trigger_response: dict) -> dict:
+    """Summary of a describe_trigger response used by loop_trigger_check"""
+
+    summary = {
+        "triggerId": trigger_response["triggerState"]["trigger"]["triggerId"],
+        "message": trigger_response["triggerState"]["trigger"]["message"],
+        "status": trigger_response["triggerState"]["status"]
+    }
+
+    # enhance that with more information.
+    if "progress" in trigger_response.keys():
+        summary["total"] = trigger_response["triggerState"]["progress"]["total"],
+        summary["completed"] = trigger_response["triggerState"]["progress"]["completed"],
+        summary["percentageComplete"] = trigger_response["triggerState"]["progress"]["percentageComplete"]
+    return summary
+
+
+
+def _chunk_list(items: list, chunk_size: int) -> list:
+    """Split items into consecutive chunks of at most chunk_size"""
+
+    if chunk_size < 1:
+        raise HFAPIParameterException(f"chunk_size must be at least 1 not {chunk_size}")
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def _chunk_retry_policy(policy: RetryPolicy, max_retries: int) -> RetryPolicy:
+    """The policy each chunk of batch_predict_chunked is sent under, retrying the transient failures
+    policy would up to max_retries times with waits growing from BATCH_PREDICT_RETRY_WAIT"""
+
+    return RetryPolicy(max_retries=max_retries, backoff=BATCH_PREDICT_RETRY_WAIT, max_backoff=policy.max_backoff,
+                       max_retry_after=policy.max_retry_after, statuses=policy.statuses, methods=policy.methods)
+
+
+def _query_next_page_token(page: dict, pages: int, max_pages: int) -> str:
+    """Token for the page after this one, or an empty string when the query is exhausted"""
+
+    next_page_token = page.get(QUERY_NEXT_PAGE_TOKEN_FIELD, "")
+    if not page.get(QUERY_RESULTS_FIELD):
+        return ""
+    if max_pages is not None and pages >= max_pages:
+        return ""
+    return next_page_token
+
+
+class _PredictProgress:
+    """Counts predicted utterances across the chunks of a batch prediction and reports throughput
+
+    progress_callback if provided is called with (completed, total, utterances_per_second) after every chunk"""
+
+    def __init__(self, total: int, progress_callback: Callable = None):
+        self.total = total
+        self.completed = 0
+        self.progress_callback = progress_callback
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def update(self, count: int) -> float:
+        """Record count more utterances predicted and return the throughput so far"""
+
+        with self.lock:
+            self.completed = self.completed + count
+            elapsed = time.perf_counter() - self.start
+            throughput = self.completed / elapsed if elapsed > 0 else 0.0
+            logger.info('Predicted %s/%s utterances %.1f utterances/sec', self.completed, self.total, throughput)
+            if self.progress_callback:
+                self.progress_callback(self.completed, self.total, throughput)
+        return throughput
+
+
+def _write_chunks(chunks: Iterator[bytes], output) -> int:
+    """Write chunks to output, a file path or a binary file object, returning the number of bytes written"""
+
+    written = 0
+    if hasattr(output, "write"):
+        for chunk in chunks:
+            output.write(chunk)
+            written = written + len(chunk)
+    else:
+        with open(output, mode="wb") as file_out:
+            for chunk in chunks:
+                file_out.write(chunk)
+                written = written + len(chunk)
+    return written
+
+
+class HFAPI(HFAPIBase):
+    """HumanFirst API"""
+
+    transport: HFTransport
+
+    def __init__(self,
+                 api_key: str = "",
+                 username: str = "",
+                 password: str = "",
+                 environment: str = "",
+                 api_version: str = "",
+                 min_expires_in_seconds: int = PREEMPTIVE_REFRESH_SECONDS_DEFAULT,
+                 timeout: float = TIMEOUT,
+                 pool_connections: int = POOL_CONNECTIONS,
+                 pool_maxsize: int = POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 adapter: requests.adapters.BaseAdapter = None,
+                 transport: HFTransport = None,
+                 background_token_refresh: bool = False,
+                 token_cache_path: str = "",
+                 retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None,
+                 hooks: list = None):
+        """
+        Initializes bearertoken
+
+        Recommended to store the credentials only as environment variables
+        There are 2 ways of authentication
+        1. Using HumanFirst API Key
+        2. Using Firebase (HumanFirst username and password)
+        
+        1. Using HumanFirst API Key
+            This is the recommended authentication
+            Steps to get API key - TODO: get prod link https://api-keys.humanfirst-docs.pages.dev/docs/api/
+            There are 3 ways api key is passed onto the object
+            1.1. HF_API_KEY can be set as environment variables
+                1.1.1. Using CLI
+                1.1.2. A .env file be placed in the root directory of the project.
+            1.2. api_key can be passed while instantiating the object.
+        2. Using Firebase (HumanFirst username and password)
+            There are 4 ways username and password is passed onto the object
+            2.1. HF_USERNAME and HF_PASSWORD can be set as environment variables.
+                2.1.1. Using CLI
+                2.1.2. A .env file be placed in the root directory of the project.
+            2.2. username and password can be passed while instantiating the object.
+            
+        min_expires_in_seconds can be used to set how long on the token is expected to remain
+        it defaults to 1800s which is half the total expiry window 3600
+
+        All calls go through a pooled keep-alive transport so connections are reused between calls
+        pool_connections - number of per host connection pools to keep
+        pool_maxsize     - maximum connections kept open per host, set at least to the number of threads
+                           sharing this HFAPI object
+        pool_block       - wait for a free connection rather than opening a throwaway one when the pool is full
+        keep_alive       - set False to close the connection after every call
+        adapter          - a custom requests adapter to mount instead of the default pooled HTTPAdapter
+        transport        - an existing HFTransport to share between several HFAPI objects
+
+        Transient failures (429s, 5xxs, dropped connections) are retried with exponential backoff and jitter,
+        honouring Retry-After. POSTs that create or change something are only retried when the server
+        certainly did not act on them.
+        retry_policy     - a humanfirst.transport.RetryPolicy, NO_RETRY disables retries.
+                           Use humanfirst.transport.retry_policy() to change it for some calls only
+                           retries are counted in transport.counters
+
+        rate_limiter     - a humanfirst.ratelimit.RateLimiter capping the request rate and adapting the number of
+                           requests in flight per endpoint family (nlu, conversations, files, workspaces).
+                           Share one between threads, HFAPI and AsyncHFAPI objects using the same quota
+
+        hooks            - humanfirst.metrics.HFHooks such as a MetricsCollector, told about every request attempt,
+                           response, error and firebase token refresh
+
+        The firebase token is safe to share between threads, only one thread refreshes it while the others wait.
+        background_token_refresh refreshes it from a daemon thread ahead of expiry so no call waits on a refresh
+        token_cache_path (or HF_TOKEN_CACHE_PATH) shares the token through a file between all processes on a host
+        so each process doesn't sign in separately
+        """
+
+        if transport is None:
+            transport = HFTransport(pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize,
+                                    pool_block=pool_block,
+                                    keep_alive=keep_alive,
+                                    adapter=adapter,
+                                    retry_policy=retry_policy,
+                                    rate_limiter=rate_limiter,
+                                    hooks=hooks)
+        else:
+            if retry_policy is not None:
+                transport.retry_policy = retry_policy
+            if rate_limiter is not None:
+                transport.rate_limiter = rate_limiter
+            if hooks:
+                transport.hooks.extend(hooks)
+        self.transport = transport
+
+        super().__init__(api_key=api_key,
+                         username=username,
+                         password=password,
+                         environment=environment,
+                         api_version=api_version,
+                         min_expires_in_seconds=min_expires_in_seconds,
+                         timeout=timeout,
+                         session=self.transport.session,
+                         background_token_refresh=background_token_refresh,
+                         token_cache_path=token_cache_path,
+                         hooks=hooks)
+
+    def close(self):
+        """Close the pooled connections held by this object and stop any background token refresh"""
+        if self.auth_type == FIREBASE:
+            self.firebase_auth.stop_background_refresh()
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     # *****************************************************************************************************************
     # Tags
     # *****************************************************************************************************************
@@ -372,7 +1278,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/tags'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "tags")
 
@@ -388,7 +1294,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/tags/{tag_id}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -416,7 +1322,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/tags'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -439,7 +1345,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "playbooks")
 
@@ -461,7 +1367,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/humanfirst?{query_params}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "playbooks")
 
@@ -480,7 +1386,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/playbooks?{query_params}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "playbooks")
 
@@ -495,7 +1401,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -530,8 +1436,8 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/export'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
-            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        response = self.transport.request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
         response = self._validate_response(response, url, "data")
         response = base64.b64decode(response)
         response = response.decode('utf-8')
@@ -559,7 +1465,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "playbooks")
 
@@ -575,7 +1481,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "intents")
 
@@ -588,7 +1494,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/{intent_id}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -601,7 +1507,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/revisions'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "revisions")
 
@@ -627,7 +1533,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "PUT", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -662,49 +1568,20 @@ class HFAPI:
 
         """
 
-        assert isinstance(workspace_as_dict,dict)
-
-        payload = {
-            'namespace': namespace,
-            'playbook_id': playbook,
-            'format': format_int, #', # or 7?
-            'format_options': {
-                'hierarchical_intent_name_disabled': hierarchical_intent_name_disabled,
-                'hierarchical_delimiter': hierarchical_delimiter,
-                'zip_encoding': zip_encoding,
-                'gzip_encoding': gzip_encoding,
-                'include_negative_phrases': include_negative_phrases,
-                # intent_tag_predicate: {},
-                # phrase_tag_predicate: {},
-                'skip_empty_intents': skip_empty_intents
-            },
-            'import_options': {
-                'clear_intents': clear_intents,
-                'clear_entities': clear_entities,
-                'clear_tags': clear_tags,
-                'merge_intents': merge_intents,
-                'merge_entities': merge_entities,
-                'merge_tags': merge_tags,
-                # 'extra_intent_tags': extra_intent_tags,
-                # 'extra_phrase_tags': extra_phrase_tags,
-                'override_metadata': override_metadata,
-                'override_name': override_name
-            },
-            'data':''
-        }
-
-        # The payload needs to be string encoded with the field information - ' turns into "
-        payload = json.dumps(payload,indent=2)
-
-        # then the data needs to be bytes to be parsed but stored as string in the URL call
-        data_encoded_string = base64.urlsafe_b64encode(json.dumps(workspace_as_dict,indent=2).encode('utf-8')).decode('utf-8') # pylint: disable=line-too-long
-        payload = payload.replace('\"data\": \"\"',f'\"data\": \"{data_encoded_string}\"')
+        payload = _import_intents_payload(
+            namespace=namespace, playbook=playbook, workspace_as_dict=workspace_as_dict, format_int=format_int,
+            hierarchical_intent_name_disabled=hierarchical_intent_name_disabled,
+            hierarchical_delimiter=hierarchical_delimiter, zip_encoding=zip_encoding, gzip_encoding=gzip_encoding,
+            include_negative_phrases=include_negative_phrases, skip_empty_intents=skip_empty_intents,
+            clear_intents=clear_intents, clear_entities=clear_entities, clear_tags=clear_tags,
+            merge_intents=merge_intents, merge_entities=merge_entities, merge_tags=merge_tags,
+            override_metadata=override_metadata, override_name=override_name)
 
         headers = self._get_headers()
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/import'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=payload, timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -739,6 +1616,7 @@ class HFAPI:
 
         """
 
+        import requests_toolbelt # pylint: disable=import-outside-toplevel
         payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
             fields={
                 'file': ("upload_name", workspace_file_path, 'application/json'),
@@ -777,7 +1655,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/import_http'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=payload, timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -795,7 +1673,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/models'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         models = self._validate_response(response, url, "models")
         namespace_models = []
@@ -813,7 +1691,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}/nlu_engines'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "nluEngines")
 
@@ -826,7 +1704,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}/nlu_engines/{nlu_id}'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -838,7 +1716,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/nlu'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, field="runs")
 
@@ -857,28 +1735,15 @@ class HFAPI:
         This returns
 
         '''
-        payload = {
-            "namespace": namespace,
-            "playbook_id": playbook,
-            "parameters": {
-                "engines": [
-                    {
-                        "nlu_id": nlu_id, # Unique identifier of the NLU engine to train.
-                        "force_train": force_train, # Force training an on-demand NLU engine.
-                        "skip_train": skip_train, # Skip training of an NLU engine even if it's not on-demand.
-                        "force_infer": force_infer, # Force inference of an on-demand NLU engine.
-                        "skip_infer": skip_infer # Skip inference of an NLU engine even if it's not on-demand.
-                    }
-                ],
-                "auto": auto # If true, signals that the training is an automatic run.
-            }
-        }
+        payload = _train_nlu_payload(namespace=namespace, playbook=playbook, nlu_id=nlu_id,
+                                     force_train=force_train, skip_train=skip_train,
+                                     force_infer=force_infer, skip_infer=skip_infer, auto=auto)
 
         headers = self._get_headers()
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/nlu:train'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
 
         return self._validate_response(response, url)
@@ -895,27 +1760,13 @@ class HFAPI:
 
         headers = self._get_headers()
 
-        payload = {
-            "namespace": "string",
-            "playbook_id": "string",
-            "input_utterance": sentence
-        }
-
-        if model_id or revision_id:
-            if not model_id or not revision_id:
-                raise HFAPIParameterException(
-                    "If either specified both model_id and revision_id are required")
-
-        if model_id:
-            payload["model_id"] = model_id
-        if revision_id:
-            payload["revision_id"] = model_id
+        payload = _predict_payload(sentence=sentence, model_id=model_id, revision_id=revision_id)
 
         url = f'{self.base_url}/{self.api_version}/nlu/predict/{namespace}/{playbook}'
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
-            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        response = self.transport.request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
         return self._validate_response(response, url)
 
 
@@ -942,10 +1793,67 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/nlu/predict/{namespace}/{playbook}/batch'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
-            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        response = self.transport.request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
         return self._validate_response(response, url, "predictions")
 
+    def batch_predict_chunked(self, sentences: list,
+                              namespace: str,
+                              playbook: str,
+                              chunk_size: int = BATCH_PREDICT_CHUNK_SIZE,
+                              max_workers: int = BATCH_PREDICT_MAX_WORKERS,
+                              max_retries: int = BATCH_PREDICT_MAX_RETRIES,
+                              timeout: float = None,
+                              model_id: str = "",
+                              revision_id: str = "",
+                              progress_callback: Callable = None) -> list:
+        '''Predict any number of sentences by splitting them into chunks of chunk_size
+        and calling batchPredict for up to max_workers chunks at once
+
+        A chunk that fails transiently is retried on its own by the transport up to max_retries times,
+        honouring any Retry-After, with waits growing from BATCH_PREDICT_RETRY_WAIT.
+        The first chunk to fail for good fails the whole call without sending the chunks still queued.
+        Predictions are returned in the same order as sentences.
+
+        Progress and throughput are logged after every chunk, progress_callback
+        if provided is called with (completed, total, utterances_per_second)
+
+        Set max_workers no higher than the pool_maxsize of this object'''
+
+        chunks = _chunk_list(sentences, chunk_size)
+        progress = _PredictProgress(len(sentences), progress_callback)
+        policy = _chunk_retry_policy(resolve_retry_policy(self.transport.retry_policy), max_retries)
+        failed = threading.Event()
+
+        def predict_chunk(chunk: list) -> list:
+            if failed.is_set():
+                # a worker can take a queued chunk before it is cancelled
+                return None
+            try:
+                with use_retry_policy(policy):
+                    predictions = self.batchPredict(chunk, namespace=namespace, playbook=playbook,
+                                                    timeout=timeout, model_id=model_id, revision_id=revision_id)
+            except Exception:
+                failed.set()
+                raise
+            progress.update(len(chunk))
+            return predictions
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(predict_chunk, chunk) for chunk in chunks]
+            done, pending = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                # raises the exception of a failed chunk
+                future.result()
+            chunk_predictions = [future.result() for future in futures]
+
+        predictions = []
+        for chunk_prediction in chunk_predictions:
+            predictions.extend(chunk_prediction)
+        return predictions
+
     # *****************************************************************************************************************
     # Coverage
     # *****************************************************************************************************************
@@ -979,7 +1887,7 @@ class HFAPI:
 
         url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/coverage/latest'
         effective_timeout = timeout if timeout is not None else self.timeout
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "report")
 
@@ -1021,38 +1929,11 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, wantcsv=True)
 
 
-    # *****************************************************************************************************************
-    # Authorisation
-    # *****************************************************************************************************************
-
-    def  _get_headers(self) -> dict:
-        """Produce the necessary header"""
-
-        if self.auth_type == FIREBASE:
-            # validate the token
-            self.firebase_auth.validate_jwt()
-            bearer_string = f'Bearer {self.firebase_auth.bearer_token_dict["token"]}'
-        elif self.auth_type == API_KEY:
-            logger.debug('Using passed bearer string')
-            bearer_string = f'Bearer {self.api_key}'
-        else:
-            raise HFAPIAuthenticationTypeException("Authentication type is neither firebase not api_key")
-
-        headers = {}
-        headers = {
-            'Content-Type': 'application/json; charset=utf-8',
-            'Accept': 'application/json',
-            'Authorization': bearer_string
-        }
-
-        return headers
-
-
     # *****************************************************************************************************************
     # Conversation sets
     # *****************************************************************************************************************
@@ -1072,7 +1953,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=payload, timeout=effective_timeout)
 
         return self._validate_response(response=response,url=url,field='conversationSets')
@@ -1138,7 +2019,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=payload, timeout=effective_timeout)
         return self._validate_response(response=response,url=url)
 
@@ -1159,7 +2040,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         create_conversation_response = self._validate_response(response=response, url=url)
         convo_set_id = create_conversation_response["id"]
@@ -1200,7 +2081,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         create_conversation_response = self._validate_response(response=response, url=url)
         convo_set_id = create_conversation_response["id"]
@@ -1244,7 +2125,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -1273,7 +2154,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -1294,7 +2175,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response, url=url)
 
@@ -1309,7 +2190,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response, url=url)
 
@@ -1323,7 +2204,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=payload, timeout=effective_timeout)
         return self._validate_response(response=response,url=url,field="files")
 
@@ -1352,7 +2233,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response,url=url)
 
@@ -1377,7 +2258,7 @@ class HFAPI:
         effective_timeout = timeout if timeout is not None else self.timeout
 
         url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}/{convoset_id}/config"
-        response = requests.request(
+        response = self.transport.request(
             "PUT", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response, url=url)
 
@@ -1396,7 +2277,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response, url=url)
 
@@ -1411,7 +2292,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response, url=url)
 
@@ -1430,7 +2311,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response=response,url=url)
 
@@ -1501,58 +2382,19 @@ class HFAPI:
             dict: API response after validation.
         """
 
-        if stop_sequences is None:
-            stop_sequences = []
-
-        if name == "Prompt":
-            iso_timestamp = datetime.datetime.now().isoformat(timespec='seconds').replace(":", "-")
-            name = f"{name}_{iso_timestamp}"
-
-        prompt_payload = {
-            "name": name,
-            "contents": contents,
-            "nlg_model_parameters": {
-                "temperature": temperature,
-                "top_p": top_p,
-                "max_tokens": max_tokens,
-                "stop_sequences": stop_sequences,
-                "frequency_penalty": frequency_penalty,
-                "presence_penalty": presence_penalty,
-            },
-            "post_processing": post_processing,
-            "run_mode": run_mode
-        }
-
-        # Optional fields
-        if parent_id:
-            prompt_payload["parent_id"] = parent_id
-        if position is not None:
-            prompt_payload["position"] = position
-        if metadata:
-            prompt_payload["metadata"] = metadata
-        if source:
-            prompt_payload["source"] = source
-        if post_processing_delimiter:
-            prompt_payload["post_processing_delimiter"] = post_processing_delimiter
-        if parameters:
-            prompt_payload["parameters"] = parameters
-        if nlg_timeout:
-            prompt_payload["nlg_timeout"] = nlg_timeout
-
-        payload = {
-            "namespace": namespace,
-            "playbook_id": playbook_id,
-            "prompt": prompt_payload,
-        }
-
-        if position is not None:
-            payload["position"] = position
+        payload = _create_prompt_payload(
+            namespace=namespace, playbook_id=playbook_id, contents=contents, name=name,
+            temperature=temperature, top_p=top_p, max_tokens=max_tokens, stop_sequences=stop_sequences,
+            frequency_penalty=frequency_penalty, presence_penalty=presence_penalty,
+            post_processing=post_processing, run_mode=run_mode, parent_id=parent_id, position=position,
+            metadata=metadata, source=source, post_processing_delimiter=post_processing_delimiter,
+            parameters=parameters, nlg_timeout=nlg_timeout)
 
         headers = self._get_headers()
         url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts"
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout
         )
         return self._validate_response(response=response, url=url)
@@ -1632,123 +2474,22 @@ class HFAPI:
         Returns:
             dict: API response after validation.
         """
-        if stop_sequences is None:
-            stop_sequences = []
-
-        if not update_mask:
-            raise ValueError("update_mask must be provided as list of strings and cannot be empty.")
-        if not isinstance(update_mask, list):
-            raise ValueError("update_mask must be a list of field paths to update.")
-
-        # Define allowed fields and nested parameters
-        allowed_fields = {
-            "name",
-            "contents",
-            "nlg_model_parameters.temperature",
-            "nlg_model_parameters.top_p",
-            "nlg_model_parameters.max_tokens",
-            "nlg_model_parameters.stop_sequences",
-            "nlg_model_parameters.frequency_penalty",
-            "nlg_model_parameters.presence_penalty",
-            "post_processing",
-            "run_mode",
-            "parent_id",
-            "position",
-            "metadata",
-            "source",
-            "post_processing_delimiter",
-            "parameters",
-            "nlg_timeout",
-        }
-        # Check each path
-        invalid = [field for field in update_mask if field not in allowed_fields]
-        if invalid:
-            raise ValueError(f"Invalid update_mask field(s): {invalid}. Valid fields are: {sorted(allowed_fields)}")
-
-        # Always include ID
-        prompt_payload = {
-            "id": prompt_id,
-        }
-
-        # Optional fields added only if they are present in update_mask
-        if update_mask is None or "name" in update_mask:
-            if name:
-                prompt_payload["name"] = name
-
-        if update_mask is None or "contents" in update_mask:
-            if contents is not None:
-                prompt_payload["contents"] = contents
-
-        if update_mask is None or any(k.startswith("nlg_model_parameters") for k in update_mask):
-            prompt_payload["nlg_model_parameters"] = {}
-            if "nlg_model_parameters.temperature" in update_mask:
-                prompt_payload["nlg_model_parameters"]["temperature"] = temperature
-            if "nlg_model_parameters.top_p" in update_mask:
-                prompt_payload["nlg_model_parameters"]["top_p"] = top_p
-            if "nlg_model_parameters.max_tokens" in update_mask:
-                prompt_payload["nlg_model_parameters"]["max_tokens"] = max_tokens
-            if "nlg_model_parameters.stop_sequences" in update_mask:
-                prompt_payload["nlg_model_parameters"]["stop_sequences"] = stop_sequences
-            if "nlg_model_parameters.frequency_penalty" in update_mask:
-                prompt_payload["nlg_model_parameters"]["frequency_penalty"] = frequency_penalty
-            if "nlg_model_parameters.presence_penalty" in update_mask:
-                prompt_payload["nlg_model_parameters"]["presence_penalty"] = presence_penalty
-
-        # Only add nlg_model_parameters if it's not empty
-        if "nlg_model_parameters" in prompt_payload and not prompt_payload["nlg_model_parameters"]:
-            del prompt_payload["nlg_model_parameters"]
-
-        # Only include if listed in update_mask
-        if update_mask is None or "post_processing" in update_mask:
-            prompt_payload["post_processing"] = post_processing
-
-        if update_mask is None or "run_mode" in update_mask:
-            prompt_payload["run_mode"] = run_mode
-
-        if update_mask is None or "parent_id" in update_mask:
-            if parent_id:
-                prompt_payload["parent_id"] = parent_id
-
-        if update_mask is None or "position" in update_mask:
-            if position is not None:
-                prompt_payload["position"] = position
-
-        if update_mask is None or "metadata" in update_mask:
-            if metadata:
-                prompt_payload["metadata"] = metadata
-
-        if update_mask is None or "source" in update_mask:
-            if source:
-                prompt_payload["source"] = source
-
-        if update_mask is None or "post_processing_delimiter" in update_mask:
-            if post_processing_delimiter:
-                prompt_payload["post_processing_delimiter"] = post_processing_delimiter
-
-        if update_mask is None or "parameters" in update_mask:
-            if parameters:
-                prompt_payload["parameters"] = parameters
-
-        if update_mask is None or "nlg_timeout" in update_mask:
-            if nlg_timeout:
-                prompt_payload["nlg_timeout"] = nlg_timeout
-
-        mask = FieldMask(paths=update_mask)  # pylint: disable=no-value-for-parameter
-        mask_json = MessageToDict(mask, preserving_proto_field_name=True)
-
-        payload = {
-            "namespace": namespace,
-            "playbook_id": playbook_id,
-            "prompt": prompt_payload,
-            "update_mask": mask_json
-        }
+        payload = _update_prompt_payload(
+            namespace=namespace, playbook_id=playbook_id, prompt_id=prompt_id, update_mask=update_mask,
+            contents=contents, name=name,
+            temperature=temperature, top_p=top_p, max_tokens=max_tokens, stop_sequences=stop_sequences,
+            frequency_penalty=frequency_penalty, presence_penalty=presence_penalty,
+            post_processing=post_processing, run_mode=run_mode, parent_id=parent_id, position=position,
+            metadata=metadata, source=source, post_processing_delimiter=post_processing_delimiter,
+            parameters=parameters, nlg_timeout=nlg_timeout)
 
         headers = self._get_headers()
         url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts/{prompt_id}"
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.put(
+        response = self.transport.request(
+            "PUT",
             url,
             headers=headers,
             data=json.dumps(payload),
@@ -1779,8 +2520,8 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
-            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        response = self.transport.request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
         return self._validate_response(response, url, "playbooks")
 
     def upload_json_file_to_conversation_source(self, namespace: str,
@@ -1803,50 +2544,15 @@ class HFAPI:
 
         url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_source_id}"
 
-        # Read raw file bytes
-        with open(fqfp, 'rb') as f:
-            raw = f.read()
-
-        # Gzip if not already
-        lower = fqfp.lower()
-        if lower.endswith('.gz') or lower.endswith('.json.gz'):
-            gzipped_bytes = raw
-        else:
-            buf = io.BytesIO()
-            with gzip.GzipFile(fileobj=buf, mode='wb') as gz:
-                gz.write(raw)
-            gzipped_bytes = buf.getvalue()
-
-        # Normalize upload filename to .json.gz
-        base, ext = os.path.splitext(upload_name)
-        if ext.lower() in ('.gz', '.json.gz'):
-            fname = upload_name
-        elif ext.lower() == '.json':
-            fname = f"{base}.json.gz"
-        else:
-            fname = f"{upload_name}.json.gz"
+        payload = _json_upload_encoder(upload_name=upload_name, fqfp=fqfp, no_trigger=no_trigger)
 
-        if no_trigger:
-            str_no_trigger = "true"
-        else:
-            str_no_trigger = "false"
-        payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
-        fields={
-            'format': 'IMPORT_FORMAT_HUMANFIRST_JSON',
-            'no_trigger': str_no_trigger,
-            # seem to remember there is a problem with encoding multiple fields
-            # in the toolbelt multipart encoder but this seems effective during testing
-            # if I remember correctly this is present where the values are subobjects,
-            # but this is top level so seems OK?
-            'file': (fname, io.BytesIO(gzipped_bytes), 'application/gzip')}
-        )
         # This is the magic bit - you must set the content type to include the boundary information
         # multipart encoder makes working these out easier
         headers["Content-Type"] = payload.content_type
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=payload, timeout=effective_timeout)
 
         return self._validate_response(response, url, "playbooks")
@@ -1889,120 +2595,24 @@ class HFAPI:
         Supports both gzipped and non-gziped CSV files.
         '''
 
-        timestamp_dict = {
-            'UNIX_TIMESTAMP_MS': 0,
-            'UNIX_TIMESTAMP_SEC': 1,
-            'DATE_TIME_YEAR_FIRST': 2,
-            'DATE_TIME_MONTH_FIRST': 3,
-            'DATE_TIME_SLASH_MONTH_FIRST': 4,
-            'RFC3339': 5
-        }
-
-        # Read the input file bytes and determine if it's already gzipped
-        with open(fqfp, 'rb') as f:
-            raw = f.read()
-
-        if fqfp.lower().endswith('.gz'):
-            # already gzipped
-            gzipped_bytes = raw
-            # decompress to get CSV text for header parsing
-            with gzip.GzipFile(fileobj=io.BytesIO(raw)) as gz:
-                csv_bytes = gz.read()
-        else:
-            # plain CSV: keep raw for header parsing, and gzip it for upload
-            csv_bytes = raw
-            buf = io.BytesIO()
-            with gzip.GzipFile(fileobj=buf, mode='wb') as gz:
-                gz.write(raw)
-            gzipped_bytes = buf.getvalue()
-
-        payload = {
-            "namespace": namespace
-        }
+        payload = _csv_upload_encoder(upload_name=upload_name, fqfp=fqfp,
+                                      header_included=header_included, import_as_utterances=import_as_utterances,
+                                      id_column=id_column, date_column=date_column, date_format=date_format,
+                                      source_column=source_column, client_name=client_name, agent_name=agent_name,
+                                      text_column=text_column, metadata_columns=metadata_columns,
+                                      delimiter=delimiter, no_trigger=no_trigger)
 
         headers = self._get_headers()
 
         url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_source_id}"
 
-        if no_trigger:
-            str_no_trigger = "true"
-        else:
-            str_no_trigger = "false"
-
-        # Auto-derive metadata_columns if not provided
-        if metadata_columns is None:
-            # read just the first line
-            header_line = csv_bytes.split(b'\n', 1)[0].decode('utf-8')
-            cols = header_line.split(delimiter)
-            used = {
-                idx for idx in (
-                    id_column, date_column, source_column, text_column
-                ) if isinstance(idx, int)
-            }
-            metadata_columns = [
-                i for i in range(len(cols)) if i not in used
-            ]
-
-        # 3) Build the column_mapper_options dict
-        if import_as_utterances:
-            column_mapper_options = {
-                "header_included": header_included,
-                "import_as_utterances": True,
-                "text_column": text_column,
-                "id_column": None,
-                "date_column": None,
-                "date_format": timestamp_dict[date_format],
-                "source_column": None,
-                "client_name": "",
-                "agent_name": "",
-                "tag_columns": [],
-                "tag_list_column": None,
-                "metadata_columns": [{"index": i} for i in metadata_columns],
-                "delimiter": delimiter
-            }
-        else:
-            column_mapper_options = {
-                "header_included": header_included,
-                "import_as_utterances": False,
-                "id_column": {"value": id_column} if id_column is not None else None,
-                "date_column": {"value": date_column} if date_column is not None else None,
-                "date_format": timestamp_dict[date_format],
-                "source_column": {"value": source_column} if source_column is not None else None,
-                "client_name": client_name,
-                "agent_name": agent_name,
-                "text_column": text_column if text_column is not None else None,
-                "tag_columns": [],
-                "tag_list_column": None,
-                "metadata_columns": [{"index": i} for i in metadata_columns],
-                "delimiter": delimiter
-            }
-
-        # 4) Normalize filename to .csv.gz
-        base, ext = os.path.splitext(upload_name)
-        if ext.lower() in ['.gz', '.csv.gz']:
-            fname = upload_name
-        elif ext.lower() == '.csv':
-            fname = f"{base}.csv.gz"
-        else:
-            fname = f"{upload_name}.csv.gz"
-
-        payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
-        fields={
-            'format': 'IMPORT_FORMAT_SIMPLE_CSV',
-            'no_trigger': str_no_trigger,
-            # seem to remember there is a problem with encoding multiple fields in the 
-            # toolbelt multipart encoder but this seems effective during testing
-            # this is present where the values are subobjects, but this is top level so seems OK?
-            'file': (fname, io.BytesIO(gzipped_bytes), 'application/gzip'),
-            "column_mapper_options": json.dumps(column_mapper_options)}
-        )
         # This is the magic bit - you must set the content type to include the boundary information
         # multipart encoder makes working these out easier
         headers["Content-Type"] = payload.content_type
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=payload, timeout=effective_timeout)
         return self._validate_response(response, url, "playbooks")
 
@@ -2033,11 +2643,12 @@ class HFAPI:
             str_no_trigger = "true"
         else:
             str_no_trigger = "false"
+        import requests_toolbelt # pylint: disable=import-outside-toplevel
         payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
         fields={
             'format': 'IMPORT_FORMAT_DOCUMENT',
             'no_trigger': str_no_trigger, 
-            # seem to remember there is a problem with encoding multiple fields in the 
+            # seem to remember there is a problem with encoding multiple fields in the
             # toolbelt multipart encoder but this seems effective during testing
             # this is present where the values are subobjects, but this is top level so seems OK?
             'file': (upload_name, upload_file)}
@@ -2048,7 +2659,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=payload, timeout=effective_timeout)
         upload_file.close()
         return self._validate_response(response, url, "playbooks")
@@ -2073,37 +2684,12 @@ class HFAPI:
         the examples threaded along with their data like entropy, margin
         the nearest neighbour weights, the classifications and original
         inputs - on ABCD 20 conversations returns about 28k rows formatted'''
-        predicates = []
-        if search_text and search_text != '':
-            predicates.append({"inputMatch": {"text": search_text}})
-        if start_isodate and end_isodate and start_isodate != '' and end_isodate != '':
-            predicates.append(
-                {
-                    "timeRange": {
-                        "start": start_isodate,
-                        "end": end_isodate
-                    }
-                }
-            )
-        predicates.append({"conversation_type": {"type": 0}})
-        if convsetsource and convsetsource != "":
-            predicates.append(
-                {"conversationSet": {"conversationSetIds": [convsetsource]}})
-        if next_page_token and next_page_token != "":
-            predicates.append({"PageTokenData":{"PageToken":next_page_token}})
-
-        if len(predicates) == 0:
-            raise HFAPIParameterException(
-                "Must have either text or start and end date predicates." +
-                f"search_text: {search_text} start_isodate: {start_isodate} end_isodate: {end_isodate}")
-
-        payload = {
-            "predicates": predicates,
-            "pageSize": page_size
-        }
-        # TODO: this gives an error if passed - proto doesn't like PageTokenData\
-        # if next_page_token and next_page_token != "":
-        #     payload["page_token"] = next_page_token
+        payload = _query_conversation_set_payload(search_text=search_text,
+                                                  page_size=page_size,
+                                                  convsetsource=convsetsource,
+                                                  next_page_token=next_page_token,
+                                                  start_isodate=start_isodate,
+                                                  end_isodate=end_isodate)
 
         headers = self._get_headers()
 
@@ -2111,10 +2697,87 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
-            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        response = self.transport.request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
         return self._validate_response(response, url)
 
+    def iter_query_conversation_set(
+            self,
+            namespace: str,
+            workspace: str,
+            search_text: str = "",
+            page_size: int = 10,
+            convsetsource: str = "",
+            start_isodate: str = '1970-01-01T00:00:00Z',
+            end_isodate: str = '2049-12-31T23:59:59Z',
+            timeout: float = None,
+            max_pages: int = None,
+            yield_pages: bool = False,
+            prefetch: bool = True
+            ) -> Iterator[dict]:
+        '''Generator over every result of query_conversation_set following next page tokens
+
+        Yields each result of each page, or each whole page if yield_pages is True.
+        Only the current page and the next one are held in memory at once.
+        With prefetch the next page is fetched in the background while the caller
+        processes the current page.
+        max_pages stops after that many pages'''
+
+        def fetch(page_token: str) -> dict:
+            return self.query_conversation_set(namespace=namespace,
+                                               workspace=workspace,
+                                               search_text=search_text,
+                                               page_size=page_size,
+                                               convsetsource=convsetsource,
+                                               next_page_token=page_token,
+                                               start_isodate=start_isodate,
+                                               end_isodate=end_isodate,
+                                               timeout=timeout)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch("")
+            pages = 1
+            while True:
+                next_page_token = _query_next_page_token(page, pages, max_pages)
+                future = None
+                if next_page_token and prefetch:
+                    future = executor.submit(fetch, next_page_token)
+
+                if yield_pages:
+                    yield page
+                else:
+                    yield from page.get(QUERY_RESULTS_FIELD, [])
+
+                if not next_page_token:
+                    break
+                page = future.result() if future else fetch(next_page_token)
+                pages = pages + 1
+                logger.debug('Fetched conversation query page %s', pages)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def query_conversation_set_to_jsonl(self,
+                                        output_path: str,
+                                        namespace: str,
+                                        workspace: str,
+                                        **kwargs) -> int:
+        '''Write every result of a conversation query to output_path as one JSON object per line
+        without holding the conversation set in memory
+
+        Accepts the same keyword arguments as iter_query_conversation_set
+        Returns the number of lines written'''
+
+        written = 0
+        with open(output_path, mode="w", encoding="utf8") as file_out:
+            for result in self.iter_query_conversation_set(namespace=namespace, workspace=workspace, **kwargs):
+                file_out.write(json.dumps(result))
+                file_out.write("\n")
+                written = written + 1
+        logger.info('Wrote %s conversation query results to %s', written, output_path)
+        return written
+
     def export_query_conversation_inputs(
             self,
             namespace: str,
@@ -2133,10 +2796,17 @@ class HFAPI:
             exclude_phrase_objects: bool = True, # TODO: unclear why this is set
             source_kind: int = 2, # DEFAULT TO GENERATED
             source: int = 1, # DEFAULT to "client" - i.e get the client utterances
-            timeout: float = None
-            ) -> dict:
+            timeout: float = None,
+            output = None,
+            chunk_size: int = DOWNLOAD_CHUNK_SIZE
+            ) -> Union[dict, str, int]:
         '''Returns the generated data as as JSON or a as a
         CSV text file
+
+        If output, a file path or a binary file object, is given the export is streamed
+        to it chunk_size bytes at a time instead of being loaded into memory
+        and the number of bytes written is returned.
+        To process the records without writing them use iter_export_query_conversation_inputs
         
         By default waits for the new index to be available if
         one is being downloaded at the moment it is called
@@ -2164,129 +2834,61 @@ class HFAPI:
         '''
 
 
-        if metadata_predicate is None:
-            metadata_predicate = []
+        payload = _export_query_conversation_inputs_payload(
+            namespace=namespace, playbook_id=playbook_id, pipeline_id=pipeline_id,
+            pipeline_step_id=pipeline_step_id, exists_filter_key_name=exists_filter_key_name,
+            metadata_predicate=metadata_predicate, download_format=download_format, prompt_id=prompt_id,
+            generation_run_id=generation_run_id, order_by=order_by, order_direction_asc=order_direction_asc,
+            dedup_by_hash=dedup_by_hash, dedup_by_convo=dedup_by_convo,
+            exclude_phrase_objects=exclude_phrase_objects, source_kind=source_kind, source=source)
 
-        # operator 0 EQUALS filter types
-        metadata_keys = [
-            "pipelineId",
-            "pipelineStepId",
-            "promptId",
-            "generationRunId",
-        ]
-        metadata_values = [
-            pipeline_id,
-            pipeline_step_id,
-            prompt_id,
-            generation_run_id
-        ]
-        metadata_filters = []
-        for i,_ in enumerate(metadata_keys):
-            if metadata_values[i] != "":
-                metadata_filters.append({
-                    "key": metadata_keys[i],
-                    "operator": 0, # EQUALS
-                    "value": metadata_values[i]
-                })
-        # operator 4 exists -- older implementation
-        if exists_filter_key_name != "":
-            exists_filter = {
-                "key": exists_filter_key_name,
-                "operator": 4, # EXISTS
-                "optional": False,
-                "value": ""
-            }
-            metadata_filters.append(exists_filter)
-
-        #Condition dict for filtering
-        condition_dict = {
-                "EQUALS": 0,
-                "NOT_EQUALS": 1,
-                "CONTAINS": 2,
-                "NOT_CONTAINS": 3,
-                "KEY_EXISTS": 4,
-                "KEY_NOT_EXISTS": 5,
-                "KEY_MATCHES": 6,
-                "ANY": 7
-        }
-
-        #Map the metadata filters passed in via object
-        if len(metadata_predicate) > 0:
-            for _, metadata_field in enumerate(metadata_predicate):
-
-                try:
-                    #Find matching numerical operator
-                    numerical_operator = condition_dict[metadata_field["operator"]]
-                except Exception as _:
-                    logging.error("Invalid operator %s. Please choose from: "
-                            "EQUALS, NOT_EQUALS, CONTAINS, NOT_CONTAINS, "
-                            "KEY_EXISTS, KEY_NOT_EXISTS, KEY_MATCHES, ANY", metadata_field['operator'])
-                    raise
-
-                #Support for OR query
-                if metadata_field.get("optional"):
-                    metadata_filters.append({
-                        "key": metadata_field['key'],
-                        "operator": numerical_operator,
-                        "value": metadata_field['value'],
-                        "optional": metadata_field['optional'],
-                    })
-                else:
-                    metadata_filters.append({
-                        "key": metadata_field['key'],
-                        "operator": numerical_operator,
-                        "value": metadata_field['value']
-                    })
-
-
-        if order_direction_asc:
-            order_direction = 1
-        else:
-            order_direction = 2
-        payload = {
-            "namespace": namespace,
-            "playbook_id": playbook_id,
-            "input_predicates": [
-                {
-                    "metadata":{
-                        "conditions": metadata_filters
-                    }
-                },
-                {
-                    "deduping": {
-                        "by_hash": dedup_by_hash,
-                        "by_conversation": dedup_by_convo
-                    }
-                },
-                {
-                    "trainingPhrase":
-                        {
-                            "excludePhraseObjects": exclude_phrase_objects
-                        }
-                }
-            ],
-            "format": download_format,
-            "conversation_predicates": [
-                {
-                    "conversation_source": {
-                        "source_kind": source_kind
-                    }
-                }
-            ],
-            "order_by_value": {
-                "value": order_by
-            },
-            "order_direction": order_direction
-        }
+        downloadable_url = self._export_query_conversation_inputs_url(payload, timeout)
+        return self._download_file_from_url(downloadable_url, download_format, output=output, chunk_size=chunk_size)
 
-        if source != -1:
-            payload["input_predicates"].append(
-                {
-                    "source": {
-                        "source": source 
-                    }
-                }
-            )
+    def iter_export_query_conversation_inputs(
+            self,
+            namespace: str,
+            playbook_id: str,
+            pipeline_id: str = "",
+            pipeline_step_id: str = "",
+            exists_filter_key_name: str = "",
+            metadata_predicate: list[dict] = None,
+            download_format: int = 1, # 1 = JSON 2 = CSV
+            prompt_id: str = "",
+            generation_run_id: str = "",
+            order_by: int = 1,
+            order_direction_asc: bool = True,
+            dedup_by_hash: bool = False,
+            dedup_by_convo: bool = False,
+            exclude_phrase_objects: bool = True,
+            source_kind: int = 2,
+            source: int = 1,
+            timeout: float = None,
+            chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+            json_field: str = None
+            ) -> Iterator[dict]:
+        '''Generator over the records of export_query_conversation_inputs parsed as they download
+
+        Takes the same filters as export_query_conversation_inputs.
+        JSON exports yield the items of the top level array, or of every array value of the
+        top level object - json_field restricts this to a single key.
+        CSV exports yield one dict per row keyed by the header row.
+        Memory stays flat however large the export is'''
+
+        payload = _export_query_conversation_inputs_payload(
+            namespace=namespace, playbook_id=playbook_id, pipeline_id=pipeline_id,
+            pipeline_step_id=pipeline_step_id, exists_filter_key_name=exists_filter_key_name,
+            metadata_predicate=metadata_predicate, download_format=download_format, prompt_id=prompt_id,
+            generation_run_id=generation_run_id, order_by=order_by, order_direction_asc=order_direction_asc,
+            dedup_by_hash=dedup_by_hash, dedup_by_convo=dedup_by_convo,
+            exclude_phrase_objects=exclude_phrase_objects, source_kind=source_kind, source=source)
+
+        downloadable_url = self._export_query_conversation_inputs_url(payload, timeout)
+        yield from self._iter_records_from_url(downloadable_url, download_format,
+                                               chunk_size=chunk_size, json_field=json_field)
+
+    def _export_query_conversation_inputs_url(self, payload: dict, timeout: float = None) -> str:
+        """Request an export and return the url to download it from"""
 
         headers = self._get_headers()
 
@@ -2296,19 +2898,30 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
-            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        response = self.transport.request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
         res = self._validate_response(response, url)
-        downloadable_url = f'{self.base_url}{res["exportUrlPath"]}'
-        return self._download_file_from_url(downloadable_url, download_format)
+        return f'{self.base_url}{res["exportUrlPath"]}'
+
+    def _download_file_from_url(self, url: str, download_format: int, timeout: float = None,
+                                output = None, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Union[dict, str, int]:
+        """Download file from url
 
-    def _download_file_from_url(self, url: str, download_format: int, timeout: float = None) -> dict:
-        """Download file from url"""
+        If output is given stream the file into it and return the number of bytes written"""
         headers = self._get_headers()
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        downloaded_json = requests.request("GET", url, headers=headers, timeout=effective_timeout)
+        if output is not None:
+            with self.transport.request("GET", url, headers=headers, timeout=effective_timeout,
+                                        stream=True) as response:
+                if response.status_code not in (200, 201):
+                    raise HFAPIResponseValidationException(url=url, response=response)
+                written = _write_chunks(response.iter_content(chunk_size=chunk_size), output)
+            logger.info('Downloaded %s bytes from %s', written, url)
+            return written
+
+        downloaded_json = self.transport.request("GET", url, headers=headers, timeout=effective_timeout)
         if download_format == 1: #JSON
             return downloaded_json.json()
         elif download_format == 2: #CSV
@@ -2316,6 +2929,23 @@ class HFAPI:
         else:
             raise RuntimeError(f'Unrecognised download format: {download_format}')
 
+    def _iter_records_from_url(self, url: str, download_format: int, timeout: float = None,
+                               chunk_size: int = DOWNLOAD_CHUNK_SIZE, json_field: str = None) -> Iterator[dict]:
+        """Stream a JSON or CSV file from url yielding its records as they arrive"""
+        headers = self._get_headers()
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        records = _record_stream(download_format, json_field)
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        with self.transport.request("GET", url, headers=headers, timeout=effective_timeout,
+                                    stream=True) as response:
+            if response.status_code not in (200, 201):
+                raise HFAPIResponseValidationException(url=url, response=response)
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                yield from records.feed(decoder.decode(chunk))
+            yield from records.feed(decoder.decode(b"", final=True), final=True)
+
 
 
 
@@ -2333,7 +2963,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "integrations")
 
@@ -2350,7 +2980,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "workspaces")
 
@@ -2381,41 +3011,16 @@ class HFAPI:
             timeout: float = None
         ):
         '''Triggers import of the wrokspace from the selected integration'''
-        if extra_intent_tags is None:
-            extra_intent_tags = []
-        if extra_phrase_tags is None:
-            extra_phrase_tags = []
-
-        payload = {
-            "namespace": namespace,
-            "playbook_id": playbook,
-            "integration_id": integration_id,
-            "integration_workspace_id": integration_workspace_id,
-            "integration_location": {
-                "project": project,
-                "region": region
-            },
-            "bidirectional_merge": bidirectional_merge,
-            "intent_options": {
-                "hierarchical_intent_name_disabled": hierarchical_intent_name_disabled,
-                "hierarchical_delimiter": hierarchical_delimiter,
-                "zip_encoding": zip_encoding,
-                "gzip_encoding": gzip_encoding,
-                "include_negative_phrases": include_negative_phrases,
-                "skip_empty_intents": skip_empty_intents
-            },
-            "import_options": {
-                "clear_intents": clear_intents,
-                "clear_entities": clear_entities,
-                "clear_tags": clear_tags,
-                "merge_intents": merge_intents,
-                "merge_entities": merge_entities,
-                "merge_tags": merge_tags,
-                "extra_intent_tags": extra_intent_tags,
-                "extra_phrase_tags": extra_phrase_tags
-            },
-            "integration_language": integration_language
-        }
+        payload = _df_cx_import_payload(
+            namespace=namespace, playbook=playbook, integration_id=integration_id,
+            integration_workspace_id=integration_workspace_id, project=project, region=region,
+            integration_language=integration_language, bidirectional_merge=bidirectional_merge,
+            hierarchical_intent_name_disabled=hierarchical_intent_name_disabled,
+            hierarchical_delimiter=hierarchical_delimiter, zip_encoding=zip_encoding, gzip_encoding=gzip_encoding,
+            include_negative_phrases=include_negative_phrases, skip_empty_intents=skip_empty_intents,
+            clear_intents=clear_intents, clear_entities=clear_entities, clear_tags=clear_tags,
+            merge_intents=merge_intents, merge_entities=merge_entities, merge_tags=merge_tags,
+            extra_intent_tags=extra_intent_tags, extra_phrase_tags=extra_phrase_tags)
 
         headers = self._get_headers()
 
@@ -2423,7 +3028,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload),timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -2442,7 +3047,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, "presets")
 
@@ -2471,7 +3076,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -2487,7 +3092,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
 
         return self._validate_response(response=response, url=url, wantzip=True)
@@ -2504,7 +3109,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
 
         return self._validate_response(response=response,url=url)
@@ -2521,7 +3126,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
 
         return self._validate_response(response=response,url=url)
@@ -2543,7 +3148,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
 
         return self._validate_response(response=response,url=url)
@@ -2563,7 +3168,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -2577,7 +3182,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -2594,7 +3199,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -2617,7 +3222,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url)
 
@@ -2635,7 +3240,7 @@ class HFAPI:
 
         effective_timeout = timeout if timeout is not None else self.timeout
 
-        response = requests.request(
+        response = self.transport.request(
             "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
         return self._validate_response(response, url, field="pipelines")
 
@@ -2687,17 +3292,7 @@ class HFAPI:
             trigger_response = self.describe_trigger(namespace=namespace,trigger_id=trigger_id,timeout=timeout)
 
             # produce a summary
-            summary = {
-                "triggerId": trigger_response["triggerState"]["trigger"]["triggerId"],
-                "message": trigger_response["triggerState"]["trigger"]["message"],
-                "status": trigger_response["triggerState"]["status"]
-            }
-
-            # enhance that with more information.
-            if "progress" in trigger_response.keys():
-                summary["total"] = trigger_response["triggerState"]["progress"]["total"],
-                summary["completed"] = trigger_response["triggerState"]["progress"]["completed"],
-                summary["percentageComplete"] = trigger_response["triggerState"]["progress"]["percentageComplete"]
+            summary = _trigger_summary(trigger_response)
 
             # increment counter
             loops = loops + 1
@@ -0,0 +1,2374 @@
+# pylint: disable=too-many-lines
+"""
+async_apis.py
+
+asyncio version of the HumanFirst API client
+
+Requires the optional httpx dependency: pip install humanfirst[async]
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import asyncio
+import codecs
+import contextlib
+import json
+import base64
+import datetime
+import time
+import math
+import logging
+import urllib.parse
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator, Union
+
+# third party imports
+try:
+    import httpx
+except ImportError: # pragma: no cover
+    httpx = None
+
+# custom imports
+from .apis import (HFAPIBase, TIMEOUT, PREEMPTIVE_REFRESH_SECONDS_DEFAULT, FIREBASE,
+                   HFAPIResponseValidationException,
+                   BATCH_PREDICT_CHUNK_SIZE, BATCH_PREDICT_MAX_WORKERS, BATCH_PREDICT_MAX_RETRIES,
+                   _chunk_retry_policy, _chunk_list, _PredictProgress,
+                   QUERY_RESULTS_FIELD, _query_next_page_token,
+                   TRIGGER_STATUS_COMPLETED, TRIGGER_STATUS_UNKNOWN, TRIGGER_STATUS_CANCELLED, TRIGGER_STATUS_FAILED,
+                   _import_intents_payload, _train_nlu_payload, _predict_payload,
+                   _create_prompt_payload, _update_prompt_payload,
+                   _json_upload_encoder, _csv_upload_encoder,
+                   _query_conversation_set_payload, _export_query_conversation_inputs_payload,
+                   _df_cx_import_payload, _trigger_summary)
+from .transport import POOL_CONNECTIONS, POOL_MAXSIZE, RetryPolicy, RetryCounters, resolve_retry_policy
+from .transport import retry_policy as use_retry_policy
+from .ratelimit import RateLimiter
+from .records import DOWNLOAD_CHUNK_SIZE, _record_stream
+from .metrics import RequestEvent, call_hooks, body_size
+
+# create logger
+logger = logging.getLogger('humanfirst.async_apis')
+
+
+class AsyncHFAPIDependencyException(Exception):
+    """When httpx is not installed"""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class AsyncHFAPI(HFAPIBase):
+    """HumanFirst API for asyncio
+
+    Exposes the same methods as HFAPI as coroutines. All calls share one pooled
+    httpx.AsyncClient so many requests can be in flight on a single event loop.
+    """
+
+    client: "httpx.AsyncClient"
+    semaphore: asyncio.Semaphore
+
+    def __init__(self,
+                 api_key: str = "",
+                 username: str = "",
+                 password: str = "",
+                 environment: str = "",
+                 api_version: str = "",
+                 min_expires_in_seconds: int = PREEMPTIVE_REFRESH_SECONDS_DEFAULT,
+                 timeout: float = TIMEOUT,
+                 max_connections: int = POOL_MAXSIZE,
+                 max_keepalive_connections: int = POOL_CONNECTIONS,
+                 max_concurrency: int = None,
+                 transport: "httpx.AsyncBaseTransport" = None,
+                 client: "httpx.AsyncClient" = None,
+                 background_token_refresh: bool = False,
+                 token_cache_path: str = "",
+                 retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None,
+                 hooks: list = None):
+        """
+        Authentication works exactly as for HFAPI, see HFAPI.__init__
+
+        max_connections           - maximum number of connections the client keeps open
+        max_keepalive_connections - maximum number of idle connections kept alive for reuse
+        max_concurrency           - maximum number of requests in flight at once, requests above this
+                                    wait their turn. Defaults to max_connections
+        transport                 - a custom httpx async transport, for instance httpx.MockTransport
+        client                    - an existing httpx.AsyncClient to share, the max_* settings are then
+                                    only used for max_concurrency
+        background_token_refresh  - refresh the firebase token from a daemon thread ahead of expiry
+                                    so no call waits on a refresh
+        token_cache_path          - file sharing the firebase token between all processes on a host
+        retry_policy              - how transient failures are retried as for HFAPI, counted in counters
+        rate_limiter              - a humanfirst.ratelimit.RateLimiter pacing requests per endpoint family,
+                                    may be shared with other clients and threads
+        hooks                     - humanfirst.metrics.HFHooks called on every request attempt, response, error
+                                    and token refresh
+        """
+
+        if httpx is None:
+            raise AsyncHFAPIDependencyException(
+                "AsyncHFAPI requires httpx - install it with: pip install humanfirst[async]")
+
+        # token requests made by Authorization remain synchronous and run in a worker thread
+        super().__init__(api_key=api_key,
+                         username=username,
+                         password=password,
+                         environment=environment,
+                         api_version=api_version,
+                         min_expires_in_seconds=min_expires_in_seconds,
+                         timeout=timeout,
+                         background_token_refresh=background_token_refresh,
+                         token_cache_path=token_cache_path,
+                         hooks=hooks)
+
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_keepalive_connections),
+                transport=transport)
+        self.client = client
+
+        if max_concurrency is None:
+            max_concurrency = max_connections
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+        self.counters = RetryCounters()
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks) if hooks else []
+
+        logger.debug("AsyncHFAPI created max_connections: %s max_concurrency: %s",
+                     max_connections, max_concurrency)
+
+    async def aclose(self):
+        """Close the pooled connections held by this object and stop any background token refresh"""
+        if self.auth_type == FIREBASE:
+            self.firebase_auth.stop_background_refresh()
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def _aget_headers(self) -> dict:
+        """Produce the necessary header, validating or refreshing a firebase token off the event loop
+
+        A token already verified with time left on it is used as it is, as validate_jwt would,
+        without waiting for a thread of the default executor"""
+
+        if self.auth_type == FIREBASE:
+            firebase_auth = self.firebase_auth
+            if firebase_auth.seconds_to_expiry() <= firebase_auth.min_expires_in_seconds:
+                await asyncio.to_thread(firebase_auth.validate_jwt)
+        return self._bearer_headers()
+
+    async def _request(self,
+                       method: str,
+                       url: str,
+                       headers: dict = None,
+                       data=None,
+                       timeout: float = None,
+                       retry=None,
+                       idempotent: bool = None,
+                       stream: bool = False) -> "httpx.Response":
+        """Send a request through the pooled client, waiting for a free concurrency slot
+
+        data may be a str, bytes, dict or a requests_toolbelt MultipartEncoder as accepted by HFAPI
+        Transient failures are retried as HFTransport.request does, the slot is released while waiting.
+        Each attempt first waits for the rate_limiter if there is one.
+        With stream=True only the response headers are read, the caller reads the body and must aclose
+        the response, which holds its rate_limiter slot until then as HFTransport.request does"""
+
+        if hasattr(data, "to_string"):
+            data = data.to_string()
+        elif isinstance(data, dict):
+            # requests form encodes a dict body and sends nothing for an empty one
+            data = urllib.parse.urlencode(data) if data else None
+        policy = resolve_retry_policy(self.retry_policy, retry)
+        limiter = self.rate_limiter.for_url(url) if self.rate_limiter is not None else None
+        attempt = 0
+        while True:
+            self.counters.increment("requests")
+            ticket = await limiter.acquire_async() if limiter is not None else None
+            event = None
+            try:
+                async with self.semaphore:
+                    if self.hooks:
+                        event = RequestEvent(method, url, attempt=attempt, bytes_sent=body_size(data))
+                        call_hooks(self.hooks, "on_request", event)
+                    if stream:
+                        request = self.client.build_request(method, url, headers=headers, content=data,
+                                                            timeout=timeout)
+                        response = await self.client.send(request, stream=True)
+                    else:
+                        response = await self.client.request(method, url, headers=headers, content=data,
+                                                             timeout=timeout)
+            except httpx.TransportError as e:
+                self._request_failed(limiter, ticket, event, e)
+                connect_error = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not policy.should_retry(attempt, method, idempotent, connect_error=connect_error):
+                    if attempt > 0:
+                        self.counters.increment("retries_exhausted")
+                    raise
+                reason = type(e).__name__
+                retry_after = None
+            except BaseException as e:
+                # interrupted or cancelled, free the slot for the other callers
+                self._request_failed(limiter, ticket, event, e)
+                raise
+            else:
+                if limiter is not None:
+                    if stream:
+                        _release_on_aclose(response, limiter, ticket)
+                    else:
+                        limiter.release(ticket, response.status_code)
+                if event is not None:
+                    if stream:
+                        received = int(response.headers.get("Content-Length") or 0)
+                    else:
+                        received = len(response.content)
+                    event.finish(status_code=response.status_code, bytes_received=received)
+                    call_hooks(self.hooks, "on_response", event)
+                if not policy.should_retry(attempt, method, idempotent, status_code=response.status_code):
+                    if attempt > 0 and response.status_code in policy.statuses:
+                        self.counters.increment("retries_exhausted")
+                    return response
+                reason = str(response.status_code)
+                retry_after = response.headers.get("Retry-After")
+                if stream:
+                    await response.aclose()
+
+            attempt = attempt + 1
+            wait = policy.wait(attempt, retry_after)
+            self.counters.increment("retries")
+            self.counters.increment(f'retries_{reason}')
+            logger.warning("Retrying %s %s after %s in %.2fs (retry %s of %s)",
+                           method, url, reason, wait, attempt, policy.max_retries)
+            await asyncio.sleep(wait)
+
+    def _request_failed(self, limiter, ticket: int, event: RequestEvent, exception: BaseException):
+        """Free the rate limiter slot and report an attempt that got no response"""
+        if limiter is not None:
+            limiter.release(ticket)
+        if event is not None:
+            event.finish(exception=exception)
+            call_hooks(self.hooks, "on_error", event)
+
+    @contextlib.asynccontextmanager
+    async def _stream(self, method: str, url: str, **kwargs) -> AsyncIterator["httpx.Response"]:
+        """_request with stream=True, closing the response when the block exits"""
+        response = await self._request(method, url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def _iter_chunks(self, response: "httpx.Response", chunk_size: int) -> AsyncIterator[bytes]:
+        """The body of a streamed response in chunks, each read while holding a concurrency slot
+        so the slot is free while the caller handles the chunk"""
+        chunks = response.aiter_bytes(chunk_size=chunk_size)
+        while True:
+            async with self.semaphore:
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield chunk
+
+    # *****************************************************************************************************************
+    # Tags
+    # *****************************************************************************************************************
+
+    async def get_tags(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''Returns tags'''
+        payload = {}
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/tags'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "tags")
+
+    async def delete_tag(self, namespace: str, playbook: str, tag_id: str, timeout: float = None) -> dict:
+        '''Returns tags'''
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook,
+            "tag_id": tag_id
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/tags/{tag_id}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def create_tag(self, namespace: str, playbook: str,
+                tag_id: str, tag_name: str, tag_color: str,
+                timeout: float = None) -> dict:
+        '''Create a tag'''
+
+        now = datetime.datetime.now()
+        now = now.isoformat()
+
+        tag = {
+            "id": tag_id,
+            "name": tag_name,
+            "color": tag_color
+        }
+
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook,
+            "tag":tag
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/tags'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    # *****************************************************************************************************************
+    # Playbooks/Workspaces
+    # *****************************************************************************************************************
+
+    async def create_playbook(self, namespace: str, playbook_name: str, timeout: float = None) -> dict:
+        '''
+        Creates a playbook in the given namespace
+
+        If the playbook name already exists, that playbook gets deleted and a new one is creates
+        '''
+        payload = {
+            "namespace": namespace,
+            "playbook_name": playbook_name,
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "playbooks")
+
+    # version with workspaces
+    async def list_playbooks_old(self, namespace: str, conversation_set_id: str = "", timeout: float = None) -> dict:
+        '''Returns list of all playbooks for an organisation
+        Note namepsace parameter doesn't appear to provide filtering
+        
+        If conversation_set_id is provided, it retuns only those playbooks linked to the conversation_set_id
+        '''
+
+        payload = {
+            "namespace": namespace
+        }
+
+        headers = await self._aget_headers()
+
+        query_params = f"namespace={namespace}&conversation_set_id={conversation_set_id}"
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/humanfirst?{query_params}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "playbooks")
+
+    # as originally in PR - with playbooks
+    async def list_playbooks(self, namespace: str, conversation_set_id: str = "", timeout: float = None) -> dict:
+        '''Returns list of all playbooks for an organisation
+        Note namepsace parameter doesn't appear to provide filtering
+        
+        If conversation_set_id is provided, it retuns only those playbooks linked to the conversation_set_id
+        '''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        query_params = f"namespace={namespace}&conversation_set_id={conversation_set_id}"
+
+        url = f'{self.base_url}/{self.api_version}/playbooks?{query_params}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "playbooks")
+
+    async def get_playbook_info(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''Returns metadata of playbook'''
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def get_playbook(self,
+                    namespace: str,
+                    playbook: str,
+                    hierarchical_delimiter="-",
+                    hierarchical_intent_name_disabled: bool = True,
+                    zip_encoding: bool = False,
+                    include_negative_phrases: bool = False,
+                    timeout: float = None
+                    ) -> dict:
+        '''Returns the actual training information including where present in the workspace
+        * intents
+        * examples
+        * entities
+        * tags
+        '''
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook,
+            "format": 7,
+            "format_options": {
+                "hierarchical_intent_name_disabled": hierarchical_intent_name_disabled,
+                "hierarchical_delimiter": hierarchical_delimiter,
+                "zip_encoding": zip_encoding,
+                "include_negative_phrases": include_negative_phrases
+            }
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/export'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
+        response = self._validate_response(response, url, "data")
+        response = base64.b64decode(response)
+        response = response.decode('utf-8')
+        response_dict = json.loads(response)
+        return response_dict
+
+    async def delete_playbook(self,
+                        namespace: str,
+                        playbook_id: str,
+                        hard_delete: bool = False,
+                        timeout: float = None) -> dict:
+        '''
+        Delete the playbook provided
+
+        hard_delete - Don't just flag the playbook as deleted, but completely delete it from the database
+        '''
+
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook_id,
+            "hard_delete": hard_delete
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "playbooks")
+
+    # *****************************************************************************************************************
+    # Intents
+    # *****************************************************************************************************************
+
+    async def get_intents(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''Get all the intents in a workspace'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "intents")
+
+
+    async def get_intent(self, namespace: str, playbook: str, intent_id: str, timeout: float = None) -> dict:
+        '''Get the metdata for the intent needed'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/{intent_id}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+
+    async def get_revisions(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''Get revisions for the namespace and playbook'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/revisions'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "revisions")
+
+    async def update_intent(self,
+                      namespace: str,
+                      playbook: str,
+                      intent: dict,
+                      update_mask: str,
+                      timeout: float = None) -> dict:
+        '''Update an intent
+
+        *update_mask = <keywords used in an intent hf format>
+        this helps in updating specific keyword
+        '''
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook,
+            "intent": intent,
+            "update_mask": update_mask
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "PUT", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def import_intents(
+            self,
+            namespace: str, playbook: str,
+            workspace_as_dict: dict,
+            format_int: int = 7,
+            hierarchical_intent_name_disabled: bool = True,
+            hierarchical_delimiter: str = "/",
+            zip_encoding: bool = False,
+            gzip_encoding: bool = False,
+            include_negative_phrases: bool = False,
+            skip_empty_intents: bool = True,
+            clear_intents: bool = False,
+            clear_entities: bool = False,
+            clear_tags: bool = False,
+            merge_intents: bool = False,
+            merge_entities: bool = False,
+            merge_tags: bool = False,
+            # extra_intent_tags: list = None,
+            # extra_phrase_tags: list = None,
+            override_metadata: bool = True,
+            override_name: bool = True,
+            timeout: float = None
+        ) -> dict:
+        """Import intents using multipart assuming an input humanfirst JSON file
+
+        Reference: https://docs.humanfirst.ai/api/import-intents
+
+        How to nest Request object?
+
+        """
+
+        payload = _import_intents_payload(
+            namespace=namespace, playbook=playbook, workspace_as_dict=workspace_as_dict, format_int=format_int,
+            hierarchical_intent_name_disabled=hierarchical_intent_name_disabled,
+            hierarchical_delimiter=hierarchical_delimiter, zip_encoding=zip_encoding, gzip_encoding=gzip_encoding,
+            include_negative_phrases=include_negative_phrases, skip_empty_intents=skip_empty_intents,
+            clear_intents=clear_intents, clear_entities=clear_entities, clear_tags=clear_tags,
+            merge_intents=merge_intents, merge_entities=merge_entities, merge_tags=merge_tags,
+            override_metadata=override_metadata, override_name=override_name)
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/import'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=payload, timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def import_intents_http(
+            self,
+            namespace: str, playbook: str,
+            workspace_file_path: str, # or union HFWorkspace
+            # format_int: int = 7,
+            hierarchical_intent_name_disabled: bool = True,
+            hierarchical_delimiter: str = "/",
+            timeout: float = None
+            # zip_encoding: bool = False,
+            # gzip_encoding: bool = False,
+            # clear_intents: bool = False,
+            # clear_entities: bool = False,
+            # clear_tags: bool = False,
+            # merge_intents: bool = False,
+            # merge_entities: bool = False,
+            # merge_tags: bool = False,
+            # extra_intent_tags: list = None,
+            # extra_phrase_tags: list = None,
+            # override_metadata: bool = True,
+            # override_name: bool = True
+        ) -> dict:
+        """Import intents using multipart assuming an input humanfirst JSON file
+
+        Reference: https://docs.humanfirst.ai/api/import-intents-http
+
+        How to nest Request object?
+
+        TODO: this doesn't currently work as is - see intents_import option instead
+
+        """
+
+        import requests_toolbelt # pylint: disable=import-outside-toplevel
+        payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
+            fields={
+                'file': ("upload_name", workspace_file_path, 'application/json'),
+                'format': 'INTENTS_FORMAT_HF_JSON',
+                "namespace": namespace,
+                "playbook_id": playbook,
+                "format_options": str(hierarchical_intent_name_disabled),
+                "hierarchical_delimiter": str(hierarchical_delimiter)
+                # 'request' : {
+                #     "namespace": namespace,
+                #     "playbook_id": playbook,
+                #     "format": format_int,
+                #     "format_options": hierarchical_intent_name_disabled,
+                #     "hierarchical_delimiter": hierarchical_delimiter,
+                #     "zip_encoding": zip_encoding,
+                #     "gzip_encoding": gzip_encoding,
+                #     "import_options": {
+                #         "clear_intents": clear_intents,
+                #         "clear_entities": clear_entities,
+                #         "clear_tags": clear_tags,
+                #         "merge_intents": merge_intents,
+                #         "merge_entities": merge_entities,
+                #         "merge_tags": merge_tags,
+                #         "extra_intent_tags": extra_intent_tags,
+                #         "extra_phrase_tags": extra_phrase_tags,
+                #         "override_metadata": override_metadata,
+                #         "override_name": override_name
+                #     }
+                # }
+            }
+        )
+
+        headers = await self._aget_headers()
+
+        headers["Content-Type"] = payload.content_type
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/intents/import_http'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=payload, timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+
+    # *****************************************************************************************************************
+    # Call NLU engines
+    # *****************************************************************************************************************
+
+    async def get_models(self, namespace: str, timeout: float = None) -> dict:
+        '''Get available models for a namespace
+        NOTE: THIS IS NOT nlu-id!'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/models'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        models = self._validate_response(response, url, "models")
+        namespace_models = []
+        for model in models:
+            if model["namespace"] == namespace:
+                namespace_models.append(model)
+        return namespace_models
+
+
+    async def get_nlu_engines(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''Get nlu engines for the for the namespace and playbook'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}/nlu_engines'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "nluEngines")
+
+
+    async def get_nlu_engine(self, namespace: str, playbook: str, nlu_id: str, timeout: float = None) -> dict:
+        '''Get nlu engine for the for the namespace and playbook'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}/nlu_engines/{nlu_id}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def list_trained_nlu(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''Get trained run ids for the playbook, then will have to filter by the nlu_engine interested in'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/nlu'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, field="runs")
+
+
+    async def trigger_train_nlu(self, namespace: str, playbook: str, nlu_id: str,
+                        force_train: bool = True, skip_train: bool= False,
+                        force_infer: bool = False, skip_infer: bool = True,
+                        auto: bool = False, timeout: float = None) -> dict:
+        '''Trigger training for a workspace here we only allow for one request for
+        one engine - but theoretically you can call to trigger many on the same
+        playbook
+
+        This example skips the infer by default - override the settings to stop skipping
+        if enabled by default, or force it if not enabled by default
+
+        This returns
+
+        '''
+        payload = _train_nlu_payload(namespace=namespace, playbook=playbook, nlu_id=nlu_id,
+                                     force_train=force_train, skip_train=skip_train,
+                                     force_infer=force_infer, skip_infer=skip_infer, auto=auto)
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/nlu:train'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+
+        return self._validate_response(response, url)
+
+
+    async def predict(self, sentence: str, namespace: str, playbook: str,
+                model_id: str = None, revision_id: str = None, timeout: float = None) -> dict:
+        '''Get response_dict of matches and hier matches for an input
+        optionally specify which model and revision ID you want the prediction from
+        model_id probably better know as nlu-id
+        revision_id probably better known as run_id
+        but it needs to be the run_id of the model job not revisions which is showing export job
+        TODO: update when updated'''
+
+        headers = await self._aget_headers()
+
+        payload = _predict_payload(sentence=sentence, model_id=model_id, revision_id=revision_id)
+
+        url = f'{self.base_url}/{self.api_version}/nlu/predict/{namespace}/{playbook}'
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
+        return self._validate_response(response, url)
+
+
+    async def batchPredict(self, sentences: list, # pylint: disable=invalid-name
+                     namespace: str,
+                     playbook: str,
+                     timeout: float = None,
+                     model_id: str = "",
+                     revision_id: str = "") -> dict:
+        '''Get response_dict of matches and hier matches for a batch of sentences
+        Accepts an optional model_id and revision_id to run it against a previous
+        version of the NLU, if these are not provided it defaults to the latest'''
+        payload = {
+            "namespace": "string",
+            "playbook_id": "string",
+            "input_utterances": sentences,
+        }
+        if model_id != "":
+            payload["model_id"] = model_id
+        if revision_id != "":
+            payload["revision_id"] = revision_id
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/nlu/predict/{namespace}/{playbook}/batch'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
+        return self._validate_response(response, url, "predictions")
+
+    async def batch_predict_chunked(self, sentences: list,
+                                    namespace: str,
+                                    playbook: str,
+                                    chunk_size: int = BATCH_PREDICT_CHUNK_SIZE,
+                                    max_workers: int = BATCH_PREDICT_MAX_WORKERS,
+                                    max_retries: int = BATCH_PREDICT_MAX_RETRIES,
+                                    timeout: float = None,
+                                    model_id: str = "",
+                                    revision_id: str = "",
+                                    progress_callback: Callable = None) -> list:
+        '''Predict any number of sentences by splitting them into chunks of chunk_size
+        and calling batchPredict for up to max_workers chunks at once
+
+        A chunk that fails transiently is retried on its own by _request up to max_retries times,
+        honouring any Retry-After, with waits growing from BATCH_PREDICT_RETRY_WAIT.
+        The first chunk to fail for good fails the whole call and cancels the others.
+        Predictions are returned in the same order as sentences.
+
+        Progress and throughput are logged after every chunk, progress_callback
+        if provided is called with (completed, total, utterances_per_second)'''
+
+        chunks = _chunk_list(sentences, chunk_size)
+        progress = _PredictProgress(len(sentences), progress_callback)
+        workers = asyncio.Semaphore(max_workers)
+        policy = _chunk_retry_policy(resolve_retry_policy(self.retry_policy), max_retries)
+        failed = asyncio.Event()
+
+        async def predict_chunk(chunk: list) -> list:
+            async with workers:
+                if failed.is_set():
+                    # a waiting chunk can take the free worker before it is cancelled
+                    return None
+                try:
+                    with use_retry_policy(policy):
+                        predictions = await self.batchPredict(chunk, namespace=namespace, playbook=playbook,
+                                                              timeout=timeout, model_id=model_id,
+                                                              revision_id=revision_id)
+                except Exception:
+                    failed.set()
+                    raise
+            progress.update(len(chunk))
+            return predictions
+
+        tasks = [asyncio.ensure_future(predict_chunk(chunk)) for chunk in chunks]
+        try:
+            chunk_predictions = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        predictions = []
+        for chunk_prediction in chunk_predictions:
+            predictions.extend(chunk_prediction)
+        return predictions
+
+    # *****************************************************************************************************************
+    # Coverage
+    # *****************************************************************************************************************
+
+    async def get_intents_coverage_request(self,
+                                     namespace: str,
+                                     playbook: str,
+                                     data_selection: int = 1,
+                                     model_id: str = None,
+                                     timeout: float = None):
+        '''Download a set of coverage histogram data at 0.5 confidence clip intervals
+        TODO: this is unvalidated in academy
+
+        data_selection values are:
+        DATA_TYPE_DEFAULT = 0
+        DATA_TYPE_ALL = 1
+        DATA_TYPE_UPLOADED = 2
+        DATA_TYPE_GENERATED = 3
+        '''
+
+        payload = {
+            "namespace": namespace,
+            "playbook": playbook,
+            "data_selection": data_selection
+        }
+
+        if model_id:
+            payload["model_id"] = model_id
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/coverage/latest'
+        effective_timeout = timeout if timeout is not None else self.timeout
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "report")
+
+    async def export_intents_coverage(self,
+                                namespace: str,
+                                playbook: str,
+                                model_id: str = None,
+                                confidence_threshold: int = 70, # This is the default in the GUI
+                                coverage_type: int = 1, # COVERAGE_TYPE_TOTAL
+                                data_selection: int = 1, # DATA_TYPE_ALL
+                                timeout: float = None
+                                ):
+        '''Get the coverage calculation at a certain clip returned as a csv file
+        This works the same as downloading the coverage report from the intents tab
+
+        coverage_type
+        COVERAGE_TYPE_UNIQUE = 0;
+        COVERAGE_TYPE_TOTAL = 1;
+
+        data_selection values are:
+        DATA_TYPE_DEFAULT = 0
+        DATA_TYPE_ALL = 1
+        DATA_TYPE_UPLOADED = 2
+        DATA_TYPE_GENERATED = 3
+        '''
+
+        payload = {}
+        if model_id:
+            payload["model_id"] = model_id
+
+        logger.info('PAYLOAD - %s ', payload)
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/coverage/latest/export'
+        params0 = f'?namespace={namespace}&playbook={playbook}&confidence_threshold={confidence_threshold}'
+        params1 = f'&coverage_type={coverage_type}&data_selection={data_selection}'
+        url = url + params0 + params1
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, wantcsv=True)
+
+
+    # *****************************************************************************************************************
+    # Conversation sets
+    # *****************************************************************************************************************
+
+    async def get_conversation_set_list(self,
+                                  namespace: str,
+                                  conversation_source_id: str = "",
+                                  timeout: float = None) -> tuple:
+        """Get all the conversation sets and their info for a namespaces"""
+
+        payload = {}
+        headers = await self._aget_headers()
+
+        query_params = f"namespace={namespace}&conversation_source_id={conversation_source_id}"
+
+        url = f"{self.base_url}/{self.api_version}/conversation_sets?{query_params}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=payload, timeout=effective_timeout)
+
+        return self._validate_response(response=response,url=url,field='conversationSets')
+
+    async def get_conversation_set_deep_report(self, namespace: str, timeout: float = None) -> tuple:
+        """Get all the conversation sets,
+        prepare a deep report which includes two pieces of additional summary boolean
+        information
+        is_data_folder_empty
+        no_data_file_uploaded_since_creation
+        To do this it will query individually each conversation set, which can take a while
+        in cases where there are a lot of conversationsets
+        
+        These are primarily to aid in finding conversation sets which can be deleted.
+        
+        This has now been replaced with the in tool (i) additional information on
+        Data managemnet subscription.
+        The intention is to depreciate this functionality
+        
+        TODO: check after release no-one is still using and delete
+        """
+
+        # Make the simple call
+        conversation_sets = await self.get_conversation_set_list(namespace=namespace, timeout=timeout)
+
+        # Enrich with the additional information by calling to get each's information
+        conversation_set_list = []
+        for conversation_set in conversation_sets:
+            conversation_set = await self.get_conversation_set(namespace=namespace,
+                                                         conversation_set_id=conversation_set['id'],
+                                                         timeout=timeout)
+
+            # carry over the legacy logic
+            if "state" in conversation_set.keys():
+                conversation_set["no_data_file_is_uploaded_since_creation"] = False
+                if (("jobsStatus" in conversation_set["state"].keys()) and
+                        ("jobs" in conversation_set["state"]["jobsStatus"].keys())):
+                    jobs_dict = {}
+                    jobs = conversation_set["state"]["jobsStatus"]["jobs"]
+                    range_end = range(len(jobs))
+                    for i in range_end:
+                        if jobs[i]["name"] in ["merged", "filtered", "indexed", "embedded"]:
+                            jobs_dict[jobs[i]["name"]] = jobs[i]
+                            del jobs_dict[jobs[i]["name"]]["name"]
+                    conversation_set["is_datafolder_empty"] = False
+                    conversation_set["state"]["jobsStatus"]["jobs"] = jobs_dict
+                else:
+                    conversation_set["is_datafolder_empty"] = True
+            else:
+                conversation_set["is_datafolder_empty"] = True
+                conversation_set["no_data_file_is_uploaded_since_creation"] = True
+            conversation_set_list.append(conversation_set)
+
+        return conversation_set_list
+
+    async def get_conversation_set(self, namespace: str, conversation_set_id: str, timeout: float = None) -> dict:
+        """Get conversation set"""
+
+        headers = await self._aget_headers()
+
+        payload = {}
+        url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}/{conversation_set_id}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=payload, timeout=effective_timeout)
+        return self._validate_response(response=response,url=url)
+
+    async def create_conversation_set(self, namespace: str, convoset_name: str, timeout: float = None) -> dict:
+        """Creates a conversation set. Returns conversation source ID"""
+
+        payload = {
+            "namespace": namespace,
+            "conversation_set":{
+                "name": convoset_name,
+                "description": ""
+            }
+        }
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        create_conversation_response = self._validate_response(response=response, url=url)
+        convo_set_id = create_conversation_response["id"]
+
+        # check whether conversation source has been created
+        # If not, then create one
+        get_convo_set_config_response = await self.get_conversation_set_configuration(namespace=namespace,
+                                                                                convoset_id=convo_set_id)
+
+        if "sources" in get_convo_set_config_response:
+            conversation_source_id = get_convo_set_config_response["sources"][0]["userUpload"]["conversationSourceId"]
+
+        else:
+            update_convo_set_config_response = await self.update_conversation_set_configuration(namespace=namespace,
+                                                                                          convoset_id=convo_set_id)
+
+            conversation_source_id=update_convo_set_config_response["sources"][0]["userUpload"]["conversationSourceId"]
+
+        return conversation_source_id
+
+    async def create_conversation_set_with_set_and_src_id(self,
+                                                    namespace: str,
+                                                    convoset_name: str,
+                                                    timeout: float = None) -> dict:
+        """Creates a conversation set. Returns both conversation set and source ID"""
+
+        payload = {
+            "namespace": namespace,
+            "conversation_set":{
+                "name": convoset_name,
+                "description": ""
+            }
+        }
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        create_conversation_response = self._validate_response(response=response, url=url)
+        convo_set_id = create_conversation_response["id"]
+
+        # check whether conversation source has been created
+        # If not, then create one
+        get_convo_set_config_response = await self.get_conversation_set_configuration(namespace=namespace,
+                                                                                convoset_id=convo_set_id)
+
+        if "sources" in get_convo_set_config_response:
+            conversation_source_id = get_convo_set_config_response["sources"][0]["userUpload"]["conversationSourceId"]
+
+        else:
+            update_convo_set_config_response = await self.update_conversation_set_configuration(namespace=namespace,
+                                                                                          convoset_id=convo_set_id)
+
+            conversation_source_id=update_convo_set_config_response["sources"][0]["userUpload"]["conversationSourceId"]
+
+        conversation_obj = {
+            "convoset_id": convo_set_id,
+            "convosrc_id": conversation_source_id
+        }
+
+        return conversation_obj
+
+    async def link_conversation_set(self, namespace: str, playbook_id: str, convoset_id: str,
+                                    timeout: float = None) -> dict:
+        """Link conversation sets"""
+
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook_id,
+            "conversation_sets": [{
+                "namespace": namespace,
+                "id": convoset_id
+            }]
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/conversation_sets/{namespace}:link'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    # TODO: Implement API to get the list of playbook ids a convoset is linked to
+    async def unlink_conversation_set(self,
+                                namespace: str,
+                                playbook_id: str,
+                                convoset_id: str,
+                                timeout: float = None) -> dict:
+        """Unlink conversation sets"""
+
+        # TODO: Unlink convoset from all the linked workspaces
+
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook_id,
+            "conversation_sets": [{
+                "namespace": namespace,
+                "id": convoset_id
+            }]
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/conversation_sets/{namespace}:unlink'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def delete_conversation_set(self, namespace: str, convoset_id: str, timeout: float = None) -> dict:
+        """Deletes a conversation_set"""
+
+        # TODO: A "force" boolean method parameter
+        #       when enabled, the convoset should be unlinked from all the workspaces and deleted
+
+        payload = {
+            "namespace": namespace,
+            "id": convoset_id
+        }
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}/{convoset_id}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response, url=url)
+
+    async def get_conversation_set_configuration(self, namespace: str, convoset_id: str, timeout: float = None) -> dict:
+        """Gets conversation set configuration"""
+
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}/{convoset_id}/config"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response, url=url)
+
+    async def list_conversation_src_files(self, namespace: str, conversation_set_src_id: str,
+                                          timeout: float = None) -> dict:
+        """Get the list of conversation files within a convo set."""
+
+        headers = await self._aget_headers()
+
+        payload = {}
+        url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_set_src_id}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=payload, timeout=effective_timeout)
+        return self._validate_response(response=response,url=url,field="files")
+
+    async def delete_conversation_file(self,
+                                 namespace:str,
+                                 conversation_set_src_id: str,
+                                 file_name:str,
+                                 timeout: float = None,
+                                 no_trigger: bool = False):
+        """Deletes a specific file within a convo set.
+        no_trigger=True prevents indexes from building if passed in case you want to delete
+        or upload additional files before triggering them.  If you use this you must 
+        upload or delete a final file with no_trigger=False (the default) otherwise the new data in 
+        your conversation set will not be available to other processes."""
+
+        headers = await self._aget_headers()
+
+        payload = {
+            "namespace":namespace,
+            "no_trigger": no_trigger, 
+            # TODO: debugging this should it be a string or a boolean?  json.dumps will change True to true, no quotes
+            "filename": file_name,
+            "conversation_source_id":conversation_set_src_id
+        }
+        url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_set_src_id}/{file_name}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response,url=url)
+
+    async def update_conversation_set_configuration(self, namespace: str, convoset_id: str,
+                                                    timeout: float = None) -> dict:
+        """Update conversation set configuration"""
+
+        payload = {
+            "namespace": namespace,
+            "id": convoset_id,
+            "config": {
+                "namespace": namespace,
+                "sources": [
+                    {
+                        "userUpload": {}
+                    }
+                ]
+            }
+        }
+
+        headers = await self._aget_headers()
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        url = f"{self.base_url}/{self.api_version}/conversation_sets/{namespace}/{convoset_id}/config"
+        response = await self._request(
+            "PUT", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response, url=url)
+
+    # *****************************************************************************************************************
+    # Prompt
+    # *****************************************************************************************************************
+
+    async def list_prompts(self, namespace: str, playbook_id: str, timeout: float = None) -> dict:
+        """Lists all prompts for a given playbook"""
+
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response, url=url)
+
+    async def get_prompt(self, namespace: str, playbook_id: str, prompt_id: str, timeout: float = None) -> dict:
+        """Lists specific prompts from a given playbook"""
+
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts/{prompt_id}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response, url=url)
+
+    async def delete_prompt(self,
+                    namespace:str,
+                    playbook_id: str,
+                    prompt_id: str,
+                    timeout: float = None):
+        """Deletes a specific prompt within a playbook"""
+
+        headers = await self._aget_headers()
+
+        payload = {}
+
+        url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts/{prompt_id}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "DELETE", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response=response,url=url)
+
+    async def create_prompt(self, namespace: str,
+                    playbook_id: str,
+                    contents: str,
+                    name: str = "Prompt",
+                    temperature: float = 1.0,
+                    top_p: float = 1.0,
+                    max_tokens: int = 0,
+                    stop_sequences: List[str] = None,
+                    frequency_penalty: float = 0.0,
+                    presence_penalty: float = 0.0,
+                    post_processing: int = 1,
+                    run_mode: int = 0,
+                    parent_id: Optional[str] = None,
+                    position: Optional[int] = None,
+                    metadata: Optional[Dict[str, Any]] = None,
+                    source: Optional[Dict[str, Any]] = None,
+                    post_processing_delimiter: Optional[str] = None,
+                    parameters: Optional[List[Dict[str, Any]]] = None,
+                    nlg_timeout: Optional[str] = None,
+                    timeout: Optional[float] = None) -> dict:
+        """
+        Create a prompt in a playbook.
+
+        Args:
+            namespace (str): Namespace of the playbook.
+            playbook_id (str): ID of the playbook.
+            contents (str): The content of the prompt.
+            name (str, optional): Name of the prompt.
+            temperature (float, optional): Sampling temperature used for randomness in generation.
+            top_p (float, optional): Nucleus sampling—tokens are considered from the top-p cumulative probability mass
+            max_tokens (int, optional): Maximum number of tokens to generate.
+            stop_sequences (List[str], optional): List of strings where the model will stop generating further tokens.
+            frequency_penalty (float,optional):Reduces likelihood of repeating tokens proportionally to their frequency
+            presence_penalty (float, optional): Increases likelihood of introducing new tokens not already present.
+            post_processing (int, optional): Post-processing strategy ID. Controls how the LLM output is transformed.
+                Values:
+                    0 - POSTPROCESSING_DEFAULT:
+                        Use the system's default post-processing (currently equivalent to NONE).
+                    1 - POSTPROCESSING_NONE:
+                        No post-processing applied; raw output is used as-is.
+                    2 - POSTPROCESSING_NEWLINES:
+                        Splits output on newlines. Each line becomes a separate input.
+                    3 - POSTPROCESSING_CONVERSATIONS:
+                        Expects lines like "User: ..." or "Agent: ..." and parses them as conversation turns.
+                    4 - POSTPROCESSING_KEY_VALUE:
+                        Parses "key: value" format into structured inputs with metadata key and content value.
+                    5 - POSTPROCESSING_DELIMITER:
+                        Splits the text using a custom delimiter defined via `post_processing_delimiter`.
+            post_processing_delimiter (str, optional):
+                Custom delimiter used when `post_processing` is set to 5 (DELIMITER).
+            run_mode (int, optional): How the prompt is executed:
+                1 - RUN_ONCE: Run on the entire stash.
+                2 - RUN_EACH_ITEM: Run on each stash item separately (default).
+            parent_id (str, optional): ID of a parent prompt, if this prompt is nested.
+            position (int, optional): Ordering position under the parent prompt or playbook.
+            metadata (dict, optional): Arbitrary metadata associated with the prompt.
+            source (dict, optional): Source information (e.g., if prompt was imported).
+            parameters (List[Dict], optional): List of parameter definitions used by the prompt.
+            nlg_timeout (str, optional):
+                Timeout for generation by the LLM, formatted as ISO 8601 durations (e.g., "3s", "1.5s").
+            timeout (float, optional): Request-level timeout for the HTTP request in seconds.
+
+
+        Returns:
+            dict: API response after validation.
+        """
+
+        payload = _create_prompt_payload(
+            namespace=namespace, playbook_id=playbook_id, contents=contents, name=name,
+            temperature=temperature, top_p=top_p, max_tokens=max_tokens, stop_sequences=stop_sequences,
+            frequency_penalty=frequency_penalty, presence_penalty=presence_penalty,
+            post_processing=post_processing, run_mode=run_mode, parent_id=parent_id, position=position,
+            metadata=metadata, source=source, post_processing_delimiter=post_processing_delimiter,
+            parameters=parameters, nlg_timeout=nlg_timeout)
+
+        headers = await self._aget_headers()
+        url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts"
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout
+        )
+        return self._validate_response(response=response, url=url)
+
+    async def update_prompt(self, namespace: str,
+                    playbook_id: str,
+                    prompt_id: str,
+                    update_mask: List[str],
+                    contents: Optional[str] = None,
+                    name: Optional[str] = None,
+                    temperature: float = 1.0,
+                    top_p: float = 1.0,
+                    max_tokens: int = 0,
+                    stop_sequences: List[str] = None,
+                    frequency_penalty: float = 0.0,
+                    presence_penalty: float = 0.0,
+                    post_processing: int = 1,
+                    run_mode: int = 0,
+                    parent_id: Optional[str] = None,
+                    position: Optional[int] = None,
+                    metadata: Optional[Dict[str, Any]] = None,
+                    source: Optional[Dict[str, Any]] = None,
+                    post_processing_delimiter: Optional[str] = None,
+                    parameters: Optional[List[Dict[str, Any]]] = None,
+                    nlg_timeout: Optional[str] = None,
+                    timeout: Optional[float] = None) -> dict:
+        """
+        Update a prompt in a playbook.
+
+        Args:
+            namespace (str): Namespace of the playbook.
+            playbook_id (str): ID of the playbook.
+            prompt_id (str): ID of the prompt to update.
+            contents (str): The content of the prompt.
+            name (str, optional): Name of the prompt.
+            temperature (float, optional):
+                Sampling temperature used for randomness in generation.
+            top_p (float, optional):
+                Nucleus sampling—tokens are considered from the top-p cumulative probability mass.
+            max_tokens (int, optional): Maximum number of tokens to generate.
+            stop_sequences (List[str], optional):
+                List of strings where the model will stop generating further tokens.
+            frequency_penalty (float, optional):
+                Reduces likelihood of repeating tokens proportionally to their frequency.
+            presence_penalty (float, optional): Increases likelihood of introducing new tokens not already present.
+            post_processing (int, optional): Post-processing strategy ID. Controls how the LLM output is transformed.
+                Values:
+                    0 - POSTPROCESSING_DEFAULT:
+                        Use the system's default post-processing (currently equivalent to NONE).
+                    1 - POSTPROCESSING_NONE:
+                        No post-processing applied; raw output is used as-is.
+                    2 - POSTPROCESSING_NEWLINES:
+                        Splits output on newlines. Each line becomes a separate input.
+                    3 - POSTPROCESSING_CONVERSATIONS:
+                        Expects lines like "User: ..." or "Agent: ..." and parses them as conversation turns.
+                    4 - POSTPROCESSING_KEY_VALUE:
+                        Parses "key: value" format into structured inputs with metadata key and content value.
+                    5 - POSTPROCESSING_DELIMITER:
+                        Splits the text using a custom delimiter defined via `post_processing_delimiter`.
+            run_mode (int, optional): How the prompt is executed:
+                1 - RUN_ONCE: Run on the entire stash.
+                2 - RUN_EACH_ITEM: Run on each stash item separately (default).
+            parent_id (str, optional): ID of a parent prompt, if this prompt is nested.
+            position (int, optional): Ordering position under the parent prompt or playbook.
+            metadata (dict, optional): Arbitrary metadata associated with the prompt.
+            source (dict, optional): Source information (e.g., if prompt was imported).
+            post_processing_delimiter (str, optional):
+                Custom delimiter used when `post_processing` is set to 5 (DELIMITER).
+            parameters (List[Dict], optional): List of parameter definitions used by the prompt.
+            nlg_timeout (str, optional):
+                Timeout for generation by the LLM, formatted as ISO 8601 durations (e.g., "3s", "1.5s").
+            timeout (float, optional): Request-level timeout for the HTTP request in seconds.
+            update_mask (List[str], optional): List of field paths to update (e.g.,
+                update_mask = ["name", "contents", "nlg_model_parameters.temperature", "nlg_model_parameters.top_p"])
+
+
+        Returns:
+            dict: API response after validation.
+        """
+        payload = _update_prompt_payload(
+            namespace=namespace, playbook_id=playbook_id, prompt_id=prompt_id, update_mask=update_mask,
+            contents=contents, name=name,
+            temperature=temperature, top_p=top_p, max_tokens=max_tokens, stop_sequences=stop_sequences,
+            frequency_penalty=frequency_penalty, presence_penalty=presence_penalty,
+            post_processing=post_processing, run_mode=run_mode, parent_id=parent_id, position=position,
+            metadata=metadata, source=source, post_processing_delimiter=post_processing_delimiter,
+            parameters=parameters, nlg_timeout=nlg_timeout)
+
+        headers = await self._aget_headers()
+        url = f"{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook_id}/prompts/{prompt_id}"
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "PUT",
+            url,
+            headers=headers,
+            data=json.dumps(payload),
+            timeout=effective_timeout
+        )
+
+        return self._validate_response(response=response, url=url)
+
+    # *****************************************************************************************************************
+    # Conversation Source - including add files
+    # *****************************************************************************************************************
+
+    # TODO: Reference conversation set id using conversation source id
+    #       Currently create_conversation_set method returns only conversation_source_id
+    #       Implemented a method which returns both convoset and convosrc ids
+    #       Meanwhile people who implemented create_conversation_set, need this todo to help them get the convoset id,
+    #       which then can be used to delete the set.
+    async def get_conversation_source(self, namespace: str, conversation_source_id: str, timeout: float = None) -> dict:
+        '''Download conversation set'''
+        payload = {
+            "namespace": namespace
+        }
+
+        headers = await self._aget_headers()
+
+        # /{self.api_version}/files/{namespace}/{conversation_source_id}/export
+        url = f'{self.base_url}/{self.api_version}/files/{namespace}/{conversation_source_id}/export'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
+        return self._validate_response(response, url, "playbooks")
+
+    async def upload_json_file_to_conversation_source(self, namespace: str,
+                                                conversation_source_id: str,
+                                                upload_name: str,
+                                                fqfp: str,
+                                                timeout: float = None,
+                                                no_trigger: bool = False) -> dict:
+        '''Upload a JSON file to a conversation source
+        no_trigger=True prevents indexes from building if passed in case you want to delete
+        or upload additional files before triggering them. If you use this you must 
+        upload or delete a final file with no_trigger=False (the default) otherwise the new data in 
+        your conversation set will not be available to other processes.'''
+
+        payload = {
+            "namespace": namespace
+        }
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_source_id}"
+
+        payload = _json_upload_encoder(upload_name=upload_name, fqfp=fqfp, no_trigger=no_trigger)
+
+        # This is the magic bit - you must set the content type to include the boundary information
+        # multipart encoder makes working these out easier
+        headers["Content-Type"] = payload.content_type
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=payload, timeout=effective_timeout)
+
+        return self._validate_response(response, url, "playbooks")
+
+    async def upload_csv_file_to_conversation_source(self,
+                                                namespace: str,
+                                                conversation_source_id: str,
+                                                upload_name: str,
+                                                fqfp: str,
+                                                *,
+                                                header_included: bool = True,
+                                                import_as_utterances: bool = False,
+                                                id_column: int = None,
+                                                date_column: int = None,
+                                                date_format: str = 'UNIX_TIMESTAMP_MS',
+                                                source_column: int = None,
+                                                client_name: str = '',
+                                                agent_name: str = '',
+                                                text_column: int = 0,
+                                                metadata_columns: list[int] = None,
+                                                delimiter: str = ',',
+                                                timeout: float = None,
+                                                no_trigger: bool = False) -> dict:
+        '''Upload a CSV file to a conversation source
+        no_trigger=True prevents indexes from building if passed in case you want to delete
+        or upload additional files before triggering them. If you use this you must 
+        upload or delete a final file with no_trigger=False (the default) otherwise the new data in 
+        your conversation set will not be available to other processes.
+        
+        Date Format Options (for `date_format` in IMPORT_FORMAT_SIMPLE_CSV):
+        • UNIX_TIMESTAMP_MS          - 0 - Milliseconds since the Unix epoch.
+        • UNIX_TIMESTAMP_SEC         - 1 - Seconds since the Unix epoch.
+        • DATE_TIME_YEAR_FIRST       - 2 - “YYYY-MM-DD” style date strings.
+        • DATE_TIME_MONTH_FIRST      - 3 - “MM-DD-YYYY” style date strings.
+        • DATE_TIME_SLASH_MONTH_FIRST- 4 - “MM/DD/YYYY” style date strings.
+        • RFC3339                    - 5 - Full RFC3339 timestamp strings
+                                        (e.g. “2025-06-11T14:23:00Z”).
+                
+        
+        Supports both gzipped and non-gziped CSV files.
+        '''
+
+        payload = _csv_upload_encoder(upload_name=upload_name, fqfp=fqfp,
+                                      header_included=header_included, import_as_utterances=import_as_utterances,
+                                      id_column=id_column, date_column=date_column, date_format=date_format,
+                                      source_column=source_column, client_name=client_name, agent_name=agent_name,
+                                      text_column=text_column, metadata_columns=metadata_columns,
+                                      delimiter=delimiter, no_trigger=no_trigger)
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_source_id}"
+
+        # This is the magic bit - you must set the content type to include the boundary information
+        # multipart encoder makes working these out easier
+        headers["Content-Type"] = payload.content_type
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=payload, timeout=effective_timeout)
+        return self._validate_response(response, url, "playbooks")
+
+    async def upload_doc_file_to_conversation_source(self, namespace: str,
+                                                conversation_source_id: str,
+                                                upload_name: str,
+                                                fqfp: str,
+                                                timeout: float = None,
+                                                no_trigger: bool = False) -> dict:
+        '''Upload a document file to a conversation source
+        no_trigger=True prevents indexes from building if passed in case you want to delete
+        or upload additional files before triggering them. If you use this you must 
+        upload or delete a final file with no_trigger=False (the default) otherwise the new data in 
+        your conversation set will not be available to other processes.
+        
+        Does not support Gzipped data
+        '''
+        payload = {
+            "namespace": namespace
+        }
+
+        headers = await self._aget_headers()
+
+        url = f"{self.base_url}/{self.api_version}/files/{namespace}/{conversation_source_id}"
+
+        upload_file = open(fqfp, 'rb')
+        if no_trigger:
+            str_no_trigger = "true"
+        else:
+            str_no_trigger = "false"
+        import requests_toolbelt # pylint: disable=import-outside-toplevel
+        payload = requests_toolbelt.multipart.encoder.MultipartEncoder(
+        fields={
+            'format': 'IMPORT_FORMAT_DOCUMENT',
+            'no_trigger': str_no_trigger, 
+            # seem to remember there is a problem with encoding multiple fields in the
+            # toolbelt multipart encoder but this seems effective during testing
+            # this is present where the values are subobjects, but this is top level so seems OK?
+            'file': (upload_name, upload_file)}
+        )
+        # This is the magic bit - you must set the content type to include the boundary information
+        # multipart encoder makes working these out easier
+        headers["Content-Type"] = payload.content_type
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=payload, timeout=effective_timeout)
+        upload_file.close()
+        return self._validate_response(response, url, "playbooks")
+
+    # *****************************************************************************************************************
+    # Querying Processed Conversation set data
+    # *****************************************************************************************************************
+
+    async def query_conversation_set(
+            self,
+            namespace: str,
+            workspace: str,
+            search_text: str = "",
+            page_size: int = 10,
+            convsetsource: str = "",
+            next_page_token: str = "",
+            start_isodate: str = '1970-01-01T00:00:00Z',
+            end_isodate: str = '2049-12-31T23:59:59Z',
+            timeout: float = None
+            ) -> dict:
+        '''This will seach a converation set for converations and return
+        the examples threaded along with their data like entropy, margin
+        the nearest neighbour weights, the classifications and original
+        inputs - on ABCD 20 conversations returns about 28k rows formatted'''
+        payload = _query_conversation_set_payload(search_text=search_text,
+                                                  page_size=page_size,
+                                                  convsetsource=convsetsource,
+                                                  next_page_token=next_page_token,
+                                                  start_isodate=start_isodate,
+                                                  end_isodate=end_isodate)
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/conversations/{namespace}/{workspace}/query'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
+        return self._validate_response(response, url)
+
+    async def iter_query_conversation_set(
+            self,
+            namespace: str,
+            workspace: str,
+            search_text: str = "",
+            page_size: int = 10,
+            convsetsource: str = "",
+            start_isodate: str = '1970-01-01T00:00:00Z',
+            end_isodate: str = '2049-12-31T23:59:59Z',
+            timeout: float = None,
+            max_pages: int = None,
+            yield_pages: bool = False,
+            prefetch: bool = True
+            ) -> AsyncIterator[dict]:
+        '''Async generator over every result of query_conversation_set following next page tokens
+
+        Yields each result of each page, or each whole page if yield_pages is True.
+        Only the current page and the next one are held in memory at once.
+        With prefetch the next page is requested while the caller processes the current page.
+        max_pages stops after that many pages'''
+
+        async def fetch(page_token: str) -> dict:
+            return await self.query_conversation_set(namespace=namespace,
+                                                     workspace=workspace,
+                                                     search_text=search_text,
+                                                     page_size=page_size,
+                                                     convsetsource=convsetsource,
+                                                     next_page_token=page_token,
+                                                     start_isodate=start_isodate,
+                                                     end_isodate=end_isodate,
+                                                     timeout=timeout)
+
+        task = None
+        try:
+            page = await fetch("")
+            pages = 1
+            while True:
+                next_page_token = _query_next_page_token(page, pages, max_pages)
+                if next_page_token and prefetch:
+                    task = asyncio.create_task(fetch(next_page_token))
+
+                if yield_pages:
+                    yield page
+                else:
+                    for result in page.get(QUERY_RESULTS_FIELD, []):
+                        yield result
+
+                if not next_page_token:
+                    break
+                page = await task if task else await fetch(next_page_token)
+                task = None
+                pages = pages + 1
+                logger.debug('Fetched conversation query page %s', pages)
+        finally:
+            if task:
+                task.cancel()
+
+    async def query_conversation_set_to_jsonl(self,
+                                              output_path: str,
+                                              namespace: str,
+                                              workspace: str,
+                                              **kwargs) -> int:
+        '''Write every result of a conversation query to output_path as one JSON object per line
+        without holding the conversation set in memory
+
+        Accepts the same keyword arguments as iter_query_conversation_set
+        Returns the number of lines written'''
+
+        written = 0
+        with open(output_path, mode="w", encoding="utf8") as file_out:
+            async for result in self.iter_query_conversation_set(namespace=namespace, workspace=workspace, **kwargs):
+                file_out.write(json.dumps(result))
+                file_out.write("\n")
+                written = written + 1
+        logger.info('Wrote %s conversation query results to %s', written, output_path)
+        return written
+
+    async def export_query_conversation_inputs(
+            self,
+            namespace: str,
+            playbook_id: str,
+            pipeline_id: str = "",
+            pipeline_step_id: str = "",
+            exists_filter_key_name: str = "",
+            metadata_predicate: list[dict] = None,
+            download_format: int = 1, # 1 = JSON 2 = CSV
+            prompt_id: str = "",
+            generation_run_id: str = "",
+            order_by: int = 1,
+            order_direction_asc: bool = True,
+            dedup_by_hash: bool = False,
+            dedup_by_convo: bool = False,
+            exclude_phrase_objects: bool = True, # TODO: unclear why this is set
+            source_kind: int = 2, # DEFAULT TO GENERATED
+            source: int = 1, # DEFAULT to "client" - i.e get the client utterances
+            timeout: float = None,
+            output = None,
+            chunk_size: int = DOWNLOAD_CHUNK_SIZE
+            ) -> Union[dict, str, int]:
+        '''Returns the generated data as as JSON or a as a
+        CSV text file
+
+        If output, a file path or a binary file object, is given the export is streamed
+        to it chunk_size bytes at a time instead of being loaded into memory
+        and the number of bytes written is returned.
+        To process the records without writing them use iter_export_query_conversation_inputs
+        
+        By default waits for the new index to be available if
+        one is being downloaded at the moment it is called
+
+        source_kind
+        SOURCE_KIND_UNSPECIFIED = 0;
+        SOURCE_KIND_UNLABELED = 1;
+        SOURCE_KIND_GENERATED = 2;
+        
+        source
+        -1 removes this predicate in this SDK
+        INVALID = 0;
+        CLIENT = 1;
+        EXPERT = 2;
+
+        metadata_predicate
+        [
+            {
+                "key": "INSERT_KEY_NAME",
+                "operator": "EQUALS|NOT_EQUALS|CONTAINS|NOT_CONTAINS|KEY_EXISTS|KEY_NOT_EXISTS|KEY_MATCHES|ANY",
+                "value": "VALUE|''"
+            },
+            #other filters..
+        ]
+        '''
+
+
+        payload = _export_query_conversation_inputs_payload(
+            namespace=namespace, playbook_id=playbook_id, pipeline_id=pipeline_id,
+            pipeline_step_id=pipeline_step_id, exists_filter_key_name=exists_filter_key_name,
+            metadata_predicate=metadata_predicate, download_format=download_format, prompt_id=prompt_id,
+            generation_run_id=generation_run_id, order_by=order_by, order_direction_asc=order_direction_asc,
+            dedup_by_hash=dedup_by_hash, dedup_by_convo=dedup_by_convo,
+            exclude_phrase_objects=exclude_phrase_objects, source_kind=source_kind, source=source)
+
+        downloadable_url = await self._export_query_conversation_inputs_url(payload, timeout)
+        return await self._download_file_from_url(downloadable_url, download_format, output=output,
+                                                  chunk_size=chunk_size)
+
+    async def iter_export_query_conversation_inputs(
+            self,
+            namespace: str,
+            playbook_id: str,
+            pipeline_id: str = "",
+            pipeline_step_id: str = "",
+            exists_filter_key_name: str = "",
+            metadata_predicate: list[dict] = None,
+            download_format: int = 1, # 1 = JSON 2 = CSV
+            prompt_id: str = "",
+            generation_run_id: str = "",
+            order_by: int = 1,
+            order_direction_asc: bool = True,
+            dedup_by_hash: bool = False,
+            dedup_by_convo: bool = False,
+            exclude_phrase_objects: bool = True,
+            source_kind: int = 2,
+            source: int = 1,
+            timeout: float = None,
+            chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+            json_field: str = None
+            ) -> AsyncIterator[dict]:
+        '''Async generator over the records of export_query_conversation_inputs parsed as they download
+
+        Takes the same filters as export_query_conversation_inputs.
+        JSON exports yield the items of the top level array, or of every array value of the
+        top level object - json_field restricts this to a single key.
+        CSV exports yield one dict per row keyed by the header row.
+        Memory stays flat however large the export is'''
+
+        payload = _export_query_conversation_inputs_payload(
+            namespace=namespace, playbook_id=playbook_id, pipeline_id=pipeline_id,
+            pipeline_step_id=pipeline_step_id, exists_filter_key_name=exists_filter_key_name,
+            metadata_predicate=metadata_predicate, download_format=download_format, prompt_id=prompt_id,
+            generation_run_id=generation_run_id, order_by=order_by, order_direction_asc=order_direction_asc,
+            dedup_by_hash=dedup_by_hash, dedup_by_convo=dedup_by_convo,
+            exclude_phrase_objects=exclude_phrase_objects, source_kind=source_kind, source=source)
+
+        downloadable_url = await self._export_query_conversation_inputs_url(payload, timeout)
+        async for record in self._iter_records_from_url(downloadable_url, download_format,
+                                                        chunk_size=chunk_size, json_field=json_field):
+            yield record
+
+    async def _export_query_conversation_inputs_url(self, payload: dict, timeout: float = None) -> str:
+        """Request an export and return the url to download it from"""
+
+        headers = await self._aget_headers()
+
+        base_url = f'{self.base_url}/'
+        args_url = f'{self.api_version}/conversations/query/inputs/export'
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout, idempotent=True)
+        res = self._validate_response(response, url)
+        return f'{self.base_url}{res["exportUrlPath"]}'
+
+    async def _download_file_from_url(self, url: str, download_format: int, timeout: float = None,
+                                output = None, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Union[dict, str, int]:
+        """Download file from url
+
+        If output is given stream the file into it and return the number of bytes written"""
+        headers = await self._aget_headers()
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        if output is not None:
+            written = 0
+            # pylint: disable-next=consider-using-with
+            file_out = output if hasattr(output, "write") else open(output, mode="wb")
+            try:
+                async with self._stream("GET", url, headers=headers, timeout=effective_timeout) as response:
+                    if response.status_code not in (200, 201):
+                        await response.aread()
+                        raise HFAPIResponseValidationException(url=url, response=response)
+                    async for chunk in self._iter_chunks(response, chunk_size):
+                        file_out.write(chunk)
+                        written = written + len(chunk)
+            finally:
+                if file_out is not output:
+                    file_out.close()
+            logger.info('Downloaded %s bytes from %s', written, url)
+            return written
+
+        downloaded_json = await self._request("GET", url, headers=headers, timeout=effective_timeout)
+        if download_format == 1: #JSON
+            return downloaded_json.json()
+        elif download_format == 2: #CSV
+            return downloaded_json.text
+        else:
+            raise RuntimeError(f'Unrecognised download format: {download_format}')
+
+    async def _iter_records_from_url(self, url: str, download_format: int, timeout: float = None,
+                               chunk_size: int = DOWNLOAD_CHUNK_SIZE, json_field: str = None) -> AsyncIterator[dict]:
+        """Stream a JSON or CSV file from url yielding its records as they arrive"""
+        headers = await self._aget_headers()
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        records = _record_stream(download_format, json_field)
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        async with self._stream("GET", url, headers=headers, timeout=effective_timeout) as response:
+            if response.status_code not in (200, 201):
+                await response.aread()
+                raise HFAPIResponseValidationException(url=url, response=response)
+            async for chunk in self._iter_chunks(response, chunk_size):
+                for record in records.feed(decoder.decode(chunk)):
+                    yield record
+            for record in records.feed(decoder.decode(b"", final=True), final=True):
+                yield record
+
+
+
+
+    # *****************************************************************************************************************
+    # Integrations
+    # *****************************************************************************************************************
+
+    async def get_integrations(self, namespace: str, timeout: float = None):
+        '''Returns all the integrations configured for a namespace'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/integrations/{namespace}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "integrations")
+
+    async def get_integration_workspaces(self, namespace: str, integration_id: str, timeout: float = None):
+        '''Get the integration workspaces for an integration
+        i.e call the integration in HF to detect in the integrated NLU
+        what target/source workspaces there are.
+        i.e in DF case find out what agents there are to import data from'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/integration_workspaces/{namespace}/{integration_id}/workspaces'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "workspaces")
+
+    async def trigger_import_from_df_cx_integration(
+            self,
+            namespace: str,
+            playbook: str,
+            integration_id: str,
+            integration_workspace_id: str,
+            project: str,
+            region: str,
+            integration_language: str,
+            bidirectional_merge: bool = False,
+            hierarchical_intent_name_disabled: bool = True,
+            hierarchical_delimiter: str = '--',
+            zip_encoding: bool = False,
+            gzip_encoding: bool = False,
+            include_negative_phrases: bool = False,
+            skip_empty_intents: bool = True,
+            clear_intents: bool = False,
+            clear_entities: bool = False,
+            clear_tags: bool = False,
+            merge_intents: bool = False,
+            merge_entities: bool = False,
+            merge_tags: bool = False,
+            extra_intent_tags: list = None,
+            extra_phrase_tags: list = None,
+            timeout: float = None
+        ):
+        '''Triggers import of the wrokspace from the selected integration'''
+        payload = _df_cx_import_payload(
+            namespace=namespace, playbook=playbook, integration_id=integration_id,
+            integration_workspace_id=integration_workspace_id, project=project, region=region,
+            integration_language=integration_language, bidirectional_merge=bidirectional_merge,
+            hierarchical_intent_name_disabled=hierarchical_intent_name_disabled,
+            hierarchical_delimiter=hierarchical_delimiter, zip_encoding=zip_encoding, gzip_encoding=gzip_encoding,
+            include_negative_phrases=include_negative_phrases, skip_empty_intents=skip_empty_intents,
+            clear_intents=clear_intents, clear_entities=clear_entities, clear_tags=clear_tags,
+            merge_intents=merge_intents, merge_entities=merge_entities, merge_tags=merge_tags,
+            extra_intent_tags=extra_intent_tags, extra_phrase_tags=extra_phrase_tags)
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/integration_workspaces/{namespace}/{integration_id}/workspaces/{integration_workspace_id}/import' # pylint: disable=line-too-long
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload),timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+
+    # *****************************************************************************************************************
+    # Evaluations
+    # *****************************************************************************************************************
+
+    async def get_evaluation_presets(self, namespace: str, playbook: str, timeout: float = None):
+        '''Get the presets to find the evaluation_preset_id to run an evaluation'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/playbooks/{namespace}/{playbook}/presets'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, "presets")
+
+    async def trigger_preset_evaluation(
+                self,
+                namespace: str,
+                playbook: str,
+                evaluation_preset_id: str,
+                name: str = '',
+                timeout: float = None):
+        '''Start an evaluation based on a preset'''
+        if name == '':
+            name = f'API triggered: {datetime.datetime.now()}'
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook,
+            "params": {
+                "evaluation_preset_id": evaluation_preset_id
+            },
+            "name": name
+        }
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/workspaces/{namespace}/{playbook}/evaluations'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def get_evaluation_report(self, namespace: str, playbook: str, evaluation_id: str,
+                                    timeout: float = None) -> dict:
+        '''Get the evaluation report as zip'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        base_url = f'{self.base_url}/{self.api_version}/workspaces'
+        args_url = f'/{namespace}/{playbook}/evaluations/{evaluation_id}/report.zip'
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+
+        return self._validate_response(response=response, url=url, wantzip=True)
+
+    async def get_evaluation_summary(self, namespace: str, playbook: str, evaluation_id: str,
+                                     timeout: float = None) -> dict:
+        '''Get the evaluation summary as json'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        base_url = f'{self.base_url}/{self.api_version}/workspaces'
+        args_url = f'/{namespace}/{playbook}/evaluations/{evaluation_id}'
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+
+        return self._validate_response(response=response,url=url)
+
+    async def list_evaluations(self, namespace: str, playbook: str, timeout: float = None) -> dict:
+        '''List all evaluations in the given playbook'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        base_url = f'{self.base_url}/{self.api_version}/workspaces'
+        args_url = f'/{namespace}/{playbook}/evaluations'
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+
+        return self._validate_response(response=response,url=url)
+
+    async def get_intent_results(self,
+                           namespace: str,
+                           playbook: str,
+                           evaluation_id: str,
+                           intent_id: str,
+                           timeout: float = None) -> dict:
+        '''Get a list of training phrases that were evaluated'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        base_url = f'{self.base_url}/{self.api_version}/workspaces'
+        args_url = f'/{namespace}/{playbook}/evaluations/{evaluation_id}/{intent_id}'
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+
+        return self._validate_response(response=response,url=url)
+
+
+    # *****************************************************************************************************************
+    # Subscriptions
+    # *****************************************************************************************************************
+
+    async def get_plan(self, timeout: float = None):
+        '''Get the plan for a subscription'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/subscriptions/plan'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def get_usage(self, timeout: float = None):
+        '''Get the usage for a subscription'''
+        payload = {}
+
+        headers = await self._aget_headers()
+
+        url = f'{self.base_url}/{self.api_version}/subscriptions/usage'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    # *****************************************************************************************************************
+    # Pipeline
+    # *****************************************************************************************************************
+
+    async def describe_trigger(self, namespace: str, trigger_id: str, timeout: float = None):
+        """Describe Trigger"""
+        payload = {}
+
+        headers = await self._aget_headers()
+        url = f'{self.base_url}/{self.api_version}/triggers/{namespace}/{trigger_id}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def trigger_playbook_pipeline(self,
+                                  namespace: str,
+                                  playbook_id: str,
+                                  pipeline_id: str,
+                                  timeout: float = None) -> dict:
+        '''Triggers a pipeline'''
+        payload = {
+            "namespace": namespace,
+            "playbook_id": playbook_id,
+            "pipeline_id": pipeline_id
+        }
+
+        headers = await self._aget_headers()
+        base_url = f'{self.base_url}/{self.api_version}/playbooks'
+        args_url = f"/{namespace}/{playbook_id}/pipelines/{pipeline_id}:trigger"
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "POST", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url)
+
+    async def list_playbook_pipelines(self,
+                                namespace: str,
+                                playbook_id: str,
+                                timeout: float = None) -> dict:
+        '''List pipelines for a playbook'''
+        payload = ()
+
+        headers = await self._aget_headers()
+        base_url = f'{self.base_url}/{self.api_version}/playbooks'
+        args_url = f"/{namespace}/{playbook_id}/pipelines"
+        url = f'{base_url}{args_url}'
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+
+        response = await self._request(
+            "GET", url, headers=headers, data=json.dumps(payload), timeout=effective_timeout)
+        return self._validate_response(response, url, field="pipelines")
+
+    async def loop_trigger_check(self,
+                            namespace: str,
+                            trigger_id: str,
+                            timeout: int = 120,
+                            wait_seconds_between_loops: int = 1,
+                            exponential_factor: int = 1,
+                            max_loops: int = 240,
+                            ) -> int:
+        """Loops round checking a trigger ID
+        
+        Will keep checking until timeout time has elapsed whilst receiving one of
+        TRIGGER_STATUS_PENDING (waiting to run)
+        TRIGGER_STATUS_RUNNING (running)
+        
+        If this status changes to 
+        TRIGGER_STATUS_FAILED or
+        TRIGGER_STATUS_CANCELLED or
+        TRIGGER_STATUS_UNKNOWN
+        it will return -1 representing an error
+        
+        if it receives TRIGGER_STATUS_COMPLETED it will return the total time in seconds min 1 as an integer 
+        that it took to reach this state (active time and wait time included - so may be different to number of loops)
+        if it reaches it's max number of loops value before receiving an error or success state it will return 0
+        
+        Between each loop it waits the amount of time last waited times the exponential_factor
+        for an exponential backoff option.
+        
+        By default this is 1 so it will wait the same amount of time each loop,
+        set it to 2 for instance to wait twice as long each loop.
+
+        Default wait is 1 second, exponential backoff, max default loops is 240 with an api timeout of 120s
+        so it will wait at least 4 minutes
+        Plus any API call time.
+        
+        """
+        start = time.perf_counter()
+        loops = 0
+        done = False
+        wait = wait_seconds_between_loops
+        while done is False:
+            # wait if not the first loop
+            if loops > 0:
+                await asyncio.sleep(wait)
+
+            # Call the api
+            trigger_response = await self.describe_trigger(namespace=namespace,trigger_id=trigger_id,timeout=timeout)
+
+            # produce a summary
+            summary = _trigger_summary(trigger_response)
+
+            # increment counter
+            loops = loops + 1
+
+            # increase the wait if necessary
+            wait = wait * exponential_factor
+
+            # Calculate total time to date and add it to summary
+            summary["duration"] = round(time.perf_counter() - start,2)
+
+            # success
+            if summary["status"] == TRIGGER_STATUS_COMPLETED:
+                logger.info('%s', summary)
+                done = True
+                break
+
+            # failure or cancelled
+            if summary["status"] in [TRIGGER_STATUS_UNKNOWN,TRIGGER_STATUS_CANCELLED,TRIGGER_STATUS_FAILED]:
+                logger.error('%s', summary)
+                return -1
+
+            # Log at info if waiting
+            logger.info('%s', summary)
+
+            # timed out
+            if loops > max_loops:
+                break
+
+        if done:
+            return int(math.ceil(summary["duration"]))
+        else:
+            # timed out return 0
+            return 0
+
+
+def _release_on_aclose(response: "httpx.Response", limiter, ticket: int):
+    """Free the rate limiter slot of a streamed response when it is closed, once however often aclose is called"""
+    aclose = response.aclose
+    released = []
+
+    async def aclose_and_release():
+        try:
+            await aclose()
+        finally:
+            if not released:
+                released.append(True)
+                limiter.release(ticket, response.status_code)
+
+    response.aclose = aclose_and_release
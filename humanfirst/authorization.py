@@ -10,18 +10,27 @@ Manages HF authorization
 import json
 import time
 import os
+import re
+import threading
+import contextlib
 from configparser import ConfigParser
 import logging
-import logging.config
 from datetime import datetime, timezone # pylint:disable=unused-import
 
 # 3rd Party imports
 import requests
-import jwt
-from jwt import ExpiredSignatureError, InvalidTokenError, DecodeError
-from jwt.algorithms import RSAAlgorithm
 from dotenv import load_dotenv, find_dotenv
-
+# jwt and the cryptography backend it loads are imported where used as API key users never need them
+try:
+    import fcntl
+    msvcrt = None # pylint: disable=invalid-name
+except ImportError: # pragma: no cover - windows
+    fcntl = None # pylint: disable=invalid-name
+    import msvcrt # pylint: disable=import-error
+
+# custom imports
+from .logging_config import configure_logging
+from .metrics import TokenEvent, call_hooks
 
 # locate where we are
 here = os.path.abspath(os.path.dirname(__file__))
@@ -44,6 +53,7 @@ TEST_AUDIENCE = constants.get("humanfirst.CONSTANTS","TEST_AUDIENCE")
 
 # Google serts
 GOOGLE_CERTS_URL = constants.get("humanfirst.CONSTANTS","GOOGLE_CERTS_URL")
+GOOGLE_CERTS_DEFAULT_MAX_AGE = int(constants.get("humanfirst.CONSTANTS","GOOGLE_CERTS_DEFAULT_MAX_AGE"))
 
 # API keys (which are validated by config call)
 TEST_SIGN_IN_API_KEY = constants.get("humanfirst.CONSTANTS","TEST_SIGN_IN_API_KEY")
@@ -66,77 +76,11 @@ TOKEN_REVALIDATE_WAIT_TIME = float(constants.get("humanfirst.CONSTANTS","TOKEN_R
 # token refresh
 PREEMPTIVE_REFRESH_SECONDS_DEFAULT = int(constants.get("humanfirst.CONSTANTS","PREEMPTIVE_REFRESH_SECONDS_DEFAULT"))
 HUMANFIRST_TOKEN_TTL_SECONDS = int(constants.get("humanfirst.CONSTANTS","HUMANFIRST_TOKEN_TTL_SECONDS"))
+BACKGROUND_REFRESH_MARGIN_SECONDS = float(constants.get("humanfirst.CONSTANTS","BACKGROUND_REFRESH_MARGIN_SECONDS"))
+BACKGROUND_REFRESH_MIN_SHARE = float(constants.get("humanfirst.CONSTANTS","BACKGROUND_REFRESH_MIN_SHARE"))
 
-# locate where we are
-path_to_log_config_file = os.path.join(here,'config','logging.conf')
-
-# Get the current date and time
-current_datetime = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-# Create the log file name with the current datetime
-log_filename = f"log_{current_datetime}.log" # pylint:disable=invalid-name
-
-# Decide whether to save logs in a file or not
-log_file_enable = os.environ.get("HF_LOG_FILE_ENABLE")
-
-log_handler_list = []
-
-if log_file_enable == "TRUE":
-    log_handler_list.append('rotatingFileHandler')
-elif log_file_enable == "FALSE" or log_file_enable is None:
-    pass
-else:
-    raise RuntimeError("Incorrect HF_LOG_FILE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
-
-log_defaults = {}
-
-# get log directory if going to save the logs
-if log_file_enable == "TRUE":
-    log_dir = os.environ.get("HF_LOG_DIR")
-    if log_dir:
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        path_to_save_log = os.path.join(log_dir,log_filename)
-    else:
-        raise RuntimeError("Require Log directory environment variable set up - HF_LOG_DIR")
-else:
-    # avoid logging to a file
-    path_to_save_log = '/dev/null'  # On Linux/MacOS, this discards logs (Windows: NUL) pylint:disable=invalid-name
-log_defaults['HF_LOG_FILE_PATH'] = path_to_save_log
-
-# Decide whether to print the logs in the console or not
-log_console_enable = os.environ.get("HF_LOG_CONSOLE_ENABLE")
-
-if log_console_enable == "TRUE":
-    log_handler_list.append('consoleHandler')
-elif log_console_enable == "FALSE" or log_console_enable is None:
-    pass
-else:
-    raise RuntimeError("Incorrect HF_LOG_CONSOLE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
-
-if log_handler_list:
-    log_defaults['HF_LOG_HANDLER'] = ",".join(log_handler_list)
-else:
-    log_defaults['HF_LOG_HANDLER'] = "nullHandler"
-
-
-# Set log levels
-log_level = os.environ.get("HF_LOG_LEVEL")
-if log_level is not None:
-    # set log level
-    if log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-        raise RuntimeError("Incorrect log level. Should be - 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'")
-
-    log_defaults['HF_LOG_LEVEL'] = log_level
-else:
-    log_defaults['HF_LOG_LEVEL'] = 'INFO' # default level
-
-
-# Load logging configuration
-logging.config.fileConfig(
-    path_to_log_config_file,
-    defaults=log_defaults
-)
+# configure logging for the SDK - only the first module imported does this
+configure_logging()
 
 # create logger
 logger = logging.getLogger('humanfirst.authorization')
@@ -165,6 +109,134 @@ class HFCredentialNotAvailableException(Exception):
         super().__init__(self.message)
 
 
+
+class JWKSCache:
+    """Cache of Google's public signing keys keyed by kid
+
+    Keys are kept for the Cache-Control max-age Google returns them with and are parsed
+    into RSA public keys once, so validating a token with a known kid needs no network call.
+    One cache is shared by every Authorization in the process unless another is passed in.
+    """
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL, default_max_age: int = GOOGLE_CERTS_DEFAULT_MAX_AGE):
+        self.url = url
+        self.default_max_age = default_max_age
+        self.keys = {}
+        self.expires_at = 0.0
+        self.fetch_count = 0
+        self.lock = threading.Lock()
+
+    def get_key(self, key_id: str, session: requests.Session, timeout: float = None):
+        """Return the public key for key_id
+
+        The keys are only fetched again once they have expired or when key_id is unknown,
+        which happens when Google rotates its keys"""
+
+        with self.lock:
+            if key_id not in self.keys or time.monotonic() >= self.expires_at:
+                self._fetch(session, timeout)
+            if key_id not in self.keys:
+                raise HFAPIAuthException("Invalid token header. No matching key found.")
+            return self.keys[key_id]
+
+    def clear(self):
+        """Drop all cached keys"""
+        with self.lock:
+            self.keys = {}
+            self.expires_at = 0.0
+
+    def _fetch(self, session: requests.Session, timeout: float = None):
+        import jwt.algorithms # pylint: disable=import-outside-toplevel
+
+        response = session.get(self.url, timeout=timeout)
+        if response.status_code != 200:
+            raise HFAPIAuthException(f"Failed to get Google public keys. Status code: {response.status_code}")
+
+        keys = {}
+        for key in response.json()["keys"]:
+            keys[key["kid"]] = jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(key))
+
+        max_age = self.default_max_age
+        match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+        if match:
+            max_age = int(match.group(1))
+
+        self.keys = keys
+        self.expires_at = time.monotonic() + max_age
+        self.fetch_count = self.fetch_count + 1
+        logger.debug("Fetched %s Google public keys cached for %ss", len(keys), max_age)
+
+
+# shared by all Authorization objects in the process
+google_jwks_cache = JWKSCache()
+
+
+
+class TokenFileCache:
+    """Tokens shared by every process on a host through a JSON file guarded by a file lock
+
+    Records are keyed by environment and username and hold the token, refresh token and
+    the wall clock time the token expires. The file is only readable by its owner."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+
+    @contextlib.contextmanager
+    def lock(self):
+        """Hold the cache exclusively across processes, reentrant within a thread"""
+
+        with self.thread_lock:
+            if self.depth > 0:
+                self.depth = self.depth + 1
+                try:
+                    yield
+                finally:
+                    self.depth = self.depth - 1
+                return
+
+            directory = os.path.dirname(os.path.abspath(self.lock_path))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.lock_path, mode="a+b") as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                else: # pragma: no cover - windows
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                self.depth = 1
+                try:
+                    yield
+                finally:
+                    self.depth = 0
+                    if fcntl:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    else: # pragma: no cover - windows
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read_all(self) -> dict:
+        try:
+            with open(self.path, mode="r", encoding="utf8") as file_in:
+                return json.load(file_in)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def read(self, key: str) -> dict:
+        """The record stored for key or None"""
+        return self._read_all().get(key)
+
+    def write(self, key: str, record: dict):
+        """Store the record for key, replacing the file atomically"""
+
+        records = self._read_all()
+        records[key] = record
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        file_descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, mode="w", encoding="utf8") as file_out:
+            json.dump(records, file_out)
+        os.replace(temp_path, self.path)
+
+
 class Authorization:
     """HF Authorization"""
 
@@ -178,14 +250,38 @@ class Authorization:
                  password: str = "",
                  environment: str = "",
                  timeout: float = TIMEOUT,
-                 min_expires_in_seconds: int = PREEMPTIVE_REFRESH_SECONDS_DEFAULT):
+                 min_expires_in_seconds: int = PREEMPTIVE_REFRESH_SECONDS_DEFAULT,
+                 session: requests.Session = None,
+                 jwks_cache: JWKSCache = None,
+                 token_cache_path: str = "",
+                 hooks: list = None):
         """
         Initializes bearertoken
         
         min_expires_in_seconds can be overriden to ensure that each call there is at least a minimum amount
         of seconds before token expiry.
+
+        session can be passed to share a pooled requests.Session (i.e the one owned by HFAPI)
+
+        jwks_cache defaults to the Google public key cache shared by the whole process
+
+        token_cache_path (or the HF_TOKEN_CACHE_PATH environment variable) is a file where the token is shared
+        by all processes on the host. A new process reuses a valid token from it instead of signing in and
+        only one process refreshes it
+
+        hooks are humanfirst.metrics.HFHooks whose on_token_refresh is called after every sign in and refresh
         """
 
+        if session is None:
+            session = requests.Session()
+        self.session = session
+
+        if jwks_cache is None:
+            jwks_cache = google_jwks_cache
+        self.jwks_cache = jwks_cache
+
+        self.hooks = list(hooks) if hooks else []
+
         dotenv_path = find_dotenv(usecwd=True)
 
         # load the environment variables from the .env file if present
@@ -254,12 +350,80 @@ class Authorization:
 
         self.min_expires_in_seconds = min_expires_in_seconds
 
+        # the last token that passed full validation and the monotonic time it stops being usable
+        self.verified_token = ""
+        self.verified_until = 0.0
+
+        # one thread at a time validates or refreshes the token, the others wait and reuse the result
+        self.lock = threading.RLock()
+        self.refresh_thread = None
+        self.refresh_stop = threading.Event()
+
         self.timeout = timeout
 
-        self._validate_config()
+        if token_cache_path == "":
+            token_cache_path = os.environ.get("HF_TOKEN_CACHE_PATH", "")
+        self.token_cache = TokenFileCache(token_cache_path) if token_cache_path else None
+        self.token_cache_key = f"{environment}/{username}"
 
-        self._authorize(username=username,
-                        password=password)
+        if self.token_cache is None:
+            self._validate_config()
+            self._authorize(username=username,
+                            password=password)
+        else:
+            # holding the lock means only one process signs in, the others wait and reuse its token
+            with self.token_cache.lock():
+                if not self._load_cached_token():
+                    self._validate_config()
+                    self._authorize(username=username,
+                                    password=password)
+                    self._store_cached_token()
+
+    def _load_cached_token(self) -> bool:
+        """Adopt a token another process stored in the token cache if it has enough time left"""
+
+        record = self.token_cache.read(self.token_cache_key)
+        if not record or record["expires_at"] - time.time() <= self.min_expires_in_seconds:
+            return False
+        if record["token"] == self.bearer_token_dict["token"]:
+            return False
+        logger.debug("Using token from token cache %s", self.token_cache.path)
+        self.bearer_token_dict["token"] = record["token"]
+        self.bearer_token_dict["refresh_token"] = record["refresh_token"]
+        self.validate_jwt(force=True)
+        return True
+
+    def _store_cached_token(self):
+        """Write the current token to the token cache"""
+        import jwt # pylint: disable=import-outside-toplevel
+
+        claims = jwt.decode(self.bearer_token_dict["token"], options={"verify_signature": False})
+        self.token_cache.write(self.token_cache_key, {
+            "token": self.bearer_token_dict["token"],
+            "refresh_token": self.bearer_token_dict["refresh_token"],
+            "expires_at": claims["iat"] + HUMANFIRST_TOKEN_TTL_SECONDS
+        })
+
+    def _refresh_bearer_token(self, timeout: float = None) -> bool:
+        """Replace the token using the refresh token, False if no new token was received
+
+        With a token cache a token already refreshed by another process is used instead"""
+
+        if self.token_cache is None:
+            return self._apply_refresh(timeout=timeout)
+        with self.token_cache.lock():
+            if self._load_cached_token():
+                return True
+            if not self._apply_refresh(timeout=timeout):
+                return False
+            self._store_cached_token()
+            return True
+
+    def _apply_refresh(self, timeout: float = None) -> bool:
+        refresh_response = self._refresh_token(self.bearer_token_dict["refresh_token"], timeout=timeout)
+        self.bearer_token_dict["token"] = refresh_response.get("id_token")
+        self.bearer_token_dict["refresh_token"] = refresh_response.get("refresh_token")
+        return bool(self.bearer_token_dict["token"])
 
     def _validate_config(self):
         """Calls the config end point for that URL
@@ -280,7 +444,7 @@ class Authorization:
             'Content-Type': 'application/json; charset=utf-8',
             'Accept': 'application/json'
         }
-        response = requests.request(
+        response = self.session.request(
             "GET", url, headers=headers, data=json.dumps(payload)) # pylint: disable=missing-timeout
         if response.status_code != 200 and response.status_code != 201:
             raise RuntimeError(f'Couldn\'t verify config from: {url}')
@@ -332,8 +496,7 @@ class Authorization:
             auth_body["tenantId"] = self.tenant_id
 
         effective_timeout = timeout if timeout is not None else self.timeout
-        auth_response = requests.request(
-            "POST", auth_url, headers=headers, data=json.dumps(auth_body), timeout=effective_timeout)
+        auth_response = self._timed_token_request("sign_in", auth_url, headers, auth_body, effective_timeout)
 
         if auth_response.status_code != 200:
             raise HFAPIAuthException(
@@ -368,8 +531,7 @@ class Authorization:
             "refresh_token": refresh_token
         }
         effective_timeout = timeout if timeout is not None else self.timeout
-        refresh_response = requests.request(
-            "POST", refresh_url, headers=headers, data=json.dumps(refresh_body), timeout=effective_timeout)
+        refresh_response = self._timed_token_request("refresh", refresh_url, headers, refresh_body, effective_timeout)
 
         if refresh_response.status_code != 200:
             raise HFAPIAuthException(
@@ -377,6 +539,19 @@ class Authorization:
 
         return refresh_response.json()
 
+    def _timed_token_request(self, kind: str, url: str, headers: dict, body: dict,
+                             timeout: float) -> requests.Response:
+        """POST a sign in or refresh to Google, telling the hooks how long it took"""
+        started = time.perf_counter()
+        try:
+            response = self.session.request("POST", url, headers=headers, data=json.dumps(body), timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            call_hooks(self.hooks, "on_token_refresh", TokenEvent(kind, time.perf_counter() - started, exception=e))
+            raise
+        call_hooks(self.hooks, "on_token_refresh",
+                   TokenEvent(kind, time.perf_counter() - started, status_code=response.status_code))
+        return response
+
     def _get_headers(self):
         # Function to return headers for your request
         headers = {
@@ -385,19 +560,95 @@ class Authorization:
         }
         return headers
 
+    def seconds_to_expiry(self) -> float:
+        """Seconds the current token remains valid for, measured on the monotonic clock from when it was verified
+
+        0 if the current token has not been verified"""
+
+        if not self.verified_token or self.verified_token != self.bearer_token_dict["token"]:
+            return 0.0
+        return max(self.verified_until - time.monotonic(), 0.0)
+
     def validate_jwt(self,
-                     timeout: float = None) -> dict:
-        """Validate the JWT token using Google's public keys"""
+                     timeout: float = None,
+                     force: bool = False) -> dict:
+        """Validate the JWT token using Google's public keys
+
+        A token that already passed validation is trusted without repeating the signature check
+        until it is within min_expires_in_seconds of expiry, pass force to always check it"""
+
+        # fast path - nothing to do for an already verified token with time left on it
+        if not force and self.seconds_to_expiry() > self.min_expires_in_seconds:
+            return
+
+        with self.lock:
+            # another thread may have validated or refreshed the token while this one waited
+            if not force and self.seconds_to_expiry() > self.min_expires_in_seconds:
+                return
+            return self._validate_jwt(timeout=timeout)
+
+    def refresh(self, timeout: float = None):
+        """Refresh the token now and verify the new one"""
+
+        with self.lock:
+            if not self._refresh_bearer_token(timeout=timeout):
+                raise HFAPIAuthException("Failed to refresh the token. No new ID token received.")
+            self.validate_jwt(timeout=timeout, force=True)
+
+    def start_background_refresh(self, margin_seconds: float = BACKGROUND_REFRESH_MARGIN_SECONDS):
+        """Refresh the token from a daemon thread margin_seconds before validate_jwt would have to
+        so threads making requests never wait on a refresh
+
+        A new token is not refreshed again until BACKGROUND_REFRESH_MIN_SHARE of its life has passed,
+        so if min_expires_in_seconds + margin_seconds is not less than the token TTL it is refreshed
+        that often rather than continuously"""
+
+        if self.refresh_thread is not None and self.refresh_thread.is_alive():
+            return
+        if self.min_expires_in_seconds + margin_seconds >= HUMANFIRST_TOKEN_TTL_SECONDS:
+            logger.warning("min_expires_in_seconds %s plus margin_seconds %s is not less than the token TTL %s, "
+                           "background refresh will run every %s of the token life",
+                           self.min_expires_in_seconds, margin_seconds, HUMANFIRST_TOKEN_TTL_SECONDS,
+                           BACKGROUND_REFRESH_MIN_SHARE)
+        self.refresh_stop.clear()
+        self.refresh_thread = threading.Thread(target=self._background_refresh,
+                                               args=(margin_seconds,),
+                                               name="humanfirst-token-refresh",
+                                               daemon=True)
+        self.refresh_thread.start()
+
+    def stop_background_refresh(self):
+        """Stop the background refresh thread if running"""
+
+        self.refresh_stop.set()
+        if self.refresh_thread is not None:
+            self.refresh_thread.join()
+            self.refresh_thread = None
+
+    def _background_refresh(self, margin_seconds: float):
+        import jwt # pylint: disable=import-outside-toplevel
+
+        min_wait = TOKEN_REVALIDATE_WAIT_TIME
+        while True:
+            wait = self.seconds_to_expiry() - self.min_expires_in_seconds - margin_seconds
+            if self.refresh_stop.wait(max(wait, min_wait)):
+                return
+            try:
+                self.refresh()
+                min_wait = max(self.seconds_to_expiry() * BACKGROUND_REFRESH_MIN_SHARE, TOKEN_REVALIDATE_WAIT_TIME)
+                logger.debug("Background refresh done token valid for %ss", self.seconds_to_expiry())
+            except (HFAPIAuthException, jwt.InvalidTokenError, requests.exceptions.RequestException) as e:
+                # requests will fall back to refreshing in validate_jwt
+                logger.error("Background token refresh failed: %s", str(e))
+
+    def _validate_jwt(self, timeout: float = None) -> dict:
+        """Full validation of the token, refreshing it if expired or close to expiry"""
+        import jwt # pylint: disable=import-outside-toplevel
+        from jwt import ExpiredSignatureError, InvalidTokenError, DecodeError # pylint: disable=import-outside-toplevel
 
         # Get Google Public Keys for RS256 validation
         effective_timeout = timeout if timeout is not None else self.timeout
         try:
-            response = requests.get(GOOGLE_CERTS_URL, timeout=effective_timeout)
-            if response.status_code != 200:
-                raise HFAPIAuthException(f"Failed to get Google public keys. Status code: {response.status_code}")
-
-            google_public_keys = response.json()["keys"]
-
             # Since Google provides several keys, we need to use the one specified in the JWT header
             unverified_header = jwt.get_unverified_header(self.bearer_token_dict["token"])
 
@@ -407,18 +658,8 @@ class Authorization:
             if not key_id:
                 raise HFAPIAuthException("Invalid token header. No key ID (kid) found.")
 
-            # Find the key that matches the key ID from the token header
-            public_key_data = None
-            for key in google_public_keys:
-                if key["kid"] == key_id:
-                    public_key_data = key
-                    break
-
-            if not public_key_data:
-                raise HFAPIAuthException("Invalid token header. No matching key found.")
-
-            # Convert the public key data to an RSA public key
-            public_key = RSAAlgorithm.from_jwk(json.dumps(public_key_data))
+            # Find the key that matches the key ID from the token header - cached between calls
+            public_key = self.jwks_cache.get_key(key_id, self.session, effective_timeout)
 
             # Decode the token using the public key
             refresh_attempts = 0
@@ -469,10 +710,7 @@ class Authorization:
                             "Pre-emptively refresh token at client_time: %s as seconds to expiry: %s less than min: %s for expiry time %s", # pylint:disable=line-too-long
                             decoded_token_iat, HUMANFIRST_TOKEN_TTL_SECONDS - time_diff, self.min_expires_in_seconds, decoded_token_exp # pylint:disable=line-too-long
                         )
-                        refresh_response = self._refresh_token(self.bearer_token_dict["refresh_token"])
-                        self.bearer_token_dict["token"] = refresh_response.get("id_token")
-                        self.bearer_token_dict["refresh_token"] = refresh_response.get("refresh_token")
-                        if not self.bearer_token_dict["token"]:
+                        if not self._refresh_bearer_token():
                             logger.error("Failed to refresh the token. No new ID token received.")
                             time.sleep(TOKEN_REVALIDATE_WAIT_TIME)
                             # only need another attempt and continue if we didn't get the token pre-emptively refreshed
@@ -483,6 +721,8 @@ class Authorization:
                     else:
                         logger.debug("Didn't refresh token as seconds to expiry: %s > than min: %s client_time: %s expiry_time: %s", # pylint:disable=line-too-long
                                      HUMANFIRST_TOKEN_TTL_SECONDS - time_diff, self.min_expires_in_seconds, decoded_token_iat, decoded_token_exp) # pylint:disable=line-too-long
+                        self.verified_token = self.bearer_token_dict["token"]
+                        self.verified_until = time.monotonic() + HUMANFIRST_TOKEN_TTL_SECONDS - time_diff
 
 
                     # So we had a valid token and didn't need to refresh it
@@ -494,10 +734,7 @@ class Authorization:
                         logger.error("Refresh attempts exceeded 5 or more times")
                         raise
                     logger.info("The token has expired. Attempting to refresh token...")
-                    refresh_response = self._refresh_token(self.bearer_token_dict["refresh_token"])
-                    self.bearer_token_dict["token"] = refresh_response.get("id_token")
-                    self.bearer_token_dict["refresh_token"] = refresh_response.get("refresh_token")
-                    if not self.bearer_token_dict["token"]:
+                    if not self._refresh_bearer_token():
                         logger.error("Failed to refresh the token. No new ID token received.")
                         time.sleep(TOKEN_REVALIDATE_WAIT_TIME)
                     refresh_attempts = refresh_attempts + 1
@@ -1,30 +1,387 @@
-# pylint: disable=too-many-lines
 """
 generators.py
 
 Helpers to Generate various sorts of data.
 
+Synthetic workspaces and conversation sets are sampled with NumPy a chunk at a time
+and streamed to disk as HF JSON or JSONL, so millions of examples can be generated
+without holding them in memory. The same seed and arguments always generate the same data.
+
 """
 # *********************************************************************************************************************
 
 # standard imports
+import os
+import sys
+import json
+import datetime
+import functools
+from configparser import ConfigParser
+from typing import IO, Iterator, Union
 
 # third party imports
 
 # custom imports
 
+# locate where we are
+here = os.path.abspath(os.path.dirname(__file__))
+path_to_large_word_list = os.path.join(here,'data','large_word_list.txt')
+
+# CONSTANTS
+constants = ConfigParser()
+path_to_config_file = os.path.join(here,'config','setup.cfg')
+constants.read(path_to_config_file)
+
+# number of examples sampled and written at a time
+GENERATOR_CHUNK_SIZE = int(constants.get("humanfirst.CONSTANTS","GENERATOR_CHUNK_SIZE"))
+
+# generated examples are timestamped from here onwards
+DEFAULT_START_TIME = "2024-01-01T00:00:00"
+
+
+@functools.lru_cache(maxsize=None)
+def load_large_word_list() -> tuple:
+    '''Reads data/large_word_list.txt the first time it is called and returns
+    the same interned tuple to every caller after that'''
+    with open(path_to_large_word_list, mode="r", encoding="utf8") as file_in:
+        return tuple(sys.intern(word) for word in file_in.read().split("\n") if word)
+
+
+@functools.lru_cache(maxsize=None)
+def load_large_word_array():
+    '''The large word list as a numpy object array so many words can be picked at once by index'''
+    import numpy # pylint: disable=import-outside-toplevel
+    return numpy.array(load_large_word_list(), dtype=object)
+
 
 class HFGEN:
     """HumanFirst Data Generator"""
 
-    def __init__(self):
+    seed: int
+
+    def __init__(self, seed: int = None):
         """
         Initializes generator
+
+        seed - seeds the random generator so the generated data is repeatable.
+               If None a fresh seed is drawn from the OS
+
+        The word list is only loaded the first time it is used and is shared by all generators
         """
-        long_word_list = self.get_large_word_list()
-        
-    def get_large_word_list(self) -> list:
-        '''Returns a long list of about 20,000 words 4 or more char words from the top 100k English words on Wikipedia'''
-        return [
-            "AEneas","AEneid","AEschylus","Aagot","Aaron","Abandon","Abandoned","Abbas","Abbaye","Abbess","Abbeville","Abbey","Abbie","Abbot","Abbotsford","Abbott","Abbé","Abdallah","Abdul","Abdullah","Abelard","Abend","Abends","Abenteuer","Abercrombie","Abercromby","Aberdeen","Abgrund","Abiathar","Abide","Abies","Abigael","Abigail","Abijah","Ability","Abimelech","Abingdon","Abner","Abolition","Abolitionist","Abolitionists","Aborigines","Aboukir","Abounding","About","Above","Abraham","Abrahams","Abram","Abreise","Abridged","Abroad","Abruptly","Absalom","Abschied","Absence","Absent","Absicht","Absichten","Absinthe","Absolute","Absolutely","Absorbed","Abstract","Abstraktion","Absurd","Abteilung","Abulfeda","Abundance","Abuse","Abwesenheit","Abydos","Abyssinia","Abyssinian","Abyssinians","Abélard","Acacia","Academia","Academic","Academie","Academies","Academy","Acadia","Acadian","Acadians","Acapulco","Accent","Accept","Accepting","Access","Accession","Accident","Accidents","Accommodation","Accompanied","Accompanying","According","Accordingly","Account","Accounts","Accursed","Accustomed","Achab","Achaean","Achaeans","Achaia","Achaians","Achates","Acheron","Achille","Achilles","Achitophel","Achmet","Achter","Achtung","Acquaintance","Acres","Acropolis","Across","Acting","Action","Actions","Actium","Active","Activity","Acton","Actor","Actors","Actual","Actually","Actus","Adair","Adams","Adamson","Adapted","Addams","Added","Addie","Adding","Addington","Addison","Addition","Additional","Additions","Address","Addressed","Addresses","Addressing","Adela","Adelaide","Adelantado","Adele","Adelheid","Adeline","Adelphi","Adern","Adieu","Adige","Adirondack","Adirondacks","Adister","Adjective","Adjectives","Adjoining","Adjutant","Adler","Admetus","Administration","Administrative","Administrator","Admirable","Admiral","Admirall","Admirals","Admiralty","Admiration","Admission","Admit","Admitting","Adolf","Adolph","Adolphe","Adolphus","Adonais","Adonis","Adoration","Adown","Adrast","Adrian","Adriana","Adrianople","Adriatic","Adrien","Adrienne","Advance","Advanced","Advancement","Advancing","Advantage","Advantages","Advent","Adventure","Adventurer","Adventurers","Adventures","Adversity","Advertisement","Advertisements","Advertiser","Advertising","Advice","Advise","Advisory","Advocate","Adèle","Aegean","Aegina","Aegisthus","Aegypten","Aemilius","Aeneas","Aeneid","Aeolian","Aeolus","Aerschot","Aerssens","Aeschines","Aeschylus","Aesculapius","Aesop","Aesthetic","Aetna","Aetolians","Affair","Affaires","Affairs","Affectation","Affected","Affection","Affectionately","Affections","Affliction","Affonso","Afghan","Afghanistan","Afghans","Afraid","Afric","Africa","African","Africans","Africanus","Afrika","Afrique","After","Afternoon","Afterward","Again","Against","Agamemnon","Agassiz","Agatha","Agathe","Agathemer","Agathon","Agency","Agent","Agents","Agesilaus","Aggie","Agias","Agincourt","Agitation","Agnes","Agnew","Agnus","Agony","Agora","Agostino","Agrarian","Agreeably","Agreed","Agreement","Agricol","Agricola","Agricultural","Agriculture","Agrippa","Agrippina","Aguilar","Aguinaldo","Aguirre","Agustin","Ahasuerus","Ahead","Ahenobarbus","Ahmad","Ahmed","Ahmet","Ahnung","Ahora","Ahriman","Ahura","Aided","Aietes","Aiken","Aileen","Ailie","Ailill","Ailsa","Ainoastaan","Ainslie","Ainsworth","Aires","Airports","Aisne","Aivan","Aiwohikupua","Ajaccio","Akademie","Akbar","Akenside","Akhaiens","Aklis","Alabama","Alack","Aladdin","Alaeddin","Alain","Alaire","Alameda","Alamo","Alaric","Alarm","Alarmed","Alaska","Alaskan","Alban","Albania","Albanian","Albanians","Albano","Albans","Albany","Albatros","Albatross","Albeit","Albemarle","Alberoni","Albert","Alberta","Alberti","Albertine","Alberto","Albertus","Albine","Albinia","Albinus","Albion","Albrecht","Album","Albuquerque","Alcala","Alcalde","Alcatraz","Alcazar","Alceste","Alcestis","Alcibiades","Alcide","Alcides","Alcinous","Alcohol","Alcott","Alcuin","Aldarondo","Aldclyffe","Aldegonde","Alden","Alder","Alderman","Aldermen","Alderney","Aldershot","Aldous","Aldrich","Aldus","Aleck","Alencon","Aleppo","Alert","Alessandria","Alessandro","Alexander","Alexanders","Alexandra","Alexandre","Alexandria","Alexandrian","Alexandrians","Alexandrie","Alexandrina","Alexandrine","Alexandrovitch","Alexandrovna","Alexei","Alexey","Alexia","Alexina","Alexis","Alexius","Alfieri","Alfonso","Alford","Alfred","Algebra","Alger","Algeria","Algerian","Algerine","Algernon","Algiers","Algonquin","Algonquins","Alhambra","Alice","Alicia","Alick","Alida","Alien","Alike","Aline","Alison","Alister","Alive","Alixe","Alizon","Alkibiades","Allah","Allahabad","Allan","Allatoona","Allee","Alleen","Alleghanies","Alleghany","Allegheny","Allegory","Allegro","Allein","Allem","Allemagne","Allemands","Allen","Aller","Allerdings","Allerdyke","Alles","Alley","Alleyne","Allez","Allgemeine","Allgemeinen","Allgemeinheit","Alliance","Allie","Allied","Allies","Alligator","Allington","Allinson","Allis","Allison","Allonby","Allons","Allora","Allow","Allowing","Allston","Alluding","Allusion","Allworthy","Allyn","Allí","Almagro","Almamen","Almanac","Almanack","Almanzor","Almayer","Almeria","Almighty","Almond","Almonds","Almost","Aloft","Alois","Alone","Along","Alonso","Alonzo","Alors","Aloud","Alpen","Alpes","Alpha","Alphabet","Alpheus","Alphonse","Alphonso","Alpine","Alquist","Already","Alsace","Alsatian","Alston","Altamont","Altar","Alten","Altenberg","Alter","Alternate","Alternative","Alters","Altertum","Altesse","Althea","Although","Altogether","Alton","Altona","Altruria","Altrurian","Alvan","Alvar","Alvarado","Alvarez","Alvaro","Alvin","Always","Alwyn","Amabel","Amadis","Amalek","Amalekites","Amalia","Amalie","Amanda","Amarilly","Amaryllis","Amasa","Amasia","Amasis","Amateur","Amazed","Amazement","Amaziah","Amazing","Amazon","Amazonian","Amazons","Ambassador","Ambassadors","Amber","Amberson","Ambition","Ambitious","Amboise","Amboyna","Ambroise","Ambrose","Ambrosio","Ambrosius","Ambulance","Ambulinia","Amedee","Ameer","Amelia","Amelie","Amelius","Amendment","Amendments","Ameni","America","American","Americana","Americanism","Americans","Americas","Amerigo","Amerika","Amesbury","Amherst","Amidst","Amiel","Amiens","Amine","Aminta","Ammiani","Ammianus","Ammon","Ammonites","Among","Amongst","Amoor","Amorites","Amory","Amount","Amour","Amours","Ample","Amram","Amrei","Amroth","Amsterdam","Amtmann","Amusement","Amusements","Amyas","Amyntas","Amélie","Américains","Amérique","Anabaptists","Anacreon","Anales","Analogy","Analysis","Ananda","Ananias","Anarchist","Anarchists","Anarchy","Anastasia","Anastasius","Anatole","Anatolia","Anatomy","Anaxagoras","Anblick","Ancestors","Anchises","Anchor","Ancient","Ancients","Ancona","Andalusia","Andalusian","Andaman","Andenken","Andere","Anderen","Anderes","Andern","Anders","Andersen","Anderson","Andersonville","Andes","Andorra","Andover","Andras","Andre","Andrea","Andreas","Andree","Andres","Andrew","Andrews","Andrey","Andromache","Andromeda","Andronicus","Andros","Androvsky","André","Andrés","Anecdote","Anecdotes","Anemone","Anerkennung","Anfang","Angel","Angela","Angele","Angelegenheit","Angelegenheiten","Angeles","Angelic","Angelica","Angelico","Angelina","Angelique","Angell","Angelo","Angels","Angelus","Anger","Angers","Angesicht","Anglais","Angle","Angler","Angles","Anglesey","Angleterre","Anglia","Anglican","Angola","Angora","Angouleme","Angriff","Angry","Angst","Anguish","Angus","Angélique","Anhalt","Aniela","Animal","Animals","Animated","Anita","Anjou","Anker","Ankunft","Anlage","Anmerkung","Anmut","Annabel","Annadoah","Annahme","Annal","Annales","Annals","Annan","Annapolis","Annas","Anneke","Annesley","Annette","Annex","Annie","Anniversary","Annixter","Annotated","Annual","Annunciation","Anonymous","Another","Ansbach","Anschauung","Anschauungen","Anscombe","Ansehen","Ansehung","Ansell","Anselm","Anselme","Anselmo","Anselmus","Ansicht","Ansichten","Ansigt","Anson","Anspruch","Anstalt","Anstalten","Anstand","Anstey","Anstrengung","Anstruther","Answer","Answered","Answering","Answers","Antar","Antarctic","Antarctica","Anteil","Antelope","Antero","Antes","Anthea","Anthem","Anthology","Anthony","Anthrax","Anthropological","Anthropology","Antichrist","Antietam","Antigone","Antigonus","Antigua","Antilles","Antinous","Antioch","Antiochus","Antipas","Antipater","Antipholis","Antipholus","Antipodes","Antiq","Antiquarian","Antiquaries","Antiquary","Antique","Antiquities","Antiquity","Antium","Antlitz","Antoine","Antoinette","Anton","Antonelli","Antonia","Antoninus","Antonio","Antonius","Antony","Antonyms","Antrag","Antrim","Antti","Antwerp","Antwerpen","Antwort","Anubis","Anvers","Anwendung","Anxiety","Anxious","Anybody","Anyhow","Anyone","Anything","Anyway","Anywhere","Anzahl","Anzoleto","Aouda","Apache","Apaches","Apart","Apartment","Apelles","Apennine","Apennines","Aphrodite","Apocalypse","Apollinaris","Apollo","Apollodorus","Apollonia","Apollonius","Apollos","Apollyon","Apology","Aponibolinayen","Aponitolau","Apostle","Apostles","Apostolic","Appalachian","Apparatus","Apparent","Apparently","Appeal","Appeals","Appear","Appearance","Appearances","Appeared","Appearing","Appears","Appendix","Appetite","Appian","Appius","Applause","Apple","Appleby","Applehead","Apples","Appleton","Application","Applications","Applied","Apply","Applying","Appointed","Appointment","Appomattox","Apprehension","Apprentice","Approach","Approaching","Approbation","Approved","Apres","April","Apropos","Après","Apuleius","Apulia","Aquel","Aquila","Aquileia","Aquinas","Aquitaine","Aquí","Arabella","Arabes","Arabia","Arabian","Arabians","Arabic","Arabs","Arachne","Arago","Aragon","Aramaic","Araminta","Aramis","Arapahoes","Ararat","Aratus","Araucanians","Arbaces","Arbeit","Arbeiten","Arbeiter","Arbitration","Arbor","Arbuthnot","Arcadia","Arcadian","Arcadians","Arcady","Archaeological","Archaic","Archangel","Archbishop","Archbishops","Archdeacon","Archduchess","Archduke","Archdukes","Archelaus","Archer","Arches","Archias","Archibald","Archibius","Archie","Archimedes","Archipelago","Architect","Architectural","Architecture","Archiv","Archive","Archives","Archivo","Archy","Arcis","Arcite","Arctic","Arcturus","Ardan","Ardea","Arden","Ardennes","Ardworth","Aremberg","Arena","Areopagus","Arethusa","Arezzo","Argent","Argentina","Argentine","Argive","Argives","Argonauts","Argos","Argosy","Argument","Arguments","Argus","Argyle","Argyll","Ariadne","Arian","Arians","Arias","Ariberti","Ariel","Aries","Arion","Ariosto","Arise","Arist","Aristarchus","Aristeides","Aristides","Aristippus","Aristobulus","Aristocracy","Ariston","Aristophanes","Aristote","Aristoteles","Aristotelian","Aristotle","Arithmetic","Arius","Arizona","Arjuna","Arkadyevitch","Arkansas","Arkwright","Arlee","Arleigh","Arles","Arlington","Armada","Armadale","Armagh","Armand","Armande","Armed","Armee","Armelline","Armen","Armenia","Armenian","Armenians","Armes","Armida","Armies","Armine","Arminian","Arminians","Arminius","Armistice","Armitage","Armour","Armstrong","Armut","Arnaud","Arnauld","Arnault","Arnheim","Arnold","Arnot","Arnott","Aronnax","Around","Arragon","Arrah","Arran","Arrange","Arranged","Arrangement","Arrangements","Arras","Arrest","Arrested","Arrian","Arrival","Arrive","Arrived","Arriving","Arrivé","Arrow","Arrowhead","Arrows","Arsenal","Arsene","Arsinoe","Arsène","Artabanus","Artaxerxes","Artemis","Artemisia","Artemus","Arten","Arter","Artevelde","Arthur","Arthurian","Article","Articles","Artificial","Artikel","Artillery","Artist","Artistic","Artists","Artois","Arundel","Aryan","Aryans","Asako","Asaph","Asbury","Ascalon","Ascanio","Ascend","Ascending","Ascension","Ascham","Asche","Ascot","Ascott","Ascyltos","Asenath","Ashamed","Ashantee","Ashbourne","Ashburnham","Ashburton","Ashby","Asher","Ashes","Ashford","Ashland","Ashleigh","Ashley","Ashton","Ashurst","Ashwell","Asian","Asiatic","Asiatics","Aside","Asien","Asinius","Asked","Asking","Asleep","Asmund","Asoka","Asparagus","Aspasia","Aspect","Aspects","Asquith","Assam","Assemblies","Assembly","Assez","Assheton","Assingham","Assisi","Assist","Assistance","Assistant","Assistants","Assisted","Assize","Assizes","Associate","Associated","Associates","Association","Associations","Assume","Assuming","Assumption","Assur","Assurance","Assure","Assured","Assuredly","Assyria","Assyrian","Assyrians","Astarte","Astley","Aston","Astonished","Astonishment","Astor","Astoria","Astounding","Astracan","Astron","Astronomer","Astronomical","Astronomy","Asturias","Astyages","Asura","Asuras","Asylum","Atalanta","Atchison","Athabasca","Athanase","Athanasian","Athanasius","Atheism","Atheist","Atheists","Athelstan","Athelstane","Athen","Athena","Athenaeum","Athenaeus","Athenais","Athene","Athenians","Athens","Athenæum","Atherton","Athletic","Athos","Athwart","Atkins","Atkinson","Atlanta","Atlantic","Atlantis","Atlas","Atlee","Atomic","Atonement","Atossa","Atque","Atreus","Attached","Attack","Attalus","Attempt","Attempts","Attend","Attendant","Attendants","Attended","Attendez","Attends","Attention","Atterbury","Attic","Attica","Atticus","Attila","Attilio","Attitude","Attorney","Attracted","Atwater","Atwell","Atwood","Auber","Aubert","Aubrey","Aubry","Auburn","Aucassin","Auckland","Aucun","Aucune","Audience","Audiencia","Audio","Auditor","Audley","Audrey","Audubon","Aufenthalt","Auffassung","Aufgabe","Aufgaben","Aufheben","Auflösung","Aufmerksamkeit","Aufnahme","Aufregung","Auftrag","Auftritt","Aufzug","Augen","Augenblick","Augenblicke","Augenblicken","Augereau","Aught","Augsburg","August","Augusta","Augustan","Auguste","Augustin","Augustina","Augustine","Augustinian","Augustus","Aujourd","Aulus","Aunque","Auntie","Aunty","Aurelia","Aurelian","Aurelius","Aurilly","Aurora","Aurore","Ausbildung","Ausbruch","Ausdehnung","Ausdruck","Ausführung","Ausgabe","Ausgaben","Ausgang","Ausland","Ausnahme","Aussi","Aussicht","Aussitot","Aussitôt","Austen","Austerlitz","Austin","Australasia","Australasian","Australia","Australians","Australis","Austria","Austrian","Austrians","Autant","Auteuil","Author","Authorities","Authority","Authorized","Authors","Autobiography","Autocrat","Autograph","Automatic","Automobile","Autor","Autour","Autrefois","Autrichiens","Autumn","Autun","Auvergne","Auxerre","Auxiliary","Avant","Avarice","Avaunt","Avdotya","Avenel","Avenger","Aventine","Avenue","Average","Averil","Aversion","Avery","Avesta","Avice","Avicenna","Avignon","Avila","Avoid","Avoiding","Awake","Awakening","Aware","Aweel","Awful","Awfully","Awhile","Awkward","Axtell","Ayant","Ayesha","Aylesbury","Aylmer","Aylward","Aylwin","Aymer","Aynesworth","Ayres","Ayrshire","Ayrton","Ayscough","Azalea","Azariah","Azarias","Azerbaijan","Azores","Aztec","Aztecs","Baalbec","Babalatchi","Babbalanja","Babbie","Babbitt","Babcock","Babel","Babes","Babet","Babette","Babie","Babies","Babilonia","Babington","Babylon","Babylone","Babylonia","Babylonian","Babylonians","Bacchanal","Bacchic","Bacchus","Bache","Bachelor","Background","Backward","Bacon","Baconian","Bactria","Badawi","Baden","Badger","Badlam","Badman","Badshah","Baedeker","Baeume","Baffled","Bagarag","Bagdad","Baggs","Baghdad","Bagley","Bagnet","Bagration","Bahama","Bahamas","Bahia","Bahrain","Baiae","Bailey","Bailie","Bailiff","Baillie","Bailly","Bainbridge","Baines","Bainrothe","Baird","Baireuth","Baisemeaux","Bajazet","Baked","Baker","Bakewell","Baking","Balaam","Balak","Balance","Balbec","Balbi","Balbilla","Balboa","Balch","Balcom","Baldassare","Balder","Baldur","Baldwin","Baldy","Balearic","Baleinier","Baletti","Balfour","Balin","Baliol","Balkan","Balkans","Ballad","Ballade","Ballads","Ballantyne","Ballarat","Ballard","Ballindine","Balliol","Balloon","Ballou","Balls","Balmoral","Balsam","Balthasar","Balthazar","Baltic","Baltimore","Balty","Balzac","Balzajette","Bamberg","Bambi","Bampton","Banana","Banbury","Bancroft","Banda","Bande","Bands","Bangkok","Bangladesh","Bangor","Bangs","Banion","Banker","Bankers","Banking","Bankruptcy","Banks","Banneker","Banner","Bannerworth","Banning","Bannister","Banque","Banquet","Banquo","Bantam","Bantu","Baptism","Baptist","Baptista","Baptiste","Baptists","Barabbas","Barak","Barba","Barbadoes","Barbados","Barbara","Barbaren","Barbarian","Barbarians","Barbaro","Barbarossa","Barbary","Barbe","Barber","Barberini","Barbicane","Barbier","Barbour","Barbro","Barbuda","Barby","Barca","Barcelona","Barchester","Barclay","Bardolph","Bards","Barebone","Baree","Barefoot","Barely","Baretti","Bargeton","Barham","Barincq","Barine","Baring","Barizel","Barkeley","Barker","Barkilphedro","Barkley","Barley","Barlow","Barmby","Barmecide","Barnabas","Barnaby","Barnard","Barnave","Barnes","Barnet","Barnett","Barneveld","Barney","Barnstable","Barnum","Barnwell","Barometer","Baron","Baronen","Baroness","Baronet","Baronne","Barons","Barouche","Barracks","Barral","Barrant","Barras","Barre","Barrel","Barren","Barrett","Barrie","Barrier","Barring","Barrington","Barron","Barrow","Barrows","Barry","Barrymore","Barsoom","Barstow","Barter","Barth","Bartholomew","Bartja","Bartle","Bartlett","Bartley","Barto","Bartolomeo","Bartolommeo","Barton","Bartram","Barty","Baruch","Basan","Bascom","Bascombe","Based","Basel","Basha","Bashan","Bashwood","Basic","Basil","Basilica","Basilio","Basin","Basis","Baskelett","Baskerville","Basket","Basle","Basque","Basques","Bassa","Bassanio","Bassano","Basset","Bassett","Bassompierre","Bassorah","Bastard","Bastile","Bastille","Bastin","Batavia","Batavian","Batchgrew","Batelier","Bateman","Bates","Bathing","Baths","Bathsheba","Bathurst","Batman","Baton","Battalion","Batten","Batteries","Battersea","Battery","Battista","Battles","Batty","Baucis","Baudelaire","Baudin","Baudoin","Baudraye","Bauer","Bauern","Baume","Bautista","Bavaria","Bavarian","Bavarians","Baxter","Bayard","Bayer","Bayern","Bayeux","Bayle","Bayley","Bayliss","Bayne","Baynes","Bayonne","Bayou","Bayreuth","Bayswater","Bazaar","Bazaine","Bazar","Bazin","Beach","Beacon","Beaconsfield","Beagle","Beale","Beamish","Beams","Beamte","Beamten","Beans","Beard","Beare","Bearer","Bearing","Bearn","Bearnese","Bears","Bearwarden","Beasley","Beast","Beastly","Beasts","Beata","Beaten","Beating","Beaton","Beatrice","Beatrix","Beats","Beattie","Beatty","Beaucaire","Beauce","Beauchamp","Beauclerc","Beauclerk","Beaucoup","Beaufort","Beauharnais","Beaujeu","Beaulieu","Beaumanoir","Beaumarchais","Beaumont","Beauport","Beauregard","Beauseant","Beauties","Beautiful","Beauty","Beauvais","Beauvilliers","Beauvoir","Beaux","Beaver","Bebel","Became","Because","Becher","Beckendorff","Becker","Becket","Beckford","Beckley","Beckwith","Becky","Become","Becomes","Becoming","Bedchamber","Bedenken","Bedeutung","Bedford","Bedfordshire","Bedient","Bediente","Bedienten","Bedingung","Bedingungen","Bedivere","Bedlam","Bedouin","Bedouins","Bedreddin","Beebe","Beech","Beecher","Beekman","Beelzebub","Beers","Beersheba","Beethoven","Beetle","Beets","Befehl","Before","Befreiung","Befriedigung","Began","Begebenheiten","Begeisterung","Beggar","Beggars","Begging","Begierde","Begin","Beginn","Beginning","Beginnings","Begins","Begleiter","Begone","Begriff","Begriffe","Begriffen","Begriffes","Begriffs","Begum","Behandlung","Behauptung","Behavior","Behaviour","Beheld","Behind","Behold","Beholding","Beide","Beifall","Beine","Beinen","Being","Beings","Beispiel","Beispiele","Bekannten","Bekanntschaft","Belagerung","Belarus","Belcher","Belden","Belding","Belfast","Belfield","Belford","Belges","Belgians","Belgic","Belgique","Belgium","Belgrade","Belgrave","Belial","Belief","Believers","Believing","Belike","Belinda","Belisarius","Belize","Belknap","Bella","Bellamy","Bellasses","Belle","Bellegarde","Belleisle","Bellenden","Bellerophon","Belles","Belleville","Bellevue","Bellew","Bellingham","Bellini","Belllounds","Bellmour","Bello","Belloc","Bellona","Belloni","Bellows","Bells","Belly","Belmont","Belonging","Beloved","Below","Belshazzar","Beltane","Beltham","Belton","Belus","Belvedere","Belward","Bemelmans","Bemerkung","Bemerkungen","Bemis","Benares","Bench","Bender","Bendigo","Bending","Beneath","Benedetta","Benedetti","Benedetto","Benedick","Benedict","Benedictine","Benedictines","Benedictus","Benefit","Benehmen","Benet","Benevolence","Benevolent","Benfield","Bengal","Bengali","Benham","Benicia","Benin","Benita","Benito","Benjamin","Benjy","Bennet","Bennett","Bennington","Benny","Benoit","Benoni","Benson","Bentham","Bentinck","Bentivoglio","Bentley","Benton","Benvenuto","Beobachtung","Beorn","Beowulf","Beppo","Beranger","Berber","Berbers","Bereich","Berenger","Berenguer","Berenice","Berenike","Beresford","Beresina","Bergamo","Berge","Bergen","Bergenheim","Berger","Bergson","Beriah","Beric","Bericht","Bering","Berkeley","Berkley","Berks","Berkshire","Berlaymont","Berlin","Berliner","Berlioz","Bermuda","Bermudas","Bernadette","Bernadotte","Bernal","Bernaldez","Bernard","Bernardin","Bernardine","Bernardino","Bernardo","Berne","Bernhard","Bernhardt","Bernice","Bernick","Bernier","Bernis","Bernstein","Beroviero","Berri","Berries","Berry","Berta","Bertalda","Bertha","Berthe","Berthier","Berthold","Bertie","Bertin","Bertram","Bertran","Bertrand","Bertrande","Bertuccio","Beruf","Berwick","Beryl","Besancon","Besant","Besançon","Beschaffenheit","Beschreibung","Beschäftigung","Beside","Besides","Besitz","Besitzer","Besonders","Bessie","Bessy","Beste","Bestehen","Besten","Bestimmtheit","Bestimmung","Bestimmungen","Besuch","Besuche","Bethany","Bethel","Bethink","Bethlehem","Bethune","Betracht","Betrachtung","Betrachtungen","Betragen","Betsey","Betsy","Bette","Better","Betterton","Bettie","Bettina","Bettler","Betts","Betty","Between","Betwixt","Beulah","Beule","Beust","Beute","Beutel","Bevan","Beverley","Beverly","Bevis","Bevisham","Bevölkerung","Beware","Bewegung","Bewegungen","Beweis","Beweise","Bewildered","Bewohner","Bewunderung","Bewusstsein","Bewusstseins","Bewußtsein","Bewußtseins","Beyond","Bezeichnung","Beziehung","Beziehungen","Bezug","Bhaer","Bhanavar","Bharata","Bharatas","Bhima","Bhimasena","Bhishma","Bhutan","Bianca","Bianchon","Biarritz","Bibber","Bibbs","Biberli","Bible","Bibles","Biblical","Bibliography","Bibliotheca","Bibliothek","Bibliotheque","Bibliothèque","Bibulus","Bickers","Bickerstaff","Bickley","Bidding","Biddle","Biddy","Bidwell","Bientot","Bientôt","Bienville","Bigelow","Biggs","Bight","Bigler","Biglow","Bigot","Bijah","Bijou","Bildad","Bilde","Bilder","Bildern","Bildung","Billie","Billings","Billingsgate","Bills","Billy","Bilton","Binder","Bines","Binet","Bingham","Bingle","Bingley","Bingo","Biodiversity","Biographia","Biographical","Biographie","Biography","Biology","Biorn","Birch","Birchill","Birdalone","Birdie","Birds","Birkin","Birmingham","Birney","Biron","Birotteau","Birrell","Birth","Birthday","Biscay","Biscayan","Bischof","Biscuit","Bishop","Bishops","Bishopsgate","Bismarck","Bithynia","Bitnet","Bitte","Bitten","Bitter","Bitterly","Bittridge","Bixby","Bixiou","Bjaaland","Black","Blackbird","Blackburn","Blackett","Blackfeet","Blackfoot","Blackfriars","Blackheath","Blackie","Blackmore","Blacks","Blacksmith","Blackstone","Blackwater","Blackwell","Blackwood","Blacky","Blade","Bladene","Blaetter","Blaine","Blair","Blaisdell","Blaise","Blaize","Blake","Blakeney","Blame","Blanc","Blanca","Blanch","Blanchard","Blanche","Blanco","Bland","Blandish","Blandy","Blank","Blasco","Blast","Blatt","Blaze","Bleak","Bleeding","Blenheim","Blenkiron","Blentz","Blessed","Blessing","Blessings","Blessington","Blest","Blick","Blicke","Blicken","Blifil","Bligh","Blind","Blink","Bliss","Blithers","Blitz","Blizzard","Bloch","Block","Blodgett","Bloemfontein","Blois","Blomster","Blomsterne","Blondel","Blondet","Blood","Bloody","Bloom","Bloomfield","Bloomsbury","Blossom","Blossoms","Bloundel","Blount","Blowing","Blown","Blows","Blucher","Bluebeard","Bluebell","Bluecher","Blues","Blueskin","Bluff","Bluffs","Blume","Blumen","Blumenthal","Blunt","Bluntschli","Blushing","Blyth","Blythe","Blätter","Blücher","Boabdil","Board","Boardman","Boards","Boats","Bobadilla","Bobbie","Bobbsey","Bobby","Bocca","Boccaccio","Bocchus","Boche","Boches","Boden","Bodies","Bodin","Bodine","Bodleian","Bodley","Boeotia","Boeotian","Boeotians","Boers","Boethius","Boffin","Bogan","Bogen","Boges","Boggs","Bogota","Bohemia","Bohemian","Bohemians","Bohun","Boileau","Boiled","Boiling","Boiscoran","Bokhara","Boldly","Boldwood","Boleslas","Boleyn","Bolingbroke","Bolivar","Bolivia","Bologna","Bologne","Bolognese","Bolshevik","Bolsheviki","Bolshevism","Bolton","Bolívar","Bombay","Bonacieux","Bonaparte","Bonapartes","Bonapartist","Bonar","Bonard","Bonaventure","Bonbright","Boncassen","Bonds","Bones","Boney","Bonheur","Boniface","Bonjour","Bonne","Bonner","Bonnet","Bonneville","Bonnie","Bonny","Bonsoir","Bontoc","Booby","Booker","Books","Bookseller","Booksellers","Boone","Booth","Boots","Bordeaux","Border","Bordet","Boreas","Borghese","Borgia","Borgias","Borgo","Boris","Borne","Borneo","Borodino","Borough","Borroughcliffe","Borrow","Bosheit","Bosinney","Bosio","Bosnia","Bosphorus","Bosporus","Bossu","Bossuet","Bostil","Boston","Bostonian","Bostonians","Boswell","Bosworth","Botanic","Botanical","Botany","Botcher","Boten","Botha","Bother","Bothwell","Botschaft","Botswana","Botticelli","Bottle","Bottom","Boucher","Boufflers","Bougainville","Bough","Bought","Bouille","Bouillon","Boulanger","Boule","Boulevard","Boulevards","Boulogne","Boulton","Bouncer","Bound","Boundary","Bounderby","Bountiful","Bounty","Bouquet","Bourbon","Bourbons","Bourdon","Bourg","Bourgeois","Bourges","Bourget","Bourgogne","Bourke","Bourne","Bournemouth","Bourrienne","Bourse","Bousquier","Bouvard","Bouvet","Bouvier","Bovary","Bowdoin","Bowed","Bowen","Bower","Bowers","Bowery","Bowes","Bowie","Bowing","Bowles","Bowling","Bowman","Bowring","Bowser","Bowyer","Boxall","Boxer","Boxes","Boyce","Boyer","Boylan","Boyle","Boyne","Boynton","Bozzle","Brabant","Brabazon","Bracciolini","Brace","Bracy","Bradamante","Bradbury","Braddock","Braden","Bradford","Bradlaugh","Bradley","Bradshaw","Bradstreet","Bradwardine","Brady","Bragadin","Bragelonne","Bragg","Braham","Brahe","Brahm","Brahma","Brahman","Brahmana","Brahmanas","Brahmanic","Brahmanism","Brahmans","Brahmin","Brahmins","Brahms","Brain","Brainard","Brainerd","Brains","Braintop","Braithwaite","Brake","Bramante","Bramble","Brampton","Branch","Branches","Brand","Brande","Brandeis","Brandenburg","Brander","Brandon","Brandt","Brandy","Brandywine","Brannan","Brant","Brantome","Brasil","Brass","Brauch","Braun","Braut","Brave","Bravely","Bravo","Braxton","Brazen","Brazil","Brazilian","Brazilians","Brazils","Breach","Bread","Break","Breakfast","Breaking","Breaks","Breast","Breath","Breathe","Breathed","Breathes","Breathing","Breathless","Breck","Brecken","Breckenridge","Breckinridge","Breckon","Breda","Brede","Brederode","Breeches","Breed","Breeding","Breen","Breeze","Brehgert","Breite","Breitmann","Bremen","Brenda","Brendon","Brennan","Brenner","Brent","Brenta","Brentano","Brentford","Brenton","Brereton","Brescia","Bresl","Breslau","Bressant","Brest","Bretagne","Brethren","Breton","Bretons","Brett","Bretton","Brevet","Breviary","Brewer","Brewster","Brian","Brice","Brick","Bricolin","Bridal","Bridau","Bride","Bridegroom","Brides","Bridewell","Bridge","Bridgenorth","Bridgeport","Bridger","Bridges","Bridget","Bridgewater","Brief","Briefe","Briefen","Briefly","Brienne","Brier","Brierly","Briest","Brigade","Brigadier","Briggs","Brigham","Bright","Brighteyes","Brighton","Brigitte","Brill","Brilliant","Brindley","Bring","Bringing","Brings","Brinkley","Brinnaria","Brinsmade","Brinton","Briquet","Brisbane","Brisk","Brissac","Brissot","Bristol","Bristow","Britain","Britannia","Britannic","Britannica","British","Britisher","Britishers","Britling","Britomart","Briton","Britons","Britt","Brittany","Britton","Brixton","Broad","Broadhurst","Broadway","Brock","Brocken","Broderick","Brodie","Broglie","Broiled","Broke","Broken","Bromfield","Bromley","Brompton","Bronson","Bronte","Brontë","Bronx","Bronze","Brook","Brooke","Brookes","Brookfield","Brooklyn","Brooks","Broom","Broome","Broth","Brother","Brotherhood","Brothers","Brough","Brougham","Brought","Broughton","Brouncker","Broune","Broussel","Brower","Brown","Browne","Brownie","Browning","Brownlow","Browns","Brownsville","Bruce","Brudenell","Bruder","Bruders","Brueder","Bruges","Brugge","Bruin","Brumaire","Bruncker","Brundusium","Brune","Brunei","Brunhild","Brunnen","Brunner","Bruno","Brunswick","Brunton","Brusch","Brush","Brusquement","Brussels","Brust","Brute","Bruton","Brutus","Bruxelles","Bruyere","Bryan","Bryant","Bryce","Brynhild","Brødre","Brücke","Brüder","Bubble","Bubbles","Buben","Buccaneer","Buccleuch","Buchan","Buchanan","Buche","Buchez","Buchstaben","Bucket","Buckhurst","Buckingham","Buckinghamshire","Buckland","Bucklaw","Buckle","Buckley","Buckner","Bucks","Buckstone","Bucky","Budapest","Buddha","Buddhas","Buddhism","Buddhist","Buddhistic","Buddhists","Buddir","Buddy","Budge","Budget","Buecher","Buehne","Buell","Buena","Buenos","Buerger","Buergerschaft","Buffalo","Buffon","Buford","Build","Builder","Builders","Building","Buildings","Built","Bulgaria","Bulgarian","Bulgarians","Bulgars","Bulger","Bullard","Bullen","Buller","Bulletin","Bullets","Bullions","Bullock","Bulls","Bully","Bulmer","Bulow","Bulstrode","Bulwer","Bumble","Bumpus","Bunce","Bunch","Bundercombe","Bungay","Bunker","Bunny","Bunsen","Bunting","Buntingford","Bunyan","Buonaparte","Buonarroti","Burbank","Burchard","Burckhardt","Burden","Burdett","Bureau","Buren","Burgess","Burgesses","Burgh","Burghley","Burgomaster","Burgos","Burgoyne","Burgsdorf","Burgundian","Burgundians","Burgundy","Burial","Buried","Burke","Burkina","Burleigh","Burley","Burlingame","Burlington","Burma","Burmah","Burman","Burmese","Burnamy","Burne","Burned","Burnet","Burnett","Burney","Burnham","Burning","Burns","Burnside","Burnt","Burrell","Burrill","Burroughs","Burrows","Bursch","Bursche","Burschen","Bursley","Burst","Bursting","Burton","Burundi","Busch","Busen","Bushman","Bushmen","Business","Bussi","Bussy","Buster","Butch","Butcher","Buteau","Butler","Butte","Butter","Butterfield","Butterflies","Butterfly","Butterworth","Buttler","Button","Buttons","Butts","Buxieres","Buxton","Buzzard","Byers","Byles","Byrne","Byron","Byronic","Bysshe","Byzantine","Byzantium","Bäume","Bäumen","Børn","Bücher","Bühne","Bürger","CAPÍTULO","Caballero","Cabbage","Cabell","Cabin","Cabinet","Cabinets","Cable","Cabot","Cabul","Cactus","Caddy","Cadell","Caderousse","Cadet","Cadets","Cadiz","Cadmus","Cadogan","Cadoudal","Cadurcis","Cadwallader","Caecilius","Caelius","Caere","Caesar","Caesarea","Caesars","Caffie","Café","Cagayan","Cagliostro","Cahors","Caiaphas","Caire","Cairns","Cairo","Caithness","Caius","Cakes","Calabar","Calabria","Calabrian","Calais","Calamity","Calcutta","Calder","Calderon","Caldigate","Caldwell","Caleb","Caledonia","Caledonian","Calendar","Calhoun","Caliban","Calico","Calicut","Calif","California","Californian","Californians","Caligula","Caliph","Callaghan","Callandar","Callao","Calle","Called","Callender","Callimachus","Calling","Calliope","Callonby","Calls","Cally","Calmly","Calonne","Calpurnius","Calton","Calvary","Calvert","Calvin","Calvinism","Calvinist","Calvinistic","Calvinists","Calypso","Calyste","Cambaceres","Camber","Cambodia","Cambon","Cambrai","Cambray","Cambremer","Cambrian","Cambridge","Cambridgeshire","Cambyses","Camden","Camel","Camelot","Camels","Camera","Cameron","Cameroon","Camilla","Camille","Camillo","Camillus","Camisards","Camoens","Camors","Campagna","Campaign","Campan","Campanella","Campania","Campanian","Campbell","Campbells","Campeador","Camped","Camper","Camperdown","Campion","Campo","Camps","Campus","Camus","Camusot","Canaan","Canaanite","Canaanites","Canada","Canadas","Canadian","Canadians","Canadien","Canal","Canalis","Canaries","Canary","Canby","Cancer","Candace","Candahar","Candeur","Candia","Candida","Candidate","Candidates","Candide","Candido","Candle","Candles","Candy","Canfield","Cannae","Canned","Cannes","Canning","Cannon","Cannot","Canoe","Canoes","Canon","Canongate","Canons","Canova","Canst","Canterbury","Canticles","Canto","Canton","Cantons","Cantor","Canty","Canute","Canyon","Capable","Capacity","Capel","Capella","Caper","Capernaum","Capes","Capet","Capitain","Capitaine","Capital","Capitan","Capitol","Capitoline","Cappadocia","Cappy","Capri","Capricorn","Captain","Captaine","Captaines","Captains","Captive","Captivity","Capture","Captured","Capua","Capuchin","Capuchins","Capulet","Caracalla","Caracas","Caradoc","Caravan","Carbajal","Carbo","Carbon","Carboniferous","Carbuncle","Carbury","Cardan","Cardello","Carden","Cardenio","Cardew","Cardiff","Cardigan","Cardinal","Cardinals","Cardonnet","Cardoville","Cardross","Cards","Career","Careful","Carefully","Careless","Cares","Carew","Carey","Carfax","Caria","Caribbean","Caribs","Carinthia","Carker","Carleton","Carley","Carlisle","Carlo","Carlos","Carlotta","Carlsbad","Carlsruhe","Carlton","Carlyle","Carlyon","Carmel","Carmelite","Carmelites","Carmen","Carmichael","Carmina","Carmine","Carnaby","Carnac","Carnarvon","Carnatic","Carnegie","Carnival","Carnot","Carol","Carolina","Carolinas","Caroline","Carolinians","Carolyn","Caron","Carotte","Carpathians","Carpentaria","Carpenter","Carpenters","Carrara","Carrasco","Carriage","Carriages","Carrick","Carrie","Carried","Carrier","Carrington","Carrion","Carrol","Carroll","Carrollton","Carrots","Carrousel","Carruthers","Carry","Carrying","Carson","Carstairs","Carta","Cartagena","Carte","Carter","Carteret","Carthage","Carthagena","Carthaginian","Carthaginians","Carthoris","Carthusian","Cartier","Carton","Cartoons","Cartwright","Carvajal","Carved","Carvel","Carver","Caryll","Casanova","Casas","Casaubon","Casca","Cascade","Cascades","Cases","Casey","Cashel","Cashmere","Casimir","Casino","Caspar","Casper","Caspian","Cassandra","Cassel","Cassia","Cassidy","Cassio","Cassius","Cassy","Castanier","Castel","Castell","Castello","Casterbridge","Casterley","Castiglione","Castile","Castilian","Castilians","Castilla","Castille","Castillo","Casting","Castle","Castlemaine","Castlemayne","Castlereagh","Castles","Castleton","Castlewood","Castor","Castries","Castro","Castruccio","Caswell","Catacombs","Catalan","Catalanes","Catalina","Catalog","Catalogue","Catalogues","Catalonia","Cataract","Catawba","Catch","Catching","Catechism","Caterina","Catesby","Catharine","Cathay","Cathcart","Cathedral","Cathelineau","Catherine","Catheron","Catholic","Catholicism","Catholics","Cathy","Catilina","Catiline","Catinat","Catlin","Catolicos","Caton","Catrina","Catriona","Cattaro","Cattle","Catullus","Catulus","Católicos","Caucasian","Caucasus","Cauchon","Caudle","Caught","Caulaincourt","Cauliflower","Cause","Causes","Causing","Caution","Cautious","Cautiously","Cavalcanti","Cavalier","Cavaliere","Cavaliers","Cavalry","Cavanagh","Cavendish","Caversham","Caves","Cavite","Cavor","Cavour","Cawnpore","Caxton","Cayenne","Cayley","Caylus","Cayrol","Cease","Cecil","Cecile","Cecilia","Cecily","Cedar","Cedars","Cedric","Celebes","Celebrated","Celebration","Celebrity","Celery","Celeste","Celestial","Celestine","Celia","Celie","Celinda","Celle","Cellini","Cells","Celsus","Celtic","Celts","Celui","Cemetery","Cenci","Cenis","Censor","Censorship","Censure","Census","Centaur","Centaurs","Centennial","Center","Central","Centre","Centreville","Cents","Centuries","Centurion","Century","Cependant","Cephas","Cephyse","Cerberus","Ceremonies","Ceremony","Ceres","Cerizet","Cerro","Certainement","Certainly","Certes","Cervantes","Cervera","Cesar","Cesare","Cesarine","Cesarini","Cesario","Cesena","Cette","Ceuta","Cevennes","Ceylon","Chabot","Chacun","Chadwick","Chain","Chains","Chair","Chairman","Chairs","Chaise","Chaka","Chalcis","Chaldaean","Chaldea","Chaldean","Chaldeans","Chalk","Challenge","Challenger","Challoner","Chalmers","Chalons","Chamber","Chamberlain","Chambers","Chambery","Chambord","Chambrais","Chambre","Chamillart","Chamonix","Champ","Champagne","Champagny","Champaign","Champion","Champions","Champlain","Champneys","Champs","Chanaan","Chance","Chancellor","Chancellorsville","Chancery","Chandler","Chandos","Chang","Change","Changed","Changes","Changing","Chanlouineau","Channel","Channing","Chanson","Chant","Chantilly","Chantrey","Chaos","Chapeau","Chapel","Chapelle","Chapin","Chapitre","Chaplain","Chaplin","Chapman","Chappell","Chapter","Chapters","Chaque","Character","Characteristic","Characteristics","Characterized","Characters","Charakter","Charaktere","Chardin","Chardon","Charenton","Charette","Charge","Charges","Charing","Chariot","Charities","Charity","Charivari","Charlemagne","Charlemont","Charleroi","Charles","Charleston","Charlestown","Charlevoix","Charley","Charlie","Charlot","Charlotte","Charlottesville","Charlton","Charlus","Charm","Charmed","Charmian","Charmides","Charming","Charms","Charnock","Charnot","Charolais","Charon","Charpillon","Chart","Charta","Charter","Charterhouse","Charteris","Charters","Chartist","Chartres","Chartreuse","Charybdis","Chase","Chasseurs","Chastity","Chateau","Chateaubriand","Chatelet","Chatfield","Chatham","Chatillon","Chatre","Chattahoochee","Chattanooga","Chatterton","Chaucer","Chaudiere","Chaulieu","Chaumont","Chauncey","Chauncy","Chaussee","Chautauqua","Chauvelin","Chauvenet","Chauxville","Chavigny","Chayne","Cheap","Cheapside","Cheat","Chebe","Check","Cheddar","Cheer","Cheerful","Cheers","Cheese","Cheever","Chelford","Chelmsford","Chelsea","Cheltenham","Chemical","Chemie","Chemist","Chemistry","Cheng","Chenier","Cheops","Cherbourg","Cherbury","Cherokee","Cherokees","Cherries","Cherry","Chersonese","Cherubim","Chesapeake","Cheshire","Chesnel","Chesney","Chess","Chest","Chester","Chesterfield","Chesterton","Chestnut","Chettle","Chevalier","Cheviot","Chevreuse","Cheyenne","Cheyennes","Cheyne","Chiang","Chicago","Chichester","Chichikov","Chick","Chickahominy","Chickamauga","Chickasaw","Chickasaws","Chicken","Chickens","Chico","Chicot","Chief","Chiefly","Chiefs","Chieftain","Chien","Chiffinch","Chihuahua","Child","Childe","Childers","Childhood","Children","Childs","Chile","Chilean","Chili","Chilian","Chill","Chillingly","Chillingworth","Chillon","Chilo","Chiloe","Chiltern","Chilton","Chimney","China","Chinaman","Chinamen","Chinatown","Chine","Chinese","Ching","Chingachgook","Chinon","Chinook","Chios","Chipmunk","Chippendale","Chippering","Chippewa","Chippewas","Chips","Chiron","Chisholm","Chiswick","Chivalry","Chloe","Chloris","Choate","Chocolate","Choctaw","Choctaws","Choice","Choir","Choiseul","Choisy","Cholera","Cholmly","Cholmondeley","Choose","Choosing","Chopin","Chops","Chorus","Chose","Chosen","Chosroes","Chouans","Choulette","Chris","Christ","Christabel","Christchurch","Christen","Christendom","Christi","Christian","Christiana","Christiania","Christianity","Christianized","Christians","Christie","Christina","Christine","Christmas","Christo","Christoph","Christophe","Christopher","Christoval","Christus","Christy","Chron","Chronicle","Chronicles","Chronology","Chrysantheme","Chrysippus","Chrysostom","Chrystie","Chuck","Chump","Chung","Chunky","Chupin","Church","Churches","Churchill","Churchman","Churchmen","Churchyard","Churton","Chute","Chuzzlewit","Château","Cibber","Cibot","Cicely","Cicero","Cigar","Cigarette","Cilicia","Cimabue","Cimbri","Cimon","Cimourdain","Cincinnati","Cinderella","Cinna","Cinnamon","Cinque","Cintre","Circassian","Circe","Circle","Circles","Circuit","Circular","Circumstance","Circumstances","Circus","Cirencester","Cisalpine","Cissie","Cissy","Cistercian","Citadel","Citations","Citie","Cities","Citizen","Citizens","Citoyens","Ciudad","Civic","Civil","Civilisation","Civilization","Civita","Claes","Clagny","Claiborne","Claim","Claimant","Claims","Clair","Claire","Clairmont","Clancy","Clandon","Clapham","Clapp","Clapperton","Clara","Clare","Clarence","Clarenden","Clarendon","Claret","Clarges","Clarice","Claridge","Clarinda","Clarion","Clarissa","Clarisse","Clark","Clarke","Clarkson","Clary","Clasping","Class","Classes","Classic","Classical","Classics","Classification","Claud","Claude","Claudet","Claudia","Claudian","Claudieuse","Claudine","Claudio","Claudius","Claus","Clause","Claverhouse","Clavering","Clawbonny","Claxon","Clayton","Clean","Clear","Clearing","Clearly","Cleek","Cleggett","Clelia","Clemence","Clemenceau","Clemency","Clemens","Clement","Clemente","Clementina","Clementine","Clements","Clennam","Cleomenes","Cleon","Cleone","Cleopatra","Clephane","Clerambault","Clerc","Clergy","Clergyman","Clerical","Clerk","Clerke","Clerkenwell","Clerks","Clermont","Clerval","Clery","Cleve","Cleveland","Clever","Cleves","Clichy","Cliff","Cliffe","Clifford","Cliffs","Clifton","Cliges","Climate","Climb","Climbing","Clinch","Cling","Clinging","Clinker","Clint","Clinton","Clive","Cllia","Clock","Clodius","Cloister","Clonbrony","Clorinda","Closed","Closely","Closer","Closing","Cloth","Clothed","Clothes","Clothing","Clotilde","Cloud","Clouds","Cloudy","Clough","Clovelly","Clover","Cloves","Clovis","Clowes","Clown","Clubs","Cluny","Clutching","Clyde","Clymer","Clytemnestra","Clytie","Clément","Cneius","Coach","Coalition","Coarse","Coast","Coastline","Coates","Cobbett","Cobbler","Cobden","Cobham","Coblentz","Coburg","Coburn","Cochin","Cochrane","Cockburn","Cocke","Cockney","Cocksmoor","Cocoa","Coconnas","Cocos","Codex","Coello","Coercion","Coeur","Coffee","Coffin","Cogan","Coggan","Cogia","Cohen","Cointet","Colambre","Colbert","Colburn","Colby","Colchester","Colchis","Colden","Coleman","Colenso","Coleridge","Coles","Colette","Colfax","Coligny","Colin","Colina","Coliseum","Collar","Collect","Collected","Collecting","Collection","Collective","Collector","College","Colleges","Colleville","Colley","Collie","Collier","Collin","Collingwood","Collins","Colloq","Collot","Colman","Colney","Cologne","Colomba","Colombia","Colombian","Colombo","Colon","Colonel","Colonels","Colonial","Colonies","Colonists","Colonization","Colonna","Colony","Color","Colorado","Colored","Colors","Colosseum","Colossians","Colossus","Colour","Coloured","Colours","Colquhoun","Colton","Columba","Columbia","Columbiad","Columbian","Columbine","Columbus","Column","Columns","Colville","Colvin","Colwood","Comanche","Comanches","Combat","Combe","Combien","Combination","Combined","Combray","Comedie","Comedies","Comedy","Comendador","Comenius","Comes","Comet","Comfort","Comforter","Comic","Comics","Comines","Comite","Comité","Command","Commandant","Commander","Commanders","Commanding","Commandment","Commandments","Commands","Comme","Commedia","Commencement","Commend","Commentaries","Commentary","Commerce","Commercial","Comminges","Commissary","Commission","Commissioner","Commissioners","Commissions","Commit","Committee","Committees","Commodore","Commodus","Common","Commonly","Commons","Commonwealth","Commune","Communication","Communications","Communion","Communism","Communist","Communists","Community","Comoros","Compact","Compagnie","Companies","Companion","Companions","Company","Compar","Comparative","Compared","Comparing","Comparison","Compass","Compassion","Compassionate","Compelled","Compendium","Compensation","Competition","Compiegne","Compiled","Complaint","Complaints","Complete","Completely","Compliance","Compliments","Compose","Composed","Composition","Compound","Compromise","Compton","Comptroller","Compuserve","Computer","Computers","Comrade","Comrades","Comstock","Comte","Comtesse","Comus","Comyn","Conall","Conan","Conant","Conceit","Conceive","Concepcion","Conception","Concern","Concerning","Concert","Concerto","Conch","Concha","Concho","Conciergerie","Conciliation","Concini","Concluding","Conclusion","Concord","Concordat","Concorde","Concordia","Conde","Condemned","Condillac","Condition","Conditions","Condor","Condorcet","Conduct","Conductor","Condy","Condé","Coney","Confederacy","Confederate","Confederates","Confederation","Conference","Conferences","Confess","Confession","Confessions","Confessor","Confidence","Confident","Confirmation","Conflict","Confound","Confucian","Confucianism","Confucius","Confused","Confusion","Congo","Congregation","Congregational","Congress","Congressional","Congressman","Congressmen","Congreve","Coningsby","Coniston","Conkling","Connal","Connaught","Connected","Connecticut","Connection","Connell","Connie","Connolly","Connor","Conolly","Conor","Conquer","Conqueror","Conquest","Conrad","Conrade","Conroy","Conscience","Conscious","Consciousness","Conseil","Consejo","Consent","Consequence","Consequences","Conservation","Conservative","Conservatives","Conservatoire","Consider","Considerable","Consideration","Considerations","Considered","Considering","Considine","Consisting","Consolation","Consolidated","Consort","Conspicuous","Conspiracy","Constable","Constance","Constancy","Constant","Constantia","Constantin","Constantine","Constantinople","Constantius","Constantly","Constituent","Constitution","Constitutional","Constitutions","Construction","Consuelo","Consul","Consular","Consulate","Consulates","Consuls","Consulship","Consult","Consulting","Consumption","Contact","Containing","Contains","Contarini","Conte","Contemplation","Contemporary","Contempt","Content","Contentment","Contents","Contes","Contessa","Contest","Conti","Contiguous","Continent","Continental","Continuation","Continue","Continued","Continuing","Contra","Contract","Contrary","Contrast","Contre","Contributions","Control","Controller","Controversy","Convent","Convention","Conventions","Conversation","Conversations","Converse","Conversion","Conviction","Convinced","Convocation","Conway","Conwell","Conyngham","Cooke","Cookery","Cooking","Cooley","Coolidge","Coombe","Coonrod","Cooper","Cooperation","Cooperative","Coote","Copeland","Copenhagen","Copernican","Copernicus","Cophagus","Copies","Copley","Copper","Copperfield","Copplestone","Coptic","Copyright","Coquelin","Coquenil","Coquette","Coral","Coralie","Corbario","Corbet","Corbett","Corbin","Corcoran","Corcyra","Cordelia","Cordeliers","Cordillera","Cordilleras","Cordova","Cordula","Corea","Corean","Corentin","Corey","Corfu","Corilla","Corinna","Corinne","Corinth","Corinthian","Corinthians","Coriolanus","Corliss","Cormac","Cormon","Corne","Corneille","Cornelia","Cornelis","Cornelius","Cornell","Cornelli","Corner","Corners","Cornet","Corney","Cornhill","Cornish","Cornwall","Cornwallis","Corny","Coromandel","Corona","Coronado","Coronation","Coroner","Corot","Corporal","Corporation","Corporations","Corps","Corpus","Correct","Corrected","Correction","Correggio","Correspondance","Correspondence","Correspondent","Correspondents","Corresponding","Corrie","Corriveau","Corrupted","Corruption","Corsair","Corse","Corsica","Corsican","Corso","Corson","Corte","Cortes","Cortez","Corticelli","Cortlandt","Corunna","Corvisart","Corwin","Corydon","Coryndon","Corysandre","Coryston","Cosaques","Cosette","Cosimo","Cosmic","Cosmo","Cosmopolitan","Cosmos","Cossack","Cossacks","Costa","Costanza","Costigan","Così","Cotswold","Cotta","Cottage","Cottard","Cottle","Cotton","Couch","Coulanges","Could","Couldn","Coulson","Council","Councillor","Councillors","Councils","Counsel","Counsellor","Count","Countenance","Counter","Countess","Counties","Counting","Countless","Countrey","Countries","Country","Countrymen","Counts","County","Coupeau","Couple","Courage","Courant","Courcelles","Courcy","Courier","Cours","Course","Court","Courtenay","Courtesan","Courtesy","Courtier","Courtiers","Courtland","Courtney","Courtois","Courts","Courtship","Cousin","Cousins","Couthon","Covenant","Covenanters","Covent","Coventry","Cover","Covered","Covering","Coverley","Covington","Cowan","Coward","Cowardly","Cowards","Cowes","Cowles","Cowley","Cowper","Cowperwood","Coyote","Crabb","Crabbe","Crabs","Crabtree","Crack","Cracked","Cracow","Cradle","Cradock","Craft","Craig","Craigie","Craik","Crampton","Cranch","Crane","Cranes","Cranford","Cranmer","Cranstoun","Crash","Crass","Crassus","Crauford","Craven","Crawford","Crawley","Crawshay","Craye","Crazy","Cream","Creamed","Crean","Created","Creating","Creation","Creative","Creator","Creature","Creatures","Crecy","Credit","Credo","Creech","Creed","Creeds","Creek","Creeks","Creeping","Crees","Creighton","Cremona","Creole","Creoles","Creon","Crescent","Cressida","Cresswell","Cressy","Cretaceous","Cretan","Cretans","Crete","Crevecoeur","Crevel","Crewe","Crichton","Cricket","Cried","Cries","Crillon","Crime","Crimea","Crimean","Crimes","Criminal","Criminals","Crimson","Cripple","Crisco","Criscoed","Crisis","Crisp","Crispin","Crispus","Cristo","Cristobal","Critic","Critical","Criticism","Critics","Critique","Crito","Crittenden","Croatia","Croatian","Croats","Croce","Crocker","Crockett","Crocodile","Croesus","Croft","Crofts","Croisier","Croisilles","Croisset","Croix","Croker","Croll","Croly","Cromarty","Cromer","Crompton","Cromwell","Cromwellian","Crook","Crooked","Crookes","Croquettes","Crosbie","Crosby","Cross","Crosse","Crossed","Crosses","Crossing","Crossjay","Croton","Crouch","Crouching","Crowd","Crowds","Crowe","Crowell","Crown","Crowne","Crowned","Crowns","Crows","Crowther","Croydon","Crozier","Cruchot","Crucifixion","Cruel","Cruelty","Cruise","Crumb","Crump","Crusade","Crusader","Crusaders","Crusades","Crushed","Crusoe","Crustacea","Crying","Crystal","Ctesias","Ctesiphon","Cuando","Cuban","Cubans","Cuchulain","Cuchulainn","Cuckoo","Cucumber","Cucumbers","Cuddie","Cuffe","Cuffy","Culch","Culkin","Cullen","Culling","Culloden","Culpeper","Culpepper","Cultivation","Cultur","Culture","Culver","Cumae","Cumana","Cumberland","Cumming","Cummings","Cummins","Cumnor","Cumulative","Cunard","Cunning","Cunningham","Cupid","Cupids","Cupples","Curate","Curdie","Curia","Curio","Curiosities","Curiosity","Curious","Curiously","Curly","Curran","Currant","Currency","Current","Currie","Curry","Curse","Cursed","Curses","Curtain","Curtis","Curtius","Curzon","Curé","Cushing","Cushman","Custard","Custer","Custis","Custom","Customs","Cuthbert","Cuthrell","Cutler","Cutter","Cutting","Cuttle","Cutts","Cutty","Cuvier","Cuzco","Cybele","Cycle","Cyclopaedia","Cyclopean","Cyclopedia","Cyclops","Cymbeline","Cynic","Cynthia","Cynthy","Cypress","Cyprian","Cypriot","Cyprus","Cyrano","Cyrene","Cyril","Cyrus","Cytherea","Czarina","Czech","Czechoslovakia","Czechs","CÃ¦sar","Cæsar","Cécile","César","Césarine","Cétait","DArtagnan","DOÑA","Daarna","Daarom","Dabei","Dabney","Daburon","Dacier","Dacre","Dacres","Daddy","Daedalus","Dagaeoga","Daganoweda","Dagegen","Dagen","Daggett","Dagny","Dagobert","Dagon","Daher","Dahlia","Dahomey","Daily","Dainty","Dairy","Daisy","Dakerlia","Dakota","Dakotas","Dalgetty","Dalhousie","Dalibard","Dallam","Dallas","Dalles","Dalmatia","Dalmatian","Dalrymple","Dalton","Dalzell","Damals","Damaris","Damas","Damascus","Damask","Damayanti","Damen","Damer","Dames","Damian","Damis","Damit","Dammauville","Damme","Damnation","Damned","Damocles","Damon","Dampier","Damsel","Danae","Danavas","Danby","Dance","Dances","Dancing","Dancy","Dandolo","Dandy","Danes","Daney","Danforth","Danger","Dangerous","Dangers","Danglars","Daniel","Daniella","Daniels","Dankbarkeit","Dannie","Danny","Dante","Dantes","Danton","Dantzic","Dantzig","Danube","Danusia","Danvers","Danville","Daphne","Daphnis","Dapple","Darauf","Darby","Darcy","Dardanelles","Darien","Daring","Dario","Darius","Darkness","Darley","Darling","Darlington","Darmstadt","Darnay","Darnley","Darrel","Darrell","Darrin","Darrow","Darry","Darstellung","Dartie","Dartmoor","Dartmouth","Dartrey","Darum","Darwin","Darwinian","Darwinism","Darya","Darzac","Dasein","Daseins","Daseyn","Dashwood","Dasmarinas","Dated","Dates","Daubrecq","Daudet","Dauer","Daughter","Daughters","Daughtry","Dauphin","Dauphine","Dauphiness","Davenant","Davenport","Davers","David","Davids","Davidson","Davie","Davies","Davis","Davison","Davitt","Davoust","Dawes","Dawker","Dawkins","Dawson","Dawtie","Dayaks","Daylight","Dayton","DeWitt","Deacon","Deadly","Dealing","Deane","Deanery","Deans","Dearborn","Dearest","Dearly","Death","Deaths","Debate","Debates","Debby","Deberle","Deborah","Debray","Debts","Decaen","Decalogue","Decameron","Decatur","Decay","Deccan","Deceit","Deceived","December","Deception","Dechartre","Decidedly","Decima","Decimus","Decision","Decius","Decke","Decker","Declan","Declaration","Declare","Decline","Decorated","Decoration","Decorations","Decree","Decrees","Dedalus","Dedicated","Dedication","Dedlock","Deeds","Deeper","Deeply","Deerham","Deering","Deerslayer","Deeze","Defarge","Defeat","Defeated","Defect","Defects","Defence","Defend","Defender","Defense","Defiance","Define","Definition","Defoe","Degas","Degen","Degree","Degrees","Deine","Deinen","Deiner","Deirdre","Deities","Deity","Dejah","Dekker","Delacour","Delacroix","Delafield","Delagoa","Delamere","Delancy","Delaney","Delano","Delany","Delaunay","Delaware","Delawares","Delay","Deleah","Delectable","Delegate","Delegates","Delft","Delhi","Delia","Delicacy","Delicate","Delicious","Delight","Delighted","Delightful","Delights","Delilah","Delille","Delineator","Deliver","Deliverance","Delivered","Deliverer","Della","Delmonico","Delobelle","Delorme","Delos","Delphi","Delphic","Delphin","Delphine","Delsarte","Delta","Deluge","Delvile","Demain","Demand","Demands","Demdike","Demerara","Demeter","Demetrios","Demetrius","Democracy","Democrat","Democratic","Democrats","Democritus","Demon","Demons","Demonstration","Demorest","Demosthenes","Dempsey","Dempster","Denbigh","Denham","Denis","Denise","Denison","Denisov","Denken","Denkens","Denmark","Denna","Dennant","Denne","Denning","Dennis","Dennison","Dennoch","Denny","Denonville","Denry","Denton","Denver","Denys","Denzil","Depart","Departing","Department","Departments","Departure","Depend","Depends","Deposit","Depot","Deppingham","Deprived","Deptford","Depth","Depuis","Deputies","Deputy","Derby","Derbyshire","Derek","Deres","Derfor","Derigny","Deringham","Derleth","Dermot","Deronda","Deroulede","Derpå","Derrick","Derriere","Derringham","Derrière","Derry","Derselbe","Derues","Derville","Dervish","Dervishes","Derwent","Desaix","Desborough","Descartes","Descend","Descending","Descent","Describe","Description","Descriptions","Descriptive","Desde","Desdemona","Desert","Deserted","Desertification","Design","Designs","Desire","Desiree","Desires","Desiring","Desirous","Desmarets","Desmond","Desmoulins","Desnoyers","Desolation","Despair","Despard","Despatch","Despatches","Desperate","Desperately","Despise","Despite","Despues","Después","Desroches","Dessa","Dessau","Destiny","Destitute","Destroy","Destroyer","Destruction","Desvarennes","Details","Detective","Determination","Determined","Detricand","Detroit","Detta","Deucalion","Deuce","Deuteronomy","Deutsch","Deutsche","Deutschen","Deutschland","Deutschlands","Devant","Development","Deventer","Devereux","Device","Devil","Devils","Devin","Devine","Devlin","Devon","Devonian","Devonshire","Devoted","Devotion","Dewan","Dewey","Dexter","Dezember","Dhananjaya","Dharma","Dhrishtadyumna","Dhritarashtra","Diable","Diablo","Diabolus","Diagram","Dialect","Dialogue","Dialogues","Diamond","Diamonds","Diana","Diane","Diantha","Diarmuid","Diary","Diavolo","Dibdin","Dichter","Dichters","Dichtung","Dickens","Dickey","Dickie","Dickinson","Dickon","Dickson","Dicky","Dictator","Dictionary","Dictionnaire","Diderot","Didier","Didon","Didst","Didymus","Diego","Diemen","Diener","Dienst","Dienste","Dieppe","Diese","Diesen","Dieser","Dieses","Dietrich","Dieux","Difference","Differences","Different","Difficult","Difficulties","Difficulty","Digby","Digest","Digital","Dignity","Digraph","Dijon","Diligence","Dilke","Dillon","Dilly","Dilworthy","Dimly","Dimsdale","Dinadan","Dinah","Dined","Dingaan","Dinge","Dingen","Dinges","Dingley","Dining","Dinks","Dinmont","Dinna","Dinner","Dinsmore","Dinwiddie","Diocletian","Diodoros","Diodorus","Diogenes","Diomed","Diomede","Diomedes","Dionysia","Dionysius","Dionysus","Diplomacy","Diplomatic","Dirck","Direck","Direct","Direction","Directions","Directly","Director","Directors","Directory","Direktor","Dirty","Disagreeable","Disappointed","Disappointment","Disaster","Disciple","Disciples","Discipline","Discontent","Discord","Discours","Discourse","Discourses","Discovered","Discoveries","Discovering","Discovery","Discretion","Discussion","Disdir","Disease","Diseases","Disgrace","Disko","Dismal","Dismiss","Disney","Disorder","Dispatch","Disposition","Dispute","Disputes","Disraeli","Dissenters","Dissenting","Dissertation","Dissolution","Dissolve","Distance","Distant","Distinction","Distinguished","Distress","Distressed","Distributed","Distribution","District","Districts","Distrust","Ditch","Dites","Ditmar","Ditto","Divan","Divers","Diversion","Diversions","Dives","Divide","Divided","Divina","Divine","Divines","Divinity","Division","Divisions","Divorce","Dixie","Dixon","Djalma","Djebel","Djibouti","Djidda","Dmitri","Dmitrievna","Dnieper","Doane","Dobbin","Dobbs","Dobson","Docks","Docteur","Doctor","Doctors","Doctrine","Doctrines","Document","Documentos","Documents","Doddridge","Dodge","Dodgson","Dodsley","Dodson","Doesn","Doing","Doktor","Dokumente","Dolabella","Dolch","Dollar","Dollars","Dolly","Dolokhov","Dolores","Dolph","Dolphin","Doltaire","Domain","Dombey","Domenico","Domesday","Domestic","Domin","Domine","Dominey","Domingo","Domini","Dominic","Dominica","Dominican","Dominicans","Dominie","Dominion","Dominions","Dominique","Domino","Dominus","Domitian","Domitius","Domremy","Donal","Donald","Donaldson","Donat","Donatello","Donations","Donatus","Donau","Doncaster","Donde","Donegal","Donelson","Dongo","Donkey","Donna","Donne","Donnegan","Donnelly","Donner","Donovan","Doodle","Dooley","Doolittle","Doone","Doors","Dorado","Doran","Dorcas","Dorchester","Doreen","Doren","Dorfe","Doria","Dorian","Dorians","Doric","Doris","Dorjiling","Dorking","Dormer","Dorothea","Dorothy","Dorrit","Dorsenne","Dorset","Dorsetshire","Dorsey","Dotty","Douai","Douay","Double","Doubleday","Doubt","Doubtful","Doubting","Doubtless","Doubts","Douce","Dougal","Douglas","Douglass","Dounia","Douro","Dousterswivel","Dover","Dowager","Dowden","Dower","Dowling","Downe","Downes","Downing","Downs","Downstairs","Doyle","Dozen","Doña","Draft","Dragoch","Dragon","Dragoon","Dragoons","Drain","Drake","Drama","Dramatic","Dramatis","Drang","Draper","Draupadi","Dravot","Drawer","Drawing","Drawings","Drawn","Draws","Draxy","Drayton","Dread","Dreadful","Dream","Dreaming","Dreams","Dredlinton","Dresden","Dress","Dressed","Dresser","Dressing","Dreux","Drewyer","Dreyfus","Dried","Drift","Drill","Drink","Drinking","Drinks","Driscoll","Dritte","Dritter","Drive","Driven","Driver","Driving","Drogheda","Droit","Dromio","Dromore","Drona","Dropped","Dropping","Drops","Drosera","Drouet","Drove","Drowned","Druck","Druid","Druidical","Druids","Drummond","Drums","Drumsheugh","Drumtochty","Drunk","Drunkenness","Drupada","Drury","Druse","Druses","Drusilla","Drusus","Dryden","Dryfoos","Duane","Dublin","Dubois","Ducal","Ducange","Duchemin","Duchesne","Duchess","Duchessa","Duchesse","Duchies","Duchy","Ducie","Ducks","Duclos","Dudevant","Dudleigh","Dudley","Duerer","Duessa","Dufferin","Duffy","Dufour","Dugald","Dugdale","Dukes","Dulcie","Dulcinea","Duluth","Dulwich","Dumas","Dumbarton","Dumfries","Dumont","Dumoulin","Dumouriez","Dumping","Dunbar","Duncan","Dunciad","Duncombe","Dundas","Dundee","Dunglison","Dunham","Dunkel","Dunkelheit","Dunkirk","Dunlap","Dunlop","Dunmore","Dunne","Dunning","Dunno","Dunois","Dunstable","Dunstan","Dunstane","Dunster","Dunwoodie","Dunyazad","Duomo","Dupin","Duplessis","Dupont","Dupre","Duquesne","Durance","Durand","Durant","Durante","Duras","Duration","Durazzo","Durban","Durch","Durgin","Durham","During","Duroc","Durrett","Durst","Durtal","Durward","Duryodhana","Dusky","Dusseldorf","Dutch","Dutchman","Dutchmen","Duties","Dutocq","Dutton","Dutzend","Duval","Duveyrier","Dwarf","Dwelling","Dwight","Dwyer","Dyaks","Dyckman","Dying","Dynasty","Därefter","Därför","Déjà","Dérigny","Déroulède","Døren","Dürer","EBook","EBooks","Eager","Eagerly","Eagle","Eagles","Eames","Earle","Earlier","Earliest","Earls","Early","Earnest","Earth","Earthly","Earthquake","Easily","Eastbourne","Easter","Easterfield","Easterly","Eastern","Easterns","Eastman","Easton","Eastport","Eastward","Eating","Eaton","Ebene","Ebenezer","Ebenso","Eberhard","Ebers","Ecbatana","Eccles","Ecclesiastes","Ecclesiastical","Ecclesiasticus","Echoes","Eclipse","Eclogues","Ecole","Economic","Economics","Economy","Ecoutez","Ector","Ecuador","Eddie","Edelmann","Edestone","Edgar","Edgerton","Edgeworth","Edict","Edinburgh","Edison","Edited","Edith","Editha","Edition","Editions","Editor","Editorial","Editors","Edmee","Edmond","Edmonds","Edmonstone","Edmonton","Edmund","Edmunds","Edomites","Edouard","Edric","Eduard","Eduardo","Educated","Education","Educational","Edward","Edwards","Edwin","Eenige","Eerst","Effect","Effects","Effendi","Effie","Effingham","Effort","Efforts","Efter","Egbert","Egeria","Egerton","Egipto","Eglantine","Eglington","Egmont","Egremont","Egypt","Egypte","Egypten","Egyptens","Egyptian","Egyptians","Ehkä","Ehren","Ehrfurcht","Ehrgeiz","Eichbaum","Eifer","Eifersucht","Eigenschaft","Eigenschaften","Eigentum","Eight","Eighteen","Eighteenth","Eighth","Eighty","Eihän","Eikä","Eikö","Eileen","Einar","Einbildung","Einbildungskraft","Eindelijk","Eindruck","Einem","Einen","Einer","Eines","Einfachheit","Einfall","Einfluss","Einfluß","Eingang","Einheit","Einige","Einladung","Einleitung","Einmal","Einrichtung","Einsamkeit","Einsicht","Einst","Einstein","Eintritt","Einwohner","Einzelne","Einzelnen","Einzelnheit","Eipä","Eisen","Eisenbahn","Eitelkeit","Either","Elaine","Elbert","Elbow","Elbridge","Elder","Elders","Eldest","Eldon","Eldorado","Eldred","Eldrick","Eldridge","Eleanor","Eleanore","Eleazar","Elect","Elected","Election","Elections","Elector","Electoral","Electorate","Electors","Electra","Electress","Electric","Electrical","Electricity","Electronic","Elegant","Elegy","Element","Elementary","Elemente","Elements","Elena","Elend","Eleonora","Elephant","Elephants","Eleseus","Eletto","Eleusinian","Eleusis","Elevated","Elevation","Eleven","Eleventh","Elfonzo","Elfrida","Elfride","Elgin","Eliab","Elias","Eliezer","Elihu","Elijah","Elinor","Eliot","Eliphalet","Eliphaz","Elisa","Elisabeth","Elisaveta","Elise","Eliseus","Elisha","Elixir","Eliza","Elizabeth","Elizabethan","Elkanah","Ellangowan","Ellen","Ellenborough","Eller","Ellerey","Ellery","Elles","Ellice","Ellie","Ellinor","Elliot","Elliott","Ellis","Ellison","Elliston","Ellsworth","Elmer","Elmira","Elmwood","Elnora","Elocution","Elodie","Elohim","Eloise","Eloquence","Elphinstone","Elsewhere","Elsie","Elsje","Elsley","Elsli","Elsmere","Elson","Elspeth","Eltern","Eltham","Elton","Elves","Elvira","Elwood","Elysee","Elysees","Elysian","Elysium","Elzevir","Email","Emancipation","Emanuel","Embankment","Embassador","Embassy","Emblem","Embrace","Embracing","Embroidery","Emeline","Emerald","Emergency","Emerging","Emerson","Emery","Emigration","Emile","Emilia","Emilie","Emilio","Emilius","Emily","Eminence","Eminent","Emirs","Emlyn","Emmanuel","Emmeline","Emmet","Emmett","Emory","Emotion","Emotions","Empedocles","Emperador","Empero","Emperor","Emperors","Emperour","Empfang","Empfindung","Empfindungen","Empire","Empires","Employed","Employee","Employment","Empress","Empty","Enchanted","Enclosed","Encore","Encounter","Encouraged","Encouragement","Encyc","Encyclopaedia","Encyclopedia","Endangered","Endeavor","Endeavour","Enden","Enderby","Endicott","Endless","Endlich","Endnote","Endor","Endowed","Endued","Endymion","Enemies","Enemy","Energie","Energy","Enfield","Enfin","Engaged","Engagement","Engel","Engeland","Engels","Engelsche","Engelschen","Enghien","Engine","Engineer","Engineering","Engineers","England","Englander","Englanders","Englands","Engle","English","Englishman","Englishmen","Englishwoman","Englishwomen","Engländer","Engraving","Engravings","Enguerrand","Enjoy","Enjoyment","Enkel","Enkä","Ennen","Ennius","Enoch","Enormous","Enough","Enquiry","Enraged","Enrica","Enrico","Enright","Enrique","Ensign","Ensuite","Entdeckung","Entente","Enter","Entered","Entering","Enterprise","Enters","Entertainment","Entertainments","Entfernung","Enthusiasm","Entire","Entirely","Entonces","Entrance","Entre","Entrez","Entry","Entscheidung","Entschluss","Entschluß","Entsetzen","Entstehung","Entwickelung","Entwicklung","Entónces","Environment","Environmental","Envoy","Eocene","Epaminondas","Epeira","Ephesians","Ephesus","Ephraim","Epictetus","Epicurean","Epicureans","Epicurus","Epigram","Epigrams","Epilogue","Epimetheus","Epiphanes","Epiphany","Epirus","Episcopacy","Episcopal","Episcopalian","Episcopalians","Episode","Epist","Epistemon","Epistle","Epistles","Epitaph","Epitome","Epoche","Epsom","Equal","Equality","Equally","Equator","Equatorial","Equipment","Equity","Eradicate","Erasmus","Erastus","Eratosthenes","Ercole","Erden","Erebus","Erect","Ereignis","Ereignisse","Erfahrung","Erfahrungen","Erfindung","Erfolg","Erfurt","Erfüllung","Ergebnis","Erhebung","Erica","Erich","Erick","Ericson","Ericsson","Erinnerung","Erinnerungen","Eritrea","Erkennen","Erkenntnis","Erkenntnisse","Erklaerung","Erklärung","Erlaubnis","Erling","Ermine","Erminia","Ernanton","Ernauton","Ernest","Ernestine","Ernie","Ernst","Erpingham","Erregung","Errington","Errol","Error","Errors","Erscheinung","Erscheinungen","Erskine","Erstaunen","Erste","Erster","Erwartung","Erwartungen","Erwin","Erzaehlung","Erzbischof","Erzherzog","Erziehung","Erzählung","Escape","Escaped","Eschman","Escobar","Escovedo","Esdras","Eskimo","Eskimos","Esmeralda","Esmond","Esmondet","Espagne","Espagnols","Espana","Espanola","España","Especially","Esperance","Espinosa","Espiritu","Esplanade","Esprit","EspÃ©rance","Espérance","Espíritu","Esquimaux","Esquire","Essai","Essay","Essays","Essen","Essence","Essenes","Essential","Essentials","Essex","Essington","Essper","Estaba","Established","Establishment","Estado","Estados","Estas","Estate","Estates","Esteban","Esteem","Estella","Estelle","Ester","Esterhazy","Esteri","Estevan","Esther","Estimate","Estimates","Estonia","Estos","Etain","Etats","Eternal","Eternity","Etext","Etexts","Ethan","Ethel","Ethelbert","Ethelberta","Ethelred","Ethelyn","Ether","Ethical","Ethics","Ethie","Ethiopia","Ethiopian","Ethiopians","Ethnic","Ethnol","Ethnology","Etienne","Etiquette","Etkö","Etruria","Etruscan","Etruscans","Ettrick","Että","Etudes","Etwas","Etymol","Etymology","Etzel","Euboea","Eucalyptus","Eucharist","Euclid","Eudora","Eudoxia","Euergetes","Eugen","Eugene","Eugenia","Eugenie","Eugenio","Eugenius","Eugène","Eugénie","Eulaeus","Eulalie","Euler","Eumaeus","Eumenes","Eumolpus","Eunice","Eunuch","Euphemia","Euphra","Euphrasia","Euphrates","Euphrosyne","Eureka","Eurem","Euren","Eurer","Eurie","Euripides","Europa","Europe","European","Europeans","Euryale","Eurydice","Eusebius","Eustace","Eustache","Eustacia","Eustis","Euston","Euthymia","Euxine","Evadne","Evandale","Evangelical","Evangeline","Evangelio","Evangelist","Evangelista","Evangelists","Evans","Evarts","Eveena","Eveleth","Evelina","Eveline","Evelyn","Evening","Event","Events","Eventually","Everard","Everett","Everlasting","Evers","Eversleigh","Every","Everybody","Everyday","Everyman","Everyone","Everything","Everywhere","Evesham","Evidemment","Evidence","Evidences","Evils","Evolution","Evreux","Evringham","Ewald","Ewell","Ewigkeit","Ewing","Exact","Exactly","Examen","Examination","Examinations","Examine","Examiner","Examining","Example","Examples","Excellence","Excellencies","Excellency","Excellent","Excelsior","Except","Excepting","Excess","Excessive","Exchange","Exchequer","Excise","Excited","Excitement","Exclusive","Excursion","Excuse","Execution","Executive","Exempel","Exercise","Exercises","Exeter","Exeunt","Exhausted","Exhibit","Exhibition","Exile","Existence","Existenz","Exodus","Expansion","Expect","Expectation","Expecting","Expedition","Expeditionary","Expeditions","Expenses","Experience","Experiences","Experiment","Experimental","Experiments","Expert","Explain","Explanation","Exploration","Exploring","Exports","Exposed","Exposition","Express","Expressing","Expression","Expressions","Exquisite","Extension","Extent","External","Externally","Extra","Extract","Extracts","Extraordinary","Extreme","Extremely","Eylau","Eysvogel","Ezechias","Ezechiel","Ezekiel","Ezzelin","Fabel","Faber","Fabian","Fabien","Fabio","Fabius","Fable","Fables","Fabre","Fabrice","Fabricius","Fabrik","Fabry","Faces","Facing","Facsimile","Factor","Factory","Facts","Faculties","Faculty","Faden","Fader","Faderen","Fadrique","Faellen","Faenza","Faerie","Faery","Fagan","Fagin","Fagon","Fahne","Fahrenheit","Fahrt","Failing","Failure","Faint","Faintly","Fairbanks","Fairburn","Fairchild","Faire","Fairest","Fairfax","Fairfield","Fairford","Fairies","Fairlie","Fairly","Fairport","Fairthorn","Fairview","Fairweather","Fairy","Fairyland","Faites","Faith","Faithful","Faithfully","Falaise","Falchion","Falco","Falcon","Falconer","Falkenberg","Falkland","Falkner","Falle","Fallen","Falling","Falloden","Fallow","Falls","Falmouth","False","Falsehood","Falstaff","Falsterhof","Falten","Familiar","Familiarity","Familie","Familien","Families","Family","Famine","Famous","Fanchon","Fancies","Fancy","Faneuil","Fannie","Fanning","Fanny","Fanshaw","Fanshawe","Fantastic","Faraday","Farao","Farbe","Farben","Farce","Fareham","Farewell","Faria","Farina","Faringhea","Farley","Farmer","Farmers","Farming","Farms","Farnese","Farnham","Farnsworth","Faroe","Farquhar","Farragut","Farrar","Farrell","Farrington","Farrow","Farther","Farwell","Fashion","Fashionable","Fassung","Fasten","Faster","Fasti","Fasting","Fatal","Fates","Father","Fatherland","Fathers","Fathom","Fatigue","Fatima","Fatty","Faubourg","Fauchery","Faugh","Faujas","Faulkner","Fault","Faults","Fauna","Fauntleroy","Faust","Fausta","Faustina","Faustine","Faustus","Fauvel","Fauville","Faversham","Favoral","Favorite","Favour","Favourite","Favre","Fawcett","Fawkes","Fayal","Fayette","Fayetteville","Fearful","Fearing","Fearless","Fears","Feast","Feather","Feathers","Featherstone","Features","Februar","February","Feder","Federal","Federalist","Federalists","Federals","Federated","Federation","Federigo","Federn","Feeble","Feeding","Feeling","Feelings","Feels","Fehler","Feind","Feinde","Feinden","Felde","Felder","Feldherr","Feldherrn","Felice","Felicia","Felicite","Felicity","Felipe","Felix","Fellow","Fellowes","Fellows","Fellowship","Felsen","Felton","Feltram","Female","Females","Feminine","Femme","Femmes","Fenella","Fenellan","Fenelon","Fenian","Fenians","Fenimore","Fenster","Fenstern","Fentolin","Fenton","Fenwick","Feodor","Ferdinand","Ferdinando","Ferdy","Fergus","Ferguson","Fergusson","Feria","Ferice","Fernand","Fernande","Fernandez","Fernando","Ferne","Ferner","Ferns","Ferragut","Ferrand","Ferrara","Ferrari","Ferrars","Ferrers","Ferret","Ferrier","Ferris","Ferrol","Ferry","Fersen","Fesch","Feste","Festing","Festival","Festivals","Festung","Festus","Fetch","Fetter","Feudal","Feudalism","Feuer","Fever","Feverel","Feversham","Fianna","Fichte","Fiction","Fiddle","Fidelis","Fidelity","Fieber","Field","Fielding","Fields","Fiend","Fierce","Fiercely","Fiery","Fiesco","Fiesole","Fifine","Fifteen","Fifteenth","Fifth","Fifty","Figaro","Fight","Fighting","Figur","Figure","Figuren","Figures","Fijian","Files","Filipinas","Filipino","Filipinos","Filippo","Fille","Filled","Fillgrave","Filling","Fillmore","Fills","Final","Finally","Finance","Finances","Financial","Finch","Finding","Findon","Finds","Fingal","Finger","Fingern","Fingers","Finish","Finished","Finland","Finlay","Finley","Finnish","Finns","Finot","Finsbury","Finsternis","Fionn","Fiorsen","Firando","Fired","Firefly","Firenze","Fires","Fireside","Firing","Firma","Firmin","Firmly","First","Firstly","Firth","Fiscal","Fische","Fischer","Fisher","Fisheries","Fisherman","Fishery","Fishes","Fishing","Fiske","Fisker","Fitch","Fitzgerald","Fitzhugh","Fitzmaurice","Fitzpatrick","Fitzroy","Fitzwilliam","Fiume","Fixed","Fixing","Flaccus","Flack","Flagg","Flags","Flambeau","Flame","Flames","Flametti","Flaming","Flaminius","Flamme","Flammen","Flanagan","Flanders","Flandre","Flasche","Flash","Flats","Flattery","Flaubert","Flavia","Flavian","Flavius","Flaxman","Fleck","Flecken","Fleda","Fleece","Fleet","Fleete","Fleetwood","Fleisch","Fleming","Flemings","Flemish","Flemming","Flesh","Fletcher","Fleur","Fleury","Flexen","Flies","Flight","Flinders","Fling","Flinging","Flint","Float","Floating","Flocks","Flodden","Flood","Floor","Flopper","Flora","Flore","Florence","Florent","Florentin","Florentine","Florentines","Florenz","Flores","Florian","Florida","Florimel","Florine","Florio","Florrie","Florry","Florus","Flosi","Floss","Flossie","Flossy","Flotte","Flour","Flourish","Flower","Flowering","Flowers","Flowing","Floyd","Fluch","Flucht","Fluegel","Flung","Flush","Flushed","Flushing","Fluss","Flute","Fluß","Flying","Flynn","Flügel","Foedor","Foger","Foker","Folco","Folding","Foley","Folgat","Folge","Folgen","Folio","Folkestone","Folket","Folklore","Folks","Folliard","Follow","Followed","Following","Folly","Folsom","Fonseca","Fontaine","Fontainebleau","Fontana","Fontanares","Fontanes","Fontanges","Fontenelle","Fontenoy","Foolish","Fools","Football","Foote","Footman","Footnote","Footnotes","Footsteps","Forasmuch","Forbear","Forbes","Forbid","Forbidden","Force","Forced","Forces","Forcing","Forderung","Forderungen","Fordyce","Foreign","Foreigners","Foreman","Foremost","Foresman","Forest","Forester","Forestry","Forests","Foret","Forever","Foreword","Forge","Forget","Forgetful","Forgetting","Forgiveness","Forgot","Forgotten","Forks","Forlorn","Formal","Forman","Formation","Formed","Formen","Former","Formerly","Forming","Formosa","Forms","Forney","Forrest","Forrester","Forsooth","Forster","Forsyte","Forsytes","Forsyth","Forsythe","Fortescue","Forth","Forthwith","Fortitude","Fortnightly","Fortress","Forts","Fortschritt","Fortuna","Fortunate","Fortunately","Fortunatus","Fortune","Fortunes","Forty","Forum","Forward","Fosdick","Fosse","Fossil","Foster","Fothergill","Fotheringay","Fouan","Fouche","Fouché","Found","Foundation","Foundations","Founded","Founder","Founding","Foundling","Fountain","Fountains","Fouquet","Fourcy","Fourier","Fourteen","Fourteenth","Fourth","Fourthly","Fowler","Fowls","Foxes","Frabelle","Fraeulein","Frage","Fragen","Fragment","Fragments","Frail","Fraisier","Frame","Framheim","Framley","Francais","Francaise","France","Frances","Francesca","Francesco","Franchise","Francia","Francie","Francine","Francis","Franciscan","Franciscans","Francisco","Franck","Franco","Francois","Francoise","Franconia","Francs","Frank","Franken","Frankenstein","Frankfort","Frankfurt","Frankfurter","Frankish","Frankland","Franklin","Frankly","Frankreich","Frankreichs","Frankrijk","Franks","Frans","Fransch","Fransche","Franschen","Frantz","Franz","Franziska","Franzosen","Français","Française","François","Françoise","Frascati","Fraser","Fraternity","Fraud","Frauen","Frauenzimmer","Fraulein","Frazer","Freckles","Freda","Freddie","Freddy","Frederic","Frederica","Frederick","Fredericksburg","Frederik","Freed","Freedmen","Freedom","Freeland","Freely","Freeman","Freemasonry","Freemasons","Freeport","Freiburg","Freie","Freien","Freight","Freiheit","Freiherr","Freilich","Frejus","Fremde","Fremden","Fremont","French","Frenchman","Frenchmen","Frenchwoman","Frenchwomen","Frenchy","Frequent","Frequently","Frere","Fresh","Freshman","Freshmen","Fresno","Freud","Freude","Freuden","Freudenberg","Freund","Freunde","Freunden","Freundes","Freundin","Freundlichkeit","Freundschaft","Freya","Freycinet","Friar","Friars","Frida","Friday","Fridays","Fried","Friede","Frieden","Friedens","Frieder","Friedland","Friedrich","Friend","Friendly","Friends","Friendship","Friesland","Frightened","Frisbie","Frisian","Frisians","Frist","Frith","Frithiof","Frits","Fritz","Fritzing","Frobisher","Froebel","Frogs","Froissart","Froken","Frome","Froment","Fromont","Fronde","Front","Frontenac","Frontier","Frontispiece","Frost","Frothingham","Froude","Frowenfeld","Frozen","Frucht","Fructidor","Fruen","Fruit","Fruits","Fräulein","Frère","Frédéric","Frøken","Früchte","Fuchs","Fudge","Fuego","Fuehrer","Fuentes","Fuerst","Fuersten","Fuesse","Fuessen","Fugitive","Fujinami","Fulco","Fulda","Fulham","Fulke","Fulkerson","Fullaway","Fuller","Fullerton","Fully","Fulton","Fulvia","Fulvius","Function","Fundamental","Fundamentals","Funds","Fundy","Funeral","Funktion","Funktionen","Funny","Furcht","Furies","Furioso","Furious","Furnace","Furneaux","Furness","Furnished","Furniture","Further","Furthermore","Fusiliers","Future","Fußnote","Fyodor","Fyodorovna","FÃ¼rsten","Fällen","Félicité","Félix","Führer","Fülle","Fürst","Fürsten","Fürstin","Füße","Füßen","Gaben","Gabinius","Gables","Gabon","Gaboon","Gabord","Gabriel","Gabriele","Gabriella","Gabrielle","Gackeleia","Gaelic","Gaeste","Gaeta","Gaetano","Gaffer","Gahan","Gaiety","Gaillard","Gaines","Gainsborough","Gaius","Galaad","Galahad","Galapagos","Galatea","Galatians","Galaxy","Galba","Galbraith","Galeazzo","Galen","Galena","Galerie","Gales","Galicia","Galician","Galilean","Galilee","Galileo","Galla","Gallagher","Galland","Gallant","Gallantry","Gallas","Gallatin","Galle","Galleries","Gallery","Gallia","Gallic","Gallica","Gallican","Gallico","Gallien","Gallilee","Gallipoli","Gallo","Galloway","Gallus","Galors","Galsworthy","Galton","Galusha","Galveston","Galway","Gamaliel","Gambetta","Gambia","Gambier","Gamble","Gambling","Games","Gamle","Gammon","Gandharva","Gandharvas","Gandiva","Ganelon","Ganga","Gange","Ganges","Ganymede","Ganze","Ganzen","Garcia","Garcilasso","Garda","Garde","Garden","Gardener","Gardening","Gardens","Gardeur","Gardiner","Gardner","Gareth","Garfield","Gargantua","Garibaldi","Garland","Garnache","Garnet","Garnett","Garnier","Garnish","Garonne","Garratt","Garret","Garrett","Garrick","Garrison","Garry","Garstin","Garston","Garten","Garter","Garth","Garvin","Garvington","Gascoigne","Gascon","Gascons","Gascony","Gascoyne","Gaskell","Gaspar","Gaspard","Gaspare","Gasse","Gastfreund","Gaston","Gates","Gateway","Gatewood","Gather","Gathered","Gathering","Gathol","Gatling","Gatte","Gatten","Gattin","Gatton","Gattung","Gaudissart","Gauley","Gaulish","Gauls","Gaunt","Gautama","Gautier","Gauvain","Gavard","Gavin","Gawain","Gawaine","Gawayne","Gawden","Gawein","Gawtrey","Gaydon","Gaylord","Gazebee","Gazen","Gazette","Gazetteer","Gazing","Geary","Gebet","Gebhard","Gebiet","Gebiete","Gebieter","Gebirge","Gebot","Gebrauch","Gebrauche","Geburt","Gebäude","Gedanke","Gedanken","Geddes","Gedicht","Gedichte","Geduld","Gedurende","Geese","Geest","Gefahr","Gefahren","Gefallen","Gefangenen","Gefolge","Gefuehl","Gefuehle","Gefühl","Gefühle","Gegen","Gegend","Gegenden","Gegensatz","Gegenstaende","Gegenstand","Gegenstande","Gegenstandes","Gegenstände","Gegenteil","Gegenwart","Gegner","Gehalt","Geheimnis","Gehen","Gehenna","Gehirn","Gehorsam","Geissler","Geist","Geiste","Geister","Geistes","Gelderland","Gelegenheit","Gelehrten","Geliebte","Geliebten","Gellius","Gelsomina","Gemach","Gemaelde","Gemahl","Gemahlin","Gemeinde","Gemeinden","Gemeinschaft","Gemma","Gemuet","Gemälde","Gemüt","Gendarmerie","General","Generale","Generall","Generally","Generals","Generation","Generations","Generosity","Generous","Genesee","Genesis","Genet","Geneva","Geneve","Genevese","Genevieve","Geneviève","Genevra","Genie","Genii","Genius","Genlis","Genoa","Genoese","Genossen","Gente","Gentile","Gentiles","Gentle","Gentleman","Gentlemen","Gentlewoman","Gently","Gentry","Genua","Genug","Genuine","Genus","Genuss","Genuß","Genève","Geoff","Geoffrey","Geoffroy","Geographic","Geographical","Geography","Geological","Geology","Geometry","Geordie","Georg","George","Georges","Georgetown","Georgette","Georgey","Georgia","Georgian","Georgiana","Georgians","Georgics","Georgie","Georgina","Georgy","Gerade","Geraint","Gerald","Geraldine","Gerard","Gerda","Gerechtigkeit","Gerfaut","Gerhard","Gerhardt","Gericht","Gering","Germain","Germaine","Germains","German","Germania","Germanic","Germanicus","Germans","Germantown","Germany","Geronimo","Gerrit","Gerry","Gershom","Gerson","Gertie","Gertrude","Gerty","Geruch","Gervais","Gervaise","Gervase","Gesandten","Gesang","Geschaeft","Geschaefte","Geschenk","Geschenke","Geschichte","Geschichten","Geschick","Geschlecht","Geschlechts","Geschmack","Geschrei","Geschwindigkeit","Geschwister","Geschäft","Geschäfte","Gesellen","Gesellschaft","Gesetz","Gesetze","Gesetzen","Gesetzes","Gesetztseyn","Gesicht","Gesichte","Gesichter","Gesinnung","Gesinnungen","Gespenst","Gespraech","Gespräch","Gessler","Gesta","Gestalt","Gestalten","Gesundheit","Gethryn","Gethsemane","Getreide","Getting","Gettysburg","Gewalt","Gewand","Gewerbe","Gewicht","Gewinn","Gewiss","Gewissen","Gewissheit","Gewiß","Gewißheit","Gewohnheit","Ghana","Gharib","Ghent","Ghetto","Ghibelline","Ghislaine","Ghita","Ghost","Ghosts","Giacinto","Giacomo","Gianluca","Giant","Giants","Giaour","Gibbie","Gibbon","Gibbons","Gibbs","Gibeon","Gibraltar","Gibson","Giddings","Gideon","Gifford","Gifted","Gifts","Gilbert","Gilberte","Gilchrist","Gilded","Gilder","Gilead","Giles","Gilfoyle","Gilgal","Gilles","Gillespie","Gillian","Gillis","Gilly","Gilman","Gilmore","Gilpin","Gimblet","Gimme","Ginevra","Ginger","Giordano","Giorgio","Giorgione","Giotto","Giovanna","Giovanni","Gipfel","Gipsies","Gipsy","Giraffe","Giraldus","Girard","Girardin","Giraud","Girls","Girolamo","Gironde","Girondins","Girondists","Girty","Giselle","Gisors","Gissing","Giton","Giulia","Giuliano","Giulio","Giuseppe","Giustiniani","Given","Giver","Gives","Giving","Gizur","Glacial","Glacier","Gladiator","Gladly","Gladstone","Gladstonian","Gladys","Glamorgan","Glance","Glancing","Glanvill","Glanville","Glanz","Glascock","Glasgow","Glass","Glasses","Glastonbury","Glaube","Glauben","Glaubens","Glaucus","Gleason","Glegg","Gleich","Gleichheit","Glenallan","Glenarvan","Glencoe","Glendower","Glengarry","Glenn","Glidden","Glied","Glieder","Gliedern","Glinda","Glistonbury","Glittering","Globe","Glocke","Gloom","Gloomy","Gloria","Glorious","Glory","Gloss","Glossary","Glossin","Gloster","Gloucester","Gloucestershire","Glover","Gloves","Gluck","Glueck","Glyndon","Glynn","Glück","Gnade","Gnaden","Goats","Gobseck","Gockel","Godalming","Godard","Goddard","Goddess","Goddesses","Godefroid","Godefroy","Godfrey","Godhead","Godlike","Godolphin","Godwin","Goethe","Goetter","Goetz","Gohier","Going","Goldberger","Golden","Goldie","Goldoni","Goldsboro","Goldsmith","Goldthwaite","Goldwin","Golgotha","Goliath","Golly","Gomez","Gomorrah","Goncourt","Gondi","Gondokoro","Gondreville","Gondy","Goneril","Gonsalvo","Gonzaga","Gonzales","Gonzalez","Gonzalo","Gooch","Goodbye","Goodenough","Goodfellow","Goodman","Goodness","Goodnight","Goodrich","Goods","Goodwin","Goodwood","Goody","Goose","Gopher","Gordian","Gordon","Gordons","Gordonsville","Goree","Gorenflot","Gorge","Gorges","Gorgias","Gorgio","Gorgo","Gorgon","Gorham","Gorilla","Goring","Goriot","Gorka","Gorman","Gorse","Goschen","Goshen","Gospel","Gospels","Gosse","Gossip","Gotama","Gotha","Gotham","Gothard","Gothic","Goths","Gottes","Gottfried","Gottheit","Gottingen","Gottlieb","Gotzkowsky","Gouache","Goudar","Gough","Goujet","Gould","Gourgaud","Gourlay","Gourville","Gouvernement","Gouverneur","Government","Governments","Governor","Governors","Govinda","Gowdy","Gower","Graaf","Grabe","Gracchi","Gracchus","Grace","Graces","Gracie","Gracious","Grade","Gradgrind","Gradually","Grady","Graefin","Graeme","Grafen","Grafton","Graham","Grahame","Grail","Grain","Grainger","Gramercy","Grammar","Grammont","Gramont","Granada","Granby","Grand","Grandcourt","Grande","Grandees","Grandet","Grandeur","Grandfather","Grandier","Grandison","Grandissime","Grandma","Grandmamma","Grandmother","Grandpa","Grandpapa","Grands","Grandsire","Granet","Grange","Granger","Grania","Granite","Grannie","Granny","Grant","Granted","Grantham","Granting","Grantly","Grants","Granvelle","Granville","Grape","Grapes","Graphic","Grasmere","Grasping","Grass","Grasse","Grasshopper","Grassins","Grate","Grateful","Gratian","Gratitude","Grattan","Gratton","Gratz","Grauen","Graustark","Grave","Gravely","Graves","Gravesend","Gravity","Gravy","Graydon","Grays","Grayson","Great","Greater","Greatest","Greatly","Greatness","Greatorex","Greaves","Grece","Grecian","Grecians","Grecs","Greeby","Greece","Greek","Greeks","Greeley","Greely","Green","Greene","Greenfield","Greenland","Greenleaf","Greenock","Greens","Greenville","Greenwich","Greenwood","Greer","Greet","Greeting","Gregg","Gregoire","Gregor","Gregorian","Gregorio","Gregory","Gregson","Greif","Greis","Grenada","Grenadier","Grenadiers","Grenadines","Grendall","Grendel","Grenoble","Grenville","Grenze","Grenzen","Gresham","Greshamsbury","Gresley","Greta","Gretchen","Grete","Gretel","Grethel","Grettir","Greve","Greville","Greyle","Greys","Greyson","Gridley","Griechen","Griechenland","Grief","Griegos","Grier","Grierson","Grieve","Griff","Griffin","Griffith","Griffiths","Griggs","Grillhofer","Grimaldi","Grimani","Grimaud","Grimes","Grimly","Grimm","Grimsby","Grimshaw","Grind","Grinder","Griselda","Grisell","Grisons","Griswold","Grivois","Grizel","Grizzel","Grizzly","Groesse","Groningen","Groom","Groot","Groote","Groschen","Grose","Gross","Grosse","Grossen","Grossmutter","Grossvater","Grosvenor","Grote","Grotius","Groton","Grotto","Grouchy","Ground","Grounds","Group","Groups","Grouse","Grove","Grover","Groves","Growing","Growler","Grown","Grows","Growth","Großen","Großmutter","Großvater","Gruber","Gruende","Grund","Grunde","Grundlage","Grundsaetze","Grundsatz","Grundsätze","Grundy","Gruppe","Gruppen","Gryce","Grâce","Gräfin","Grèce","Grégoire","Größe","Gründe","Gründen","Guadaloupe","Guadalupe","Guadeloupe","Guard","Guardian","Guardians","Guards","Guarini","Guatemala","Guayaquil","Gudruda","Gudrun","Guelph","Guenever","Guerchard","Guerin","Guermantes","Guernsey","Guerra","Guerre","Guersaint","Guert","Guesclin","Guess","Guest","Guests","Guete","Guiana","Guicciardini","Guiche","Guida","Guide","Guided","Guides","Guido","Guienne","Guild","Guildford","Guildhall","Guilford","Guillaume","Guilt","Guilty","Guinea","Guinevere","Guion","Guiscard","Guise","Guises","Guizot","Gulch","Gulden","Gulliver","Gully","Gunga","Gunnar","Gunner","Gunning","Gunpowder","Gunst","Gunther","Guppy","Gurney","Gurth","Gussie","Gustav","Gustave","Gustavus","Guten","Gutenberg","Gutes","Guthrie","Guyana","Guyon","Guzerat","Guzman","Gwenda","Gwendolen","Gwendolyn","Gwilt","Gwynne","Gwynplaine","Gyges","Gymnasium","Gypsies","Gypsy","Gärten","Gäste","Gédéon","Gênes","Götter","Güte","Güter","HERRENs","Haand","Haanden","Haare","Haaren","Haarlem","Habeas","Haben","Habit","Habitat","Habits","Habsburg","Hacker","Hackers","Hacket","Hackett","Hackney","Hadad","Haddington","Haddock","Haddon","Hades","Hadji","Hadley","Hadrian","Hadst","Haeckel","Haelfte","Haende","Haenden","Haeuser","Hafen","Hafiz","Hafner","Hagan","Hagar","Hagen","Haggard","Haggerty","Hague","Hahnemann","Haight","Hainault","Haines","Haiti","Hakluyt","Hakon","Halbert","Halbinsel","Halcombe","Halcyone","Haldane","Haldimar","Haldin","Hales","Haley","Halfdan","Halfway","Halicarnassus","Halifax","Halkett","Hallam","Halle","Halleck","Hallelujah","Haller","Halles","Halley","Halliday","Hallin","Halliwell","Hallo","Halloa","Hallock","Halloo","Halloway","Hallowe","Hallowell","Halls","Hallward","Halse","Halsey","Halstead","Haltung","Halvor","Haman","Hamar","Hamath","Hambleton","Hamblin","Hamburg","Hamburger","Hamburgh","Hamel","Hamerton","Hamet","Hamid","Hamil","Hamilcar","Hamilton","Hamish","Hamlet","Hamley","Hamlin","Hammam","Hammer","Hammersmith","Hammond","Hampden","Hampshire","Hampstead","Hampton","Hanbridge","Hanbury","Hancock","Handbook","Handbuch","Handel","Handeln","Handing","Handle","Handlung","Handlungen","Hands","Handsome","Handwerk","Handy","Hanged","Hanging","Hangs","Hanks","Hanna","Hannah","Hannay","Hanne","Hannes","Hannibal","Hanno","Hannover","Hanover","Hanoverian","Hanse","Hanseatic","Hansel","Hansen","Hanska","Hanson","Hanssen","Hapgood","Haply","Happening","Happily","Happiness","Happy","Hapsburg","Harald","Haran","Harbert","Harbinger","Harbor","Harbour","Harcourt","Hardee","Harden","Hardenberg","Hardie","Hardin","Harding","Hardinge","Hardly","Hardwick","Hardwicke","Hardy","Hargrave","Harkaway","Harker","Harkness","Harlan","Harland","Harleian","Harlem","Harlequin","Harleston","Harley","Harlow","Harlowe","Harman","Harmon","Harmonie","Harmony","Harness","Harney","Harold","Haroun","Harpagon","Harpe","Harper","Harpers","Harran","Harrel","Harriet","Harriett","Harrigan","Harrington","Harriot","Harris","Harrisburg","Harrison","Harrow","Harry","Harsh","Harson","Harte","Hartfield","Hartford","Hartington","Hartley","Hartman","Hartmann","Hartmut","Hartwell","Harun","Harvard","Harvest","Harvester","Harvey","Harwich","Harwood","Hasan","Hasdrubal","Haskell","Hassan","Hasta","Haste","Hasten","Hastening","Hastily","Hastings","Hasty","Hatch","Hatchie","Hater","Hatfield","Hathaway","Hathor","Hatred","Hatte","Hatteraick","Hatteras","Hattie","Hatton","Hauch","Haufen","Haughton","Haugwitz","Hauksbee","Haunted","Haupt","Haupte","Hauptmann","Hauptsache","Hauptstadt","Hause","Hauser","Hauses","Hausfrau","Hauskuld","Haute","Havana","Havannah","Havelaar","Havelock","Havelok","Haven","Haviland","Having","Havisham","Havre","Hawaii","Hawaiian","Haward","Hawbury","Hawes","Hawke","Hawkehurst","Hawker","Hawkes","Hawkesbury","Hawkesworth","Hawkeye","Hawkins","Hawley","Haworth","Hawthorne","Haycox","Hayden","Haydn","Haydon","Hayes","Haymarket","Hayne","Haynes","Hayti","Hayward","Haywood","Hazael","Hazard","Hazardous","Hazel","Hazeldean","Hazelton","Hazen","Hazlewood","Hazlitt","Headley","Headlong","Headquarters","Heads","Healing","Health","Healthy","Healy","Heaps","Heard","Hearing","Hearken","Hearn","Hearne","Hears","Hearst","Heart","Hearth","Hearts","Hearty","Heath","Heathcliff","Heathcote","Heathen","Heatherbloom","Heaton","Heauen","Heave","Heaven","Heavenly","Heavens","Heavily","Heavy","Heber","Hebert","Hebrew","Hebrews","Hebrides","Hebron","Hecate","Hecla","Hector","Hecuba","Hedda","Hederich","Hedge","Hedges","Hedjaz","Hedrick","Hedvig","Hedwig","Heedless","Heeft","Heemskerk","Heere","Heeren","Hegel","Heideck","Heidelberg","Heidi","Heidän","Heigh","Heigho","Height","Heights","Heikin","Heikki","Heilige","Heiligen","Heimat","Heine","Heinrich","Heinsius","Heinz","Heirs","Heiterkeit","Hektôr","Helaman","Helas","Helbeck","Helden","Helen","Helena","Helene","Helga","Helgi","Helicon","Heligoland","Heliodora","Heliopolis","Helios","Helium","Hella","Hellas","Hellenes","Hellenic","Hellenism","Hellenistic","Heller","Hellespont","Hellingman","Hello","Helmer","Helmholtz","Heloise","Helots","Helper","Helpless","Helps","Helsing","Helvetius","Helwyse","Heman","Hemans","Hemingway","Hemisphere","Hemstead","Hence","Henceforth","Henceforward","Henchard","Henderson","Hendes","Hendon","Hendricks","Hendrik","Hendryx","Heneage","Henery","Hengist","Henker","Henley","Hennepin","Hennes","Henri","Henrica","Henrich","Henrietta","Henriette","Henrik","Henriot","Henry","Henshaw","Henson","Henty","Hepburn","Hephzy","Hepzibah","Heracles","Heraclitus","Heraclius","Herakles","Herald","Herat","Herbart","Herbert","Herbs","Herbst","Herculaneum","Hercule","Herculean","Hercules","Herde","Herdegen","Herder","Hereafter","Hereat","Hereditary","Heredity","Hereford","Herefordshire","Herein","Heretofore","Hereupon","Hereward","Herewith","Heriot","Heritage","Herkimer","Herluf","Herman","Hermann","Hermas","Hermes","Hermia","Herminia","Hermione","Hermit","Hermitage","Hermon","Hermy","Hernandez","Hernando","Hernani","Herndon","Herne","Herod","Herodes","Herodias","Herodotus","Heroes","Heroic","Heron","Herra","Herran","Herre","Herren","Herrens","Herrera","Herrick","Herries","Herrin","Herring","Herrlichkeit","Herrn","Herrschaft","Herrscher","Herschel","Herse","Herself","Herstellung","Hertford","Hertfordshire","Hertz","Hervey","Herzegovina","Herzen","Herzens","Herzog","Herzogin","Herzogs","Hesiod","Hesper","Hesperides","Hesperus","Hesse","Hessian","Hessians","Hester","Hetta","Hetty","Heureusement","Heureux","Heute","Hewer","Hewitt","Hewson","Heyst","Heythorp","Heyward","Heywood","Hezekiah","Hiawatha","Hibbert","Hibernian","Hibiscus","Hickman","Hickory","Hicks","Hickson","Hidalgo","Hidden","Hides","Hiding","Hierauf","Hiero","Hieronymus","Higgins","Higginson","Higgs","Higher","Highest","Highgate","Highland","Highlander","Highlanders","Highlands","Highly","Highness","Highnesse","Highnesses","Highway","Highways","Hilaire","Hilary","Hilda","Hildebrand","Hildegarde","Hildreth","Hilfe","Hilliard","Hills","Hillsboro","Hillsborough","Hillyard","Hillyer","Hilma","Hilmer","Hilton","Hilyard","Himalaya","Himalayan","Himalayas","Himmel","Himmels","Himself","Hinchingbroke","Hinde","Hindenburg","Hindi","Hindman","Hindoo","Hindoos","Hindostan","Hindu","Hinduism","Hindus","Hindustan","Hindustani","Hinkel","Hinkki","Hinkle","Hinpoha","Hinsicht","Hinter","Hintergrund","Hintergrunde","Hinton","Hints","Hipparchus","Hippias","Hippo","Hippocrates","Hippodrome","Hippolyte","Hippolytus","Hippy","Hiram","Hirsch","Hirten","Hispanic","Hispaniola","Histoire","Historia","Historian","Historians","Historic","Historical","Historie","Histories","History","Hitchcock","Hither","Hitherto","Hitler","Hittite","Hittites","Hitze","Hjerte","Hobart","Hobbes","Hobbs","Hobhouse","Hoboken","Hobson","Hoche","Hochzeit","Hodder","Hodenosaunee","Hodge","Hodges","Hodgson","Hoehe","Hoelle","Hofer","Hoffman","Hoffmann","Hoffnung","Hoffnungen","Hofrat","Hogan","Hogarth","Hoheit","Hohenlo","Hohenlohe","Hohenzollern","Hohenzollerns","Hokkaido","Holbein","Holborn","Holbrook","Holcombe","Holcroft","Holden","Holder","Holderness","Holding","Holds","Holiday","Holies","Holiness","Holland","Hollandais","Hollande","Hollander","Hollanders","Hollandsche","Hollingford","Hollingsworth","Hollis","Hollister","Hollo","Hollow","Holloway","Holly","Holman","Holme","Holmes","Holofernes","Holroyd","Holstein","Holston","Holyhead","Holymead","Holyoke","Holyrood","Holzen","Homage","Homais","Homburg","Homer","Homeric","Homes","Homestead","Homeward","Homme","Hommes","Homoeopathic","Homoeopathy","Honduras","Honest","Honestly","Honesty","Honey","Honeyman","Honfleur","Hongkong","Honolulu","Honor","Honora","Honorable","Honorary","Honore","Honoria","Honorine","Honorius","Honors","Honoré","Honour","Honours","Hoogstraaten","Hooke","Hooker","Hooper","Hooray","Hoosier","Hoover","Hopalong","Hopeful","Hopeless","Hopes","Hoping","Hopkins","Hopkinson","Hopper","Horace","Horapollo","Horatio","Horatius","Horeb","Hornblower","Hornby","Horne","Horned","Horner","Hornet","Horns","Horrible","Horrid","Horrocks","Horror","Horrors","Horry","Horse","Horses","Horseshoe","Hortense","Hortensius","Horticultural","Horton","Horus","Hosanna","Hosea","Hosmer","Hospice","Hospital","Hospitality","Hospitals","Hosts","Hotchkiss","Hotel","Hotels","Hotham","Hotspur","Hottentot","Hottentots","Hough","Houghton","Hound","Hounds","Hounslow","Hours","House","Household","Houseman","Houses","Housing","Houston","Hoved","Hovedet","Hovey","Howard","Howards","Howat","Howbeit","Howdy","Howel","Howell","Howells","However","Howitt","Howland","Hoxton","Hrothgar","Hsiang","Hsueeh","Hsüeh","Huang","Hubbard","Huber","Hubert","Huckleberry","Hudibras","Hudson","Huegel","Huelfe","Huerta","Huette","Hughes","Hughie","Hughs","Huguenot","Huguenots","Hugues","Huguette","Hulda","Huldbrand","Hullo","Hulot","Human","Humane","Humanity","Humans","Humber","Humbert","Humble","Humbly","Humboldt","Humfrey","Humiliation","Humility","Humor","Humorists","Humorous","Humour","Humph","Humphrey","Humphreys","Humphry","Hunchback","Hunde","Hundred","Hundreds","Hungarian","Hungarians","Hungary","Hunger","Hungerford","Hungry","Hunne","Hunston","Hunter","Hunters","Hunting","Huntingdon","Huntington","Huntley","Huntly","Huntsman","Huntsville","Hurlbut","Hurley","Huron","Hurons","Hurra","Hurrah","Hurricane","Hurriedly","Hurry","Hurrying","Hurst","Hurstwood","Hurtado","Hurtle","Husband","Husbandry","Husbands","Huset","Hussars","Hussein","Hutchings","Hutchins","Hutchinson","Hutten","Hutter","Hutton","Huxley","Huxter","Huzza","Hyacinth","Hyacinthe","Hyder","Hydra","Hygiene","Hylas","Hylda","Hymen","Hymns","Hynds","Hypatia","Hyperion","Hypocrisy","Hyrcanus","Hyvä","Hyvästi","Hälfte","Hände","Händen","Hänellä","Hänen","Häntä","Häuser","Hånd","Hænder","Hélas","Hélène","Hôtel","Höhe","Hölle","Hügel","Hülfe","Hütte","Ibarra","Iberia","Iberian","Iberians","Iberville","Ibrahim","Ibsen","Icarus","Iceland","Icelandic","Ichabod","Idaho","Ideal","Idealism","Ideals","Ideas","Ideen","Identification","Identitaet","Identität","Idiot","Idleness","Idler","Idolatry","Idols","Idomeneus","Iduna","Idylls","Ierusalem","Iesus","Iglesia","Iglesias","Ignacio","Ignatius","Ignazia","Ignorance","Ignorant","Igorot","Ihnen","Ihrem","Ihren","Ihrer","Ihres","Iland","Ilands","Ileisa","Iliad","Ilion","Ilium","Illicit","Illinois","Illness","Illumination","Illus","Illusion","Illusions","Illust","Illustrated","Illustration","Illustrations","Illustrious","Illyria","Illyrian","Illyricum","Ilmarinen","Image","Images","Imaginary","Imagination","Imagine","Imgjor","Imitation","Imlac","Immaculate","Immanuel","Immediate","Immediately","Immense","Immer","Immigration","Immortal","Immortality","Immortals","Imogen","Imogene","Imola","Impatient","Impelled","Imperator","Imperfect","Imperial","Imperialism","Imperialist","Imperialists","Importance","Important","Imports","Impossible","Impressed","Impression","Impressions","Improved","Improvement","Improvements","Impudence","Impulse","Inasmuch","Inaugural","Incapable","Incarnate","Incarnation","Incas","Inches","Incident","Incidentally","Incidents","Inclination","Inclined","Included","Including","Income","Increase","Increased","Increasing","Incredible","Indeed","Indem","Independence","Independent","Independently","Independents","Inderdaad","Indes","Indessen","Index","India","Indiaman","Indian","Indiana","Indianapolis","Indianen","Indians","Indias","Indica","Indien","Indiens","Indies","Indifference","Indifferent","Indignant","Indignation","Indigo","Indios","Individual","Individuals","Individuen","Individuum","Indolence","Indonesia","Indra","Induction","Indulgence","Indus","Industrial","Industrie","Industries","Industry","Infant","Infanta","Infante","Infantes","Infantry","Infants","Inferior","Infernal","Inferno","Infidel","Infidels","Infinite","Infirmary","Inflammation","Inflation","Influence","Influenced","Inform","Information","Ingate","Ingeborg","Ingen","Ingenious","Inger","Ingersoll","Inglaterra","Inglethorp","Inglis","Ingmar","Ingolby","Ingram","Ingratitude","Ingredients","Ingrid","Inhabitants","Inhalt","Inhalte","Inhalts","Inheritance","Inigo","Initiative","Injin","Injun","Injuns","Injury","Injustice","Inland","Inlet","Inner","Innere","Innern","Innes","Innocence","Innocent","Innocents","Innsbruck","Innstetten","Innumerable","Inquire","Inquiries","Inquiry","Inquisition","Inquisitor","Inquisitors","Insall","Insane","Insanity","Inscription","Inscriptions","Insect","Insects","Insel","Inseln","Insensibly","Inshallah","Inside","Insolent","Insomuch","Inspector","Inspectors","Inspiration","Inspired","Installment","Instance","Instances","Instant","Instantly","Instead","Instinct","Instinctively","Institut","Institute","Institutes","Institution","Institutions","Instruction","Instructions","Instructor","Instrument","Instruments","Insult","Insurance","Insurgent","Insurrection","Intellect","Intellectual","Intelligence","Intelligencer","Intelligent","Intelsat","Intendant","Intense","Intent","Intention","Inter","Intercourse","Interesse","Interessen","Interest","Interesting","Interests","Interior","Intermediate","Internal","International","Internet","Interpol","Interpretation","Interpreter","Interstate","Interview","Interviewer","Intrigues","Introd","Introduced","Introduction","Introductory","Intuition","Intusschen","Invalides","Invasion","Invention","Inventions","Inverness","Investigation","Investigator","Investment","Invincible","Invisible","Invitation","Involuntarily","Inwardly","Inzwischen","Ionia","Ionian","Ionians","Ionic","Iphigenia","Iphigenie","Ippolito","Ipswich","Iranian","Ireland","Irenaeus","Irene","Ireton","Irgens","Irish","Irishman","Irishmen","Irishwoman","Irkutsk","Irons","Ironsides","Iroquois","Irregular","Irrigated","Irrtum","Irvin","Irvine","Irving","Irwin","Isaac","Isaacs","Isabel","Isabella","Isabelle","Isaiah","Isaias","Isaura","Iscariot","Iseult","Isham","Ishmael","Isidore","Iskander","Islam","Islamic","Island","Islander","Islanders","Islands","Islas","Isles","Islington","Ismael","Ismail","Isobel","Isocrates","Isolde","Isora","Isoult","Ispahan","Israel","Israeli","Israelite","Israelites","Israelitish","Israels","Issachar","Issoudun","Issue","Issued","Issues","Issus","Isthmian","Isthmus","Istoria","Istria","Italia","Italian","Italians","Italics","Italie","Italien","Italiens","Italy","Itaque","Ithaca","Ithuel","Itinerary","Itself","Ivanhoe","Ivanitch","Ivanoff","Ivanovitch","Ivanovna","Ivory","Izaak","Izumo","Jaafer","Jaakko","Jabez","Jacinto","Jackal","Jacket","Jackie","Jacks","Jackson","Jacksonville","Jacky","Jacob","Jacobean","Jacobi","Jacobin","Jacobinism","Jacobins","Jacobite","Jacobites","Jacobo","Jacobs","Jacobus","Jacopo","Jacqueline","Jacquemin","Jacques","Jadin","Jadwin","Jaeger","Jaffa","Jaffery","Jaggers","Jagienka","Jahre","Jahren","Jahres","Jahrh","Jahrhundert","Jahrhunderte","Jahrhunderts","Jaina","Jains","Jakob","Jakobs","Jamaica","Jamais","James","Jameson","Jamestown","Jamie","Jamieson","Jammer","Janamejaya","Janeiro","Janet","Janey","Janice","Janie","Janille","Janin","Janina","Janissaries","Jansen","Jansenists","Jansoulet","Jantje","Januar","January","Janus","Janvier","Japan","Japanese","Japhet","Japon","Jaques","Jardin","Jardine","Jared","Jargon","Jarndyce","Jarvie","Jarvis","Jasmin","Jasmine","Jason","Jaspar","Jasper","Javanese","Javert","Jawohl","Jealous","Jealousies","Jealousy","Jeanette","Jeanie","Jeanne","Jeannette","Jeannie","Jeannin","Jebel","Jeddak","Jeder","Jedes","Jeekie","Jeems","Jeeves","Jefferson","Jeffersonian","Jeffrey","Jeffreys","Jeffries","Jehan","Jehane","Jehoiada","Jehoiakim","Jehoshaphat","Jehovah","Jekyll","Jellicoe","Jelly","Jellyby","Jemima","Jemmy","Jener","Jenkin","Jenkins","Jenkinson","Jenks","Jenner","Jenney","Jennie","Jennifer","Jennings","Jenny","Jenseits","Jensen","Jephthah","Jeppe","Jeremiah","Jeremias","Jeremy","Jericho","Jermyn","Jeroboam","Jeroen","Jerome","Jerrie","Jerrold","Jerry","Jersey","Jerusalem","Jerusalems","JerusalÃ©n","Jervaise","Jervis","Jessamine","Jesse","Jessica","Jessie","Jessup","Jessy","Jester","Jesuit","Jesuits","Jesus","JesÃºs","Jesús","Jethro","Jetzt","Jeune","Jevons","Jewdwine","Jewel","Jewels","Jewess","Jewett","Jewish","Jewkes","Jewry","Jezebel","Jezus","Jimmie","Jimmy","Jimsy","Jingle","Jingo","Jinks","Jinny","Joachim","Joanna","Joanne","Joaquin","Joash","Jobson","Jocelyn","Jockey","Joffre","Johan","Johanan","Johann","Johanna","Johanneksen","Johannes","Johannesburg","Johnnie","Johnnies","Johnny","Johns","Johnson","Johnston","Johnstone","Joiada","Joined","Joint","Joinville","Joliet","Jolly","Jolyon","Jombateeste","Jonadab","Jonah","Jonas","Jonathan","Jondo","Jones","Jonesboro","Jonesville","Jonquiere","Jonson","Joppa","Joram","Jordan","Jorden","Jorge","Jorian","Joris","Jorrocks","Josaphat","Josef","Joseph","Josepha","Josephine","Josephus","Joshua","Josiah","Josias","Josie","Josserand","Josua","Josue","José","Jotham","Joubert","Jourdain","Jourdan","Journ","Journal","Journalism","Journals","Journey","Journeys","Jovial","Jovis","Jowett","Joyce","Joyeuse","Joyful","Joyous","Jozef","Juana","Juanita","Juanna","Juarez","Jubal","Jubel","Jubilee","Judaea","Judah","Judaism","Judar","Judas","Judea","Judean","Juden","Judge","Judged","Judgement","Judges","Judging","Judgment","Judicial","Judiciary","Judith","Judson","JudÃ¡","Judíos","Juengling","Juffrouw","Jugend","Jugurtha","Juhani","Juice","Juifs","Juillet","Jukes","Jules","Juley","Julia","Julian","Juliana","Julianus","Julich","Julie","Julien","Juliet","Juliette","Julio","Julius","Jumala","Jumalaa","Jumalan","Jumbo","Jumna","Jumping","Junction","Junge","Jungen","Jungfer","Jungfrau","Jungfrauen","Jungle","Junia","Junior","Juniper","Junipero","Junius","Junker","Junot","Junta","Jupiter","Jurand","Jurassic","Jurgen","Jurgis","Jurisdiction","Jurisprudence","Jusqu","Jussi","Juste","Justement","Justice","Justices","Justification","Justin","Justine","Justinian","Justus","Juteinin","Jutland","Juuri","Juvenal","Juvenile","Juxon","Jäger","Jésus","Jüngling","Kaaba","Kabul","Kadesh","Kaethe","Kaffee","Kaffir","Kaffirs","Kafir","Kafirs","Kahalaomapuana","Kaikki","Kaisa","Kaiser","Kaiserin","Kaisers","Kaksi","Kalevala","Kalle","Kalman","Kamala","Kamar","Kamchatka","Kameraden","Kames","Kammer","Kammerdiener","Kampf","Kampfe","Kamrasi","Kanag","Kanaka","Kanal","Kanawha","Kangaroo","Kanmakan","Kannst","Kansas","Kantian","Kantor","Kantos","Kanzler","Kapelle","Kapital","Kapitel","Kapor","Kappa","Kardinal","Karel","Karen","Karenin","Karin","Karma","Karmides","Karna","Karnak","Karnis","Karol","Karte","Karthago","Kartoffeln","Kashmir","Kaskaskia","Kaspar","Kasten","Kasyapa","Kategorie","Kategorien","Katelijne","Katerina","Katharina","Katharine","Katherine","Kathleen","Kathryn","Katie","Katinka","Katri","Katrina","Katrine","Katso","Katterle","Kattowitz","Katuti","Katze","Kauai","Kaufmann","Kaunitz","Kauravas","Kavanagh","Kayan","Kayans","Kazakhstan","Kazan","Keane","Kearney","Keating","Keats","Keble","Kedzie","Keeler","Keeling","Keene","Keeper","Keeping","Keeps","Keilhau","Keine","Keister","Keith","Keizer","Kekalukaluokewa","Keller","Kelley","Kellner","Kellogg","Kells","Kelly","Kelsey","Kelson","Kemble","Kemper","Kempis","Kenby","Kendal","Kendall","Kendrick","Kendricks","Kenelm","Kenesaw","Kenilworth","Kennebec","Kennedy","Kenner","Kenneth","Kennicott","Kennon","Kenntnis","Kenntnisse","Kenny","Kenric","Kensington","Kentish","Kenton","Kentuckian","Kentuckians","Kentucky","Kenya","Kenyon","Keokuk","Kepler","Keppel","Keraban","Keraunus","Kerels","Kerensky","Kerran","Kerry","Kershaw","Kerttu","Kesava","Kester","Keswick","Ketch","Ketchum","Kette","Ketten","Kettle","Kevin","Keyes","Keziah","Khalif","Khalifa","Khartoum","Khasi","Khasia","Khasis","Khedive","Khoja","Khyber","Kilcullen","Kildare","Kilgobbin","Kilkenny","Killarney","Killed","Killer","Killigrew","Killing","Kilpatrick","Kimball","Kimberley","Kimon","Kincaid","Kinde","Kinder","Kindergarten","Kindern","Kindes","Kindheit","Kindly","Kindness","Kinds","Kingdom","Kingdome","Kingdoms","Kingozi","Kings","Kingsland","Kingsley","Kingston","Kinney","Kinraid","Kintail","Kiowas","Kipling","Kirby","Kirche","Kirchen","Kiribati","Kirkbank","Kirke","Kirkham","Kirkland","Kirkpatrick","Kirkwood","Kirschner","Kirsty","Kissen","Kisses","Kissing","Kitchen","Kitchener","Kittredge","Kitts","Kitty","Klaas","Klage","Klagen","Klamm","Klang","Klara","Klarheit","Klasse","Klassen","Klaus","Kleber","Kleid","Kleider","Kleidern","Kleidung","Klein","Kleine","Kleinen","Kleist","Klemens","Klondike","Klopstock","Kloster","Klosterheim","Klugheit","Knabe","Knaben","Knapp","Knave","Knecht","Knechte","Kneel","Kneeling","Knickerbocker","Knife","Knight","Knightley","Knights","Knightsbridge","Knipp","Knives","Knochen","Knock","Knocking","Knoll","Knollys","Knoop","Knopf","Knowest","Knowing","Knowledge","Knowles","Known","Knows","Knoxville","Koenig","Koenige","Koenigin","Koenigs","Koenigsberg","Koenraad","Koerper","Koffer","Kohlhaas","Kohta","Kolbein","Komik","Kommen","Kommt","Komoedie","Konge","Kongen","Koning","Konrad","Konstantin","Konsul","Konto","Kopfe","Korah","Korak","Koran","Korea","Korean","Koreans","Korân","Koska","Kosovo","Kossuth","Kosten","Kotzebue","Koupriane","Kourroglou","Kraefte","Krafft","Kraft","Kramer","Kranke","Kranken","Krankheit","Krankheiten","Krantz","Kranz","Krause","Krebs","Kreis","Kreise","Kreisen","Kremlin","Kreuz","Krieg","Kriege","Krieger","Krieges","Kriemhild","Kripa","Krishna","Kristi","Kristus","Kritik","Krone","Krool","Kruger","Krupp","Krysanteus","Kräfte","Kshatriya","Kshatriyas","Kublai","Kuchen","Kuenstler","Kueste","Kugel","Kuinka","Kultur","Kummer","Kunde","Kunst","Kunstwerk","Kunti","Kupfer","Kurds","Kurtz","Kurus","Kutuzov","Kuwait","Kybird","Kyllä","Kyrgyzstan","KÃ¶nig","Käthe","Kéraban","König","Könige","Königin","Königs","Köpfe","Körper","Küche","Künstler","Laban","Labienus","Lablache","Laboratory","Labour","Labrador","Labyrinth","Lacedaemon","Lacedaemonian","Lacedaemonians","Lacedemonians","Lacey","Lachen","Lacheneur","Lachlan","Lacking","Laconia","Lacroix","Lactantius","Laddie","Laden","Ladie","Ladies","Ladislaw","Ladko","Ladrones","Ladyship","Ladysmith","Laecheln","Laelius","Laertes","Laertius","Laetitia","Lafayette","Lafcadio","Lafitte","Lager","Lagoon","Lagos","Lagrange","Laguna","Lahore","Laieikawai","Laielohelohe","Laing","Laird","Laissez","Lakes","Lalande","Lamanites","Lamar","Lamarck","Lamartine","Lamas","Lamballe","Lamberg","Lambert","Lambeth","Lambs","Lamennais","Lament","Lamme","Lamon","Lamont","Lamotte","Lampe","Lamps","Lanark","Lancashire","Lancaster","Lancastrian","Lance","Lancelot","Lancers","Lancet","Landa","Landau","Lande","Landed","Landen","Lander","Landers","Landes","Landet","Landgrave","Landing","Landis","Landlady","Landlord","Landor","Landry","Lands","Landscape","Landschaft","Landschaften","Landseer","Landshut","Lanfranc","Langdale","Langdon","Lange","Langeais","Langford","Langham","Langhetti","Langholm","Langlade","Langley","Langmaid","Langmore","Langton","Language","Languages","Languedoc","Lanier","Lanka","Lannes","Lansdowne","Lansing","Lansmere","Lanstron","Lantern","Lantier","Lanyard","Laocoon","Laodice","Lapham","Lapierre","Laplace","Lapland","Laporte","Laramie","Larcher","Lardner","Lares","Large","Larger","Largo","Larkin","Larkins","Larkspur","Larne","Larned","Larpent","Larrey","Larry","Larsan","Larsen","Lascelles","Lashmar","Lassalle","Lasse","Lassie","Lassiter","Lasst","Laster","Lastly","Lately","Later","Lateran","Latham","Lathrop","Latimer","Latin","Latine","Latins","Latitude","Latium","Latona","Latour","Latter","Latterly","Latvia","Laubardemont","Lauder","Lauderdale","Laufe","Laugh","Laughed","Laughing","Laughs","Laughter","Launay","Launcelot","Laune","Laura","Laure","Laureate","Laurel","Laurels","Laurence","Laurens","Laurent","Laurentian","Lauri","Laurie","Laurier","Lauriston","Lausanne","Lautrec","Lauzun","Laval","Lavalette","Lavater","Lavendar","Lavender","Laverick","Lavinia","Lavoisier","Lavretsky","Lawes","Lawford","Lawless","Lawrence","Lawry","Lawson","Lawton","Lawyer","Lawyers","Laxley","Layard","Layer","Laying","Layton","Lazare","Lazaro","Lazarus","Laßt","Leach","Leadenhall","Leader","Leaders","Leading","Leads","League","Leaguers","Leagues","Leamington","Leander","Leandro","Leaning","Leaping","Learn","Learned","Learning","Leary","Least","Leastways","Leather","Leave","Leavenworth","Leaver","Leaves","Leavitt","Lebanon","Lebeau","Lebel","Leben","Lebens","Leblanc","Lebrun","Lecky","Leclerc","Lecompton","Lecoq","Lecount","Lecture","Lecturer","Lectures","Leddy","Ledge","Ledger","Ledscha","Leech","Leeds","Lefebvre","Lefevre","Leffingwell","Legal","Legard","Legate","Legation","Legazpi","Legend","Legendre","Legends","Leger","Legge","Leghorn","Legion","Legionen","Legions","Legislatif","Legislation","Legislative","Legislature","Legislatures","Legrand","Legree","Lehmann","Lehre","Lehren","Lehrer","Leibe","Leibnitz","Leicester","Leicestershire","Leiche","Leichhardt","Leiden","Leidenschaft","Leidenschaften","Leider","Leigh","Leighton","Leila","Leinster","Leipsic","Leipz","Leipzig","Leipziger","Leistung","Leisure","Leiter","Leith","Leitung","Leland","Leman","Lemercier","Lemme","Lemminkainen","Lemnos","Lemon","Lempriere","Lemuel","Length","Lenin","Lennan","Lennox","Lenny","Lenoir","Lenora","Lenore","Lenox","Lenten","Lentulus","Leofric","Leoline","Leonard","Leonarda","Leonardo","Leone","Leoni","Leonidas","Leonie","Leonilda","Leonora","Leonore","Leontes","Leontine","Leopard","Leopold","Lepanto","Lepic","Lepidus","Lerat","Lerma","Leroux","Leroy","Lerwick","Lesbia","Lesbos","Lescure","Lesen","Leser","Lesley","Leslie","Lesotho","Lesser","Lessing","Lessingham","Lesson","Lessons","Lester","Lestrange","Lethe","Letitia","Letter","Letters","Letting","Lettre","Lettres","Lettuce","Letty","Leurs","Leute","Leuten","Levant","Levantine","Levasseur","Level","Leven","Lever","Levesque","Leviathan","Levin","Levis","Levison","Levite","Levites","Levitical","Leviticus","Lewes","Lewin","Lewis","Lewisham","Lexicon","Lexington","Leyburn","Leyden","Liancourt","Liane","Libanus","Libbie","Libby","Liber","Liberalism","Liberals","Liberation","Liberator","Liberia","Liberian","Liberties","Liberty","Librarian","Libraries","Library","Libre","Libya","Libyan","Libyans","License","Licentiate","Lichfield","Licht","Lichte","Lichtenstein","Lichter","Licinius","Liddell","Liddy","Lidgerwood","Lidia","Liebchen","Liebe","Lieber","Liebhaber","Liebig","Liebknecht","Liebling","Liechtenstein","Lieder","Liege","Lienhard","Lieut","Lieutenant","Lieutenants","Lifted","Lifting","Light","Lightfoot","Lighthouse","Lighting","Lightly","Lightning","Lights","Ligny","Ligue","Ligurian","Liisa","Liisan","Likely","Likewise","Lilburne","Lilian","Lilias","Lilienthal","Lilies","Lilith","Lilla","Lille","Lillian","Lillie","Lilliput","Lilly","Limehouse","Limerick","Limestone","Limited","Limits","Limoges","Limon","Limousin","Lincoln","Lincolnshire","Linda","Lindau","Linde","Linden","Lindley","Lindsay","Lindsey","Linen","Lines","Linforth","Lingard","Linie","Linien","Linken","Links","Linley","Linnaeus","Linnean","Linnet","Linton","Linus","Linux","Lionardo","Lionel","Lions","Liosha","Lippe","Lippen","Lippi","Lippincott","Lippo","Lipsius","Liquor","Liquors","Lisbeth","Lisboa","Lisbon","Lisette","Lisieux","Lisle","Lissac","Listen","Listening","Lister","Lists","Liszt","Lisée","Litany","Litchfield","Literacy","Literally","Literary","Literatur","Literature","Lithuania","Lithuanian","Litteratur","Littimer","Little","Littleton","Liturgy","Lived","Lively","Liver","Livermore","Liverpool","Lives","Livia","Living","Livingston","Livingstone","Livius","Livre","Livres","Lizard","Lizaveta","Lizzie","Lizzy","Liège","Llewellyn","Lloyd","Lobster","Local","Locality","Location","Lochias","Lochleven","Locke","Locked","Locken","Locker","Lockhart","Locks","Locksley","Lockwood","Locust","Loder","Lodge","Lodges","Lodgings","Lodovico","Loftus","Lofty","Logan","Logic","Logik","Logos","Logotheti","Lohengrin","Loignac","Loire","Loiseau","Lomax","Lombard","Lombards","Lombardy","Lomond","London","Londonderry","Londoner","Londoners","Londres","Lonely","Lonesome","Longdon","Longer","Longestaffe","Longfellow","Longford","Longing","Longinus","Longitude","Longman","Longmans","Longstreet","Longtemps","Longueville","Longwood","Longworth","Looke","Looked","Looking","Lookout","Looks","Loomis","Loose","Lopez","Lords","Lordship","Lordships","Lordy","Lorelei","Lorenz","Lorenzo","Lorette","Lorilleux","Lorimer","Loring","Loristan","Lorna","Lorne","Lorrain","Lorraine","Lorrequer","Lorry","Lorsqu","Lorsque","Losely","Losing","Lothair","Lothario","Lothian","Lothrop","Lotta","Lottchen","Lotte","Lottie","Lotus","Lotys","Louder","Loudon","Loudun","Loudwater","Lough","Louie","Louis","Louisa","Louisbourg","Louisburg","Louise","Louisiana","Louison","Louisville","Lourdes","Lousteau","Louvain","Louve","Louvier","Louvois","Louvre","Loved","Loveday","Lovejoy","Lovel","Lovelace","Lovell","Lovely","Lover","Lovers","Loves","Loving","Lowell","Lower","Lowestoft","Lowington","Lowland","Lowlands","Lowndes","Lowry","Lowth","Lowther","Loyal","Loyalists","Loyalty","Loyola","Lubbock","Lubeck","Lubin","Lucan","Lucas","Lucca","Lucerne","Lucia","Lucian","Luciano","Lucie","Lucien","Lucienne","Lucifer","Lucile","Lucilius","Lucilla","Lucille","Lucinda","Lucio","Lucius","Luckily","Lucknow","Lucky","Lucre","Lucrece","Lucretia","Lucretius","Lucrezia","Lucullus","Ludgate","Ludlow","Ludovic","Ludovico","Ludvig","Ludwig","Luego","Luella","Luellin","Lufton","Lugano","Luigi","Luisa","Luise","Lukin","Lumber","Lumley","Lunar","Lunch","Luncheon","Lundie","Lundy","Luneville","Lunnon","Luojan","Lupeaulx","Lupin","Lupus","Lurida","Luscinda","Lushington","Lusignan","Lusitania","Lutchester","Lutha","Luther","Lutheran","Lutherans","Luthers","Luttrell","Luxembourg","Luxemburg","Luxor","Luxury","Luynes","Luzon","Lyceum","Lycidas","Lycurgus","Lyddell","Lyddy","Lydgate","Lydia","Lydian","Lydiard","Lyell","Lygia","Lygian","Lying","Lyman","Lynch","Lynchburg","Lynda","Lynde","Lyndon","Lyndsay","Lynne","Lyons","Lyric","Lyrical","Lyrics","Lysander","Lysias","Lysimachus","Lyster","Lyttelton","Lytton","Lázaro","Lächeln","Länder","Länge","Lärm","Léon","Léonce","MCImail","Mabel","MacArthur","MacDonald","MacDowell","MacGregor","MacIan","MacLean","MacLure","MacMahon","MacNair","MacPherson","Macan","Macao","Macaroni","Macartney","Macassar","Macaulay","Macavoy","Macbeth","Maccabee","Maccabees","Macdonald","Macduff","Macedon","Macedonia","Macedonian","Macedonians","Macfarlane","Macgregor","Machiavel","Machiavelli","Machin","Machine","Machinery","Machines","Macht","Macintosh","Mackay","Mackenzie","Mackintosh","Macklin","Macko","Maclean","Macleod","Macmillan","Macon","Macpherson","Macquarie","Macquart","Macready","Macrinus","Macumazahn","Madagascar","Madaline","Madam","Madame","Maddalena","Madden","Maddox","Maddy","Madeira","Madeleine","Madeline","Mademoiselle","Madge","Madison","Madness","Madonna","Madonnas","Madras","Madre","Madrid","Maecenas","Maedchen","Maenner","Maennern","Maerchen","Maestricht","Maestro","Maeterlinck","Mafeking","Maffei","Magazine","Magazines","Magda","Magdala","Magdalen","Magdalena","Magdalene","Magdeburg","Magellan","Magen","Maggie","Maggiore","Magian","Magic","Magician","Magister","Magistrate","Magistrates","Maglena","Magloire","Magna","Magnesia","Magnetic","Magnetism","Magnificence","Magnificent","Magnolia","Magnus","Magog","Magpie","Magua","Maguire","Magus","Magyar","Magyars","Mahabharata","Mahadeva","Mahaffy","Mahal","Mahan","Maharajah","Mahars","Mahawanso","Mahbub","Mahdi","Maheu","Mahmoud","Mahmud","Mahomed","Mahomedan","Mahomedans","Mahomet","Mahometan","Mahometans","Mahommed","Mahommedan","Mahon","Mahony","Mahratta","Mahrattas","Maiden","Maidens","Maids","Maidstone","Maiestie","Maiesties","Maiesty","Maija","Maimie","Maimonides","Maine","Maintenance","Maintenant","Maintenon","Mainwaring","Mainz","Maire","Maisie","Maison","Maister","Maistre","Maitland","Maitre","Majestaet","Majeste","Majestic","Majesties","Majesty","MajestÃ¤t","Majestät","Majesté","Major","Majorca","Majority","Majors","Makely","Maker","Makers","Makes","Making","Makololo","Malabar","Malaca","Malacca","Malachi","Malaga","Malatesta","Malawi","Malay","Malayan","Malays","Malaysia","Malchus","Malcolm","Malcom","Malcourt","Maldives","Maldon","Maldonado","Malebranche","Maler","Malerei","Malesherbes","Malgre","Malgré","Malherbe","Malheur","Malheureusement","Malice","Malicorne","Malines","Malipieri","Mallard","Mallathorpe","Mallet","Malling","Mallock","Malloring","Mallory","Mallow","Malmaison","Malmesbury","Malone","Maloney","Malory","Malta","Malte","Maltese","Maltravers","Maluco","Maluka","Malvern","Malvolio","Maman","Mameluke","Mamelukes","Mamie","Mamma","Mammalia","Mammals","Mammon","Mammoth","Mammy","Mamsie","Management","Manager","Managers","Managing","Manassas","Manasse","Manasseh","Manasses","Manator","Mancha","Manche","Manchester","Manchu","Manchuria","Manchus","Mandans","Mandarin","Mandel","Mandeville","Mandi","Mandy","Manes","Manet","Manetho","Manette","Manfred","Manfredo","Mangan","Mangel","Mangles","Manhattan","Manhood","Manicamp","Manifestly","Manifesto","Manila","Manilla","Manisty","Manitoba","Manitou","Mankind","Manley","Manlius","Manly","Manna","Manne","Manner","Mannering","Manners","Mannes","Mannheim","Mannigfaltigen","Mannigfaltigkeit","Manning","Manoel","Manon","Manor","Manpower","Manse","Mansfeld","Mansfield","Mansion","Mansions","Mansoul","Manston","Mantel","Mantes","Manton","Mantoue","Mantua","Mantuan","Manual","Manuel","Manufacture","Manufacturers","Manufactures","Manufacturing","Manus","Manuscript","Manuscripts","Manzoni","Maori","Maoris","Maple","Mappo","Marais","Marat","Marathon","Marble","Marblehead","Marbury","Marcel","Marcella","Marcelle","Marcellinus","Marcello","Marcellus","March","Marchand","Marchant","Marchants","Marchbanks","Marchdale","Marche","Marches","Marchesa","Marchese","Marching","Marchioness","Marchmont","Marcia","Marcian","Marcius","Marck","Marco","Marcoline","Marconi","Marcos","Marcus","Marcy","Mardi","Mardonius","Marechal","Marechale","Maren","Marengo","Maret","Marfa","Margaret","Margarete","Margarita","Margate","Margery","Marget","Margie","Marginal","Margit","Margot","Margrave","Marguerite","Marhaus","Maria","Mariage","Mariamne","Marian","Mariana","Mariane","Marianna","Marianne","Mariano","Marie","Marien","Marietta","Mariette","Marigny","Marigold","Marilla","Marillac","Marin","Marina","Marine","Marinelli","Mariner","Mariners","Marines","Marini","Marino","Mario","Marion","Mariposa","Maris","Marise","Maritime","Mariuccia","Marius","Marivaux","Marjorie","Marjory","Marke","Marked","Market","Markham","Markland","Marko","Markovna","Marks","Markt","Marlanx","Marlborough","Marliani","Marlow","Marlowe","Marly","Marmaduke","Marmet","Marmion","Marmont","Marmontel","Marmor","Marmora","Marne","Marneffe","Marner","Marokko","Maroons","Marot","Marquand","Marques","Marquesas","Marquess","Marquette","Marquis","Marquise","Marriage","Marriages","Married","Marrineal","Marriott","Marrow","Marry","Marryat","Marsa","Marsan","Marsay","Marsch","Marschall","Marsden","Marse","Marseillais","Marseillaise","Marseille","Marseilles","Marsh","Marshal","Marshall","Marshals","Marshalsea","Marsham","Marshes","Marshpee","Marster","Marston","Marta","Marte","Martel","Marten","Martens","Martha","Marthe","Martial","Martian","Martians","Martie","Martin","Martina","Martindale","Martine","Martineau","Martinez","Martini","Martinique","Martinmas","Martino","Martins","Martinsburg","Martinus","Martius","Martti","Marty","Martyn","Martyr","Martyrdom","Martyrs","Martín","Maruts","Marvel","Marvell","Marvellous","Marvin","Marya","Maryland","Marylebone","Maryllia","Marys","Marysville","Maréchal","María","Masai","Masaniello","Mascarille","Mascarin","Maschine","Maschinen","Masculine","Masefield","Masha","Masham","Mashed","Maske","Maskull","Maslova","Mason","Masonic","Masonry","Masons","Masque","Masrur","Massa","Massachusetts","Massacre","Masse","Massen","Massena","Masses","Massey","Massingbird","Massinger","Masson","Masséna","Master","Masters","Masterton","Mastery","Maston","Mataafa","Matanzas","Match","Mateo","Mater","Materia","Material","Materials","Materie","Maternus","Matey","Mathematical","Mathematics","Mathematik","Mather","Mathew","Mathews","Mathias","Mathieu","Mathilda","Mathilde","Matho","Mathurin","Matilda","Matilde","Matin","Matlock","Matrena","Matrimony","Matron","Matta","Matteo","Matter","Matterhorn","Matters","Matth","Matthew","Matthews","Matthias","Matthieu","Matti","Mattie","Matty","Maturin","Maude","Mauer","Mauern","Maufrigneuse","Maugiron","Maule","Mauleon","Mauleverer","Maulevrier","Maupassant","Maupertuis","Mauprat","Maurepas","Maurevert","Maurice","Maurier","Mauritania","Mauritius","Maury","Mavering","Mavick","Mavis","Maxence","Maxim","Maxime","Maximilian","Maximilien","Maxims","Maximus","Maxine","Maxwell","Maybe","Mayberry","Mayence","Mayenne","Mayer","Mayeux","Mayfair","Mayflower","Mayhap","Mayhew","Maynard","Mayne","Maynooth","Mayor","Mayors","Maypole","Maysie","Mazarin","Mazarine","Mazda","Mazeroux","Mazzini","Maître","McAllister","McBride","McCLELLAN","McCall","McCann","McCarthy","McChesney","McClellan","McClernand","McClintock","McClure","McConathy","McCook","McCormick","McCoy","McCulloch","McDonald","McDougall","McDowell","McGee","McGill","McGraw","McGregor","McGuire","McHenry","McIntosh","McIntyre","McKINLEY","McKay","McKaye","McKee","McKenzie","McKinley","McLane","McLean","McLeod","McMahon","McMurdo","McNally","McNaughtan","McPherson","McTavish","McTeague","McTee","Mdlle","Meade","Meader","Meadow","Meadows","Meaning","Means","Meantime","Meanwhile","Meares","Measure","Measures","Measuring","Meath","Meaulnes","Meaux","Mebbe","Mebby","Mecca","Meccah","Mechanical","Mechanically","Mechanics","Mechlin","Mecklenburg","Medal","Medallion","Medea","Medes","Media","Mediaeval","Median","Mediator","Medical","Medicean","Medici","Medicine","Medicines","Medicis","Medieval","Medina","Meditation","Meditations","Mediterranean","Medium","Medora","Medusa","Medway","Meehan","Meeker","Meere","Meeres","Meeson","Meeting","Meetings","Megan","Megara","Mehemet","Mehrheit","Meidän","Meigs","Meilen","Meine","Meinen","Meinung","Meister","Meisters","Mekka","Melan","Melancholy","Melanchthon","Melanctha","Melancthon","Melanesian","Melas","Melbourne","Melchior","Melcombe","Meleager","Melicent","Melinda","Melissa","Melky","Mellefont","Mellish","Mellon","Melmoth","Melmotte","Melmottes","Melody","Melrose","Melton","Melun","Melvil","Melville","Member","Members","Memnon","Memoir","Memoire","Memoires","Memoirs","Memorandum","Memorial","Memorials","Memoriam","Memories","Memory","Memphis","Menander","Mencius","Mendelssohn","Mendez","Mendoza","Menee","Menelaus","Menendez","Meneval","Menge","Mengs","Menin","Menko","Menneske","Mennesker","Menon","Mensch","Menschen","Menschheit","Mental","Mentally","Menteith","Mention","Mentone","Mentor","Mentz","Mephistopheles","Meran","Merari","Mercadet","Mercantile","Merced","Mercedes","Mercer","Merchant","Merchants","Merci","Mercia","Mercier","Merciful","Mercure","Mercurius","Mercury","Mercutio","Mercy","Meredith","Merely","Meridian","Meriem","Merit","Merivale","Merkmale","Merle","Merlin","Mermaid","Merodach","Merope","Merovingian","Merriam","Merrick","Merrifield","Merrill","Merrily","Merrimac","Merrimack","Merriman","Merritt","Merriwell","Merry","Mersey","Merthyr","Merton","Merwyn","Mescal","Mesdames","Meshach","Mesopotamia","Mesopotamian","Mesozoic","Mesrour","Message","Messages","Messala","Messalina","Messe","Messenger","Messengers","Messer","Messiah","Messianic","Messias","Messieurs","Messina","Messire","Messrs","Mesty","Mesurier","Metal","Metals","Metamorphoses","Metaphysical","Metaphysics","Metaphysik","Metcalfe","Metellus","Meter","Methinks","Method","Methode","Methodism","Methodist","Methodists","Methods","Methought","Methuen","Methuselah","Metropolis","Metropolitan","Metternich","Meudon","Meuse","Mevrouw","Mexican","Mexicans","Mexico","Mexique","Meyer","Meyerbeer","Meyers","Meynell","Meyrick","Miami","Miamis","Micah","Micawber","Michael","Michaelis","Michaelmas","Michaud","Michel","Michelangelo","Michele","Michelet","Micheline","Michell","Michie","Michigan","Michu","Mickey","Micronesia","Microscope","Midas","Middelburg","Middle","Middlemarch","Middlemount","Middlesex","Middleton","Middletown","Midget","Midian","Midianites","Midland","Midlands","Midnight","Midshipman","Midst","Midsummer","Midway","Midwinter","Miene","Mienen","Mientras","Mieux","Mifflin","Mightinesses","Mighty","Mignon","Miguel","Migwan","Mihalovna","Mijne","Mijnheer","Mikado","Mikko","Miksi","Mikä","Milady","Milan","Milanese","Milano","Milch","Milde","Mildred","Miles","Milesian","Miletus","Milford","Military","Militia","Milky","Millar","Millard","Millay","Millbank","Mille","Milledgeville","Miller","Millet","Millicent","Millie","Milligan","Milliken","Million","Millionen","Millions","Mills","Milly","Milman","Milne","Milner","Milnes","Milnwood","Milord","Milray","Milroy","Miltiades","Milton","Miltonic","Miltoun","Milwaukee","Minard","Minchin","Mincio","Mindanao","Minden","Minds","Mineral","Minerva","Mines","Mingled","Mingo","Miniato","Miniature","Mining","Minister","Ministerial","Ministerium","Ministers","Ministre","Ministry","Minna","Minneapolis","Minnehaha","Minnes","Minnesota","Minnie","Minor","Minorca","Minos","Minotaur","Minster","Minstrel","Minto","Minturn","Minucius","Minulla","Minun","Minute","Minuten","Minutes","Minä","Miocene","Mirabeau","Miracle","Miracles","Mirah","Miranda","Miraut","Mirepoix","Miriam","Mirror","Mirrors","Mirth","Mirza","Miscellaneous","Miscellanies","Miscellany","Mischief","Miserable","Miserere","Misery","Misfortune","Misfortunes","Misha","Misschien","Misses","Missing","Mission","Missionaries","Missionary","Missions","Missis","Missisippi","Mississippi","Missolonghi","Missouri","Missus","Missy","Missä","Mistah","Mistake","Mistakes","Mister","Misther","Mistress","Mistris","Mistä","Mitchel","Mitchell","Mitchy","Miten","Mitford","Mitglied","Mitglieder","Mithradates","Mithras","Mithridates","Mitleid","Mitleiden","Mitre","Mittag","Mitte","Mittel","Mittelalter","Mitteln","Mittelpunkt","Mitten","Mitternacht","Mitä","Mitäs","Mivart","Mivers","Mixed","Mixture","Moabites","Mobile","Mocha","Mochuda","Modder","Model","Modena","Moder","Moderate","Moderation","Moderen","Modern","Modest","Modeste","Modesty","Modification","Modred","Moeder","Moeglichkeit","Moerder","Moffat","Moffatt","Moffett","Mogador","Mogul","Moguls","Mohammed","Mohammedan","Mohammedanism","Mohammedans","Mohawk","Mohawks","Mohican","Mohicans","Mohun","Moines","Moira","MoisÃ©s","Moldavia","Moldova","Moliere","Molina","Molière","Mollie","Molly","Moloch","Moltke","Moluccas","Molyneux","Moment","Momente","Moments","Mommsen","Momus","Monaco","Monarch","Monarchie","Monarchs","Monarchy","Monastery","Monat","Monate","Monaten","Monck","Monckton","Monday","Mondays","Monde","Mondes","Mondragon","Monet","Money","Mongol","Mongolia","Mongolian","Mongols","Monica","Monipodio","Moniteur","Monitor","Monkbarns","Monkey","Monkeys","Monks","Monmouth","Monna","Monny","Monogram","Monongahela","Monro","Monroe","Monseigneur","Monsieur","Monsignor","Monson","Monsoreau","Monster","Monsters","Monstrous","Montagne","Montagu","Montague","Montaigne","Montalais","Montalembert","Montana","Montauban","Montauk","Montbron","Montcalm","Monte","Montebello","Montenegrin","Montenegro","Montenero","Monterey","Montes","Montesinos","Montespan","Montesquieu","Montevideo","Montezuma","Montfanon","Montfaucon","Montferrat","Montfort","Montgomery","Month","Monthly","Montholon","Months","Monti","Montigny","Montmartre","Montmorenci","Montmorency","Montoni","Montpelier","Montpellier","Montpensier","Montreal","Montresor","Montreuil","Montrevel","Montriveau","Montrose","Montréal","Monts","Montserrat","Monty","Monument","Monuments","Moodie","Moody","Moone","Mooney","Moonlight","Moore","Moores","Moorish","Moors","Moose","Moppet","Moral","Morales","Morality","Morally","Morals","Moran","Morano","Moravia","Moravian","Moravians","Moray","Morbihan","Morcerf","Mordaunt","Mordecai","Morden","Mordred","Morea","Moreau","Morel","Moreland","Morell","Moreno","Moreover","Moreton","Morga","Morgan","Morgana","Morgen","Morgens","Morgiana","Morgue","Moriarty","Morin","Morison","Moritz","Morland","Morley","Mormon","Mormonism","Mormons","Morna","Morning","Moroccan","Morocco","Morok","Morone","Moroni","Moros","Morosini","Morpheus","Morrel","Morrell","Morrice","Morris","Morrison","Morriston","Morristown","Morrow","Morse","Morsfield","Mortal","Mortality","Mortals","Morte","Morten","Mortier","Mortimer","Mortlake","Morton","Mortsauf","Morumbidgee","Morus","Morven","Mosaic","Mosca","Mosco","Moscow","Moseley","Moselle","Moser","Moses","Mosiah","Moslem","Moslems","Mosque","Mosquito","Mostly","Mostyn","Mosul","Mother","Mothers","Motion","Motionless","Motions","Motive","Motives","Motley","Motor","Motte","Mouillard","Mould","Moulin","Moulins","Moulton","Moultrie","Mound","Mount","Mountain","Mountains","Mountclere","Mounted","Mounting","Mountjoy","Mounts","Mountstuart","Mouret","Mourn","Mourning","Mouse","Mousqueton","Moussa","Mouth","Moutier","Mouton","Moved","Movement","Movements","Moves","Moving","Mowbray","Mowgli","Moxon","Moxos","Moyne","Mozambique","Mozart","Mozley","Muddy","Mudge","Muehe","Mueller","Muffat","Muhammad","Muhammadan","Mukaukas","Mukoki","Mulberry","Mulbridge","Mules","Muley","Mulford","Mulgrave","Muller","Mulligan","Mullins","Multitude","Multitudes","Mulvaney","Mumford","Mummy","Munchausen","Munday","Munde","Munden","Mundi","Mundy","Mungo","Munich","Municipal","Munro","Munroe","Munster","Murad","Murano","Murat","Muratori","Murchison","Murden","Murder","Murderer","Murdoch","Murdock","Muriel","Murillo","Murmurs","Murphy","Murray","Muscat","Muscle","Muscovite","Muscovy","Muses","Museum","Musgrave","Mushrooms","Music","Musical","Musicians","Musick","Musik","Musing","Musketeers","Muskwa","Muslim","Muslims","Musset","Mussulman","Mussulmans","Mussulmaun","Mustapha","Mustard","Muster","Mutimer","Mutiny","Mutta","Mutter","Mutton","Mutual","Muzio","Mycenae","Mycenaean","Myers","Myles","Mylord","Mynheer","Myron","Myrtilus","Myrtle","Myself","Mysie","Mysore","Mysteries","Mysterious","Mystery","Mystic","Mysticism","Mythologie","Mythology","Myths","MÃ¤rz","Mädchen","Männer","Männern","Märchen","März","Mænd","Mère","Mémoires","Même","Möglichkeit","Mörder","Mühe","Müller","Naaman","Nabab","Nabal","Nabob","Naboth","Nabuchodonosor","Nachahmung","Nachbar","Nachbarn","Nachbarschaft","Nachdem","Nachfolger","Nachfrage","Nachmittag","Nachricht","Nachrichten","Nacht","Nachts","Nacional","Nacken","Nadab","Nadat","Nadia","Nadja","Naehe","Nagasaki","Nahoum","Nahrung","Nahum","Nailles","Nairn","Naked","Nakula","Named","Nameless","Namen","Namens","Names","Namibia","Namur","Nance","Nancy","Nanda","Nanette","Nanking","Nannie","Nanny","Nanon","Nansen","Nantes","Naomi","Naphtali","Napier","Naples","Napoleon","Napoleonic","Napoleons","Napoli","Napoléon","Narada","Narayana","Narbonne","Narcisse","Narcissistic","Narcissus","Nares","Narragansett","Narrative","Narren","Narrow","Narrows","Narses","Narvaez","Naseby","Nashville","Nassau","Nastasia","Nasty","Natacha","Natal","Natalie","Nataly","Natasha","Natchez","Nathan","Nathanael","Nathaniel","Nation","National","Nationale","Nationales","Nationalism","Nationalist","Nationalists","Nationality","Nationen","Nations","Native","Natives","Nativity","Natty","Natur","Natura","Natural","Naturalist","Naturally","Nature","Naturellement","Naturen","Natures","Naught","Naughty","Nauru","Nausicaa","Nautical","Nautilus","Nauvoo","Navajo","Navajos","Naval","Navarre","Navarrete","Navigation","Nawab","Nayland","Naylor","Nazarene","Nazareth","Neale","Neapel","Neapolitan","Neapolitans","Nearer","Nearest","Nearly","Nebel","Neben","Nebraska","Nebsecht","Nebuchadnezzar","Necessarily","Necessary","Necessity","Neckar","Necker","Necropolis","Nedda","Neddy","Needham","Needle","Needles","Needless","Needs","Neewa","Nefert","Neffen","Neforis","Negation","Negative","Neger","Negers","Neglect","Negoro","Negotiations","Negro","Negroes","Negros","Nehemiah","Nehljudof","Nehljudofin","Neigh","Neighbor","Neighbors","Neighbour","Neighbourhood","Neighbours","Neigung","Neill","Neilson","Neither","Neiti","Nejdanov","Nekhludoff","Nella","Nellie","Nello","Nelly","Nelson","Nemesis","Nemours","Neolithic","Neoptolemus","Nepal","Nepaul","Nepean","Nephew","Nephi","Nepos","Neptune","Neque","Neradol","Nerva","Nerves","Nervous","Nesbit","Nescience","Nessus","Nesta","Nestor","Nestorian","Nether","Netherland","Netherlander","Netherlanders","Netherlands","Netta","Nettie","Neuburg","Neuchatel","Neues","Neufchatel","Neugierde","Neuilly","Neutral","Neutrality","Neuve","Nevada","Never","Nevers","Nevertheless","Nevil","Nevile","Nevill","Neville","Nevis","Nevitt","Newark","Newbern","Newberry","Newbury","Newburyport","Newby","Newcastle","Newcome","Newell","Newfoundland","Newgate","Newhaven","Newland","Newman","Newmark","Newmarket","Newport","Newsletter","Newsletters","Newspaper","Newspapers","Newstead","Newton","Newtown","Niafer","Niagara","Nibelungen","Nibelungenlied","Nicanor","Nicaragua","Niccolo","Nicene","Nicephorus","Nicholas","Nicholl","Nicholls","Nichols","Nicholson","Nicht","Nichts","Nicias","Nickleby","Nicky","Nicodemus","Nicol","Nicolai","Nicolas","Nicole","Nicolette","Nicolo","Nidderdale","Niebuhr","Niece","Niederlage","Niels","Nielsen","Niemand","Niemen","Nietzsche","Nieuport","Nieuwe","Nigel","Niger","Nigeria","Nigger","Niggers","Night","Nighthawk","Nightingale","Nights","Nihil","Niinkuin","Niinpä","Nikias","Nikky","Nikolaevna","Nikolaus","Nikolay","Niles","Nilus","Nimbus","Nimes","Nimrod","Nineteen","Nineteenth","Ninety","Nineveh","Ninny","Ninon","Ninth","Niobe","Nirvana","Nitetis","Nixon","Nizza","Noailles","Nobili","Nobility","Noble","Nobleman","Nobles","Noblesse","Nobody","Nodding","Nodier","Noemi","Nohant","Noircarmes","Noire","Noirtier","Noise","Nokomis","Nolan","Nollie","Nombre","Nonconformist","Nonconformists","Nonsense","Nooit","Noorna","Norah","Norbert","Norbury","Norden","Noreen","Norfolk","Norgate","Norma","Normal","Norman","Normand","Normande","Normandie","Normandy","Normans","Norris","Norse","Norseman","Norsemen","Norte","North","Northampton","Northamptonshire","Northcote","Northeast","Northeastern","Northern","Northerners","Northland","Northmen","Northmour","Northumberland","Northumbria","Northumbrian","Northward","Northwest","Northwestern","Norton","Norway","Norwegian","Norwegians","Norwich","Norwood","Nosey","Nosotros","Notable","Notary","Notes","Nothin","Nothing","Nothwendigkeit","Notice","Notices","Noticing","Noting","Notion","Notions","Notre","Nottingham","Notwendigkeit","Notwithstanding","Nought","Nouns","Noureddin","Nouveau","Nouvelle","Nouvelles","Novara","Novel","Novels","Novelty","November","Novgorod","Novum","Nowadays","Nowell","Nowhere","Noyes","Noyon","Noël","Nubia","Nubian","Nucingen","Nuclear","Nueces","Nuestra","Nueva","Nuevo","Nugent","Nulla","Nulle","Number","Numbers","Numerous","Numidia","Numidian","Numidians","Nunca","Nuncio","Nunez","Nunnery","Nuova","Nuremberg","Nurse","Nursery","Nurses","Nursing","Nutmeg","Nutter","Nuttie","Nutzen","Nyassa","Nymph","Nymphs","Nyoda","Nähe","Näin","Nämä","Néanmoins","OEuvres","OFries","Oakes","Oakhurst","Oakland","Oakley","Oakwood","Oates","Oaths","Oatmeal","Obadiah","Obedience","Obedient","Oberlin","Oberon","Oberst","Obeying","Object","Objection","Objections","Objective","Objects","Objekt","Objekte","Obligation","Oblige","Obliged","Oblivion","Oblonsky","Obscure","Observation","Observations","Observatory","Observe","Observer","Observing","Obstinate","Obviously","Obwohl","Occasion","Occasional","Occasionally","Occasions","Occident","Occidental","Occult","Occupation","Occupied","Occurrences","Ocean","Oceania","Oceans","Oceanus","Ochiltree","Octave","Octavia","Octavian","Octavianus","Octavio","Octavius","October","Oddly","Odessa","Odette","Odysseus","Odyssey","Oedipus","Oesterreich","Oeuvres","Offence","Offer","Offering","Offers","Office","Officer","Officers","Offices","Official","Officials","Officier","Officiers","Offizier","Offiziere","Often","Oftentimes","Ogareff","Ogden","Ogier","Ogilvie","Ogilvy","Oglethorpe","Ogram","Oheim","Ohnmacht","Ohren","Oisin","Ojeda","Ojibway","Oklahoma","Oktober","Olavi","Oldborough","Oldbuck","Oldenburg","Older","Oldfield","Oldham","Oleron","Olihan","Oliko","Oline","Oliphant","Olisi","Olive","Oliver","Olives","Olivet","Olivia","Olivier","Ollie","Ollivier","Olney","Olsen","Olson","Olympe","Olympia","Olympian","Olympic","Olympius","Olympus","Omaha","Omega","Omnes","OmniPage","Omnia","Omnibus","Omnipotence","Omnipotent","Omnium","Onder","Oneida","Oneidas","Onesimus","Ongar","Onhan","Onion","Onions","Onkel","Online","Onondaga","Onondagas","Ontario","Onward","Ootah","Opened","Opening","Opens","Opera","Operation","Operations","Opfer","Ophelia","Ophir","Opinion","Opinions","Opium","Oporto","Oppenheim","Opportunities","Opportunity","Opposed","Opposite","Opposition","Oppressed","Oppression","Oracle","Oracles","Orange","Oranges","Oration","Orations","Orator","Orators","Oratory","Orazio","Orchard","Orchestra","Orden","Ordener","Order","Ordered","Orderly","Orders","Ordinance","Ordinarily","Ordinary","Ordnance","Ordnung","Ordre","Oregon","Orestes","Orford","Organ","Organic","Organisation","Organization","Organized","Organs","Organum","Oriana","Oriel","Orient","Oriental","Orientalist","Orientals","Oriente","Origen","Origin","Original","Originally","Orinoco","Orion","Orkney","Orkneys","Orlando","Orleans","Orloff","Ormazd","Ormes","Ormiston","Ormond","Ormonde","Ormont","Ormsby","Ormskirk","Ormus","Ormuz","Ornament","Ornaments","Orontes","Orosius","Orphan","Orpheus","Orrery","Orsini","Orsino","Orson","Ortega","Orten","Ortheris","Orthodox","Ortlieb","Orton","Orville","Osage","Osages","Osbaldistone","Osborn","Osborne","Osbourne","Oscar","Osgood","Osiris","Osman","Osmanli","Osmia","Osmond","Ossian","Ossory","Osten","Ostend","Ostia","Ostrog","Ostrogoths","Oswald","Oswego","Otaheite","Othello","Other","Others","Otherwise","Othman","Otranto","Ottawa","Ottawas","Otter","Ottilia","Ottilie","Ottokar","Ottoman","Otway","Oudinot","Ought","Ourselves","Oursler","Outer","Outlaw","Outline","Outlines","Outlook","Outram","Outre","Outside","Outward","Outwardly","Ouvrard","Ovando","Overcome","Overhead","Overland","Overseers","Overton","Overtop","Overview","Overwhelmed","Overyssel","Oviedo","Owain","Owens","Owing","Owner","Oxenstiern","Oxford","Oxfordshire","Oxley","Oyster","Oysters","Ozias","Ozone","Paaker","Paavo","Pablo","Pacha","Pacheco","Pacific","Pacification","Pacifico","Pacifique","Packard","Packet","Paddington","Paddy","Padre","Padua","Paducah","Pagan","Paganel","Paganini","Paganism","Pagans","Pagello","Pages","Paget","Paige","Paimpol","Paine","Painful","Pains","Paint","Painted","Painter","Painters","Painting","Paisley","Pakenham","Pakistan","Palace","Palaces","Paladin","Palais","Palamon","Palast","Palatinate","Palatine","Palavicino","Palazzo","Paleon","Palerme","Palermo","Palestine","Palestinian","Palestrina","Palfrey","Palgrave","Pallas","Pallieter","Palliser","Palma","Palmas","Palmer","Palmerston","Palmet","Palmetto","Palms","Palmyra","Palomides","Palos","Palus","Pamela","Pampas","Pamphlet","Pamphlets","Pamunkey","Panama","Panchalas","Pancras","Pandarus","Pandava","Pandavas","Pandora","Pandu","Pango","Panic","Panine","Panney","Pannonia","Pansy","Pantagruel","Pantheism","Pantheon","Panther","Panting","Pantomime","Panton","Panurge","Panza","Paoli","Paolina","Paolo","Paolucci","Papacy","Papal","Papeete","Paper","Papers","Paphnuce","Papias","Papier","Papiere","Papillon","Papist","Papists","Pappenheim","Papst","Papua","Papyrus","Paquita","Parable","Paracelsus","Parade","Paradis","Paradise","Paradiso","Paragraph","Paraguay","Paralipomenon","Parallel","Paramaribo","Paramor","Parbleu","Parce","Pardaillan","Pardieu","Pardon","Paredes","Parent","Parents","Paret","Parfois","Parham","Paria","Parian","Parijs","Paris","Pariser","Parish","Parisians","Parisienne","Parisiens","Parisis","Parke","Parker","Parkes","Parkhurst","Parkinson","Parkman","Parks","Parlement","Parlez","Parliament","Parliamentary","Parliaments","Parma","Parmalee","Parme","Parmenides","Parmesan","Parmi","Parnassus","Parnell","Parpon","Parramatta","Parrish","Parrot","Parrott","Parry","Parsee","Parsees","Parsifal","Parsley","Parson","Parsonage","Parsons","Parte","Partei","Parteien","Partha","Parthenon","Parthia","Parthian","Parthians","Partial","Particles","Particular","Particularly","Particulars","Partie","Parties","Parting","Partisan","Partition","Partly","Partner","Parton","Partout","Partridge","Parts","Party","Parva","Pascal","Paschal","Pasha","Pasmer","Pasquale","Pasquier","Pasquin","Passage","Passages","Passau","Passed","Passenger","Passengers","Passepartout","Passes","Passing","Passion","Passionate","Passions","Passive","Passover","Passy","Paste","Pasteur","Pastor","Pastoral","Pastorals","Pasture","Patagonia","Patagonian","Patch","Patches","Patchwork","Patent","Patents","Pater","Paternoster","Paterson","Pathan","Pathfinder","Paths","Patience","Patient","Patients","Patissot","Patmos","Patna","Patrasche","Patriarch","Patriarchs","Patricia","Patrick","Patrie","Patriot","Patriotic","Patriotism","Patriots","Patroclus","Patrol","Patron","Patsey","Patsy","Patten","Pattern","Patterne","Patterson","Patti","Pattison","Patton","Patty","Paula","Pauli","Paulina","Pauline","Paulinus","Paulo","Paulus","Pauper","Pausanias","Pause","Pausing","Pauvre","Pavel","Pavia","Pavilion","Pavlovna","Pawle","Pawnee","Pawnees","Paying","Payment","Payne","Paynim","Payson","Pazzi","Peabody","Peace","Peaceful","Peach","Peaches","Peachey","Peacock","Peaks","Pearce","Pearl","Pearls","Pears","Pearse","Pearson","Peasant","Peasants","Pease","Peasley","Peckham","Pecksniff","Peculiar","Pedgift","Pedro","Peebles","Peeping","Peerage","Peering","Peers","Pegasus","Peggotty","Peggy","Peirce","Pekin","Peking","Pekka","Peleg","Peleus","Pelham","Pelias","Pelican","Pelion","Pelle","Pellucidar","Pelopidas","Peloponnesian","Peloponnesians","Peloponnesus","Pelops","Pelusium","Pemberton","Pembroke","Penal","Penance","Pencroff","Pencroft","Pendennis","Pending","Pendleton","Pendragon","Pendyce","Penelope","Penfold","Penguin","Penhallow","Peninsula","Peninsular","Penitentiary","Pennant","Pennell","Penniman","Pennington","Pennsylvania","Penny","Penobscot","Penrod","Penrose","Pensacola","Pension","Pensions","Pentateuch","Pentaur","Pentecost","Penthesilea","Pentland","Penzance","People","Peoples","Peoria","Pepeeta","Pepin","Pepper","Peppino","Pepys","Peradventure","Perceiving","Percent","Perception","Perceval","Perch","Perchance","Perche","Perched","Percival","Percivale","Percy","Perdita","Peredur","Peregrine","Pereira","Perenna","Perez","Perfect","Perfecta","Perfection","Perfectly","Performance","Pergamus","Perhaps","Pericles","Perigord","Perikles","Peril","Perilous","Period","Periode","Periodical","Perion","Perish","Perkin","Perkins","Perlen","Permanent","Permian","Permission","Permit","Pernambuco","Peron","Peronne","Perouse","Perpendicular","Perpetual","Perpignan","Perrault","Perrichon","Perrin","Perrine","Perris","Perrot","Perry","Perse","Persecution","Persephone","Persepolis","Perseus","Perseverance","Persia","Persian","Persians","Persis","Persius","Person","Personal","Personality","Personally","Personen","Personne","Persons","Perspective","Persönlichkeit","Pertaining","Perth","Perthshire","Pertinax","Perugia","Perugino","Peruvian","Peruvians","Però","Pesaro","Pescara","Peschiera","Peshawur","Peshitta","Pestalozzi","Peste","Peter","Peterborough","Peterkin","Peters","Petersburg","Petersen","Peterson","Petion","Petit","Petite","Petition","Petitions","Petits","Petra","Petrarch","Petrea","Petrel","Petri","Petrie","Petro","Petrograd","Petroleum","Petronius","Petros","Petrovitch","Petrovna","Petruchio","Petrus","Petticoat","Pettifer","Pettit","Petty","Petya","Peuple","Pevensey","Peveril","Peyrade","Peyster","Peyton","Pfaeffling","Pfarrer","Pfeffer","Pfeil","Pferd","Pferde","Pferden","Pflanze","Pflanzen","Pflege","Pflicht","Pflichten","Pforte","Pfäffling","Phaedo","Phaedrus","Phaeton","Phalaris","Phanes","Phantasie","Phantom","Phaon","Pharamond","Pharao","Pharaoh","Pharaohs","Pharaon","Pharisee","Pharisees","Pharos","Pharsalia","Phebe","Phelim","Phellion","Phelps","Phenomena","Phidias","Philadelphia","Philadelphus","Philammon","Philander","Phileas","Philemon","Philibert","Philip","Philipinas","Philipp","Philippa","Philippe","Philippi","Philippians","Philippine","Philippines","Philippus","Philips","Philistine","Philistines","Phillip","Phillips","Phillis","Philo","Philoctetes","Philology","Philos","Philosoph","Philosophen","Philosopher","Philosophers","Philosophical","Philosophie","Philosophy","Philostratus","Philotas","Philothea","Phineas","Phipps","Phips","Phnician","Phnicians","Phocians","Phocion","Phoebe","Phoebus","Phoenicia","Phoenician","Phoenicians","Phoenix","Phokion","Photo","Photograph","Photographs","Phrase","Phrases","Phronsie","Phrygia","Phrygian","Phyllis","Physic","Physical","Physically","Physician","Physicians","Physics","Physiol","Physiological","Physiology","Piacenza","Piano","Piazza","Picard","Picardy","Picart","Piccadilly","Piccolomini","Pichegru","Pickens","Pickering","Pickersgill","Pickett","Picking","Pickle","Pickles","Pickwick","Picotee","Pictorial","Picts","Picture","Pictures","Picturesque","Piece","Pieces","Piedmont","Piedmontese","Pierce","Pierced","Pierces","Piero","Pierpont","Pierre","Pierrette","Pierrot","Piers","Pierson","Pietari","Pieter","Pietro","Piety","Pigeon","Pigeons","Pigot","Pikes","Pilar","Pilate","Pilato","Pilgrim","Pilgrimage","Pilgrims","Pilkington","Pillar","Pillars","Pillin","Pillow","Pills","Pilot","Pimlico","Pimpernel","Pinch","Pinckney","Pindar","Pineapple","Pines","Piney","Pinkerton","Pinkney","Pinky","Pinocchio","Pinta","Pinto","Pinus","Pinzon","Pioneer","Pioneers","Piotr","Pious","Piozzi","Pipelines","Piper","Pipes","Pipkin","Pippa","Pippin","Pippo","Piraeus","Pirandello","Pirate","Pirates","Pisan","Pisistratus","Pistol","Pitcairn","Pitch","Pitcher","Pitkin","Pitman","Pitris","Pitti","Pitts","Pittsburg","Pittsburgh","Pixley","Pizarro","Place","Placed","Placentia","Places","Placing","Plads","Plague","Plain","Plainly","Plains","Planchet","Plane","Planet","Planets","Plank","Plans","Plant","Plantagenet","Plantagie","Plantation","Plantations","Plante","Planter","Planters","Plantes","Planting","Plants","Plassans","Plata","Plataea","Plate","Plateau","Platero","Plates","Platform","Plato","Platon","Platonic","Platonism","Platonists","Platt","Platte","Platz","Platze","Plausaby","Plautus","Played","Players","Playing","Plays","Plaza","Pleas","Pleasant","Please","Pleased","Pleasing","Pleasure","Pleasures","Pledge","Pleiades","Plenipotentiary","Plenty","Plessis","Pleydell","Pleyel","Plimpton","Plinius","Pliny","Pliocene","Plotinus","Plots","Plough","Plowden","Plowman","Pluck","Plume","Plumer","Plumet","Plummer","Plumstead","Plunkett","Plural","Plusieurs","Plutarch","Plutarque","Pluto","Plutus","Plymouth","Pocahontas","Pocket","Pocock","Poems","Poesie","Poesy","Poetic","Poetical","Poetry","Poets","Poictiers","Poika","Point","Pointe","Pointed","Pointing","Points","Poiret","Poirot","Poison","Poisson","Poitiers","Poitou","Poker","Poland","Polar","Polder","Polen","Poles","Police","Policeman","Policy","Polignac","Polite","Politeness","Political","Politicians","Politics","Politik","Politique","Polizei","Pollard","Pollio","Pollnitz","Pollock","Pollution","Pollux","Polly","Pollyanna","Pologne","Polonais","Polonaise","Polonius","Polwarth","Polybius","Polycarp","Polykarp","Polynesia","Polynesian","Polynesians","Polyphemus","Polytechnic","Pomerania","Pomeranian","Pomeroy","Pomfret","Pomona","Pompadour","Pompeian","Pompeii","Pompeius","Pompey","Pomponia","Pomponius","Ponce","Ponds","Poniatowski","Ponsonby","Pontchartrain","Ponte","Pontiac","Pontifex","Pontiff","Pontifical","Pontis","Pontius","Ponto","Pontus","Poole","Poore","Popery","Popes","Popham","Popinot","Popish","Poplar","Poplars","Popolo","Poppy","Popular","Population","Porch","Porcupine","Porges","Porphyrius","Porphyry","Porpoise","Porpora","Porque","Porson","Porta","Portage","Portal","Porte","Porteous","Porter","Porthos","Portia","Portion","Portions","Portland","Portlaw","Portman","Porto","Portrait","Portraits","Ports","Portsmouth","Portugais","Portugal","Portugall","Portugals","Portuguese","Poseidon","Posen","Posey","Position","Positive","Positively","Possessed","Possessing","Possession","Possible","Possibly","Possum","Postage","Postal","Poste","Posten","Posterity","Posthumous","Posthumus","Postmaster","Posts","Potato","Potatoes","Potiphar","Potomac","Potosi","Potsdam","Potter","Pottery","Potts","Poughkeepsie","Poulain","Poultry","Pound","Pounds","Pouring","Pourquoi","Pourtant","Pourvu","Poussin","Poverty","Povey","Powder","Powell","Power","Powerful","Powers","Powhatan","Powis","Pownal","Powys","Poyntz","Poyser","Pracht","Practical","Practically","Practice","Prado","Praed","Praeneste","Praetor","Praetorian","Pragmatic","Prague","Prairie","Praise","Praised","Prakriti","Pratinas","Prato","Pratt","Praxis","Praxiteles","Prayer","Prayers","Praying","Preacher","Preachers","Preaching","Precepts","Preciosa","Precious","Precisely","Preface","Prefect","Prefecture","Preferred","Prehistoric","Preis","Preise","Prejudice","Prelate","Preliminary","Prelude","Premier","Prendergast","Prends","Prenez","Prentice","Prentiss","Preparation","Preparations","Prepare","Prepared","Preparing","Presbyterian","Presbyterianism","Presbyterians","Presbytery","Prescott","Presence","Present","Presentation","Presented","Presently","Presents","Preservation","Preserve","Preserved","Presidency","President","Presidente","Presidential","Presidents","Presiding","Presidio","Presley","Presque","Press","Presse","Pressed","Pressing","Presson","Pressure","Prester","Presto","Preston","Presumably","Pretender","Pretending","Pretoria","Pretty","Prettyman","Preuss","Preussen","PreuÃen","Preußen","Prevention","Previous","Previously","Prevost","Priam","Priapus","Price","Prices","Pride","Prideaux","Priest","Priester","Priestley","Priestly","Priests","Prima","Primary","Primate","Primer","Primitive","Primrose","Primula","Primus","Prince","Princely","Princes","Princess","Princesse","Princesses","Princeton","Principal","Principe","Principle","Principles","Pringle","Prins","Print","Printed","Printer","Printers","Printing","Prinz","Prinzen","Prinzessin","Prinzip","Prinzipien","Prior","Prioress","Priory","Priscilla","Priscus","Prise","Prison","Prisoner","Prisoners","Prisons","Prissy","Pritchard","Pritha","Prithee","Private","Privately","Privilege","Privileges","Privy","Prize","Prizes","Probably","Probate","Probe","Problem","Problems","Probus","Procedure","Proceed","Proceeding","Proceedings","Process","Procession","Proclaim","Proclamation","Proclus","Procopius","Procter","Proctor","Prodigal","Produce","Produced","Producing","Production","Productions","Products","Produkt","Profession","Professional","Professor","Professors","Professorship","Profit","Profond","Profound","Program","Programm","Progress","Progressive","Prohack","Prohibition","Project","Projects","Projekt","Prologue","Promenade","Prometheus","Prominent","Promise","Promised","Promises","Promotion","Prompt","Promptly","Pronounce","Pronounced","Pronouns","Proof","Proofreaders","Proofreading","Proofs","Propaganda","Propagation","Proper","Properly","Properties","Propertius","Property","Prophecy","Prophet","Prophets","Proportion","Proposal","Proposals","Proposed","Proposition","Propositions","Proprietor","Proprietors","Propriety","Prose","Prosecutor","Proserpina","Proserpine","Prospect","Prospects","Prosper","Prosperity","Prospero","Prostitution","Protagoras","Protect","Protected","Protection","Protective","Protector","Protectorate","Protest","Protestant","Protestantism","Protestants","Proteus","Prothero","Protocol","Proud","Proudhon","Proudie","Proudly","Prout","Prove","Provencal","Provence","Provençal","Proverb","Proverbs","Provide","Provided","Providence","Providers","Province","Provinces","Provincial","Provinz","Provinzen","Provision","Provisional","Provisions","Provost","Prozess","Prudence","Prudent","Prudy","Prune","Prusse","Prussia","Prussian","Prussians","Prussiens","Prynne","Pryor","Près","Psalm","Psalmist","Psalms","Psalter","Psamtik","Pshaw","Psmith","Psyche","Psychical","Psychological","Psychologie","Psychology","Ptolemaic","Ptolemais","Ptolemies","Ptolemy","Public","Publican","Publication","Publications","Publick","Publikum","Published","Publisher","Publishers","Publishing","Publius","Pucelle","Pudding","Puebla","Pueblo","Puerto","Puffs","Puget","Puisque","Pulaski","Pulcheria","Pullen","Pullet","Pulling","Pullman","Pulpit","Pulse","Pulteney","Punch","Punchinello","Punic","Punishment","Punjab","Punkt","Punkte","Punta","Pupil","Pupils","Purbeck","Purcell","Purchas","Purchase","Purdie","Purdy","Purgatorio","Purgatory","Puritan","Puritanism","Puritans","Purity","Purple","Purpose","Purse","Pursue","Pursued","Pursuing","Pursuit","Purvis","Pusey","Pushing","Pussy","Putnam","Putney","Putting","Puzzled","Pyecroft","Pygmalion","Pygmies","Pylades","Pylos","Pyncheon","Pyotr","Pyramid","Pyramids","Pyramus","Pyrenean","Pyrenees","Pyrrhus","Pythagoras","Pythagorean","Pythagoreans","Pythian","Père","Pécuchet","Qatar","Quack","Quade","Quail","Quaker","Quakers","Qualities","Quality","Qualität","Quand","Quando","Quant","Quantity","Quanto","Quantum","Quarles","Quarrel","Quarrels","Quarrier","Quarry","Quarter","Quarterly","Quartermaster","Quarters","Quartier","Quarto","Quasimodo","Quatermain","Quatre","Quebec","Queed","Queen","Queene","Queenes","Queenie","Queens","Queensberry","Queensland","Queenstown","Queequeg","Queer","Quelle","Quellen","Quelles","Quelqu","Quelque","Quelquefois","Quelques","Quels","Quelus","Quennebert","Quentin","Quenu","Queries","Querini","Query","Quest","Questa","Question","Questions","Questo","Quetzalcoatl","Quichotte","Quickly","Quicksands","Quicksilver","Quien","Quiet","Quietly","Quijada","Quijote","Quilp","Quince","Quincey","Quinctius","Quincy","Quinet","Quinn","Quinola","Quintilian","Quintin","Quintus","Quinze","Quirinal","Quite","Quito","Quitting","Quivi","Quixote","Quixotic","Quoique","Quonab","Quotations","Quote","Quoted","Québec","Rabat","Rabbi","Rabbinical","Rabbis","Rabbit","Rabbits","Rabelais","Rabourdin","Races","Racey","Rachael","Rache","Rachel","Racine","Racksole","Radcliffe","Radford","Radha","Radiant","Radical","Radicalism","Radicals","Radio","Radios","Radisson","Radley","Radnor","Radowitz","Raeburn","Rafael","Raffaelle","Raffles","Ragged","Raglan","Ragnar","Ragusa","Rahab","Rahmen","Raikes","Railroad","Railroads","Railway","Railways","Raina","Rainbow","Raine","Rains","Rainy","Raise","Raised","Raising","Raisins","Raisky","Rajah","Rajput","Rakshasa","Rakshasas","Raleigh","Rally","Ralph","Ralston","Ramah","Rambaud","Rambler","Ramblin","Rambouillet","Rameau","Ramee","Rameri","Rameses","Ramirez","Ramiro","Ramon","Ramona","Ramsay","Ramsden","Ramses","Ramsey","Ramusio","Ramée","Ranald","Ranaway","Rance","Ranch","Rancocus","Randal","Randall","Rande","Randolph","Random","Randy","Ranelagh","Range","Rangely","Ranger","Rangers","Ranges","Rangoon","Ranjoor","Rankin","Ransom","Ransome","Ranulph","Raoul","Raphael","Rapid","Rapidan","Rapidly","Rapids","Rappahannock","Rappelkopf","Rarahu","Rarely","Rascal","Rashi","Rashleigh","Raskolnikoff","Raskolnikov","Rassam","Rasselas","Rassi","Rastadt","Rastignac","Ratcliffe","Rates","Rather","Rational","Ratisbon","Rattlesnake","Rauch","Raume","Ravanel","Raven","Ravenel","Ravenna","Ravenslee","Ravenswood","Rawdon","Rawlins","Rawlinson","Rawson","Raymond","Raynal","Rayne","Raynham","Razumihin","Razumov","Reach","Reaching","Reaction","Readable","Reade","Reader","Readers","Reading","Readings","Reads","Ready","Realism","Realitaet","Reality","Realität","Realizing","Really","Realm","Realme","Reardon","Reason","Reasoning","Reasons","Rebecca","Rebekah","Rebel","Rebellion","Rebels","Rebus","Recall","Recamier","Receipt","Receipts","Receive","Received","Receiving","Recent","Recently","Reception","Recherches","Rechnung","Recht","Rechte","Rechten","Rechts","Recipes","Reckon","Recognition","Recognizing","Recollect","Recollections","Reconstruction","Record","Recorder","Recording","Records","Recovering","Recovery","Recreation","Rector","Rectory","Recueil","Redbook","Redbud","Redclyffe","Redding","Reddy","Redeemer","Redemption","Reden","Redgauntlet","Redistributing","Redistribution","Redmayne","Redmond","Redner","Redpath","Reduced","Redvers","Redwood","Redworth","Reeds","Reese","Reeve","Reeves","Reference","References","Referring","Reflect","Reflecting","Reflection","Reflections","Reflexion","Reform","Reformation","Reformed","Reformer","Reformers","Refuge","Refund","Refuse","Regained","Regan","Regard","Regarde","Regardez","Regarding","Regardless","Regel","Regeln","Regen","Regency","Regent","Reggie","Reggio","Regicide","Regierung","Regierungsbezirk","Regiment","Regimental","Regiments","Regin","Regina","Reginald","Region","Regions","Regis","Register","Registers","Registrar","Regnault","Regnier","Regret","Regular","Regulation","Regulations","Regulus","Rehearsal","Rehoboam","Reich","Reiche","Reiches","Reichs","Reichstag","Reichtum","Reign","Reigned","Reigns","Reihe","Reihen","Reilly","Reims","Reindeer","Reine","Reineke","Reinhard","Reino","Reise","Reisen","Reisenden","Reiter","Reize","Rejected","Rejoice","Rejoicing","Rejoined","Relacion","Relating","Relation","Relations","Relative","Release","Released","Reliance","Relics","Relief","Relieved","Religio","Religion","Religions","Religious","Reliques","Reluctantly","Relying","Remain","Remains","Remark","Remarkable","Remarks","Rembrandt","Remedy","Remember","Remembering","Remembrance","Remington","Reminiscences","Remonstrance","Remorse","Remote","Removal","Remove","Removed","Removing","Remsen","Remus","Remusat","Renaissance","Renald","Renaldo","Renan","Renard","Renaud","Renault","Render","Renee","Renewal","Renewed","Rennepont","Rennes","Renshaw","Rensselaer","René","Repeal","Repeat","Repeated","Repent","Repentance","Replacement","Replied","Reply","Report","Reported","Reporter","Reports","Repose","Repository","Representation","Representative","Representatives","Reprinted","Reproach","Reptiles","Republic","Republica","Republican","Republicanism","Republicans","Republics","Republik","Republique","Reputation","Requesens","Request","Requiem","Rerum","Resaca","Resartus","Rescue","Research","Researches","Resembling","Resentment","Reservation","Reserve","Reserves","Reshid","Residence","Residency","Resident","Residenz","Resignation","Resistance","Resolution","Resolutions","Resolve","Resolved","Resources","Respect","Respectfully","Respecting","Responsibility","Restatement","Restaurant","Restauration","Reste","Resting","Restless","Restoration","Restore","Restored","Result","Resultat","Results","Resuming","Resurrection","Retief","Retire","Retirement","Retreat","Rettung","Return","Returned","Returning","Returns","Reuben","Reunion","Reuss","Revealed","Revel","Revelation","Revelations","Revels","Revenge","Revenue","Reverdy","Revere","Reverence","Reverend","Reverse","Review","Reviewer","Reviewers","Reviews","Revised","Revision","Revival","Revolt","Revolution","Revolutionary","Revolutions","Revue","Reward","Rewards","Rexford","Reyes","Reynard","Reynolds","Rhadamanthus","Rheims","Rhein","Rhenish","Rhetoric","Rhine","Rhoda","Rhode","Rhodes","Rhodian","Rhodians","Rhododendron","Rhodolph","Rhodopis","Rhone","Rhyme","Rhymes","Rhythm","Rhône","Rialto","Riatt","Ribera","Ricardo","Riccabocca","Richard","Richardot","Richards","Richardson","Richelieu","Richer","Riches","Richie","Richmond","Richter","Richtung","Ricketts","Rickman","Ricks","Riddle","Rider","Riders","Ridge","Ridgeway","Ridicule","Ridiculous","Riding","Ridley","Rienzi","Rifle","Rifles","Rigaud","Rigby","Riggs","Right","Righteous","Righteousness","Rightly","Rights","Riikonen","Riley","Rilla","Rimini","Rimmon","Rinaldo","Rinehart","Ringgold","Ringing","Rings","Riots","Ripley","Ripon","Ripton","Rises","Rishi","Rishis","Rising","Risler","Ritchie","Rites","Ritter","Ritual","Rival","Rivals","River","Rivera","Riverdale","Rivers","Riverside","Riversley","Rivet","Rivier","Riviera","Riviere","Rivington","Rivoli","Rizal","Rizzio","Rizzo","Roach","Roads","Roanoke","Roaring","Roast","Robarts","Robbed","Robber","Robbers","Robbery","Robbie","Robert","Roberta","Roberto","Roberts","Robertson","Robespierre","Robin","Robina","Robins","Robinson","Robledo","Robrecht","Robson","Robur","Rocca","Rocco","Rochambeau","Roche","Rochefort","Rochefoucauld","Rochefoucault","Rochelle","Rocher","Rochester","Rocinante","Rockefeller","Rockharrt","Rockies","Rocking","Rockingham","Rockland","Rocks","Rockwell","Rocky","Roddy","Roden","Roderic","Roderick","Roderigo","Rodgers","Rodin","Rodman","Rodney","Rodolph","Rodolphe","Rodrigo","Rodriguez","Roebuck","Roederer","Roehampton","Roemer","Roemern","Roger","Rogero","Rogers","Rogron","Rogue","Rogues","Roguin","Rohan","Rojas","Rokeby","Rokoff","Roland","Roldan","Rolfe","Rolla","Rolland","Rolle","Rolled","Rollen","Rolleston","Rollin","Rolling","Rollins","Rollo","Rolls","Romagna","Romain","Romaine","Romains","Roman","Romana","Romance","Romances","Romane","Romanes","Romanesque","Romani","Romania","Romanism","Romanists","Romano","Romanorum","Romans","Romantic","Romanticism","Romanus","Romany","Romayne","Romeo","Romer","Romero","Romfrey","Romilly","Romish","Rommany","Romney","Romola","Romulus","Ronald","Ronder","Ronicky","Ronny","Ronquillo","Ronsard","Rooms","Roosevelt","Roots","Roper","Ropes","Roque","Rosalie","Rosalind","Rosalinde","Rosaline","Rosamond","Rosamund","Rosario","Rosary","Rosas","Roscius","Roscoe","Roscommon","Rosebery","Rosebud","Rosecrans","Rosemary","Rosen","Rosenberg","Rosenblatt","Rosenthal","Roses","Rosetta","Rosette","Rosey","Rosie","Rosier","Rosina","Rosine","Rosmore","Rosny","Rosse","Rossetti","Rossi","Rossignol","Rossini","Rossiter","Rossitur","Rossmore","Rostov","Roswell","Roswitha","Rotha","Rotherwood","Rothsay","Rothschild","Rotten","Rottenmeier","Rotterdam","Roubaud","Rouen","Rouge","Rouget","Rough","Roughing","Roughly","Rougon","Rouletabille","Roumania","Roumanian","Roumann","Round","Roundhead","Roundheads","Roundjacket","Rouse","Roused","Rousseau","Roussel","Roussillon","Roustan","Route","Rouva","Rover","Rovere","Rovers","Rovigo","Rowan","Rowcliffe","Rowdy","Rowena","Rowland","Rowley","Rowsley","Roxana","Roxane","Roxanne","Roxbury","Royal","Royale","Royalist","Royalists","Royall","Royalties","Royalty","Royce","Royson","Rozel","Rubber","Rubbish","Rubempre","Ruben","Rubens","Rubicon","Rubinstein","Rucker","Rudolf","Rudolph","Rudra","Rudyard","Ruecken","Rueckkehr","Ruecksicht","Rufford","Rufinus","Rufus","Rugby","Rugge","Ruggier","Ruggieri","Ruggiero","Ruggles","Ruined","Ruins","Ruler","Rulers","Rules","Ruling","Rumania","Rumanian","Rumanians","Rumford","Rumor","Rumors","Rumour","Rumours","Runeberg","Runic","Running","Runyon","Rupert","Rural","Rushing","Rushton","Rushworth","Ruskin","Russe","Russel","Russell","Russen","Russes","Russet","Russia","Russian","Russians","Russie","Rustan","Rustem","Rustum","Rusty","Rutherford","Ruthven","Rutland","Rutledge","Rutton","Ruyter","Rwanda","Rydal","Ryder","Rylton","Rymer","Räuber","République","Révolution","Rênal","Rücken","Rückkehr","Rücksicht","SCÈNE","SEÃOR","Saadat","Saale","Saavedra","Sabatini","Sabbath","Sabbaths","Sabin","Sabina","Sabine","Sabines","Sabinus","Sable","Sabre","Sache","Sachem","Sachen","Sachs","Sachsen","Sackville","Sacra","Sacrament","Sacramento","Sacraments","Sacred","Sacrifice","Sacrifices","Saddle","Saddletree","Sadducees","Sadie","Sadler","Sadly","Sadoc","Saduko","Safety","Saffron","Sagamore","Sagen","Sages","Saget","Saguenay","Sahadeva","Sahara","Sahib","Sahibs","Sahwah","Sailed","Sailing","Sailor","Sailors","Sails","Saint","Sainte","Saints","Saintsbury","Sairmeuse","Sakra","Sakris","Salad","Saladin","Salamanca","Salamander","Salamis","Salazar","Salem","Salerno","Sales","Salic","Salim","Saline","Salisbury","Salle","Sallenauve","Sallie","Sallust","Sally","Salmasius","Salmon","Salome","Salomo","Salomon","Salon","Salonika","Saloon","Saltash","Salter","Salters","Saltram","Salts","Salut","Salutation","Salute","Salvador","Salvat","Salvation","Salvator","Salve","Salzburg","Samana","Samarcand","Samaria","Samaritan","Samaritans","Samassa","Samavia","Sambo","Samian","Sammie","Sammlung","Sammy","Samnite","Samnites","Samnium","Samoa","Samoan","Samoans","Samos","Sampson","Samson","Samuel","Sanborn","Sancerre","Sanchez","Sanchia","Sancho","Sancta","Sancti","Sanction","Sanctuary","Sanctus","Sandal","Sande","Sanders","Sanderson","Sandford","Sandip","Sandoval","Sandra","Sands","Sandstone","Sandusky","Sandwich","Sandy","Sandys","Sanford","Sangamon","Sangleys","Sangreal","Sanhedrin","Saniel","Sanin","Sanine","Sanitary","Sanjaya","Sankey","Sanna","Sanoi","Sanscrit","Sanskrit","Santa","Santander","Santee","Santerre","Santiago","Santo","Santos","Saone","Sapor","Sappho","Saracen","Saracenic","Saracens","Saracinesca","Saragossa","Sarah","Saratoga","Sarawak","Sardanapalus","Sardinia","Sardinian","Sardis","Sargent","Sargon","Sarmiento","Sarpent","Sarrasin","Sarrion","Sarto","Sartor","Sarudine","Sarum","Sasha","Saskatchewan","Satan","Satanic","Satin","Satire","Satires","Satisfaction","Satisfied","Saturday","Saturdays","Saturn","Saturnalia","Saturninus","Satyaki","Satyr","Satyrs","Sauce","Saudi","Sauers","Sault","Saumur","Saunders","Sauti","Sauvage","Sauve","Sauveur","Savage","Savages","Savannah","Savarin","Savary","Saved","Savigny","Saville","Savine","Saving","Savings","Savinien","Savior","Saviour","Savoie","Savonarola","Savoy","Savoyard","Sawdust","Sawyer","Saxon","Saxons","Saxony","Saying","Sayings","Scaevola","Scala","Scald","Scale","Scales","Scaliger","Scalloped","Scand","Scandal","Scandinavia","Scandinavian","Scandinavians","Scanned","Scarborough","Scarce","Scarcely","Scarecrow","Scared","Scarlet","Scarlett","Scarron","Scatcherd","Scatter","Scattered","Scattergood","Scaurus","Sceaux","Scena","Scene","Scenery","Scenes","Schaden","Schafe","Schale","Scham","Schande","Schar","Scharen","Schatten","Schatz","Schau","Schauspiel","Schauspieler","Schedule","Scheherazade","Schein","Scheldt","Schelling","Schelm","Scheme","Schemes","Schenck","Schenectady","Schenk","Scherer","Scherz","Scheveningen","Schicksal","Schiff","Schiffe","Schild","Schiller","Schimmel","Schimmer","Schlacht","Schlaf","Schlag","Schlange","Schlegel","Schleier","Schleiermacher","Schlesinger","Schleswig","Schloss","Schlosse","Schlosses","Schloß","Schluessel","Schluss","Schluß","Schlüssel","Schmach","Schmerz","Schmerzen","Schmidt","Schmuck","Schmucke","Schnabel","Schnee","Schneider","Schnell","Schoenbrunn","Schoene","Schoenheit","Schofield","Scholar","Scholars","Scholarship","Scholastic","Schomberg","Schon","School","Schoolcraft","Schoolmaster","Schools","Schopenhauer","Schorlin","Schranken","Schrecken","Schrei","Schreiben","Schreiber","Schreibtisch","Schrift","Schriften","Schriftkultur","Schriftsteller","Schritt","Schritte","Schritten","Schroeder","Schubert","Schuhe","Schuld","Schulden","Schule","Schulen","Schulmeister","Schulter","Schultern","Schultz","Schultze","Schulz","Schulze","Schumann","Schurz","Schuster","Schutz","Schuyler","Schwager","Schwartz","Schwarz","Schwarzenberg","Schweden","Schweigen","Schweitzer","Schweiz","Schwelle","Schwerin","Schwert","Schwester","Schwestern","Schwierigkeit","Schwierigkeiten","Schöne","Schönheit","Schüler","Science","Sciences","Scientific","Scientist","Scientists","Scilly","Scipio","Scipios","Sclater","Scores","Scorn","Scorpion","Scorrier","Scotch","Scotchman","Scotchmen","Scotia","Scotland","Scots","Scotsman","Scotsmen","Scott","Scottish","Scotty","Scotus","Scourge","Scout","Scouts","Scranton","Scrap","Scraps","Scratch","Screw","Scribe","Scribes","Scribner","Script","Scriptural","Scripture","Scriptures","Scrooge","Scrope","Scrub","Scudamore","Scudder","Scully","Sculpture","Scutari","Scylla","Scythia","Scythian","Scythians","Seaforth","Seagrave","Seals","Seaman","Seamen","Search","Searching","Sears","Season","Seasonable","Seasons","Seated","Seating","Seaton","Seats","Seattle","Sebastian","Sebastiano","Sebastopol","Secession","Sechard","Second","Secondary","Secondly","Secrecy","Secret","Secretaries","Secretary","Secretly","Secrets","Section","Sections","Secular","Secunda","Secundus","Secure","Security","Sedan","Sedecias","Seder","Sedgett","Sedgwick","Sedition","Sedley","Seeds","Seeing","Seeking","Seele","Seelen","Seeley","Seely","Seemed","Seeming","Seems","Seest","Segel","Segen","Segovia","Seguin","Segur","Sehen","Sehnsucht","Seide","Seigneur","Seignior","Seine","Seinen","Seiner","Seingalt","Seite","Seiten","Seitz","Seize","Seized","Seizing","Sejanus","Selah","Selborne","Selbst","Selbstbewusstsein","Selbstbewußtsein","Selby","Selden","Seldom","Select","Selected","Selection","Selections","Selene","Seleucus","Selfish","Selicour","Seligkeit","Selim","Selina","Selingman","Selkirk","Sellers","Selling","Sellingworth","Selma","Selon","Selwyn","Semele","Seminary","Seminole","Seminoles","Semiramis","Semites","Semitic","Semmes","Semper","Semple","Sempronius","Semyon","Senat","Senate","Senator","Senatorial","Senators","Sending","Sends","Seneca","Senecas","Senegal","Seneschal","Senhor","Senior","Senlis","Sennacherib","Senor","Senora","Senorita","Sensation","Sense","Senses","Sensible","Sensitive","Sentence","Sentences","Sentiment","Sentimental","Sentiments","Sentinel","Sentähden","Seoul","Separate","Separated","Separation","Separatists","Sepoy","Sepoys","Seppi","September","Septimius","Septimus","Septuagint","Sepulchre","Sequel","Sequoia","Serafina","Serapeum","Seraphim","Serapion","Serapis","Serbia","Serbian","Serbs","Serena","Serene","Serge","Sergeant","Sergey","Sergius","Serial","Series","Serious","Seriously","Serjeant","Sermon","Sermons","Serpent","Serpentine","Serpents","Serra","Serrano","Sertorius","Servadac","Servant","Servants","Serve","Served","Serves","Servia","Servian","Servians","Service","Services","Servilius","Serving","Servius","Seryozha","Sesame","Sesemann","Sesostris","Sessel","Session","Sessions","Seton","Setting","Settle","Settled","Settlement","Settlements","Settlers","Setzen","Seufzer","Seule","Seulement","Seven","Sevenoaks","Seventeen","Seventeenth","Seventh","Seventy","Several","Severance","Severe","Severn","Severus","Sevier","Sevigne","Sevilla","Seville","Sevres","Sewall","Seward","Sewell","Sewing","Sexes","Sexton","Sextus","Sexual","Seychelles","Seymour","Seyns","Seyton","SeÃ±or","Señor","Señora","Sforza","Sganarelle","Shackford","Shackleton","Shaddai","Shade","Shades","Shadow","Shadows","Shadrach","Shadwell","Shaftesbury","Shaggy","Shagpat","Shahrazad","Shake","Shaker","Shakers","Shakes","Shakespear","Shakespeare","Shakespearean","Shakespearian","Shaking","Shakspeare","Shakspere","Shall","Shallow","Shalt","Shame","Shand","Shandon","Shandy","Shane","Shang","Shanghai","Shannon","Shantung","Shanty","Shape","Shaped","Shapes","Share","Shark","Sharlee","Sharon","Sharp","Sharpe","Sharrkan","Shasta","Shawn","Shawnee","Shawnees","Shaykh","Sheba","Shechem","Sheen","Sheep","Sheer","Sheet","Sheffield","Shefford","Sheik","Sheikh","Sheila","Shelburne","Shelby","Sheldon","Shell","Shelley","Shells","Shelter","Shelton","Shenandoah","Shenstone","Shepard","Shepherd","Shepherdess","Shepherds","Shepley","Sheply","Sheppard","Sheraton","Sherborne","Sherbrooke","Sherburne","Shere","Sheridan","Sherif","Sheriff","Sheriffs","Sherkan","Sherlock","Sherman","Sherry","Sherwin","Sherwood","Shetland","Shibli","Shiel","Shiela","Shield","Shields","Shiloh","Shimei","Shine","Shines","Shining","Shint","Shinto","Shipping","Ships","Shiraz","Shire","Shirley","Shirt","Shiva","Shoal","Shoals","Shock","Shoemaker","Shoes","Shone","Shook","Shoop","Shoot","Shooting","Shops","Shore","Shoreham","Short","Shorter","Shorthouse","Shorty","Shoshone","Shoshones","Should","Shoulder","Shouldn","Shout","Shouting","Shouts","Shovel","Showed","Showers","Showing","Shows","Shrapnel","Shrew","Shrewsbury","Shrine","Shropshire","Shrove","Shucks","Shuffles","Shure","Shuster","Shuttleworth","Shylock","Siamese","Siberia","Siberian","Sibley","Sibyl","Sibyll","Sibylla","Sibylline","Sichem","Sicherheit","Sicile","Sicilia","Sicilian","Sicilians","Sicilies","Sicily","Sickness","Siculus","Siddha","Siddhartha","Siddle","Siddons","Siden","Sidenote","Sides","Sidmouth","Sidney","Sidon","Sidonia","Sidonie","Siebenburg","Siege","Siegel","Sieger","Siegfried","Siegmund","Siehst","Siellä","Siemens","Siena","Sienna","Sierra","Sierras","Sieur","Sievers","Sieyes","Sigel","Sighing","Sighs","Sight","Sigismond","Sigismund","Sigmund","Signal","Signature","Signe","Signed","Signior","Signor","Signora","Signore","Signoria","Signorina","Signory","Signs","Sigurd","Sihon","Siihen","Siinä","Siitä","Sikes","Sikhs","Sikkim","Siksi","Silanus","Silas","Silber","Silchester","Silence","Silent","Silently","Silenus","Silesia","Silesian","Silius","Silla","Sillery","Silloin","Silly","Sillä","Silurian","Silva","Silver","Silverbridge","Silverton","Silvester","Silvestre","Silvia","Silvio","Simba","Simcoe","Simeon","Similar","Similarly","Simla","Simmer","Simmonds","Simmons","Simms","Simon","Simonides","Simons","Simoun","Simple","Simplicity","Simplified","Simplon","Simply","Simpson","Simson","Simultaneously","Simón","Sinai","Sinbad","Since","Sincerely","Sincerity","Sinclair","Sindbad","Sinfi","Singapore","Singer","Singh","Singhalese","Singing","Single","Singleton","Sings","Singular","Sinking","Sinks","Sinne","Sinnen","Sinner","Sinners","Sinnlichkeit","Sinon","Sinope","Sinun","Sinä","Sioux","Sirdar","Siren","Sirens","Sirius","Sirona","Sirrah","Sisera","Sismondi","Sissie","Sissy","Sister","Sisters","Sistine","Sisyphus","Sitka","Sitte","Sitten","Sitting","Situated","Situation","Sitä","Sivert","Siward","Sixte","Sixteen","Sixteenth","Sixth","Sixtus","Sixty","Sizilien","Skala","Skale","Skallagrim","Skeat","Skeleton","Skelton","Skene","Skepsey","Sketch","Sketches","Skill","Skimpole","Skinner","Skinny","Skins","Skipper","Sklaven","Skookum","Skull","Skunk","Skyld","Slade","Slain","Slang","Slate","Slater","Slaughter","Slave","Slavery","Slaves","Slavic","Slavin","Slavonic","Slavs","Sleeman","Sleep","Sleeper","Sleeping","Sleepy","Slender","Slept","Sleuth","Slice","Slick","Slide","Slidell","Slight","Slightly","Sligo","Slimak","Slingsby","Slipping","Sloane","Slocum","Slone","Slope","Slough","Slovak","Slovakia","Slovenia","Sluys","Slægt","Small","Smallbones","Smaller","Smallweed","Smart","Smell","Smile","Smiles","Smiley","Smiling","Smith","Smither","Smithers","Smithfield","Smiths","Smithson","Smithsonian","Smoke","Smoking","Smoky","Smolensk","Smollett","Smooth","Smyrna","Smyth","Smythe","Snagsby","Snake","Snakes","Sneak","Sneck","Sneer","Snell","Sneloghe","Snepvangers","Sneyd","Snipe","Snodgrass","Snoop","Snowdon","Snowy","Snyder","Soames","Soane","Sobald","Sobieski","Sobre","Social","Socialism","Socialist","Socialists","Societe","Societies","Society","Sociology","Société","Socrate","Socrates","Socratic","Sodom","Soehne","Soeur","Sofia","Sofie","Softly","Software","Sofya","Sohne","Sohnes","Sohrab","Soissons","Sokrates","Solander","Solange","Solar","Solche","Soldan","Soldat","Soldaten","Soldier","Soldiers","Soleil","Solemn","Solen","Solicitor","Solid","Solignac","Soliman","Solis","Solitary","Solitude","Sollte","Solmes","Solomon","Solon","Solution","Solway","Solyman","Somal","Somali","Somalia","Somebody","Somehow","Someone","Somers","Somerset","Somersetshire","Somerville","Something","Sometime","Sometimes","Somewhat","Somewhere","Somme","Sommer","Sommers","Sonata","Soney","Songez","Songs","Sonia","Sonne","Sonnenschein","Sonnet","Sonnets","Sonntag","Sonny","Sonoma","Sonora","Sonst","Sonya","Soolsby","Sooner","Sooth","Sophia","Sophie","Sophist","Sophists","Sophocles","Sophonisba","Sophronia","Sophy","Soranzo","Sorbonne","Sordello","Sorel","Sorell","Sorge","Sorgen","Sorgfalt","Sorrento","Sorrow","Sorrows","Sorry","Soubise","Soudain","Soudan","Soudanese","Sought","Soulanges","Souldiers","Soule","Souls","Soult","Sound","Sounds","Source","Sources","Sousa","South","Southampton","Southdown","Southeast","Southeastern","Southern","Southerner","Southerners","Southey","Southward","Southwark","Southwell","Southwest","Southwestern","Souvenir","Souvenirs","Souvent","Souza","Soveraign","Sovereign","Sovereigns","Sovereignty","Soviet","Soviets","Sovran","Sowerby","Soyez","Space","Spade","Spagna","Spain","Spaine","Spake","Spalding","Spaniard","Spaniards","Spanien","Spanier","Spanish","Spannung","Spare","Spargo","Spark","Sparks","Sparling","Sparrow","Sparta","Spartacus","Spartan","Spartans","Spass","Spaulding","Speak","Speake","Speaker","Speaking","Speaks","Spear","Spears","Special","Species","Specific","Specifically","Specimen","Specimens","Spectator","Spectators","Spectre","Speculation","Speculations","Speculative","Speech","Speeches","Speed","Speedwell","Speedy","Speise","Speisen","Speke","Spell","Spelling","Spence","Spencer","Spend","Spenser","Spent","Sperry","Sperver","Sphere","Sphinx","Spicca","Spice","Spicer","Spider","Spiders","Spiegel","Spiel","Spiele","Spies","Spike","Spikeman","Spilett","Spinach","Spink","Spinning","Spinola","Spinoza","Spinrobin","Spion","Spires","Spirit","Spirits","Spiritual","Spiritualism","Spiritus","Spite","Spithead","Spitzbergen","Spitze","Spitzen","Splendid","Split","Spoke","Spoken","Sponge","Spoon","Spooner","Sport","Sporting","Sports","Spott","Spotted","Spottsylvania","Spouse","Sprach","Sprache","Sprachen","Spragg","Sprague","Sprang","Spray","Spread","Spreading","Sprich","Spring","Springer","Springfield","Springing","Springs","Sprinkle","Spruce","Spruch","Sprung","Spuren","Spurius","Spurlock","Squad","Squadron","Square","Squash","Squaw","Squeers","Squercum","Squier","Squills","Squinty","Squire","Squires","Squirrel","Staat","Staaten","Staats","Stable","Stacey","Stackpole","Stacy","Stadholder","Stadt","Stadtholder","Staedte","Stael","Staerke","Staff","Stafford","Staffordshire","Stage","Stahl","Staines","Stair","Stairs","Stake","Stalky","Stall","Stallman","Stamboul","Stamford","Stamm","Stamp","Stamped","Stanbury","Stancy","Stand","Standard","Standards","Stande","Standing","Standish","Standpunkt","Stands","Stanford","Stangerson","Stanhope","Staniford","Stanislas","Stanislaus","Stanistreet","Stanley","Stanshy","Stanton","Stanza","Stanzas","Staple","Staples","Stapleton","Starbrow","Starbuck","Starch","Staring","Stark","Starlight","Starling","Starner","Starr","Starratt","Stars","Start","Started","Starting","Startled","Starts","State","Stately","Statement","Staten","States","Statesman","Statesmen","Station","Stationers","Stations","Statira","Statistical","Statistics","Statius","Statt","Statthalter","Statue","Statues","Status","Statute","Statutes","Staub","Staunton","Staël","Stead","Steadfast","Steadily","Steady","Steal","Stealing","Steam","Steamed","Steamer","Stearns","Stebbins","Stedman","Steel","Steele","Steen","Steenie","Steep","Steer","Steering","Steevens","Stefan","Stefano","Steht","Stein","Steinbeck","Steine","Steinen","Steinmetz","Stella","Stellan","Stelle","Stellen","Stelling","Stellung","Stemme","Stendhal","Steno","Stepan","Stephanie","Stephano","Stephanus","Stephen","Stephens","Stephenson","Stepney","Stepping","Steps","Sterben","Sterling","Stern","Sterne","Sternen","Stetson","Stettin","Steuer","Steve","Steven","Stevens","Stevenson","Steward","Stewart","Stewed","Steyne","Stich","Stick","Sticks","Stiff","Stiles","Stilicho","Still","Stille","Stillman","Stillwater","Stillwell","Stilton","Stimme","Stimmen","Stimmung","Stimson","Stipan","Stirling","Stirn","Stirne","Stobell","Stock","Stockade","Stockbridge","Stockdale","Stockholm","Stockmann","Stocks","Stockton","Stoddard","Stoddart","Stoff","Stoffe","Stoic","Stoicism","Stoics","Stoke","Stoker","Stokes","Stole","Stolen","Stoller","Stolpe","Stolz","Stomach","Stone","Stonehenge","Stoneman","Stones","Stonewall","Stony","Stood","Stoop","Stooping","Stopped","Stopping","Stops","Storch","Store","Stores","Storia","Stories","Stork","Storm","Stormfield","Storms","Storrs","Story","Stout","Stowe","Stowey","Strabo","Strachey","Strada","Strafe","Strafford","Strahan","Strahl","Strahlen","Straight","Straightway","Strain","Strait","Straits","Stralsund","Strand","Strang","Strange","Strangely","Stranger","Strangers","Strangway","Strap","Strasbourg","Strasburg","Strassburg","Strasse","Strassen","Strategy","Stratford","Stratton","Strauss","Straw","Strawberries","Strawberry","Straße","Straßen","Stream","Streams","Streatham","Streben","Strecke","Street","Streete","Streets","Streich","Streifen","Streit","Strenge","Strength","Strephon","Stretch","Stretched","Stretching","Strether","Strickland","Strict","Strictly","Strife","Strike","Strikes","Striking","Strindberg","String","Strings","Strip","Striped","Stripes","Stripped","Strive","Strogoff","Stroke","Strom","Strong","Stronger","Strozzi","Struck","Structure","Struggle","Struggling","Struve","Stuart","Stuarts","Stubb","Stubbs","Stube","Stuck","Student","Studenten","Students","Studien","Studies","Studio","Studium","Study","Stueck","Stuecke","Stufe","Stufen","Stuff","Stuffed","Stuhl","Stukely","Stump","Stumpy","Stunde","Stunden","Stung","Stupid","Sturgis","Sturm","Sturt","Sturz","Stuttg","Stuttgart","Stuyvesant","Stygian","Style","Styles","Styria","Städte","Stärke","Stück","Stücke","Suabia","Suarez","Subject","Subjects","Subjekt","Subjunctive","Sublime","Submission","Submit","Subscription","Subscriptions","Subsequent","Subsequently","Substance","Substanz","Substanzen","Substitute","Success","Successful","Succession","Suckling","Sucre","Sudan","Sudden","Suddenly","Sudra","Suende","Suetonius","Suffer","Suffering","Sufferings","Suffice","Sufficient","Suffolk","Suffrage","Sugar","Suggested","Suggestion","Suggestions","Suicide","Suidas","Suisse","Suisses","Suitable","Suite","Suits","Suivant","Sukey","Suleiman","Sulla","Sullen","Sullivan","Sully","Sulphur","Sulpice","Sulpicius","Sultan","Sultana","Sultans","Sumatra","Sumerian","Summa","Summary","Summe","Summen","Summer","Summerhay","Summers","Summerson","Summit","Summon","Summoning","Sumner","Sumter","Sunda","Sunday","Sundays","Sunderland","Sundown","Sundry","Sunflower","Sunlight","Sunne","Sunni","Sunny","Sunrise","Sunset","Sunshine","Suomen","Suomi","Superb","Superintendent","Superior","Superiority","Superman","Supernatural","Superstition","Superstitions","Supper","Supplement","Supplementary","Supplies","Supply","Support","Supported","Suppose","Supposed","Supposing","Suppression","Supremacy","Supreme","Surat","Surely","Surface","Surgeon","Surgeons","Surgery","Surgical","Surinam","Suriname","Surinamen","Surprise","Surprised","Surrender","Surrey","Surrounded","Surry","Surtout","Survey","Surveying","Surveyor","Surya","Susan","Susanna","Susannah","Susie","Suspect","Suspension","Suspicion","Susquehanna","Sussex","Sutherland","Sutra","Sutras","Sutter","Sutton","Suzanne","Svava","Svein","Sviazhsky","Swabia","Swabian","Swain","Swallow","Swallows","Swamp","Swanhild","Swann","Swansea","Swart","Swartz","Swash","Swaziland","Swear","Sweat","Swede","Sweden","Swedenborg","Swedes","Swedish","Sweep","Sweeping","Sweet","Sweeter","Sweetheart","Sweetly","Sweetness","Sweetwater","Swell","Swept","Sweyn","Swift","Swiftly","Swimming","Swinburne","Swine","Swing","Swinging","Swinton","Swiss","Swithin","Switzerland","Swiveller","Sword","Swords","Sybarite","Sybil","Sybilla","Sydenham","Sydney","Sykes","Sylla","Sylph","Sylvain","Sylvan","Sylvanus","Sylvester","Sylvestre","Sylvia","Sylvie","Sylvius","Symbol","Symbols","Symonds","Symons","Sympathy","Symphony","Symposium","Symptoms","Synagogue","Syndicate","Synod","Synonyms","Syntax","Synthesis","Syphax","Sypher","Syracusan","Syracusans","Syracuse","Syria","Syriac","Syrian","Syrians","Syrie","Syrien","Syrup","System","Systeme","Systems","Szene","Sévigné","Söhne","Sønner","Sûtra","Süden","Sünde","Taavi","Tabaret","Tabary","Tabby","Tabernacle","Tabitha","Table","Tableau","Tables","Tabor","Tacitus","Tadoussac","Taetigkeit","Tafel","Taffy","Tagalog","Tagen","Tages","Tagus","Tahiti","Tahitian","Tahitians","Tahoe","Tailed","Taillefer","Tailor","Taine","Taiwan","Tajikistan","Taken","Takes","Taking","Talavera","Talbot","Talboys","Talent","Talents","Taler","Tales","Talfourd","Talisman","Talking","Talks","Talladega","Talleyrand","Tallien","Talma","Talmage","Talmud","Talmudic","Talon","Talpey","Tamar","Tamara","Tambien","Tamburlaine","Tamerlane","Tamil","Taming","Tammany","Tammas","Tampa","Tancred","Tandakora","Tandis","Tanganyika","Tangier","Tanis","Tankred","Tanner","Tannhauser","Tanno","Tantalus","Tante","Tanzania","Taoist","Tapferkeit","Tapio","Tappan","Taquisara","Tarascon","Tarbell","Tarboe","Tardif","Tarentum","Tariff","Tarkas","Tarkington","Tarleton","Tarquin","Tarquinius","Tarry","Tarshish","Tarsus","Tartar","Tartarin","Tartars","Tartarus","Tartary","Tartuffe","Tarzan","Tasche","Tasman","Tasmania","Tasse","Tasso","Taste","Taten","Tatham","Tatian","Tatiana","Tatius","Tatler","Tatsache","Taught","Taunton","Taurus","Tavannes","Tavern","Tavernake","Tavia","Tavish","Tavistock","Taxation","Taxes","Taylor","Tayoga","Teach","Teacher","Teachers","Teaching","Teacups","Tearing","Tears","Technical","Technology","Tecle","Tecumseh","Teddy","Teeth","Tegen","Teheran","Teidän","Teile","Teilen","Teilnahme","Teilung","Telamon","Telecommunications","Telegram","Telegraph","Telemachus","Telephone","Telephones","Television","Televisions","Telfer","Telford","Telle","Teller","Telles","Tellheim","Tellier","Telling","Tello","Tells","Tembarom","Tempe","Tempel","Tempelherr","Temper","Temperament","Temperance","Temperatur","Temperature","Tempest","Templar","Templars","Temple","Temples","Templeton","Temporal","Temporary","Temps","Temptation","Tendency","Tender","Tenderly","Tenderness","Tending","Teneriffe","Tenez","Tennant","Tennessee","Tennis","Tennyson","Tenor","Tense","Tenth","Tents","Teodoro","Terence","Terentius","Teresa","Terminus","Terms","Ternate","Terra","Terrace","Terrain","Terre","Terrenate","Terrence","Terreur","Terrible","Terrified","Territorial","Territories","Territory","Terror","Terry","Tertiary","Tertullian","Terwijl","Terzky","Tessa","Tessie","Testament","Testaments","Testimony","Testing","Tests","Tetlow","Tetzel","Teufel","Teuse","Teuton","Teutonic","Teutons","Texan","Texans","Texar","Texas","Texel","Textbook","Texts","Thacher","Thackeray","Thaddeus","Thailand","Thais","Thalassa","Thales","Thalia","Thaller","Thames","Thane","Thanet","Thank","Thankful","Thanking","Thanks","Thanksgiving","Thatcher","Thats","Thayer","Theater","Theatre","Theatres","Theatrical","Theban","Thebans","Thebes","Thecla","Theft","Theil","Theile","Their","Theirs","Thekla","Thelma","Thema","Theme","Themistocles","Themistokles","Themselves","Thenardier","Thence","Thenceforth","Thenceforward","Theobald","Theocritus","Theodor","Theodora","Theodore","Theodoric","Theodoros","Theodorus","Theodose","Theodosia","Theodosius","Theol","Theological","Theologie","Theology","Theonie","Theophan","Theophile","Theophilus","Theophrastus","Theoretically","Theorie","Theories","Theory","Theos","There","Thereafter","Thereat","Thereby","Therefore","Therein","Thereon","Theresa","Therese","Thereupon","Therewith","Therm","Thermidor","Thermometer","Thermopylae","Theron","Thersites","These","Theseus","Thesiger","Thess","Thessalian","Thessalians","Thessalonians","Thessalonica","Thessaly","Thetis","Theydon","Thibet","Thick","Thief","Thier","Thiere","Thierry","Thiers","Thieves","Thine","Thing","Things","Think","Thinkest","Thinking","Thinks","Thiodolf","Third","Thirdly","Thirkle","Thirlwell","Thirst","Thirteen","Thirteenth","Thirty","Thisbe","Thistle","Thither","Thomas","Thomasin","Thomasson","Thome","Thompson","Thomson","Thora","Thorbiorn","Thord","Thoreau","Thorfinn","Thorgeir","Thorgils","Thorir","Thoris","Thorkel","Thorn","Thorndike","Thorndyke","Thorne","Thornhill","Thorns","Thornton","Thorny","Thorolf","Thorough","Thoroughly","Thorpe","Thorstein","Thorwald","Those","Thoth","Thothmes","Though","Thought","Thoughts","Thousand","Thousands","Thrace","Thracian","Thracians","Thrale","Thread","Threats","Three","Thresk","Threw","Thrice","Thrift","Thrilling","Thring","Thron","Throne","Through","Throughout","Throw","Throwing","Thrown","Throws","Thrums","Thrush","Thrust","Thrusting","Thränen","Thucydides","Thugs","Thugut","Thuillier","Thule","Thumb","Thunder","Thunderer","Thurber","Thuringia","Thurloe","Thurlow","Thurnall","Thursday","Thursdays","Thurstane","Thurston","Thuvia","Thyme","Thyone","Thyrsis","Thyrza","Thyself","ThÃ©rÃ¨se","Thätigkeit","Théodore","Théodoros","Thérèse","Théâtre","Tibby","Tiber","Tiberias","Tiberius","Tibet","Tibetan","Tibetans","Tibullus","Tibur","Ticino","Tickell","Ticket","Tickets","Ticknor","Ticonderoga","Tides","Tidings","Tidore","Tieck","Tiefe","Tiefen","Tiens","Tientsin","Tiere","Tieren","Tiernan","Tierra","Tiffany","Tiffles","Tigellinus","Tiger","Tigers","Tigranes","Tigris","Tilbury","Tilda","Tilden","Tillemont","Tillet","Tillie","Tillotson","Tilly","Tilney","Tilsit","Tilton","Timaeus","Timber","Timbuctoo","Times","Timid","Timmins","Timmy","Timoleon","Timon","Timor","Timotheus","Timothy","Timur","Tincture","Tinguian","Tinker","Tinman","Tintern","Tintoretto","Tipperary","Tippoo","Tipton","Tirant","Tired","Tiresias","Tisch","Tische","Tisdale","Titan","Titania","Titanic","Titans","Titel","Titian","Titianus","Title","Titles","Titus","Tiverton","Tivoli","Tjaelde","Toast","Toasted","Tobacco","Tobago","Tobias","Tobin","Tobit","Toboso","Tochter","Tocqueville","Tocsin","Todas","Today","Toddie","Todes","Todos","Together","Toinen","Toiset","Tokio","Tokyo","Toland","Tolbooth","Toledo","Toleration","Tolstoi","Tolstoy","Tomas","Tomaso","Tomato","Tomatoes","Tombs","Tomkins","Tomlinson","Tommaso","Tommies","Tommy","Tomorrow","Tompkins","Tonga","Tongue","Tongues","Tonight","Tonson","Tonty","Tonya","Toogood","Tooke","Tools","Toombs","Tooth","Tooting","Toots","Topeka","Topham","Tophet","Topsy","Torah","Torbert","Torch","Torcy","Toren","Torero","Torfrida","Torgau","Torheit","Tories","Toronto","Torpenhow","Torquay","Torquemada","Torre","Torrens","Torres","Tortoise","Torture","Toryism","Tossing","Tostig","Totalitaet","Totalität","Toten","Totten","Tottenham","Totty","Touch","Touched","Touches","Touching","Tougaloo","Tough","Toujours","Toulon","Toulouse","Touraine","Tournay","Tours","Tourville","Toussaint","Toute","Toutefois","Toutes","Toward","Towards","Tower","Towers","Towne","Townley","Towns","Townsend","Townshend","Township","Trace","Tracer","Traces","Tracht","Track","Tract","Tracts","Tracy","Traddles","Trade","TradeMark","Trader","Traders","Trades","Trading","Tradition","Traditional","Traditions","Traenen","Trafalgar","Traffic","Trafford","Tragedies","Tragedy","Tragic","Tragoedie","Tragödie","Trail","Traill","Train","Trained","Training","Traite","Traitor","Traitors","Traité","Trajan","Tralee","Tramp","Tranmore","Trans","Transactions","Transatlantic","Transcribed","Transcriber","Transcript","Transfer","Transfiguration","Transit","Transition","Translate","Translated","Translation","Translations","Translator","Transliteration","Transnational","Transport","Transportation","Transvaal","Transylvania","Trapes","Trappe","Trappist","Trauer","Traum","Travel","Traveling","Traveller","Travellers","Travelling","Travels","Travers","Traverse","Traverso","Travilla","Travis","Treachery","Tread","Treas","Treason","Treasure","Treasurer","Treasures","Treasury","Treat","Treaties","Treatise","Treatment","Treaty","Trebizond","Tredgold","Trees","Treffry","Tregars","Tregear","Treherne","Treiben","Trelawny","Trelyon","Tremayne","Tremble","Trembling","Tremendous","Tremont","Tremouille","Trench","Trenchard","Trenck","Trenholme","Trennung","Trent","Trenta","Trenton","Treppe","Tressady","Tressen","Tressilian","Treue","Trevalyon","Trevanion","Trevelyan","Trevert","Treves","Treville","Trevor","Trial","Trials","Trianon","Triassic","Tribe","Tribes","Tribunal","Tribunate","Tribune","Tribunes","Tribute","Trice","Trick","Tricks","Trieb","Tried","Trieste","Trifles","Trillion","Trimalchio","Trina","Trinidad","Trinity","Triomphe","Tripeaud","Triphon","Triple","Tripoli","Trirodov","Triscoe","Tristan","Tristram","Triton","Tritt","Triumph","Triumphant","Triumphs","Trixton","Troiens","Troilus","Trois","Trojan","Trojans","Troll","Trollope","Tromp","Troop","Troops","Tropfen","Tropical","Trost","Troth","Trotter","Trotty","Trotz","Trouble","Troubled","Troubles","Troup","Trout","Trove","Trowbridge","Troyes","Truce","Truck","Truckee","Truedale","Trueman","Truesdale","Truly","Truman","Trumbull","Trumpet","Trumpets","Trunk","Truppen","Truro","Trust","Trustee","Trustees","Trusting","Trusts","Trusty","Truth","Truths","Truxton","Trying","Tryon","Tryst","Tränen","Très","Tuatha","Tubal","Tubbs","Tucker","Tucson","Tudor","Tudors","Tuere","Tuesday","Tuesdays","Tugela","Tugend","Tugenden","Tuileries","Tuition","Tulee","Tulkinghorn","Tullia","Tullius","Tulliver","Tullus","Tully","Tumult","Tunbridge","Tunis","Tunisia","Tunnel","Tuolla","Tuomas","Tuossa","Tupia","Tupman","Tuppence","Tupper","Turan","Turanian","Turchi","Turcos","Turcs","Turenne","Turgenev","Turgot","Turin","Turke","Turkes","Turkestan","Turkey","Turkish","Turkmenistan","Turks","Turnbull","Turned","Turner","Turnip","Turnips","Turns","Turnus","Turold","Turquie","Turtle","Tuscan","Tuscans","Tuscany","Tuscarora","Tusculum","Tutor","Tuttle","Twaddles","Twain","Tweed","Twelfth","Twelve","Twemlow","Twentieth","Twenty","Twice","Twichell","Twickenham","Twilight","Twins","Twist","Tybalt","Tyburn","Tycho","Tyler","Tylor","Tynan","Tyndall","Types","Typhon","Typical","Tyrannen","Tyranny","Tyrant","Tyrants","Tyrconnel","Tyrian","Tyrol","Tyrolese","Tyrone","Tyrrel","Tyrrell","Tyson","Tyttö","Tzigana","Tämä","Tämän","Tässä","Tästä","Tätigkeit","Tätä","Täällä","Töne","Türe","Uarda","Ueber","Ueberzeugung","Uffizi","Uganda","Uhlans","Uilenspiegel","Ukraine","Ukridge","Ulick","Ulloa","Ulrica","Ulrich","Ulster","Ulstermen","Ultimately","Ulysses","Umbrella","Umbria","Umbrian","Umfang","Umgang","Umgebung","Umpire","Umslopogaas","Umstaende","Umstaenden","Umstand","Umstände","Umständen","Unable","Unabridged","Uncas","Uncertain","Uncle","Unconscious","Unconsciously","Under","Underground","Underhill","Underneath","Understand","Understanding","Underwood","Undine","Undoubtedly","Uneasy","Unemployment","Unendliche","Unendlichkeit","Unfortunate","Unfortunately","Ungarn","Ungeduld","Ungeheuer","Unglueck","Unglück","Ungrateful","Unhappily","Unhappy","Unheil","Unicorn","Uniform","Uniformity","Union","Unionism","Unionist","Unionists","Unions","Unitarian","Unitarianism","Unitarians","United","Unity","Universal","Universe","Universelle","Universities","University","Universität","Unjust","Unknown","Unless","Unlike","Unluckily","Unlucky","Unlust","Unmittelbarkeit","Unorna","Unquestionably","Unrecht","Unruhe","Unschuld","Unseen","Unser","Unsere","Unter","Untergang","Unterhaltung","Unternehmen","Unterredung","Unterricht","Unterscheidung","Unterschied","Unterschiede","Untersuchung","Untersuchungen","Until","Unwilling","Unworthy","Upani","Upanishad","Upanishads","Updated","Upper","Upright","Upsala","Upstairs","Upton","Upward","Upwards","Urania","Uranus","Urbain","Urban","Urbino","Urged","Uriah","Uriel","Urrea","Ursache","Ursachen","Ursel","Ursins","Ursprung","Ursula","Ursule","Ursuline","Ursulines","Ursus","Urteil","Urteile","Urtheil","Uruguay","Usage","Useful","Usein","Useless","Usenet","Ushant","Usher","Using","Usually","Usury","Uther","Utica","Utility","Utopia","Utopian","Utrecht","Utter","Uttering","Utterly","Uzbekistan","Vacation","Vader","Vague","Vaguely","Vaikka","Vainly","Vaisampayana","Vaknin","Valais","Valancourt","Valdemar","Valdes","Valdez","Valdivia","Valence","Valencia","Valenciennes","Valens","Valentia","Valentin","Valentine","Valentinian","Valentinois","Valere","Valeria","Valerian","Valerie","Valerius","Valetta","Valette","Valhalla","Valiant","Valjean","Valkyrie","Valladolid","Valle","Vallejo","Valley","Valleys","Valliere","Vallière","Vallon","Valmond","Valois","Valour","Valparaiso","Valuable","Value","Vamos","Vance","Vancouver","Vandal","Vandals","Vandamme","Vandeloup","Vandenesse","Vanderbank","Vanderbilt","Vandet","Vandover","Vandyke","Vanel","Vanessa","Vanilla","Vaninka","Vanished","Vanity","Vannes","Vansittart","Vanslyperken","Vanstone","Vantine","Vanuatu","Varenka","Varennes","Vargas","Vargrave","Varhely","Variant","Variation","Variations","Varick","Varieties","Variety","Various","Varley","Varney","Varro","Varuna","Varus","Varvara","Vasari","Vasco","Vashti","Vasili","Vasishtha","Vassar","Vasselot","Vassili","Vassilissa","Vassily","Vasta","Vasudeva","Vater","Vaterland","Vaters","Vathek","Vatican","Vauban","Vaucluse","Vaudemont","Vaudeville","Vaudreuil","Vaudrey","Vaughan","Vaugirard","Vaunoy","Vauquer","Vaura","Vautrin","Vauxhall","Vavasour","Vavel","Vecchia","Vecchio","Vedanta","Vedas","Vedia","Vedic","Vegetable","Vegetables","Vegetation","Veiled","Vejen","Velasco","Velasquez","Velvet","Venables","Vendale","Vendee","Vendome","Vendée","Vendôme","Venedig","Veneer","Venerable","Venetia","Venetian","Venetians","Venez","Venezia","Venezuela","Vengeance","Venice","Venise","Venison","Venner","Ventadour","Venters","Ventnor","Venture","Venus","Verachtung","Veraenderung","Veranlassung","Verbindung","Verbindungen","Verbrechen","Verbrecher","Verbreitung","Verbs","Verby","Vercingetorix","Verdacht","Verdant","Verde","Verden","Verderben","Verdi","Verdienst","Verdugo","Verdun","Verdurin","Verehrung","Verein","Vereinigung","Verfahren","Verfasser","Verfassung","Verfügung","Vergangenheit","Vergennes","Vergil","Vergleich","Vergleichung","Vergniaud","Vergnuegen","Vergnügen","Vergon","Verhaeltnis","Verhaeltniss","Verhaeltnisse","Verhaeltnissen","Verhalten","Verhandlungen","Verhältnis","Verhältnisse","Verhältnissen","Verhältniß","Verily","Verity","Verkauf","Verkehr","Verlag","Verlangen","Verlauf","Verlegenheit","Verloc","Verlust","Vermandois","Vermilion","Vermittelung","Vermittlung","Vermoegen","Vermond","Vermont","Vermögen","Verne","Verner","Vernet","Verneuil","Vernon","Vernunft","Verona","Veronese","Veronica","Veronique","Verpflichtung","Verres","Verrian","Versailles","Versammlung","Verschiedenheit","Verse","Verses","Versicherung","Version","Versprechen","Verstand","Verstande","Verstandes","Versuch","Versuche","Verteidigung","Vertrag","Vertrauen","Vertreter","Vertue","Verty","Verus","Vervain","Vervolgens","Verwaltung","Verwandten","Verwendung","Verwirrung","Verwunderung","Verzeihung","Verzweiflung","Veränderung","Vesey","Veslovsky","Vespasian","Vesper","Vespers","Vespucci","Vessel","Vessels","Vesta","Vestal","Vesuvius","Vetch","Vetter","Veuillez","Vexed","Vianen","Vicar","Vicarage","Vicente","Vicenza","Viceroy","Vices","Vickers","Vicksburg","Vicky","Vicomte","Vicomtesse","Victoire","Victor","Victoria","Victorian","Victories","Victorine","Victorious","Victory","Victualling","Victurnien","Vidal","Vidame","Vidura","Viele","Vielleicht","Vielä","Vienna","Vienne","Viennese","Viens","Vierge","Viertelstunde","Vierter","Vietnam","Vieux","Viewed","Viewing","Views","Vigil","Vigilance","Viglius","Vigne","Vignon","Vigny","Vihdoin","Viion","Viking","Vikings","Viktor","Villa","Village","Villages","Villain","Villani","Villars","Ville","Villefort","Villeneuve","Villeparisis","Villeroy","Villette","Villiers","Villon","Vilna","Vincennes","Vincent","Vincenzo","Vinci","Vincy","Vindication","Vinegar","Viner","Vines","Vinet","Vineyard","Vingt","Vinicius","Vinitius","Viola","Violante","Violence","Violent","Violet","Violets","Violetta","Violette","Vipont","Virata","Virgen","Virgie","Virgil","Virgile","Virgilio","Virgin","Virginia","Virginian","Virginians","Virginie","Virginius","Virgins","Virgo","Virtue","Virtues","Virtuous","Visconti","Viscount","Viscountess","Vishnu","Visigoths","Vision","Visions","Visit","Visitation","Visited","Visiting","Visitor","Visitors","Visits","Vista","Vistula","Vitae","Vital","Vitelli","Vitellius","Viterbo","Vitruvius","Vitry","Vittoria","Vivian","Vivie","Vivien","Vizard","Vizier","Vlaanderen","Vladimir","Voban","Vocabulary","Vocal","Voelker","Vogel","Vogotzine","Vogue","Voice","Voices","Voici","Voila","Voilà","Voisin","Volga","Volgens","Volke","Volkes","Volkplanting","Volks","Vollendung","Vollkommenheit","Volney","Volscians","Volsung","Voltaire","Volterra","Volumes","Volumnia","Voluntary","Volunteer","Volunteers","Voraussetzung","Vorbereitung","Vorfall","Vorgang","Vorhang","Vorigen","Vorsatz","Vorschlag","Vorsicht","Vorst","Vorstellung","Vorstellungen","Vorteil","Vorteile","Vortigern","Vortrag","Vorwurf","Vorzug","Vosges","Vossius","Vostrand","Votes","Voyage","Voyages","Voyant","Voyez","Voyons","Vraiment","Vrede","Vronsky","Vrouw","Vulcan","Vulfran","Vulgar","Vulgate","Vulture","Vyasa","Väinämöinen","Väter","Vénus","Vögel","Völker","Waarom","Wabash","Wache","Wacht","Waddington","Waddy","Wadsworth","Waehrend","Wafers","Waffen","Wagen","Wager","Wages","Wagnalls","Wagner","Wagon","Wagram","Wahnsinn","Wahrheit","Wahrlich","Wahrnehmung","Waife","Wainamoinen","Wainwright","Waite","Waiter","Waiting","Waitz","Wakefield","Wakes","Waking","Walcheren","Walde","Waldemar","Walden","Waldo","Waldorf","Waldron","Wales","Walked","Walker","Walking","Walks","Walkyn","Wallace","Wallachia","Wallenstein","Waller","Wallingford","Wallis","Walloon","Walloons","Walls","Wally","Walnut","Walpole","Walsh","Walsingham","Walter","Walters","Waltham","Walther","Walton","Waltz","Wamba","Wanda","Wanderer","Wandering","Wangen","Wanneer","Wanted","Wanting","Wants","Wapping","Warbeck","Warble","Warbler","Warburton","Warden","Wardens","Wardes","Wardlaw","Wardle","Wardour","Wardrobe","Waren","Warfare","Wargrave","Waring","Warkworth","Warlock","Warmth","Warned","Warner","Warning","Warrant","Warre","Warren","Warrens","Warrenton","Warrington","Warrior","Warriors","Warsaw","Warton","Warum","Warwick","Warwicke","Warwickshire","Washburn","Washing","Washington","Wasser","Waste","Wastes","Wastl","Watauga","Watch","Watching","Watchman","Water","Waterbury","Waterford","Waterhouse","Waterloo","Waterman","Waters","Watertown","Waterways","Watkins","Watling","Watson","Watteau","Watterson","Watts","Waugh","Waverley","Waverton","Waves","Waving","Wayland","Waymark","Wayne","Wayside","Wazir","Wazirs","Weakness","Weald","Wealth","Wealthy","Weapons","Wearied","Wearing","Weary","Weasel","Weather","Weatherbee","Weatherbury","Weatherley","Weave","Weaver","Weaving","Webber","Weber","Webster","Wechsel","Weddell","Wedderburn","Wedding","Wedgwood","Wednesday","Wednesdays","Weekly","Weeks","Weeping","Wegen","Weges","Weibe","Weiber","Weibes","Weigh","Weight","Weights","Weile","Weimar","Weinberg","Weinen","Weird","Weise","Weisen","Weisheit","Weiss","Weisspriess","Weiter","Welbeck","Welch","Welche","Welcome","Weldon","Weldra","Welfare","Welke","Welland","Wellen","Weller","Welles","Wellesley","Wellington","Wells","Welnu","Welsh","Welshman","Welshmen","Welton","Wemmick","Wenceslas","Wendell","Wendover","Wendung","Wenham","Wenlock","Wenna","Wentworth","Wenzel","Werden","Weren","Werff","Werke","Werken","Werkzeug","Werner","Werper","Werte","Werth","Werther","Wesel","Wesen","Wesens","Weser","Wesley","Wesleyan","Wessex","Westangle","Westbrook","Westchester","Westcott","Westen","Westerling","Westerly","Westermarck","Western","Westerner","Westerners","Westlake","Westminster","Westmoreland","Weston","Westover","Westphalia","Westward","Westwood","Wetherell","Wetlands","Wetmore","Wette","Wetter","Wetzel","Wexford","Weyburn","Weyler","Weymar","Weymouth","Whale","Whales","Whaling","Whalley","Wharf","Wharton","Whate","Whately","Whatever","Whatsoever","Wheat","Wheatley","Wheaton","Wheel","Wheeler","Wheeling","Wheels","Whence","Whene","Whenever","Where","Whereas","Whereat","Whereby","Wherefore","Wherein","Whereof","Whereon","Whereto","Wherever","Wherewith","Wherof","Whether","Whewell","Which","Whichever","Whigs","While","Whiles","Whilst","Whipple","Whiskers","Whiskey","Whisky","Whisper","Whispering","Whispers","Whist","Whistle","Whistler","Whistling","Whitaker","Whitbread","Whitby","Whitcomb","White","Whitechapel","Whitefield","Whitefoot","Whitehall","Whitehead","Whitelaw","Whites","Whitfield","Whitford","Whither","Whiting","Whitley","Whitman","Whitmore","Whitney","Whitsunday","Whitsuntide","Whittaker","Whittier","Whittington","Whitwell","Whitworth","Whoever","Whole","Wholly","Whoop","Whopper","Whore","Whose","Whoso","Whosoever","Whyte","Wichita","Wichtigkeit","Wicked","Wickersham","Wickham","Wicklow","Widerspruch","Widerstand","Widger","Widow","Widows","Wieder","Wieland","Wiener","Wiesbaden","Wiese","Wiesen","Wigan","Wiggily","Wiggin","Wiggins","Wight","Wilberforce","Wilbur","Wilcox","Wilde","Wilder","Wilderness","Wildfire","Wilding","Wildmere","Wildrake","Wiley","Wilford","Wilfred","Wilfrid","Wilhelm","Wilhelmina","Wilhelmine","Wilkes","Wilkeson","Wilkie","Wilkins","Wilkinson","Wilks","Willard","Wille","Willem","Willems","Willen","Willens","Willet","Willett","William","Williams","Williamsburg","Williamson","Willibald","Willie","Willing","Willingly","Willis","Willoughby","Willow","Wills","Willson","Willst","Willy","Wilmet","Wilmington","Wilmot","Wilna","Wilson","Wilton","Wilts","Wiltshire","Wimbledon","Wimpole","Winchelsea","Winchester","Winckelmann","Winde","Windermere","Windham","Winding","Window","Windows","Winds","Windsor","Windward","Windy","Winfield","Wingate","Winged","Wingfield","Wingfold","Wingrave","Wings","Winifred","Winkel","Winkle","Winnebago","Winnebagos","Winnie","Winning","Winnington","Winnipeg","Winona","Winslow","Winsome","Winston","Winter","Winterbourne","Winters","Winthrop","Winton","Winwood","Wireless","Wirklichkeit","Wirkung","Wirkungen","Wirtin","Wirtschaft","Wisconsin","Wisdom","Wiseli","Wiseman","Wiser","Wishes","Wishing","Wissen","Wissens","Wissenschaft","Wissenschaften","Wisting","Witch","Witchcraft","Witches","Withal","Withdraw","Wither","Withers","Witherspoon","Within","Without","Witness","Witnesses","Witte","Wittenberg","Witwe","Wives","Wizard","Woburn","Woche","Wochen","Wodehouse","Woden","Wogan","Woher","Wohin","Wohlan","Wohnung","Wohnungen","Wolcott","Wolfe","Wolfert","Wolff","Wolfgang","Wolke","Wolken","Wollaston","Wollen","Wollt","Wolseley","Wolsey","Wolves","Woman","Women","Wonder","Wonderful","Wondering","Wonderland","Wonders","Wondrous","Wonne","Wonota","Woodbourne","Woodbridge","Woodburn","Woodbury","Woodcock","Woodcourt","Wooden","Woodford","Woodhouse","Woodhull","Woodman","Woodpecker","Woodrow","Woodruff","Woods","Woodseer","Woodstock","Woodville","Woodward","Woolsey","Woolwich","Worcester","Worcestershire","Worden","Words","Wordsworth","Worked","Workers","Working","Workmen","Works","World","Worldly","Worlds","Worms","Worse","Worship","Worsley","Worst","Worsted","Worte","Worten","Wortes","Worth","Worthies","Worthington","Worthy","Wortley","Wotan","Wotton","Would","Wouldn","Wouldst","Wound","Wounded","Wounds","Woven","Wragge","Wrandall","Wrangel","Wrapped","Wrath","Wrayson","Wreck","Wrenn","Wretch","Wretched","Wright","Write","Writer","Writers","Writing","Writings","Written","Wrong","Wronsky","Wrote","Wrought","Wrykyn","Wuerde","Wunde","Wunden","Wunder","Wunsch","Wurmser","Wurtemberg","Wurzburg","Wurzel","Wurzeln","Wuthering","Wyandots","Wyatt","Wycherley","Wyclif","Wylder","Wylie","Wyllys","Wyman","Wyndham","Wynne","Wynnie","Wyoming","Während","Wünsche","Würde","Xanthe","Xavier","Xenophon","Xerxes","Ximenes","Xpage","Yacht","Yahweh","Yakov","Yankee","Yankees","Yanks","Yaqui","Yards","Yarmouth","Yarrow","Yasmini","Yates","Yazoo","Yeardley","Yearly","Years","Yeast","Yeats","Yegor","Yegorushka","Yellow","Yellowstone","Yemen","Yeomanry","Yerba","Yiddish","Yield","Yielding","Yokohama","Yolanda","Yolande","Yonder","Yonge","Yorick","Yorke","Yorker","Yorkers","Yorkshire","Yorkshireman","Yorktown","Yosemite","Young","Younger","Yourii","Yours","Yourself","Youth","Youths","Ypres","Yrjö","Yucatan","Yudhishthira","Yugoslav","Yugoslavia","Yukon","Yussuf","Yusuf","Yvette","Yvonne","Zachariah","Zacharias","Zachary","Zadig","Zadok","Zahlen","Zahlung","Zaire","Zambesi","Zambia","Zamora","Zanoni","Zante","Zanzibar","Zaragoza","Zarathoustra","Zarathustra","Zauber","Zbyszko","Zdenko","Zealand","Zealanders","Zebedee","Zebulun","Zechariah","Zedekiah","Zeeland","Zeelanders","Zeichen","Zeichnung","Zeichnungen","Zeilen","Zeiten","Zeitlang","Zeitschrift","Zeitung","Zeitungen","Zeker","Zelfs","Zelle","Zeller","Zenith","Zenobia","Zephyr","Zeppelin","Zermatt","Zerubbabel","Zettel","Zeuge","Zeugen","Zeugnis","Zibeline","Zicci","Ziele","Zijne","Zikali","Zilah","Zillah","Zimbabwe","Zimmer","Zimmermann","Zimmern","Zimmers","Zinsen","Ziska","Zobeide","Zodiac","Zonaras","Zonder","Zones","Zoodra","Zoological","Zoology","Zopyrus","Zoroaster","Zorzi","Zosimus","Zouaves","Zoulmekan","Zounds","Zubereitung","Zucht","Zucker","Zuege","Zuerst","Zufall","Zuflucht","Zufriedenheit","Zugleich","Zukunft","Zuleika","Zuletzt","Zululand","Zulus","Zunge","Zurich","Zurita","Zusammenhang","Zuschauer","Zustand","Zustande","Zustimmung","Zutphen","Zuyder","Zwang","Zweck","Zwecke","Zweifel","Zweig","Zweige","Zweiter","Zwischen"
-        ]
\ No newline at end of file
+        import numpy # pylint: disable=import-outside-toplevel
+
+        self.seed = seed
+        self.rng = numpy.random.default_rng(seed)
+
+    @property
+    def word_list(self) -> tuple:
+        '''The large word list shared by every HFGEN'''
+        return load_large_word_list()
+
+    def get_large_word_list(self) -> tuple:
+        '''Returns a long list of about 20,000 words 4 or more char words from the top 100k English words on Wikipedia
+
+        The tuple is shared between all callers so it can't be modified, copy it with list() if needed'''
+        return load_large_word_list()
+
+    # *****************************************************************************************************************
+    # Sampling
+    # *****************************************************************************************************************
+
+    def generate_utterances(self, n: int, min_words: int = 3, max_words: int = 12) -> list:
+        '''Generates n utterances of between min_words and max_words random words
+
+        All the word choices are drawn in a single call, only the final joins are done per utterance'''
+        import numpy # pylint: disable=import-outside-toplevel
+
+        words = load_large_word_array()
+        lengths = self.rng.integers(min_words, max_words + 1, size=n)
+        picks = words[self.rng.integers(0, len(words), size=int(lengths.sum()))].tolist()
+        ends = numpy.cumsum(lengths).tolist()
+        starts = [0] + ends[:-1]
+        return [" ".join(picks[start:end]) for start, end in zip(starts, ends)]
+
+    def _unique_names(self, n: int) -> list:
+        '''n distinct names, words drawn without replacement while the word list is big enough'''
+        words = load_large_word_array()
+        if n <= len(words):
+            return words[self.rng.choice(len(words), size=n, replace=False)].tolist()
+        names = words[self.rng.integers(0, len(words), size=n)].tolist()
+        return [f'{name}_{i}' for i, name in enumerate(names)]
+
+    def generate_tags(self, n_tags: int) -> list:
+        '''Generates n_tags HF tags with distinct names and random colors'''
+        names = self._unique_names(n_tags)
+        colors = self.rng.integers(0, 0x1000000, size=n_tags).tolist()
+        return [{"id": f'tag-{i}', "name": name, "color": f'#{color:06X}'}
+                for i, (name, color) in enumerate(zip(names, colors))]
+
+    def generate_intents(self, n_intents: int, depth: int = 3, branching: int = 4) -> list:
+        '''Generates a hierarchy of n_intents HF intents up to depth levels deep
+
+        Each level is about branching times bigger than the one above it and every intent
+        below the top level gets a random parent from the level above.
+        Intents are returned parents first'''
+        import numpy # pylint: disable=import-outside-toplevel
+
+        if n_intents <= 0:
+            return []
+
+        weights = numpy.power(float(branching), numpy.arange(depth))
+        sizes = numpy.floor(n_intents * weights / weights.sum()).astype(int)
+        sizes[0] = max(sizes[0], 1)
+        sizes[-1] += n_intents - sizes.sum()
+
+        parents = numpy.full(n_intents, -1)
+        start = 0
+        previous = None
+        for size in sizes.tolist():
+            if size == 0:
+                continue
+            if previous is not None:
+                parents[start:start + size] = self.rng.integers(previous[0], previous[1], size=size)
+            previous = (start, start + size)
+            start = start + size
+
+        intents = []
+        for i, (name, parent) in enumerate(zip(self._unique_names(n_intents), parents.tolist())):
+            intent = {"id": f'intent-{i}', "name": name, "metadata": {}, "tags": []}
+            if parent >= 0:
+                intent["parent_intent_id"] = f'intent-{parent}'
+            intents.append(intent)
+        return intents
+
+    def _timestamps(self, start, seconds) -> list:
+        '''HF created_at strings for a numpy array of seconds after start'''
+        import numpy # pylint: disable=import-outside-toplevel
+
+        stamps = numpy.datetime64(start, 's') + seconds.astype('timedelta64[s]')
+        return [f'{stamp}Z' for stamp in numpy.datetime_as_string(stamps, unit='s').tolist()]
+
+    def iter_examples(self,
+                      n_examples: int,
+                      intents: list = None,
+                      tags: list = None,
+                      labelled_fraction: float = 0.5,
+                      tag_fraction: float = 0.1,
+                      min_words: int = 3,
+                      max_words: int = 12,
+                      start_time: Union[str, datetime.datetime] = DEFAULT_START_TIME,
+                      chunk_size: int = GENERATOR_CHUNK_SIZE) -> Iterator[list]:
+        '''Yields lists of up to chunk_size HF example dicts
+
+        labelled_fraction of the examples are labelled with a random leaf intent from intents
+        tag_fraction of the examples get a random tag from tags
+        examples are a few seconds to a minute apart starting from start_time'''
+        import numpy # pylint: disable=import-outside-toplevel
+
+        if intents is None:
+            intents = []
+        if tags is None:
+            tags = []
+
+        parent_ids = {intent.get("parent_intent_id") for intent in intents}
+        intent_refs = [{"intent_id": intent["id"]} for intent in intents if intent["id"] not in parent_ids]
+        tag_refs = [{"id": tag["id"], "name": tag["name"]} for tag in tags]
+
+        elapsed = 0
+        for offset in range(0, n_examples, chunk_size):
+            size = min(chunk_size, n_examples - offset)
+            texts = self.generate_utterances(size, min_words, max_words)
+            seconds = elapsed + numpy.cumsum(self.rng.integers(1, 60, size=size))
+            elapsed = int(seconds[-1])
+            created_at = self._timestamps(start_time, seconds)
+
+            labelled = (self.rng.random(size) < labelled_fraction).tolist()
+            intent_picks = self.rng.integers(0, max(len(intent_refs), 1), size=size).tolist()
+            tagged = (self.rng.random(size) < tag_fraction).tolist()
+            tag_picks = self.rng.integers(0, max(len(tag_refs), 1), size=size).tolist()
+
+            chunk = []
+            for i in range(size):
+                chunk.append({
+                    "id": f'example-{offset + i}',
+                    "text": texts[i],
+                    "created_at": created_at[i],
+                    "intents": [intent_refs[intent_picks[i]]] if labelled[i] and intent_refs else [],
+                    "tags": [tag_refs[tag_picks[i]]] if tagged[i] and tag_refs else [],
+                    "metadata": {},
+                    "context": {}
+                })
+            yield chunk
+
+    def iter_conversations(self,
+                           n_conversations: int,
+                           min_turns: int = 2,
+                           max_turns: int = 20,
+                           min_words: int = 3,
+                           max_words: int = 12,
+                           start_time: Union[str, datetime.datetime] = DEFAULT_START_TIME,
+                           chunk_size: int = GENERATOR_CHUNK_SIZE) -> Iterator[list]:
+        '''Yields lists of HF example dicts making up whole conversations, about chunk_size examples at a time
+
+        Each conversation has between min_turns and max_turns utterances alternating
+        between the client and the expert, starting with the client'''
+        import numpy # pylint: disable=import-outside-toplevel
+
+        conversations_per_chunk = max(1, (2 * chunk_size) // (min_turns + max_turns))
+        elapsed = 0
+        for offset in range(0, n_conversations, conversations_per_chunk):
+            size = min(conversations_per_chunk, n_conversations - offset)
+            turns = self.rng.integers(min_turns, max_turns + 1, size=size)
+            total = int(turns.sum())
+            first = numpy.cumsum(turns) - turns
+            conversation = numpy.repeat(numpy.arange(offset, offset + size), turns).tolist()
+            turn = (numpy.arange(total) - numpy.repeat(first, turns)).tolist()
+
+            # conversations start up to an hour apart and turns follow each other within a minute
+            starts = elapsed + numpy.cumsum(self.rng.integers(1, 3600, size=size))
+            elapsed = int(starts[-1])
+            gaps = numpy.cumsum(self.rng.integers(1, 60, size=total))
+            gaps = gaps - numpy.repeat(gaps[first] - 1, turns)
+            created_at = self._timestamps(start_time, numpy.repeat(starts, turns) + gaps)
+            texts = self.generate_utterances(total, min_words, max_words)
+
+            contexts = {}
+            chunk = []
+            for i in range(total):
+                role = "client" if turn[i] % 2 == 0 else "expert"
+                key = (conversation[i], role)
+                if key not in contexts:
+                    contexts[key] = {"context_id": str(conversation[i]), "type": "conversation", "role": role}
+                chunk.append({
+                    "id": f'example-{conversation[i]}-{turn[i]}',
+                    "text": texts[i],
+                    "created_at": created_at[i],
+                    "intents": [],
+                    "tags": [],
+                    "metadata": {"conversation_turn": str(turn[i])},
+                    "context": contexts[key]
+                })
+            yield chunk
+
+    # *****************************************************************************************************************
+    # Workspaces
+    # *****************************************************************************************************************
+
+    def write_workspace(self,
+                        output: Union[str, IO],
+                        n_examples: int,
+                        n_intents: int = 100,
+                        n_tags: int = 10,
+                        depth: int = 3,
+                        branching: int = 4,
+                        jsonl: bool = False,
+                        chunk_size: int = GENERATOR_CHUNK_SIZE,
+                        **kwargs) -> dict:
+        '''Streams a synthetic HF workspace of n_examples examples to output, a file path or text file object
+
+        jsonl=False writes HF JSON on one line as HFWorkspace.write_json(jsonl=True) lays it out
+        jsonl=True  writes one example per line and leaves out the tags and intents
+
+        Any other keyword arguments are passed to iter_examples.
+        Returns the HF JSON of the workspace without its examples so the tags and intents
+        can be uploaded separately when writing jsonl'''
+        from .objects import HF_JSON_SCHEMA # pylint: disable=import-outside-toplevel
+
+        workspace = {"$schema": HF_JSON_SCHEMA}
+        tags = self.generate_tags(n_tags)
+        intents = self.generate_intents(n_intents, depth=depth, branching=branching)
+        if len(tags) > 0:
+            workspace["tags"] = tags
+        if len(intents) > 0:
+            workspace["intents"] = intents
+
+        chunks = self.iter_examples(n_examples, intents=intents, tags=tags, chunk_size=chunk_size, **kwargs)
+        _write_hf_json(output, workspace, chunks, jsonl)
+        return workspace
+
+    def write_conversations(self,
+                            output: Union[str, IO],
+                            n_conversations: int,
+                            jsonl: bool = False,
+                            chunk_size: int = GENERATOR_CHUNK_SIZE,
+                            **kwargs) -> int:
+        '''Streams n_conversations synthetic conversations to output, a file path or text file object,
+        as an HF JSON conversation set or with jsonl=True one example per line
+
+        Any other keyword arguments are passed to iter_conversations.
+        Returns the number of examples written'''
+
+        chunks = self.iter_conversations(n_conversations, chunk_size=chunk_size, **kwargs)
+        return _write_hf_json(output, {}, chunks, jsonl)
+
+    def generate_workspace(self,
+                           n_examples: int,
+                           n_intents: int = 100,
+                           n_tags: int = 10,
+                           depth: int = 3,
+                           branching: int = 4,
+                           **kwargs):
+        '''Generates a synthetic HFWorkspace in memory
+
+        Intents are named by their full hierarchy joined with "-" as HFWorkspace.intent does.
+        For millions of examples use write_workspace instead'''
+        from . import objects # pylint: disable=import-outside-toplevel
+
+        workspace = objects.HFWorkspace()
+        workspace.delimiter = "-"
+
+        tags = self.generate_tags(n_tags)
+        for tag in tags:
+            workspace.tags[tag["name"]] = objects.HFTag(tag["id"], tag["name"], tag["color"])
+            workspace.tag_reference[tag["name"]] = objects.HFTagReference(tag["id"], tag["name"])
+        tag_references = {tag["id"]: workspace.tag_reference[tag["name"]] for tag in tags}
+
+        intents = self.generate_intents(n_intents, depth=depth, branching=branching)
+        paths = {}
+        for intent in intents:
+            parent_intent_id = intent.get("parent_intent_id")
+            if parent_intent_id:
+                paths[intent["id"]] = f'{paths[parent_intent_id]}-{intent["name"]}'
+            else:
+                paths[intent["id"]] = intent["name"]
+            hf_intent = objects.HFIntent(id=intent["id"], name=intent["name"], parent_intent_id=parent_intent_id)
+            workspace.intents[paths[intent["id"]]] = hf_intent
+            workspace.intents_by_id[intent["id"]] = hf_intent
+
+        for chunk in self.iter_examples(n_examples, intents=intents, tags=tags, **kwargs):
+            for example in chunk:
+                workspace.examples[example["id"]] = objects.HFExample(
+                    text=example["text"],
+                    id=example["id"],
+                    created_at=example["created_at"],
+                    intents=[intent["intent_id"] for intent in example["intents"]],
+                    tags=[tag_references[tag["id"]] for tag in example["tags"]]
+                )
+
+        return workspace
+
+
+def _write_hf_json(output: Union[str, IO], workspace: dict, chunks: Iterator[list], jsonl: bool) -> int:
+    '''Writes the examples in chunks to output as HF JSON with the rest of workspace or as JSONL
+    Returns the number of examples written'''
+    # deferred as the writer shared with HFWorkspace.write_json builds on objects
+    from .serialisation import _write_hf_json_document # pylint: disable=import-outside-toplevel
+
+    if isinstance(output, str):
+        with open(output, mode="w", encoding="utf8") as file_out:
+            return _write_hf_json(file_out, workspace, chunks, jsonl)
+
+    written = 0
+    if jsonl:
+        for chunk in chunks:
+            output.write("".join([json.dumps(example) + "\n" for example in chunk]))
+            written = written + len(chunk)
+        return written
+
+    def examples() -> Iterator[dict]:
+        nonlocal written
+        for chunk in chunks:
+            yield from chunk
+            written = written + len(chunk)
+
+    sections = {key: value for key, value in workspace.items() if key != "$schema"}
+    _write_hf_json_document(output, examples(), sections, indent=None, dumps=json.dumps)
+    output.write("\n")
+    return written
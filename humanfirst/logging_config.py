@@ -0,0 +1,101 @@
+"""
+logging_config.py
+
+Configures logging for the whole HF SDK from config/logging.conf and the HF_LOG_* environment variables
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import os
+import datetime
+import logging
+import logging.config
+
+# locate where we are
+here = os.path.abspath(os.path.dirname(__file__))
+path_to_log_config_file = os.path.join(here,'config','logging.conf')
+
+# whether configure_logging has already run in this process
+_state = {"configured": False}
+
+
+def configure_logging(force: bool = False):
+    """Load logging.conf with the handlers, log file and level chosen by the environment variables
+
+    HF_LOG_FILE_ENABLE    - TRUE to log to a rotating file in HF_LOG_DIR
+    HF_LOG_CONSOLE_ENABLE - TRUE to log to the console
+    HF_LOG_LEVEL          - DEBUG, INFO (default), WARNING, ERROR or CRITICAL
+
+    Every module calls this on import but only the first call configures anything,
+    pass force to apply changed environment variables"""
+
+    if _state["configured"] and not force:
+        return
+
+    # Get the current date and time
+    current_datetime = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    # Create the log file name with the current datetime
+    log_filename = f"log_{current_datetime}.log"
+
+    # Decide whether to save logs in a file or not
+    log_file_enable = os.environ.get("HF_LOG_FILE_ENABLE")
+
+    log_handler_list = []
+
+    if log_file_enable == "TRUE":
+        log_handler_list.append('rotatingFileHandler')
+    elif log_file_enable == "FALSE" or log_file_enable is None:
+        pass
+    else:
+        raise RuntimeError("Incorrect HF_LOG_FILE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
+
+    log_defaults = {}
+
+    # get log directory if going to save the logs
+    if log_file_enable == "TRUE":
+        log_dir = os.environ.get("HF_LOG_DIR")
+        if log_dir:
+            if not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+            path_to_save_log = os.path.join(log_dir,log_filename)
+        else:
+            raise RuntimeError("Require Log directory environment variable set up - HF_LOG_DIR")
+    else:
+        # avoid logging to a file
+        path_to_save_log = '/dev/null'  # On Linux/MacOS, this discards logs (Windows: NUL)
+    log_defaults['HF_LOG_FILE_PATH'] = path_to_save_log
+
+    # Decide whether to print the logs in the console or not
+    log_console_enable = os.environ.get("HF_LOG_CONSOLE_ENABLE")
+
+    if log_console_enable == "TRUE":
+        log_handler_list.append('consoleHandler')
+    elif log_console_enable == "FALSE" or log_console_enable is None:
+        pass
+    else:
+        raise RuntimeError("Incorrect HF_LOG_CONSOLE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
+
+    if log_handler_list:
+        log_defaults['HF_LOG_HANDLER'] = ",".join(log_handler_list)
+    else:
+        log_defaults['HF_LOG_HANDLER'] = "nullHandler"
+
+    # Set log levels
+    log_level = os.environ.get("HF_LOG_LEVEL")
+    if log_level is not None:
+        # set log level
+        if log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+            raise RuntimeError("Incorrect log level. Should be - 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'")
+
+        log_defaults['HF_LOG_LEVEL'] = log_level
+    else:
+        log_defaults['HF_LOG_LEVEL'] = 'INFO' # default level
+
+    # Load logging configuration
+    logging.config.fileConfig(
+        path_to_log_config_file,
+        defaults=log_defaults
+    )
+    _state["configured"] = True
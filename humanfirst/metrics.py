@@ -0,0 +1,343 @@
+"""
+metrics.py
+
+Instrumentation hooks for the HumanFirst API clients, an in-memory metrics collector
+and a Prometheus text exporter
+
+Hooks are passed to HFAPI, AsyncHFAPI or Authorization as hooks=[...] and called with
+- on_request(RequestEvent)         before every attempt at a request, including retries
+- on_response(RequestEvent)        when a response is received, whatever its status code
+- on_error(RequestEvent)           when no response is received, event.exception says why
+- on_token_refresh(TokenEvent)     after every firebase sign in or token refresh
+
+MetricsCollector is a hook keeping latency histograms and percentiles per endpoint.
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import re
+import math
+import time
+import random
+import logging
+import threading
+import urllib.parse
+import http.server
+from typing import List
+
+# third party imports
+
+# custom imports
+from .ratelimit import endpoint_family
+
+# create logger
+logger = logging.getLogger('humanfirst.metrics')
+
+# path segments of the HumanFirst API that are not ids, anything else is replaced by {id} in endpoint names
+ROUTE_SEGMENTS = frozenset([
+    "batch", "config", "conversation_sets", "conversations", "coverage", "environment", "evaluations", "export",
+    "files", "humanfirst", "import", "import_http", "inputs", "integration_workspaces", "integrations", "intents",
+    "latest", "models", "nlu", "nlu_engines", "pipelines", "plan", "playbooks", "predict", "presets", "prompts",
+    "query", "report.zip", "revisions", "subscriptions", "tags", "triggers", "usage", "workspaces"
+])
+API_VERSION_SEGMENT = re.compile(r"^v\d+((alpha|beta)\d*)?$")
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# latencies kept per endpoint for the percentiles
+LATENCY_SAMPLE_SIZE = 4096
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """A low cardinality name for the endpoint a request went to, ids in the path are replaced by {id}
+
+    i.e. GET https://api.humanfirst.ai/v1alpha1/workspaces/ns/playbook-1/intents
+      -> GET /v1alpha1/workspaces/{id}/{id}/intents"""
+    names = []
+    for segment in urllib.parse.urlparse(url).path.strip("/").split("/"):
+        if not segment:
+            continue
+        base, separator, action = segment.partition(":")
+        if base not in ROUTE_SEGMENTS and not API_VERSION_SEGMENT.match(base):
+            base = "{id}"
+        names.append(f'{base}{separator}{action}')
+    return f'{method.upper()} /{"/".join(names)}'
+
+
+class RequestEvent:
+    """One attempt at an API request
+
+    elapsed, status_code, bytes_received and exception are filled in once the attempt completes"""
+
+    def __init__(self, method: str, url: str, attempt: int = 0, bytes_sent: int = 0):
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpoint_name(method, url)
+        self.family = endpoint_family(url)
+        self.attempt = attempt
+        self.bytes_sent = bytes_sent
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self.status_code = None
+        self.bytes_received = 0
+        self.exception = None
+
+    def finish(self, status_code: int = None, bytes_received: int = 0, exception: Exception = None):
+        """Record the outcome of the attempt"""
+        self.elapsed = time.perf_counter() - self.started
+        self.status_code = status_code
+        self.bytes_received = bytes_received
+        self.exception = exception
+
+
+class TokenEvent:
+    """A firebase sign in ("sign_in") or token refresh ("refresh")"""
+
+    def __init__(self, kind: str, elapsed: float, status_code: int = None, exception: Exception = None):
+        self.kind = kind
+        self.elapsed = elapsed
+        self.status_code = status_code
+        self.exception = exception
+        self.success = exception is None and status_code == 200
+
+
+class HFHooks:
+    """Base class for hooks, override the methods needed"""
+
+    def on_request(self, event: RequestEvent):
+        """Called before every attempt at a request"""
+
+    def on_response(self, event: RequestEvent):
+        """Called when a response is received"""
+
+    def on_error(self, event: RequestEvent):
+        """Called when an attempt fails without a response"""
+
+    def on_token_refresh(self, event: TokenEvent):
+        """Called after every firebase sign in or token refresh"""
+
+
+def call_hooks(hooks: List[HFHooks], name: str, event):
+    """Call the named method on every hook, a failing hook is logged and never fails the request"""
+    for hook in hooks:
+        try:
+            getattr(hook, name)(event)
+        except Exception as e: # pylint: disable=broad-exception-caught
+            logger.warning("Hook %s.%s failed: %s", type(hook).__name__, name, e)
+
+
+def body_size(data) -> int:
+    """Bytes in a request body if it can be measured without consuming it"""
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf8"))
+    return int(getattr(data, "len", 0) or 0)
+
+
+class EndpointStats:
+    """Counts, bytes and latencies of the requests to one endpoint"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.samples = []
+        self.random = random.Random(0)
+
+    def add(self, event: RequestEvent):
+        """Add a completed attempt"""
+        self.count = self.count + 1
+        if event.attempt > 0:
+            self.retries = self.retries + 1
+        if event.status_code is None or event.status_code >= 400:
+            self.errors = self.errors + 1
+        status = str(event.status_code) if event.status_code is not None else type(event.exception).__name__
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_sent = self.bytes_sent + event.bytes_sent
+        self.bytes_received = self.bytes_received + event.bytes_received
+
+        self.latency_sum = self.latency_sum + event.elapsed
+        self.latency_max = max(self.latency_max, event.elapsed)
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and event.elapsed > LATENCY_BUCKETS[bucket]:
+            bucket = bucket + 1
+        self.bucket_counts[bucket] = self.bucket_counts[bucket] + 1
+
+        # reservoir sampling keeps an unbiased sample of all the latencies in bounded memory
+        if len(self.samples) < LATENCY_SAMPLE_SIZE:
+            self.samples.append(event.elapsed)
+        else:
+            replace = self.random.randrange(self.count)
+            if replace < LATENCY_SAMPLE_SIZE:
+                self.samples[replace] = event.elapsed
+
+    def percentile(self, percent: float) -> float:
+        """Latency in seconds below which percent of the requests completed"""
+        return _nearest_rank(sorted(self.samples), percent)
+
+    def summary(self) -> dict:
+        """Counts, bytes and latency percentiles in seconds"""
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "mean": self.latency_sum / self.count if self.count else 0.0,
+            "p50": _nearest_rank(ordered, 50),
+            "p90": _nearest_rank(ordered, 90),
+            "p95": _nearest_rank(ordered, 95),
+            "p99": _nearest_rank(ordered, 99),
+            "max": self.latency_max
+        }
+
+
+class MetricsCollector(HFHooks):
+    """In-memory metrics per endpoint and for token refreshes
+
+    Thread safe, share one between clients to aggregate their requests"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.token_refreshes = {}
+
+    def on_response(self, event: RequestEvent):
+        self._add(event)
+
+    def on_error(self, event: RequestEvent):
+        self._add(event)
+
+    def on_token_refresh(self, event: TokenEvent):
+        with self.lock:
+            stats = self.token_refreshes.setdefault(event.kind, {"count": 0, "failures": 0, "seconds": 0.0})
+            stats["count"] = stats["count"] + 1
+            stats["seconds"] = stats["seconds"] + event.elapsed
+            if not event.success:
+                stats["failures"] = stats["failures"] + 1
+
+    def _add(self, event: RequestEvent):
+        with self.lock:
+            stats = self.endpoints.get(event.endpoint)
+            if stats is None:
+                stats = EndpointStats()
+                self.endpoints[event.endpoint] = stats
+            stats.add(event)
+
+    def summary(self) -> dict:
+        """{"endpoints": {endpoint: EndpointStats.summary()}, "token_refreshes": {kind: counts and seconds}}
+
+        endpoints are ordered by total time spent in them, the hottest first"""
+        with self.lock:
+            hottest = sorted(self.endpoints.items(), key=lambda item: item[1].latency_sum, reverse=True)
+            return {
+                "endpoints": {endpoint: stats.summary() for endpoint, stats in hottest},
+                "token_refreshes": {kind: dict(stats) for kind, stats in self.token_refreshes.items()}
+            }
+
+    def reset(self):
+        """Forget everything collected so far"""
+        with self.lock:
+            self.endpoints = {}
+            self.token_refreshes = {}
+
+    def to_prometheus(self, prefix: str = "humanfirst") -> str:
+        """The metrics in the Prometheus text exposition format"""
+        lines = []
+        with self.lock:
+            lines.append(f'# HELP {prefix}_request_duration_seconds HumanFirst API request latency')
+            lines.append(f'# TYPE {prefix}_request_duration_seconds histogram')
+            for endpoint, stats in self.endpoints.items():
+                label = f'endpoint="{_escape_label(endpoint)}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                    cumulative = cumulative + count
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{label},le="+Inf"}} {stats.count}')
+                lines.append(f'{prefix}_request_duration_seconds_sum{{{label}}} {stats.latency_sum}')
+                lines.append(f'{prefix}_request_duration_seconds_count{{{label}}} {stats.count}')
+
+            counters = [
+                ("requests_total", "HumanFirst API requests by response status", None),
+                ("request_retries_total", "HumanFirst API requests that were retries", "retries"),
+                ("request_bytes_sent_total", "Bytes sent in HumanFirst API request bodies", "bytes_sent"),
+                ("request_bytes_received_total", "Bytes received in HumanFirst API responses", "bytes_received")
+            ]
+            for name, description, attribute in counters:
+                lines.append(f'# HELP {prefix}_{name} {description}')
+                lines.append(f'# TYPE {prefix}_{name} counter')
+                for endpoint, stats in self.endpoints.items():
+                    label = f'endpoint="{_escape_label(endpoint)}"'
+                    if attribute is None:
+                        for status, count in stats.statuses.items():
+                            lines.append(f'{prefix}_{name}{{{label},status="{_escape_label(status)}"}} {count}')
+                    else:
+                        lines.append(f'{prefix}_{name}{{{label}}} {getattr(stats, attribute)}')
+
+            lines.append(f'# HELP {prefix}_token_refreshes_total Firebase sign ins and token refreshes')
+            lines.append(f'# TYPE {prefix}_token_refreshes_total counter')
+            for kind, stats in self.token_refreshes.items():
+                lines.append(f'{prefix}_token_refreshes_total{{kind="{kind}",result="success"}} '
+                             f'{stats["count"] - stats["failures"]}')
+                lines.append(f'{prefix}_token_refreshes_total{{kind="{kind}",result="failure"}} {stats["failures"]}')
+            lines.append(f'# HELP {prefix}_token_refresh_seconds_total Time spent signing in and refreshing tokens')
+            lines.append(f'# TYPE {prefix}_token_refresh_seconds_total counter')
+            for kind, stats in self.token_refreshes.items():
+                lines.append(f'{prefix}_token_refresh_seconds_total{{kind="{kind}"}} {stats["seconds"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _nearest_rank(ordered: list, percent: float) -> float:
+    """The nearest rank percentile of sorted values, 0 if there are none"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))]
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def start_prometheus_server(collector: MetricsCollector,
+                            port: int,
+                            addr: str = "",
+                            prefix: str = "humanfirst") -> http.server.ThreadingHTTPServer:
+    """Serve collector.to_prometheus() at /metrics from a daemon thread for Prometheus to scrape
+
+    Returns the server, call shutdown() on it to stop serving"""
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        """Answers GET /metrics"""
+
+        def do_GET(self): # pylint: disable=invalid-name
+            """Serve the metrics"""
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = collector.to_prometheus(prefix=prefix).encode("utf8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args): # pylint: disable=redefined-builtin
+            logger.debug(format, *args)
+
+    server = http.server.ThreadingHTTPServer((addr, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="humanfirst-prometheus", daemon=True)
+    thread.start()
+    return server
@@ -12,485 +12,34 @@ https://numpydoc.readthedocs.io/en/latest/format.html
 
 # standard imports
 import datetime
-import copy
 import hashlib
-import json
-import random
-from typing import IO, Any, Dict, List, Optional, Union
+from typing import IO, Dict, Iterable, List, Optional, Sequence, Union
 import logging
-import logging.config
-import os
 import uuid
 
 # third party imports
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json
-import pandas
 
-# locate where we are
-here = os.path.abspath(os.path.dirname(__file__))
-path_to_log_config_file = os.path.join(here,'config','logging.conf')
-
-# Get the current date and time
-current_datetime = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-# Create the log file name with the current datetime
-log_filename = f"log_{current_datetime}.log"
-
-# Decide whether to save logs in a file or not
-log_file_enable = os.environ.get("HF_LOG_FILE_ENABLE")
-
-log_handler_list = []
-
-if log_file_enable == "TRUE":
-    log_handler_list.append('rotatingFileHandler')
-elif log_file_enable == "FALSE" or log_file_enable is None:
-    pass
-else:
-    raise RuntimeError("Incorrect HF_LOG_FILE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
-
-log_defaults = {}
-
-# get log directory if going to save the logs
-path_to_save_log = os.path.join(here,'logs',log_filename)
-if log_file_enable == "TRUE":
-    log_dir = os.environ.get("HF_LOG_DIR")
-    if log_dir:
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        path_to_save_log = os.path.join(log_dir,log_filename)
-    else:
-        raise RuntimeError("Require Log directory environment variable set up - HF_LOG_DIR")
-else:
-    # avoid logging to a file
-    path_to_save_log = '/dev/null'  # On Linux/MacOS, this discards logs (Windows: NUL)
-log_defaults['HF_LOG_FILE_PATH'] = path_to_save_log
-
-# Decide whether to print the logs in the console or not
-log_console_enable = os.environ.get("HF_LOG_CONSOLE_ENABLE")
-
-if log_console_enable == "TRUE":
-    log_handler_list.append('consoleHandler')
-elif log_console_enable == "FALSE" or log_console_enable is None:
-    pass
-else:
-    raise RuntimeError("Incorrect HF_LOG_CONSOLE_ENABLE value. Should be - 'TRUE', 'FALSE' or ''")
-
-if log_handler_list:
-    log_defaults['HF_LOG_HANDLER'] = ",".join(log_handler_list)
-else:
-    log_defaults['HF_LOG_HANDLER'] = "nullHandler"
-
-
-# Set log levels
-log_level = os.environ.get("HF_LOG_LEVEL")
-if log_level is not None:
-    # set log level
-    if log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-        raise RuntimeError("Incorrect log level. Should be - 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'")
-
-    log_defaults['HF_LOG_LEVEL'] = log_level
-else:
-    log_defaults['HF_LOG_LEVEL'] = 'INFO' # default level
-
-
-# Load logging configuration
-logging.config.fileConfig(
-    path_to_log_config_file,
-    defaults=log_defaults
-)
+# custom imports
+from .logging_config import configure_logging
+from .schema import (HFMetadata, HFContext, HFExample, HFIntent, HFIntentRef, HFTag, HFTagFilters, HFTagReference,
+                     HFExxampleIDNotPresentException, HFIncompatibleOptionException,
+                     _TagMatcher, _VersionedDict, _gc_paused)
+# the rest of the schema, so everything can still be imported from humanfirst.objects
+from .schema import ( # pylint: disable=unused-import
+    HF_JSON_SCHEMA, HFTagFilter, HFMissingCredentialsException, HFMapperException, HFOutputFileMustBeDifferent,
+    HFInvlaidIntentTypeException, HFInvalidWorkspaceInputTypeException, HFContextTypeException,
+    HFContextRoleException, InvalidFilterLevel, InvalidFilterType, InvalidTagFilterListFormat, generate_random_color)
+from . import serialisation
+from .serialisation import PARQUET_BATCH_SIZE
+
+# configure logging for the SDK - only the first module imported does this
+configure_logging()
 
 # create logger
 logger = logging.getLogger('humanfirst.objects')
 
-HFMetadata = Dict[str, Any]
-
-class HFIncompatibleOptionException(Exception):
-    """When parameters passed are incompatible"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFMissingCredentialsException(Exception):
-    """When can't locate assumed credentials"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFMapperException(Exception):
-    """When a mapping can't be resolved"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFOutputFileMustBeDifferent(Exception):
-    """When the output file name is the same as the input file name"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFInvlaidIntentTypeException(Exception):
-    """This happens when intent is not of type HFIntentRef, HFIntent or str (intent_id) objects"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFInvalidWorkspaceInputTypeException(Exception):
-    """This happens when HFWorkspace object is not from a dict of a json (from api) or from a json file"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFExxampleIDNotPresentException(Exception):
-    """This happens when HF example does not have any ID to be included in the workspace"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFContextTypeException(Exception):
-    """This happens when HF example does not have any ID to be included in the workspace"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-class HFContextRoleException(Exception):
-    """This happens when HF example does not have any ID to be included in the workspace"""
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
-
-@dataclass_json
-@dataclass
-class HFTag:
-    '''Schema object for HF Tags
-
-    Validates the format of a tag
-
-    Parameters
-    ----------
-    id:    str            unique id for tag
-    name:  str            name of tag that will be displayed in HF studio
-    color: str, optional  a hex code starting with # for a color to display the tag in eg #ff33da (a bright pink)
-                          if a color isn't provided a random one will be assigned
-    '''
-    id: str
-    name: str
-    color: Optional[str] = None
-
-    def __init__(self,
-                 id: str, # pylint: disable=redefined-builtin
-                 name: str,
-                 color: Optional[str] = None):
-        self.id = id # pylint: disable=redefined-builtin
-        self.name = name
-        if color and color != '':
-            self.color = color
-        else:
-            self.color = generate_random_color()
-
-@dataclass_json
-@dataclass
-class HFTagReference:
-    '''Schema object for HF Tags to be used in HF intents and HF examples
-
-    Validates the format of a tag used in intents and examples
-
-    These tags are added to HFIntents and HFExamples
-
-    Parameters
-    ----------
-    id:    str            unique id for tag
-    name:  str            name of tag that will be displayed in HF studio
-    '''
-    id: str
-    name: str
-
-    def __init__(self,
-                 id: str, # pylint: disable=redefined-builtin
-                 name: str):
-        self.id = id # pylint: disable=redefined-builtin
-        self.name = name
-
-@dataclass_json
-@dataclass
-class HFTagFilter:
-    '''Schema object for HF Tag Filter
-
-    Validates the format of a tag filter
-    of types include|exclude
-
-    Provide lists of tags to filter as comma delimited strings or lists
-
-    Parameters
-    ----------
-    include: [],
-    exclude: [],
-    '''
-    include: list
-    exclude: list
-
-    def __init__(self, include: list = None, exclude: list = None):
-
-        if include is None:
-            include = []
-
-        if exclude is None:
-            exclude = []
-
-        self.include = include
-        self.exclude = exclude
-
-@dataclass_json
-@dataclass
-class HFTagFilters:
-    """
-    HumaFirst Tag filters
-
-    Sets and validates intent and utterance level tags
-    """
-    intent: HFTagFilter
-    utterance: HFTagFilter
-
-    def __init__(self):
-        """Provide skeleton tag filter object
-        tags can be provided as a comma delimited string
-        or an extracted list
-        """
-        self.intent = HFTagFilter()
-        self.utterance = HFTagFilter()
-
-    def set_tag_filter(self, level: str, tag_type: str, tags: Union[list,str]):
-        """Sets tag filters"""
-        accepted_levels = ["intent","utterance"]
-        if not level in accepted_levels :
-            raise InvalidFilterLevel(f"Accepted levels are {accepted_levels} level was: {level}")
-        accepted_types = ["include","exclude"]
-        if not tag_type in accepted_types :
-            raise InvalidFilterType(f"Accepted tag_types are {accepted_types} tag_type was: {tag_type}")
-        tags = self.validate_tag_list_format(tags)
-        tag_filter = getattr(self,level)
-        setattr(tag_filter,tag_type,tags)
-        setattr(self,"level",tag_filter)
-
-    def validate_tag_list_format(self,tags: Union[list,str]) -> list:
-        """Validates the tag list"""
-        if tags == []:
-            return []
-        if tags == "":
-            return []
-        if isinstance(tags, str):
-            try:
-                tags = tags.split(",")
-                assert isinstance(tags, list)
-                assert len(tags) > 0
-            except InvalidTagFilterListFormat as e:
-                error_msg_1 = "Couldn't parse -g --tags filters"
-                error_msg_2 = "please make sure a quoted string with a comma separated list of tag names :"
-                logger.error("%s %s %s", error_msg_1, error_msg_2, e)
-                quit()
-            return tags
-        if isinstance(tags,list):
-            return tags
-            # could have a tag validate function here,
-            # but that would need to check if have a labelled workspace to check against
-        raise InvalidTagFilterListFormat(
-            f"Did not recognise type of tags argument passed {tags} {type(tags)}"
-        )
-
-@dataclass_json
-@dataclass
-class HFIntent:
-    '''Schema object for HF Intent
-
-     Validates the format of an Intent
-
-     Parameters
-     ----------
-     id:        str            unique id for intent
-     name:      str            name of intent that will be displayed in HF studio
-     metadata:  dict           a dictionary or HFMetadata object of string only key value pairs
-     tags:      list           a list of HFTagReference objects
-     parent_intent_id: str, optional  a reference to the ID of the immediate parent if using hierarchy intents
-     '''
-    id: str
-    name: str
-    metadata: HFMetadata = field(default_factory=dict)
-    tags: List[HFTagReference] = field(default_factory=list)
-    parent_intent_id: Optional[str] = None
-
-    def __init__(self,
-                 id: str, # pylint: disable=redefined-builtin
-                 name: str,
-                 metadata: HFMetadata = None,
-                 tags: List[HFTagReference] = None,
-                 parent_intent_id: Optional[str] = None):
-
-
-        if metadata is None:
-            metadata = {}
-
-        if tags is None:
-            tags = []
-
-        self.id = id
-        self.name = name
-        self.parent_intent_id = parent_intent_id
-        self.metadata = metadata
-        self.tags = tags
-
-
-@dataclass_json
-@dataclass
-class HFContext:
-    '''Schema object for HFContext
-
-    Validates the format of a the Context object interelating multiple HFExamples (utterances)
-    within a document or conversation.
-
-    Parameters
-    ----------
-    context_id: str             unique id for context object
-    type      : str, optional   the document type, only "conversation" is currently supported
-                                will control how the utterances display in multi utterance GUI items
-    role      : str, optional   two roles are defined for conversation document
-                                'client' - the analysed party in the tool typically the human user, customer etc.
-                                'expert' - the responding party in the tool typically the bot, agent etc.
-    '''
-    context_id: Optional[str] = None
-    type: Optional[str] = None
-    role: Optional[str] = None
-
-    def __init__(self,
-                 context_id: Optional[str] = None,
-                 type: Optional[str] = None, #pylint: disable=W0622:redefined-builtin
-                 role: Optional[str] = None):
-        self.context_id = context_id
-        if type and type != '':
-            if type in ['conversation',"utterance","training_phrase",'unknown']:
-                self.type = type
-                if role and role != '':
-                    if type == 'conversation':
-                        if role in ['expert', 'client']:
-                            self.role = role
-                        else:
-                            raise HFContextRoleException(
-                                'Only "client" or "expert" roles are currently supported with "converation" context type')
-                    else:
-                        raise HFContextRoleException(
-                            'Not expecting a role for context types except conversation'
-                        )
-            else:
-                raise HFContextTypeException(
-                    'Only "conversation","utterance","training_phrase" and "unknown" document types are currently supported')
-
-
-@dataclass_json
-@dataclass
-class HFIntentRef:
-    '''Schema object for HFIntentRef - a reference to another intent typically for identifying the parent in a hierarchy
-
-    Validates the format of a the HFIntentRef Object
-
-    Parameters
-    ----------
-    intent_id: str  the id of the referenced intent
-    '''
-    intent_id: str
-
-    def __init__(self, intent_id: str):
-        self.intent_id = intent_id
-
-
-@dataclass_json
-@dataclass
-class HFExample:
-    '''Schema object for HFExample - a labelled or unlabelled utterance example
-
-    Text from a document of some kind.
-    May be a single utterance or be linked by a HFContext object to other examples forming a document
-    May contain metadata about where was created useful to an annotator in the HF Studio
-
-    TODO: annotation of entities
-
-    Parameters
-    ----------
-    id:       str  An id for the Example
-    text:     str  The text of the example
-    context:  HFContext, optional  A HFContext object defining what document type the example came from
-                                   defining what role the speaker/writer was performing and linking the
-                                   example to other examples making up that document
-    intents:  list HFIntentRef|HFIntent|str
-                                   A list of HFintentRefs for intents, or a list of HFIntents
-                                   or a list of strings containing intent ids
-                                   May be empty list [] if so the utterance will be treated as unlabelled
-    tags:     list HFTagReference A list of ids of intents for which this example text is an example of
-                                   May be empty list [] if so the utterance will be treated as unlabelled
-                                   and appear int the data section
-                                   If provided these utterance will be treated as labelled and appear in the
-                                   intents section
-    metadata: dict | HFMetadata    A dict of string only key value pairs detailing information about the text
-                                   useful to a future annotator
-    '''
-    id: str
-    text: str
-    created_at: str
-    intents: List[HFIntentRef] = field(default_factory=list)
-    tags: List[HFTagReference] = field(default_factory=list)
-    metadata: HFMetadata = field(default_factory=dict)
-    context: Optional[HFContext] = None
-
-    def __init__(
-            self,
-            text: str,
-            id: str, # pylint: disable=redefined-builtin
-            created_at: Optional[datetime.datetime] = None,
-            intents: Union[List[HFIntentRef],List[HFIntent],List[str]] = None,
-            tags: List[HFTagReference] = None,
-            metadata: HFMetadata = None,
-            context: Optional[HFContext] = None
-        ):
-
-        if intents is None:
-            intents = []
-
-        if tags is None:
-            tags = []
-
-        if metadata is None:
-            metadata = {}
-
-        if context is None:
-            context = {}
-
-        self.id = id
-        self.text = text
-        self.intents = intents
-        self.tags = tags
-        self.metadata = metadata
-        self.context = context
-        if self.context is None:
-            self.context = {}
-
-        if created_at is not None:
-            if isinstance(created_at, str):
-                self.created_at = created_at
-            else:
-                self.created_at = created_at.isoformat() + 'Z'
-
-        if len(intents) > 0:
-            if isinstance(intents[0],HFIntentRef):
-                self.intents = [HFIntentRef(intent.intent_id)
-                                for intent in intents]
-            elif isinstance(intents[0],HFIntent):
-                self.intents = [HFIntentRef(intent.id)
-                                for intent in intents]
-            elif isinstance(intents[0],str):
-                self.intents = [HFIntentRef(intent)
-                                for intent in intents]
-            else:
-                raise HFInvlaidIntentTypeException(
-                    "Intents can be provided as a list of HFIntentRef, HFIntent or str (intent_id) objects only")
-
 
 class HFWorkspace:
     '''Schema object for HFWorkspace - may be used to update labelled or unlabelled data to HF Studio
@@ -513,11 +62,17 @@ class HFWorkspace:
 
     def __init__(self):
         self.intents = {}
-        self.intents_by_id = {}
+        self.intents_by_id = _VersionedDict()
         self.tags = {}
         self.tag_reference = {}
         self.examples = {}
         self.delimiter = None
+        # caches of the intent hierarchy kept while _intent_hierarchy_stamp is _intent_cache_stamp
+        # delimiter: (intent id: fully qualified name, fully qualified name: intent id), see _intent_names
+        self._intent_names_cache = {}
+        # parent intent id, None at the top: {name: child intent}, see _intent_tree
+        self._intent_children = None
+        self._intent_cache_stamp = None
 
     def intent(self,
                name_or_hier: Union[str, List[str]],
@@ -538,15 +93,32 @@ class HFWorkspace:
         metadata:     dict | HFMetadata     A dict of string only key value pairs detailing information about the text
                                             useful to an annotator in HF Studio
         '''
-        if tags is None:
-            tags = []
-
-        if metadata is None:
-            metadata = {}
-
         if not isinstance(name_or_hier, list):
             name_or_hier = [name_or_hier]
 
+        return self._intent_from_path(name_or_hier, id, tags, metadata, self._intent_tree())
+
+    def intents_from_paths(self,
+                           paths: Iterable[Union[str, List[str]]],
+                           delimiter: Optional[str] = None) -> List[Optional[HFIntent]]:
+        '''Bulk version of intent for many hierarchies, returns the intent at the end of each path
+
+        Each path is a list of intent names from the top of the hierarchy, or a string split on delimiter,
+        a string is one top level intent if there's no delimiter.
+        Every missing intent is created in one pass over the paths, walking the intent tree
+        without checking it is up to date for each one'''
+        children = self._intent_tree()
+        leaves = []
+        for path in paths:
+            if isinstance(path, str):
+                path = path.split(delimiter) if delimiter else [path]
+            leaves.append(self._intent_from_path(path, None, None, None, children))
+        return leaves
+
+    def _intent_from_path(self, name_or_hier: List[str], id: Optional[str], # pylint: disable=redefined-builtin
+                          tags: Optional[List[HFTagReference]], metadata: Optional[HFMetadata],
+                          children: dict) -> Optional[HFIntent]:
+        '''Find or create each intent down name_or_hier, children is the current _intent_tree'''
         parent_intent_id = None
         last = None
         for i,part in enumerate(name_or_hier):
@@ -554,39 +126,34 @@ class HFWorkspace:
             if part == '':
                 break
 
-            if i == 0:
-                previous_parts = ""
-                full_intent_path = part
-            elif i == 1:
-                previous_parts = name_or_hier[0]
-                full_intent_path = "-".join([previous_parts,part])
-            else:
-                previous_parts = "-".join(name_or_hier[0:i])
-                full_intent_path = "-".join([previous_parts,part])
-
-            if  full_intent_path not in self.intents:
-                if not id:
-                    genid = f'intent-{len(self.intents)}'
-                else:
-                    genid = id
-
+            siblings = children.get(parent_intent_id)
+            intent = siblings.get(part) if siblings else None
+            if intent is None:
                 # TODO: this doesn't work if you want the parent intent to have
                 # different metadata or tags to the child intent.
                 # the first child intent creates the full hierarchy
                 intent = HFIntent(
-                    id=genid,
+                    id=id if id else self._next_intent_id(),
                     name=part,
                     parent_intent_id=parent_intent_id,
                     metadata=metadata,
                     tags=tags,
                 )
-                self.intents[full_intent_path] = intent
-                self.intents_by_id[genid] = intent
-            last = self.intents[full_intent_path]
+                self.intents["-".join(name_or_hier[:i + 1])] = intent
+                self._add_intent_by_id(intent)
+                children.setdefault(parent_intent_id, {})[part] = intent
+            last = intent
             parent_intent_id = last.id
 
         return last
 
+    def _next_intent_id(self) -> str:
+        '''intent-<number of intents>, counting on past any id already taken'''
+        number = len(self.intents)
+        while f'intent-{number}' in self.intents_by_id:
+            number = number + 1
+        return f'intent-{number}'
+
     def tag_intent(self, intent_id, tag: HFTagReference):
         """Sets the intent tags"""
         # get the intent here
@@ -604,23 +171,73 @@ class HFWorkspace:
         return tag
 
     def get_intent_index(self, delimiter: str) -> dict:
-        """ Compute fully qualified intent name for all the intents"""
-
-        # for every intent
-        # go back up it's parent hierachy by id
-        # reassemble name_or_hier
-        # concatentate
-        # in other file need to split and trim
-        # hopefully should compare.
-        intent_name_index = {}
-        for intent_id in self.intents_by_id:
-            working = self.intents_by_id[intent_id]
-            fullpath = working.name
-            while working.parent_intent_id:
-                working = self.intents_by_id[working.parent_intent_id]
-                fullpath = f'{working.name}{delimiter}{fullpath}'
-            intent_name_index[intent_id] = fullpath
-        return intent_name_index
+        """ Compute fully qualified intent name for all the intents
+
+        Returns a copy of the cached index, which is kept up to date as intent() adds intents"""
+        return dict(self._intent_names(delimiter)[0])
+
+    def get_intent_id(self, fully_qualified_name: str, delimiter: Optional[str] = None) -> Optional[str]:
+        """The id of the intent with a fully qualified name, None if there isn't one.
+        delimiter defaults to the workspace delimiter"""
+        if delimiter is None:
+            delimiter = self.delimiter
+        return self._intent_names(delimiter)[1].get(fully_qualified_name)
+
+    def _intent_names(self, delimiter: str) -> tuple:
+        """The cached (intent id: fully qualified name, fully qualified name: intent id) indexes for delimiter
+
+        intent() adds new intents to the cached indexes as it goes. Any other change to intents_by_id,
+        or to the id, name or parent of an intent in it, makes them stale and they are rebuilt on the next call"""
+        self._check_intent_caches()
+        names = self._intent_names_cache.get(delimiter)
+        if names is None:
+            names = _fully_qualified_intent_names(self.intents_by_id, delimiter)
+            self._intent_names_cache[delimiter] = names
+        return names
+
+    def _intent_tree(self) -> dict:
+        """The cached {parent intent id: {name: child intent}} of the hierarchy, None for the top level.
+        Like the names it is added to by intent() and rebuilt after any other change"""
+        self._check_intent_caches()
+        if self._intent_children is None:
+            children = {}
+            for intent in self.intents_by_id.values():
+                # the first of any intents with the same name and parent is the one found
+                children.setdefault(intent.parent_intent_id or None, {}).setdefault(intent.name, intent)
+            self._intent_children = children
+        return self._intent_children
+
+    def _check_intent_caches(self):
+        """Drop the cached names and tree if the hierarchy has changed since they were built"""
+        stamp = self._intent_hierarchy_stamp()
+        if stamp is None or stamp != self._intent_cache_stamp:
+            self._intent_names_cache = {}
+            self._intent_children = None
+            self._intent_cache_stamp = stamp
+
+    def _intent_hierarchy_stamp(self) -> Optional[tuple]:
+        """Changes whenever intents_by_id or the hierarchy of an intent in it does,
+        None if it is a plain dict whose changes can't be tracked"""
+        if not isinstance(self.intents_by_id, _VersionedDict):
+            return None
+        return (id(self.intents_by_id), self.intents_by_id.version)
+
+    def _add_intent_by_id(self, intent: HFIntent):
+        """Add a new intent to intents_by_id and to the cached fully qualified names, if they are up to date.
+        The caller adds it to the tree"""
+        stamp = self._intent_hierarchy_stamp()
+        up_to_date = stamp is not None and stamp == self._intent_cache_stamp and intent.id not in self.intents_by_id
+        self.intents_by_id[intent.id] = intent
+        if not up_to_date:
+            return
+        for delimiter, (names, ids) in self._intent_names_cache.items():
+            if intent.parent_intent_id:
+                name = f'{names[intent.parent_intent_id]}{delimiter}{intent.name}'
+            else:
+                name = intent.name
+            names[intent.id] = name
+            ids[name] = intent.id
+        self._intent_cache_stamp = self._intent_hierarchy_stamp()
 
     def write_csv(self, output_path: str,
                   intent_metadata: bool = True,
@@ -630,88 +247,47 @@ class HFWorkspace:
                   tag_filters:HFTagFilters = None) -> None:
         """Writes the HF Workspace to a CSV file at the fully qualified path output_path
         Will by default include intent level metadata, example level metdata and tags override using arguments
-        Optionally will filter to only export certain tags"""
+        Optionally will filter to only export certain tags, the examples are filtered with filter_examples
+        before the rows are built"""
 
-        intent_name_index = self.get_intent_index(delimiter=delimiter)
+        intent_name_index = self._intent_names(delimiter)[0]
+
+        if tag_filters:
+            examples = self.filter_examples(tag_filters)
+        else:
+            examples = self.examples.values()
 
         obj_list = []
-        for phrase_id in self.examples:
-            example = self.examples[phrase_id]
+        for example in examples:
             top_intent = example.intents[0].intent_id
             obj = {
                 "utterance": example.text,
-                "fully_qualified_intent_name": intent_name_index[example.intents[0].intent_id],
+                "fully_qualified_intent_name": intent_name_index[top_intent],
             }
 
             # intent level
             if intent_metadata:
                 obj["intent_metadata"] = self.intent_by_id(top_intent).metadata
             if tags:
-                tag_obj = {}
-                for tag in self.intent_by_id(top_intent).tags:
-                    tag_obj[tag.name] = True
-                obj["intent_tags"] = tag_obj
+                obj["intent_tags"] = {tag.name: True for tag in self.intent_by_id(top_intent).tags}
 
             # example level
             if example_metadata:
                 obj["example_metadata"] = example.metadata
             if tags:
-                tag_obj = {}
-                for tag in example.tags:
-                    tag_obj[tag.name] = True
-                obj["example_tags"] = tag_obj
+                obj["example_tags"] = {tag.name: True for tag in example.tags}
+
+            # json_normalize only reads the dicts so the metadata doesn't need copying
+            obj_list.append(obj)
 
-            obj_list.append(copy.deepcopy(obj))
 
+        import pandas # pylint: disable=import-outside-toplevel # deferred as slow to import
 
         df = pandas.json_normalize(obj_list, sep=delimiter)
+        if df.empty:
+            df = pandas.DataFrame(columns=["utterance", "fully_qualified_intent_name"])
         logger.info("df0 %s",df.shape)
 
-        if tag_filters:
-            filtered_df = pandas.DataFrame()
-
-            # include utterances
-            if len(tag_filters.utterance.include) > 0:
-                for tag_name in tag_filters.utterance.include:
-                    column_name = f'example_tags{delimiter}{tag_name}'
-                    if column_name in df.columns.to_list():
-                        filtered_df = pandas.concat([filtered_df,df[df[column_name] is True]])
-            else:
-                filtered_df = df
-            filtered_df = filtered_df.drop_duplicates()
-            logger.info('fi0 %s',filtered_df.shape)
-
-            # exclude utterances
-            for tag_name in tag_filters.utterance.exclude:
-                column_name = f'example_tags{delimiter}{tag_name}'
-                if column_name in filtered_df.columns.to_list():
-                    filtered_df = filtered_df[filtered_df[column_name] is not True]
-            filtered_df = filtered_df.drop_duplicates()
-            logger.info('fi0 %s',filtered_df.shape)
-
-            final_df = pandas.DataFrame()
-
-            # include intents
-            if len(tag_filters.intent.include) > 0:
-                for tag_name in tag_filters.intent.include:
-                    column_name = f'intent_tags{delimiter}{tag_name}'
-                    if column_name in filtered_df.columns.to_list():
-                        final_df = pandas.concat([final_df,filtered_df[filtered_df[column_name] is True]])
-            else:
-                final_df = filtered_df
-            final_df = final_df.drop_duplicates()
-            logger.info('fa0 %s',final_df.shape)
-
-            # exclude intents
-            for tag_name in tag_filters.intent.exclude:
-                column_name = f'intent_tags{delimiter}{tag_name}'
-                if column_name in final_df.columns.to_list():
-                    final_df = final_df[final_df[column_name] is not True]
-            final_df = final_df.drop_duplicates()
-            logger.info('fa0 %s',final_df.shape)
-
-            df = final_df
-
         df = df.sort_values(["fully_qualified_intent_name"],ignore_index=True)
         df.to_csv(output_path, sep=",", encoding="utf8", index=False)
         logger.info("\n%s",df)
@@ -751,15 +327,6 @@ class HFWorkspace:
         '''Create a new example based on passed properties, assigning an ID if necessary
         '''
 
-        if intents is None:
-            intents = []
-
-        if tags is None:
-            tags = []
-
-        if metadata is None:
-            metadata = {}
-
         if id is None:
             id = f'ex-{hash_string(text)}'
 
@@ -783,6 +350,165 @@ class HFWorkspace:
 
         return ex
 
+    def filter_examples(self, tag_filters: HFTagFilters) -> List[HFExample]:
+        '''The examples passing the tag filters, in workspace order
+
+        An example passes when it has one of the utterance include tags, if there are any, and none
+        of the utterance exclude tags, and its top intent has one of the intent include tags, if there
+        are any, and none of the intent exclude tags. Tags are matched by name.
+        Each intent is checked once however many examples it labels, so this is one pass over the examples'''
+        utterance = _TagMatcher(tag_filters.utterance)
+        intent = _TagMatcher(tag_filters.intent)
+        intent_passes = {}
+
+        selected = []
+        for example in self.examples.values():
+            if utterance and not utterance.passes(example._tags): # pylint: disable=protected-access
+                continue
+            if intent:
+                top_intent = example.intents[0].intent_id
+                passes = intent_passes.get(top_intent)
+                if passes is None:
+                    passes = intent.passes(self.intent_by_id(top_intent).tags)
+                    intent_passes[top_intent] = passes
+                if not passes:
+                    continue
+            selected.append(example)
+        return selected
+
+    def examples_from_columns(self,
+                              texts: Sequence[str],
+                              intents: Optional[Sequence[Union[str, List[str], None]]] = None,
+                              tags: Optional[Sequence[Union[str, List[str], None]]] = None,
+                              metadata: Optional[Sequence[Optional[HFMetadata]]] = None,
+                              created_at: Optional[Sequence[Union[str, datetime.datetime, None]]] = None,
+                              ids: Optional[Sequence[Optional[str]]] = None,
+                              delimiter: Optional[str] = None) -> List[HFExample]:
+        '''Bulk version of example, adds an example for each text and returns them in the same order
+
+        Each optional column has a value per text:
+        intents     the intent path, a list of names or a string split on delimiter as in intents_from_paths,
+                    None or empty for an unlabelled example
+        tags        a tag name or list of tag names, created with tag if they don't exist
+        metadata    a dict
+        created_at  a datetime or ISO string, None for now
+        ids         None to hash the text as example does
+
+        As with example, a text whose id is already in the workspace, or earlier in the columns,
+        returns the existing example. Each distinct intent path and tag is resolved once, the ids
+        are hashed in one pass, the current time is read once and examples with the same intent
+        share one HFIntentRef. This makes it about 2-3x faster than calling example per row, the
+        remaining cost is hashing each text and building each HFExample'''
+        count = len(texts)
+        for name, column in (("intents", intents), ("tags", tags), ("metadata", metadata),
+                             ("created_at", created_at), ("ids", ids)):
+            if column is not None and len(column) != count:
+                raise HFIncompatibleOptionException(f"{name} has {len(column)} values for {count} texts")
+
+        sha256 = hashlib.sha256
+        if ids is None:
+            ids = ['ex-' + sha256(text.encode("utf-8")).hexdigest()[:20] for text in texts]
+        else:
+            ids = ['ex-' + sha256(text.encode("utf-8")).hexdigest()[:20] if example_id is None else example_id
+                   for text, example_id in zip(texts, ids)]
+
+        now = datetime.datetime.now().isoformat() + 'Z'
+        if created_at is None:
+            created_at = [now] * count
+        else:
+            created_at = [now if value is None else value if isinstance(value, str) else value.isoformat() + 'Z'
+                          for value in created_at]
+
+        intent_refs = self._intent_refs(intents, delimiter) if intents is not None else [None] * count
+        if tags is None:
+            tags = [None] * count
+        if metadata is None:
+            metadata = [None] * count
+
+        tag_references = {}
+        examples = self.examples
+        added = []
+        new_example = HFExample.__new__
+        # pylint: disable=protected-access
+        with _gc_paused():
+            for text, example_id, created, intent_ref, tag_names, example_metadata in zip(
+                    texts, ids, created_at, intent_refs, tags, metadata):
+                example = examples.get(example_id)
+                if example is None:
+                    # the columns are already normalised so the slots are set directly, skipping __init__
+                    example = new_example(HFExample)
+                    example.id = example_id
+                    example.text = text
+                    example.created_at = created
+                    example._intents = None if intent_ref is None else [intent_ref]
+                    example._tags = self._tag_references(tag_names, tag_references) if tag_names else None
+                    example._metadata = example_metadata or None
+                    example._context = None
+                    examples[example_id] = example
+                added.append(example)
+        return added
+
+    def _tag_references(self, tag_names: Union[str, List[str]], tag_references: dict) -> List[HFTagReference]:
+        '''The references of a tag name or list of names, created with tag if new and shared through tag_references'''
+        if isinstance(tag_names, str):
+            tag_names = [tag_names]
+        references = []
+        for tag_name in tag_names:
+            reference = tag_references.get(tag_name)
+            if reference is None:
+                reference = tag_references[tag_name] = self.tag(tag_name)
+            references.append(reference)
+        return references
+
+    def examples_from_table(self,
+                            table,
+                            text: str = "text",
+                            intent: Optional[str] = None,
+                            tags: Optional[str] = None,
+                            metadata: Optional[List[str]] = None,
+                            created_at: Optional[str] = None,
+                            id: Optional[str] = None, # pylint: disable=redefined-builtin
+                            delimiter: Optional[str] = None) -> List[HFExample]:
+        '''examples_from_columns from the named columns of a pandas DataFrame, a pyarrow Table or a dict of lists
+
+        metadata is a list of columns whose values, other than missing ones, make up each example's metadata.
+        Missing values, NaN and None, count as None in every column'''
+        def column(name: Optional[str]) -> Optional[list]:
+            return _table_column(table, name) if name is not None else None
+
+        example_metadata = None
+        if metadata:
+            metadata_columns = {name: _table_column(table, name) for name in metadata}
+            example_metadata = [{name: values[i] for name, values in metadata_columns.items()
+                                 if values[i] is not None}
+                                for i in range(len(metadata_columns[metadata[0]]))]
+        return self.examples_from_columns(column(text),
+                                          intents=column(intent),
+                                          tags=column(tags),
+                                          metadata=example_metadata,
+                                          created_at=column(created_at),
+                                          ids=column(id),
+                                          delimiter=delimiter)
+
+    def _intent_refs(self, paths: Sequence[Union[str, List[str], None]],
+                     delimiter: Optional[str]) -> List[Optional[HFIntentRef]]:
+        '''One HFIntentRef per intent path, shared by every path to the same intent, None for no path'''
+        refs_by_path = {}
+        refs_by_id = {}
+        refs = []
+        for path in paths:
+            if not path:
+                refs.append(None)
+                continue
+            key = path if isinstance(path, str) else tuple(path)
+            if key not in refs_by_path:
+                leaf = self.intents_from_paths([path], delimiter=delimiter)[0]
+                if leaf is not None and leaf.id not in refs_by_id:
+                    refs_by_id[leaf.id] = HFIntentRef(leaf.id)
+                refs_by_path[key] = refs_by_id[leaf.id] if leaf is not None else None
+            refs.append(refs_by_path[key])
+        return refs
+
     def add_example(self, example: HFExample):
         '''Add an example to the workspace based on an example created elsewhere using the HFExample constructor
         '''
@@ -793,15 +519,9 @@ class HFWorkspace:
         self.examples[example.id] = example
 
     def get_fully_qualified_intent_name(self, intent_id: str) -> str:
-        """Gets fully qualified intent name"""
-
-        working = self.intents_by_id[intent_id]
-        fullpath = working.name
-        while working.parent_intent_id:
-            working = self.intents_by_id[working.parent_intent_id]
-            fullpath = f'{working.name}{self.delimiter}{fullpath}'
+        """Gets fully qualified intent name, looked up in the cached index of get_intent_index"""
 
-        return fullpath
+        return self._intent_names(self.delimiter)[0][intent_id]
 
     @staticmethod
     def from_json(workspace_input: Union[IO, dict], delimiter: str) -> 'HFWorkspace':
@@ -812,63 +532,65 @@ class HFWorkspace:
         It is required to provide a delimiter for intent name.
         It can be None if there are no child intents, otherwise any other character to separate parent and child intent.
         Most widely used delimiters are / or -
-        '''
-        if isinstance(workspace_input, IO):
-            obj = HFWorkspaceJson.from_json(workspace_input.read(), infer_missing=True) # pylint: disable=no-member
-        elif isinstance(workspace_input, dict):
-            obj = HFWorkspaceJson.from_json( # pylint: disable=no-member
-                json.dumps(workspace_input), infer_missing=True)
-        else:
-            raise HFInvalidWorkspaceInputTypeException(f"What is this thing of type: {type(workspace_input)}")
 
+        The objects are built straight from the parsed dict, for files too large to parse
+        in one go use from_json_stream
+        '''
         workspace = HFWorkspace()
-        workspace.intents = {intent.name: intent for intent in obj.intents}
-        workspace.intents_by_id = {intent.id: intent for intent in obj.intents}
-        workspace.tags = {tag.id: tag for tag in obj.tags}
-        workspace.examples = {example.id: example for example in obj.examples}
         workspace.delimiter = delimiter
+        serialisation.from_json(workspace, workspace_input)
+        return workspace
 
+    @staticmethod
+    def from_json_stream(workspace_input: Union[IO, str], delimiter: str, chunk_size: int = None) -> 'HFWorkspace':
+        '''
+        Read a HFWorkspace from a HF JSON file, a path or a text or binary file object, chunk_size characters
+        at a time, building each example as it is parsed.
+
+        Only the workspace and the example being parsed are held in memory, never the whole file
+        or its parsed dict. chunk_size defaults to DOWNLOAD_CHUNK_SIZE
+        '''
+        workspace = HFWorkspace()
+        workspace.delimiter = delimiter
+        serialisation.from_json_stream(workspace, workspace_input, chunk_size)
         return workspace
 
     def get_hf_json(self) -> dict:
         '''Returns workspace object into HF format
         '''
+        return serialisation.get_hf_json(self)
 
-        sorted_examples = list(self.examples.values())
-        sorted_examples.sort(key=lambda ex: ex.created_at)
-        workspace = {
-            "$schema": "https://docs.humanfirst.ai/hf-json-schema.json",
-            "examples": [ex.to_dict() for ex in sorted_examples],
-        }
-
-        if len(self.tags) > 0:
-            workspace['tags'] = [tag.to_dict() for tag in self.tags.values()]
-
-        if len(self.intents) > 0:
-            list_intents = []
-            for intent in self.intents.values():
-                intent = intent.to_dict()
-                # schema does not accept null parent id
-                if intent["parent_intent_id"] is None:
-                    del intent["parent_intent_id"]
-                list_intents.append(intent)
-            workspace['intents'] = list_intents
+    def write_json(self, output: Union[IO, str], jsonl=False, indent=2, json_backend: str = "json"):
+        '''Write workspace object into HF format for uploading to studio
 
-        return workspace
+        output is a text file object or a path. Examples are serialised and written in created_at order
+        a batch at a time without building the whole document, so memory stays flat however large the workspace.
 
-    def write_json(self, output: IO, jsonl=False, indent=2):
-        '''Write workspace object into HF format for uploading to studio
+        json_backend "json" or "orjson" - json gives the exact json.dump layout. orjson, if installed,
+        writes the same document several times faster, though without spaces between items
+        when not indented and with non ASCII characters unescaped, and can only indent by 2
         '''
+        serialisation.write_json(self, output, jsonl=jsonl, indent=indent, json_backend=json_backend)
 
-        workspace = self.get_hf_json()
+    def write_parquet(self, output_dir: str, compression: str = "snappy", batch_size: int = PARQUET_BATCH_SIZE):
+        '''Write the workspace as columnar Parquet files examples.parquet, intents.parquet and tags.parquet
+        in output_dir, creating it if needed. Requires pyarrow - pip install pyarrow
 
-        if jsonl:
-            indent = None
+        Example intent ids, context types and roles are dictionary encoded, tag references are a list
+        of id and name structs and metadata is a JSON text column so it round trips exactly.
+        Examples are converted and written batch_size at a time so memory stays flat
+        '''
+        serialisation.write_parquet(self, output_dir, compression, batch_size)
 
-        json.dump(workspace, output, indent=indent)
+    @staticmethod
+    def read_parquet(input_dir: str, delimiter: str) -> 'HFWorkspace':
+        '''Read a HFWorkspace from the Parquet files written by write_parquet. Requires pyarrow
 
-        if jsonl:
-            output.write('\n')
+        Examples are read a row group, the batch_size of write_parquet, at a time'''
+        workspace = HFWorkspace()
+        workspace.delimiter = delimiter
+        serialisation.read_parquet(workspace, input_dir)
+        return workspace
 
 
 @dataclass_json
@@ -880,23 +602,47 @@ class HFWorkspaceJson:
     tags: List[HFTag] = field(default_factory=list)
 
 
+def _fully_qualified_intent_names(intents_by_id: Dict[str, HFIntent], delimiter: str) -> tuple:
+    '''(intent id: fully qualified name, fully qualified name: intent id) of the intents
+
+    Each name is built once from its parent's, so this is linear in the number of intents whatever the depth'''
+    names = {}
+    for intent_id, intent in intents_by_id.items():
+        # climb to the nearest ancestor already named
+        chain = []
+        prefix = None
+        while intent_id not in names:
+            chain.append((intent_id, intent))
+            intent_id = intent.parent_intent_id
+            if not intent_id:
+                break
+            intent = intents_by_id[intent_id]
+        else:
+            prefix = names[intent_id]
+        for intent_id, intent in reversed(chain):
+            prefix = intent.name if prefix is None else f'{prefix}{delimiter}{intent.name}'
+            names[intent_id] = prefix
+    # in intents_by_id order, ancestors may have been named out of turn
+    names = {intent_id: names[intent_id] for intent_id in intents_by_id}
+    return names, {name: intent_id for intent_id, name in names.items()}
+
+
+def _table_column(table, name: str) -> list:
+    '''The values of a column of a pandas DataFrame, pyarrow Table or dict of lists, None where missing'''
+    if hasattr(table, "column_names"):
+        return table.column(name).to_pylist()
+    values = table[name]
+    if hasattr(values, "notna"):
+        return values.astype(object).where(values.notna(), None).tolist()
+    return list(values)
+
+
 def hash_string(s: str, prefix: Optional[str] = None) -> str:
     '''Hash a string into a repeatable id with an optional prefix
     lets you build    myprefix-guid from "Blah whatever"
     '''
-    hexdigest = hashlib.new('sha256', s.encode('utf-8')).hexdigest()
+    hexdigest = hashlib.sha256(s.encode('utf-8')).hexdigest()
     if prefix:
         return f'{prefix}-{hexdigest[0:20]}'
     else:
         return f'{hexdigest[0:20]}'
-
-def generate_random_color() -> str:
-    """Generates random colour"""
-    return '#' + ''.join([random.choice('0123456789ABCDEF') for j in range(6)])
-
-class InvalidFilterLevel(Exception):
-    """Exception raised when tag filter value is invalid"""
-class InvalidFilterType(Exception):
-    """Exception raised when tag filter type is invalid"""
-class InvalidTagFilterListFormat(Exception):
-    """Exception raised when tag filter list is invalid"""
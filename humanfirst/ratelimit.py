@@ -0,0 +1,294 @@
+"""
+ratelimit.py
+
+Client side rate limiting and adaptive concurrency for the HumanFirst API clients
+
+Each endpoint family (nlu, conversations, files, workspaces) gets a token bucket capping its
+request rate and an AIMD (additive increase, multiplicative decrease) limit on the requests
+in flight. The concurrency limit grows while requests succeed and halves when the server
+throttles with a 429 or 503, so parallel callers settle just under the quota.
+
+A RateLimiter is thread safe and may be shared by threads, asyncio tasks and several clients.
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import os
+from configparser import ConfigParser
+import logging
+import time
+import asyncio
+import threading
+import collections
+import urllib.parse
+
+# third party imports
+
+# custom imports
+
+# locate where we are
+here = os.path.abspath(os.path.dirname(__file__))
+
+# CONSTANTS
+constants = ConfigParser()
+path_to_config_file = os.path.join(here,'config','setup.cfg')
+constants.read(path_to_config_file)
+
+# endpoint families
+NLU = "nlu"
+CONVERSATIONS = "conversations"
+FILES = "files"
+WORKSPACES = "workspaces"
+DEFAULT = "default"
+FAMILIES = (NLU, CONVERSATIONS, FILES, WORKSPACES, DEFAULT)
+
+# first path segment after the api version for each family, anything else is DEFAULT
+FAMILY_BY_PATH = {
+    "nlu": NLU,
+    "models": NLU,
+    "conversations": CONVERSATIONS,
+    "conversation_sets": CONVERSATIONS,
+    "files": FILES,
+    "workspaces": WORKSPACES,
+    "playbooks": WORKSPACES,
+}
+
+# responses that mean the server is throttling
+THROTTLE_STATUSES = frozenset([429, 503])
+
+RATE_LIMITS = {family: float(constants.get("humanfirst.CONSTANTS", f'RATE_LIMIT_{family.upper()}'))
+               for family in FAMILIES}
+RATE_LIMIT_INITIAL_CONCURRENCY = int(constants.get("humanfirst.CONSTANTS","RATE_LIMIT_INITIAL_CONCURRENCY"))
+RATE_LIMIT_MIN_CONCURRENCY = int(constants.get("humanfirst.CONSTANTS","RATE_LIMIT_MIN_CONCURRENCY"))
+RATE_LIMIT_MAX_CONCURRENCY = int(constants.get("humanfirst.CONSTANTS","RATE_LIMIT_MAX_CONCURRENCY"))
+RATE_LIMIT_DECREASE = float(constants.get("humanfirst.CONSTANTS","RATE_LIMIT_DECREASE"))
+
+# create logger
+logger = logging.getLogger('humanfirst.ratelimit')
+
+
+class TokenBucket:
+    """Caps the request rate at rate per second allowing bursts of up to burst requests
+
+    reserve() takes a token and says how long to wait for it, callers sleep themselves
+    so the bucket works the same from threads and asyncio tasks. Waiting callers are
+    served in the order they reserved."""
+
+    rate: float
+    burst: float
+
+    def __init__(self, rate: float, burst: float = None):
+        """
+        rate  - requests per second, 0 or None for no limit
+        burst - requests that may be sent at once after a quiet period, defaults to one second's worth
+        """
+        self.rate = rate or 0
+        if burst is None:
+            burst = max(1.0, self.rate)
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens = self.tokens - 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class AIMDLimiter:
+    """Limits the requests in flight to an adaptive limit
+
+    Every successful request while the limit is in use adds increase/limit, so the limit grows
+    by increase per round of requests. A throttled request multiplies it by decrease,
+    once per round so a burst of 429s only backs off once."""
+
+    limit: float
+    minimum: int
+    maximum: int
+    increase: float
+    decrease: float
+    in_flight: int
+
+    def __init__(self,
+                 initial: int = RATE_LIMIT_INITIAL_CONCURRENCY,
+                 minimum: int = RATE_LIMIT_MIN_CONCURRENCY,
+                 maximum: int = RATE_LIMIT_MAX_CONCURRENCY,
+                 increase: float = 1.0,
+                 decrease: float = RATE_LIMIT_DECREASE):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.in_flight = 0
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.waiters = collections.deque()
+
+    def acquire(self) -> int:
+        """Block until a slot is free, returns a ticket to pass to release"""
+        with self.lock:
+            if self._try_acquire():
+                return self.generation
+            event = threading.Event()
+            self.waiters.append(event)
+        event.wait()
+        return self.generation
+
+    async def acquire_async(self) -> int:
+        """Wait on the event loop until a slot is free, returns a ticket to pass to release"""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if self._try_acquire():
+                return self.generation
+            future = loop.create_future()
+            self.waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.lock:
+                if (loop, future) in self.waiters:
+                    self.waiters.remove((loop, future))
+                    raise
+            # the slot was handed over as we were cancelled, _resolve_waiter gives it back
+            # if it found the future cancelled, otherwise it is ours to give back
+            if not future.cancelled():
+                self.release(self.generation)
+            raise
+        return self.generation
+
+    def release(self, ticket: int, throttled: bool = False):
+        """Free a slot, adjusting the limit by the outcome of the request"""
+        with self.lock:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight = self.in_flight - 1
+            if throttled:
+                # only back off once for all the requests sent before the last back off
+                if ticket == self.generation:
+                    self.limit = max(float(self.minimum), self.limit * self.decrease)
+                    self.generation = self.generation + 1
+                    logger.info("Throttled, concurrency limit reduced to %s", int(self.limit))
+            elif saturated:
+                self.limit = min(float(self.maximum), self.limit + self.increase / self.limit)
+            self._wake()
+
+    def _try_acquire(self) -> bool:
+        """Take a slot if one is free, called holding the lock"""
+        if self.in_flight < max(int(self.limit), self.minimum) and not self.waiters:
+            self.in_flight = self.in_flight + 1
+            return True
+        return False
+
+    def _wake(self):
+        """Hand free slots to waiters in order, called holding the lock"""
+        while self.waiters and self.in_flight < max(int(self.limit), self.minimum):
+            waiter = self.waiters.popleft()
+            self.in_flight = self.in_flight + 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_resolve_waiter, self, future)
+
+
+def _resolve_waiter(limiter: AIMDLimiter, future: asyncio.Future):
+    """Wake an async waiter on its own loop, returning the slot if it was cancelled meanwhile
+
+    Whoever sees the cancellation first owns the slot, so it is only given back once"""
+    if future.cancelled():
+        limiter.release(limiter.generation)
+    else:
+        future.set_result(None)
+
+
+class EndpointLimiter:
+    """Token bucket and AIMD concurrency limit for one endpoint family"""
+
+    family: str
+    bucket: TokenBucket
+    concurrency: AIMDLimiter
+
+    def __init__(self,
+                 family: str,
+                 rate: float = 0,
+                 burst: float = None,
+                 initial_concurrency: int = RATE_LIMIT_INITIAL_CONCURRENCY,
+                 min_concurrency: int = RATE_LIMIT_MIN_CONCURRENCY,
+                 max_concurrency: int = RATE_LIMIT_MAX_CONCURRENCY,
+                 decrease: float = RATE_LIMIT_DECREASE):
+        """
+        rate and burst configure the TokenBucket
+        the concurrency limit starts at initial_concurrency and moves between min_concurrency and max_concurrency,
+        multiplied by decrease when throttled
+        """
+        self.family = family
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = AIMDLimiter(initial=initial_concurrency,
+                                       minimum=min_concurrency,
+                                       maximum=max_concurrency,
+                                       decrease=decrease)
+
+    def acquire(self) -> int:
+        """Wait for a token and a free slot, returns a ticket to pass to release"""
+        wait = self.bucket.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return self.concurrency.acquire()
+
+    async def acquire_async(self) -> int:
+        """acquire for asyncio tasks"""
+        wait = self.bucket.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await self.concurrency.acquire_async()
+
+    def release(self, ticket: int, status_code: int = None):
+        """Free the slot, status_code of the response if one was received"""
+        self.concurrency.release(ticket, throttled=status_code in THROTTLE_STATUSES)
+
+
+class RateLimiter:
+    """One EndpointLimiter per endpoint family
+
+    limits maps a family (NLU, CONVERSATIONS, FILES, WORKSPACES or DEFAULT) to the EndpointLimiter
+    arguments for it, e.g. {"nlu": {"rate": 20, "max_concurrency": 16}}
+    Families not given use the RATE_LIMIT_* settings from setup.cfg"""
+
+    limiters: dict
+
+    def __init__(self, limits: dict = None):
+        if limits is None:
+            limits = {}
+        self.limiters = {}
+        for family in FAMILIES:
+            settings = {"rate": RATE_LIMITS[family]}
+            settings.update(limits.get(family, {}))
+            self.limiters[family] = EndpointLimiter(family, **settings)
+
+    def for_url(self, url: str) -> EndpointLimiter:
+        """The limiter for the endpoint family the url belongs to"""
+        return self.limiters[endpoint_family(url)]
+
+
+def endpoint_family(url: str) -> str:
+    """The endpoint family of a HumanFirst API url, DEFAULT if not recognised
+
+    The family is chosen by the first path segment after the api version,
+    except the nlu engines and training of a workspace which count as NLU"""
+    segments = urllib.parse.urlparse(url).path.strip("/").split("/")
+    if len(segments) < 2:
+        return DEFAULT
+    family = FAMILY_BY_PATH.get(segments[1].split(":")[0].split("?")[0], DEFAULT)
+    if family == WORKSPACES and any(segment.startswith("nlu") for segment in segments[2:]):
+        return NLU
+    return family
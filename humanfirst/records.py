@@ -0,0 +1,174 @@
+"""
+records.py
+
+Incremental parsers yielding the records of a JSON or CSV document fed to them in pieces,
+so a streamed export or a large HF JSON file is parsed without holding all of it
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import os
+from configparser import ConfigParser
+import csv
+import json
+
+# locate where we are
+here = os.path.abspath(os.path.dirname(__file__))
+
+# CONSTANTS
+constants = ConfigParser()
+path_to_config_file = os.path.join(here,'config','setup.cfg')
+constants.read(path_to_config_file)
+
+# characters or bytes read at a time from a streamed download or file
+DOWNLOAD_CHUNK_SIZE = int(constants.get("humanfirst.CONSTANTS","DOWNLOAD_CHUNK_SIZE"))
+
+
+class _JsonRecordStream:
+    """Incremental parser yielding the records of a JSON export fed to it in pieces
+
+    Records are the items of a top level array, or of the array values of a top level object.
+    If field is given only the items of that key are yielded. keyed yields (key, item) pairs
+    instead, the key being None for a top level array. Only the unparsed tail of the
+    input is kept so memory stays proportional to the largest single record"""
+
+    def __init__(self, field: str = None, keyed: bool = False):
+        self.field = field
+        self.keyed = keyed
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.state = "start"
+        self.in_object = False
+        self.yield_items = True
+        self.key = None
+
+    def _skip(self, pos: int, skip_chars: str = " \t\r\n") -> int:
+        while pos < len(self.buffer) and self.buffer[pos] in skip_chars:
+            pos = pos + 1
+        return pos
+
+    def _decode(self, pos: int, final: bool):
+        """Decode one value at pos, None if it is not complete yet"""
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # a number at the very end of the buffer may continue in the next piece
+        if end == len(self.buffer) and not final:
+            return None
+        return value, end
+
+    def feed(self, text: str, final: bool = False) -> list:
+        """Add text to the stream and return the records completed by it"""
+
+        self.buffer = self.buffer + text
+        records = []
+        pos = 0
+        while True:
+            if self.state == "items":
+                pos = self._skip(pos, " \t\r\n,")
+                if pos >= len(self.buffer):
+                    break
+                if self.buffer[pos] == "]":
+                    pos = pos + 1
+                    self.state = "key" if self.in_object else "done"
+                    continue
+                decoded = self._decode(pos, final)
+                if decoded is None:
+                    break
+                if self.yield_items:
+                    records.append((self.key, decoded[0]) if self.keyed else decoded[0])
+                pos = decoded[1]
+            elif self.state == "key":
+                pos = self._skip(pos, " \t\r\n,")
+                if pos >= len(self.buffer):
+                    break
+                if self.buffer[pos] == "}":
+                    pos = pos + 1
+                    self.state = "done"
+                    continue
+                key = self._decode(pos, final)
+                if key is None:
+                    break
+                value_pos = self._skip(key[1])
+                if value_pos >= len(self.buffer):
+                    break
+                value_pos = self._skip(value_pos + 1) # the colon
+                if value_pos >= len(self.buffer):
+                    break
+                if self.buffer[value_pos] == "[":
+                    self.yield_items = self.field is None or key[0] == self.field
+                    self.key = key[0]
+                    self.state = "items"
+                    pos = value_pos + 1
+                    continue
+                value = self._decode(value_pos, final)
+                if value is None:
+                    break
+                pos = value[1]
+            elif self.state == "start":
+                pos = self._skip(pos)
+                if pos >= len(self.buffer):
+                    break
+                self.in_object = self.buffer[pos] == "{"
+                self.state = "key" if self.in_object else "items"
+                pos = pos + 1
+            else:
+                break
+        self.buffer = self.buffer[pos:]
+        return records
+
+
+class _CsvRecordStream:
+    """Incremental parser yielding one dict per row of a CSV export fed to it in pieces
+
+    The first row is the header. Rows are only parsed once complete, a newline inside a
+    quoted field does not end the row"""
+
+    def __init__(self):
+        self.buffer = ""
+        self.pending = ""
+        self.fieldnames = None
+
+    def feed(self, text: str, final: bool = False) -> list:
+        """Add text to the stream and return the rows completed by it"""
+
+        # only \n ends a row (\r\n keeps its \r), str.splitlines would also split on \x85, \u2028 etc in field text
+        self.buffer = self.buffer + text
+        lines = [line + "\n" for line in self.buffer.split("\n")]
+        lines[-1] = lines[-1][:-1]
+        self.buffer = ""
+        if not final:
+            self.buffer = lines.pop()
+        elif not lines[-1]:
+            lines.pop()
+
+        records = []
+        for line in lines:
+            self.pending = self.pending + line
+            # an odd number of quotes means a quoted field continues on the next line
+            if self.pending.count('"') % 2 == 1 and not final:
+                continue
+            row = next(csv.reader([self.pending]), [])
+            self.pending = ""
+            if not row:
+                continue
+            if self.fieldnames is None:
+                self.fieldnames = row
+            else:
+                records.append(dict(zip(self.fieldnames, row)))
+        return records
+
+
+def _record_stream(download_format: int, json_field: str = None):
+    """Incremental record parser for an export download_format, 1 = JSON 2 = CSV"""
+
+    if download_format == 1:
+        return _JsonRecordStream(field=json_field)
+    elif download_format == 2:
+        return _CsvRecordStream()
+    else:
+        raise RuntimeError(f'Unrecognised download format: {download_format}')
@@ -0,0 +1,571 @@
+"""
+schema.py
+
+The schema objects a HFWorkspace is made of - examples, intents, tags, their references and context -
+and the exceptions raised validating them. Available from humanfirst.objects as well
+
+"""
+# ***************************************************************************80**************************************120
+
+# standard imports
+import datetime
+import contextlib
+import gc
+import random
+import sys
+from typing import Any, Callable, Dict, List, Optional, Union
+import logging
+
+# third party imports
+from dataclasses import dataclass
+from dataclasses_json import dataclass_json
+
+# custom imports
+from .logging_config import configure_logging
+
+# configure logging for the SDK - only the first module imported does this
+configure_logging()
+
+# create logger
+logger = logging.getLogger('humanfirst.schema')
+
+HFMetadata = Dict[str, Any]
+
+HF_JSON_SCHEMA = "https://docs.humanfirst.ai/hf-json-schema.json"
+
+class HFIncompatibleOptionException(Exception):
+    """When parameters passed are incompatible"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFMissingCredentialsException(Exception):
+    """When can't locate assumed credentials"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFMapperException(Exception):
+    """When a mapping can't be resolved"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFOutputFileMustBeDifferent(Exception):
+    """When the output file name is the same as the input file name"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFInvlaidIntentTypeException(Exception):
+    """This happens when intent is not of type HFIntentRef, HFIntent or str (intent_id) objects"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFInvalidWorkspaceInputTypeException(Exception):
+    """This happens when HFWorkspace object is not from a dict of a json (from api) or from a json file"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFExxampleIDNotPresentException(Exception):
+    """This happens when HF example does not have any ID to be included in the workspace"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFContextTypeException(Exception):
+    """This happens when HF example does not have any ID to be included in the workspace"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+class HFContextRoleException(Exception):
+    """This happens when HF example does not have any ID to be included in the workspace"""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+def _intern(value):
+    '''Interns str ids so the examples and references sharing an id share one string'''
+    if type(value) is str: # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    return value
+
+
+# the HFIntent attributes that fully qualified intent names are built from
+_INTENT_HIERARCHY_FIELDS = frozenset(("id", "name", "parent_intent_id"))
+
+
+class _VersionedDict(dict):
+    '''dict counting its changes in version, so anything cached from its contents can tell when it is stale
+
+    Values with an _owner slot, the HFIntents, are given the dict as their owner
+    and count changes to their own hierarchy fields in its version too'''
+
+    version = 0
+
+    def _adopt(self, value):
+        if hasattr(type(value), "_owner"):
+            object.__setattr__(value, "_owner", self)
+
+    def _adopt_all(self):
+        for value in self.values():
+            self._adopt(value)
+
+    def __setitem__(self, key, value):
+        if dict.get(self, key, _VersionedDict) is not value:
+            self.version += 1
+        self._adopt(value)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.version += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.version += 1
+        result = super().__ior__(other)
+        self._adopt_all()
+        return result
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def update(self, *args, **kwargs): # pylint: disable=arguments-differ
+        self.version += 1
+        super().update(*args, **kwargs)
+        self._adopt_all()
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        value = super().setdefault(key, default)
+        self._adopt(value)
+        return value
+
+
+class _LazyContainer:
+    '''Descriptor for an optional container attribute of a slotted object
+
+    Reads the slot, replacing None with a new empty container the first time it is read,
+    so objects that never use the attribute don't each carry an empty list or dict'''
+
+    def __init__(self, slot: str, factory: Callable):
+        self.slot = slot
+        self.factory = factory
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = self.factory()
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
+@dataclass_json
+@dataclass
+class HFTag:
+    '''Schema object for HF Tags
+
+    Validates the format of a tag
+
+    Parameters
+    ----------
+    id:    str            unique id for tag
+    name:  str            name of tag that will be displayed in HF studio
+    color: str, optional  a hex code starting with # for a color to display the tag in eg #ff33da (a bright pink)
+                          if a color isn't provided a random one will be assigned
+    '''
+    id: str
+    name: str
+    color: Optional[str] = None
+
+    def __init__(self,
+                 id: str, # pylint: disable=redefined-builtin
+                 name: str,
+                 color: Optional[str] = None):
+        self.id = id # pylint: disable=redefined-builtin
+        self.name = name
+        if color and color != '':
+            self.color = color
+        else:
+            self.color = generate_random_color()
+
+@dataclass_json
+@dataclass
+class HFTagReference:
+    '''Schema object for HF Tags to be used in HF intents and HF examples
+
+    Validates the format of a tag used in intents and examples
+
+    These tags are added to HFIntents and HFExamples
+
+    Parameters
+    ----------
+    id:    str            unique id for tag
+    name:  str            name of tag that will be displayed in HF studio
+    '''
+    __slots__ = ("id", "name")
+
+    id: str
+    name: str
+
+    def __init__(self,
+                 id: str, # pylint: disable=redefined-builtin
+                 name: str):
+        self.id = _intern(id) # pylint: disable=redefined-builtin
+        self.name = _intern(name)
+
+@dataclass_json
+@dataclass
+class HFTagFilter:
+    '''Schema object for HF Tag Filter
+
+    Validates the format of a tag filter
+    of types include|exclude
+
+    Provide lists of tags to filter as comma delimited strings or lists
+
+    Parameters
+    ----------
+    include: [],
+    exclude: [],
+    '''
+    include: list
+    exclude: list
+
+    def __init__(self, include: list = None, exclude: list = None):
+
+        if include is None:
+            include = []
+
+        if exclude is None:
+            exclude = []
+
+        self.include = include
+        self.exclude = exclude
+
+@dataclass_json
+@dataclass
+class HFTagFilters:
+    """
+    HumaFirst Tag filters
+
+    Sets and validates intent and utterance level tags
+    """
+    intent: HFTagFilter
+    utterance: HFTagFilter
+
+    def __init__(self):
+        """Provide skeleton tag filter object
+        tags can be provided as a comma delimited string
+        or an extracted list
+        """
+        self.intent = HFTagFilter()
+        self.utterance = HFTagFilter()
+
+    def set_tag_filter(self, level: str, tag_type: str, tags: Union[list,str]):
+        """Sets tag filters"""
+        accepted_levels = ["intent","utterance"]
+        if not level in accepted_levels :
+            raise InvalidFilterLevel(f"Accepted levels are {accepted_levels} level was: {level}")
+        accepted_types = ["include","exclude"]
+        if not tag_type in accepted_types :
+            raise InvalidFilterType(f"Accepted tag_types are {accepted_types} tag_type was: {tag_type}")
+        tags = self.validate_tag_list_format(tags)
+        tag_filter = getattr(self,level)
+        setattr(tag_filter,tag_type,tags)
+        setattr(self,"level",tag_filter)
+
+    def validate_tag_list_format(self,tags: Union[list,str]) -> list:
+        """Validates the tag list"""
+        if tags == []:
+            return []
+        if tags == "":
+            return []
+        if isinstance(tags, str):
+            try:
+                tags = tags.split(",")
+                assert isinstance(tags, list)
+                assert len(tags) > 0
+            except InvalidTagFilterListFormat as e:
+                error_msg_1 = "Couldn't parse -g --tags filters"
+                error_msg_2 = "please make sure a quoted string with a comma separated list of tag names :"
+                logger.error("%s %s %s", error_msg_1, error_msg_2, e)
+                quit()
+            return tags
+        if isinstance(tags,list):
+            return tags
+            # could have a tag validate function here,
+            # but that would need to check if have a labelled workspace to check against
+        raise InvalidTagFilterListFormat(
+            f"Did not recognise type of tags argument passed {tags} {type(tags)}"
+        )
+
+class _TagMatcher:
+    '''A HFTagFilter as sets of tag names for checking many tag lists against'''
+
+    def __init__(self, tag_filter: HFTagFilter):
+        self.include = frozenset(tag_filter.include)
+        self.exclude = frozenset(tag_filter.exclude)
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude)
+
+    def passes(self, tags: Optional[List[HFTagReference]]) -> bool:
+        '''Whether tags has an include tag, if there are any, and no exclude tag'''
+        names = {tag.name for tag in tags} if tags else set()
+        if self.include and self.include.isdisjoint(names):
+            return False
+        return self.exclude.isdisjoint(names)
+
+
+@dataclass_json
+@dataclass
+class HFIntent:
+    '''Schema object for HF Intent
+
+     Validates the format of an Intent
+
+     Parameters
+     ----------
+     id:        str            unique id for intent
+     name:      str            name of intent that will be displayed in HF studio
+     metadata:  dict           a dictionary or HFMetadata object of string only key value pairs
+     tags:      list           a list of HFTagReference objects
+     parent_intent_id: str, optional  a reference to the ID of the immediate parent if using hierarchy intents
+     '''
+    # _owner is the workspace intents_by_id holding the intent, see __setattr__
+    __slots__ = ("id", "name", "metadata", "tags", "parent_intent_id", "_owner")
+
+    # no class level defaults as they would clash with the slots, __init__ supplies them
+    id: str
+    name: str
+    metadata: HFMetadata
+    tags: List[HFTagReference]
+    parent_intent_id: Optional[str]
+
+    def __setattr__(self, name: str, value):
+        # renaming or moving an intent held by a workspace makes its cached intent names stale
+        if name in _INTENT_HIERARCHY_FIELDS:
+            owner = getattr(self, "_owner", None)
+            if owner is not None:
+                owner.version += 1
+        object.__setattr__(self, name, value)
+
+    def __init__(self,
+                 id: str, # pylint: disable=redefined-builtin
+                 name: str,
+                 metadata: HFMetadata = None,
+                 tags: List[HFTagReference] = None,
+                 parent_intent_id: Optional[str] = None):
+
+        self._owner = None
+
+        if metadata is None:
+            metadata = {}
+
+        if tags is None:
+            tags = []
+
+        self.id = _intern(id)
+        self.name = name
+        self.parent_intent_id = _intern(parent_intent_id)
+        self.metadata = metadata
+        self.tags = tags
+
+
+@dataclass_json
+@dataclass
+class HFContext:
+    '''Schema object for HFContext
+
+    Validates the format of a the Context object interelating multiple HFExamples (utterances)
+    within a document or conversation.
+
+    Parameters
+    ----------
+    context_id: str             unique id for context object
+    type      : str, optional   the document type, only "conversation" is currently supported
+                                will control how the utterances display in multi utterance GUI items
+    role      : str, optional   two roles are defined for conversation document
+                                'client' - the analysed party in the tool typically the human user, customer etc.
+                                'expert' - the responding party in the tool typically the bot, agent etc.
+    '''
+    context_id: Optional[str] = None
+    type: Optional[str] = None
+    role: Optional[str] = None
+
+    def __init__(self,
+                 context_id: Optional[str] = None,
+                 type: Optional[str] = None, #pylint: disable=W0622:redefined-builtin
+                 role: Optional[str] = None):
+        self.context_id = context_id
+        if type and type != '':
+            if type in ['conversation',"utterance","training_phrase",'unknown']:
+                self.type = type
+                if role and role != '':
+                    if type == 'conversation':
+                        if role in ['expert', 'client']:
+                            self.role = role
+                        else:
+                            raise HFContextRoleException(
+                                'Only "client" or "expert" roles are currently supported with "converation" context type')
+                    else:
+                        raise HFContextRoleException(
+                            'Not expecting a role for context types except conversation'
+                        )
+            else:
+                raise HFContextTypeException(
+                    'Only "conversation","utterance","training_phrase" and "unknown" document types are currently supported')
+
+
+@dataclass_json
+@dataclass
+class HFIntentRef:
+    '''Schema object for HFIntentRef - a reference to another intent typically for identifying the parent in a hierarchy
+
+    Validates the format of a the HFIntentRef Object
+
+    Parameters
+    ----------
+    intent_id: str  the id of the referenced intent
+    '''
+    __slots__ = ("intent_id",)
+
+    intent_id: str
+
+    def __init__(self, intent_id: str):
+        self.intent_id = _intern(intent_id)
+
+
+@dataclass_json
+@dataclass
+class HFExample:
+    '''Schema object for HFExample - a labelled or unlabelled utterance example
+
+    Text from a document of some kind.
+    May be a single utterance or be linked by a HFContext object to other examples forming a document
+    May contain metadata about where was created useful to an annotator in the HF Studio
+
+    TODO: annotation of entities
+
+    Parameters
+    ----------
+    id:       str  An id for the Example
+    text:     str  The text of the example
+    context:  HFContext, optional  A HFContext object defining what document type the example came from
+                                   defining what role the speaker/writer was performing and linking the
+                                   example to other examples making up that document
+    intents:  list HFIntentRef|HFIntent|str
+                                   A list of HFintentRefs for intents, or a list of HFIntents
+                                   or a list of strings containing intent ids
+                                   May be empty list [] if so the utterance will be treated as unlabelled
+    tags:     list HFTagReference A list of ids of intents for which this example text is an example of
+                                   May be empty list [] if so the utterance will be treated as unlabelled
+                                   and appear int the data section
+                                   If provided these utterance will be treated as labelled and appear in the
+                                   intents section
+    metadata: dict | HFMetadata    A dict of string only key value pairs detailing information about the text
+                                   useful to a future annotator
+    '''
+    # intents, tags, metadata and context are _LazyContainer descriptors over the underscored slots,
+    # an example keeps None there until the container is first read so unlabelled examples stay small
+    __slots__ = ("id", "text", "created_at", "_intents", "_tags", "_metadata", "_context")
+
+    id: str
+    text: str
+    created_at: str
+    intents: List[HFIntentRef] # pylint: disable=declare-non-slot
+    tags: List[HFTagReference] # pylint: disable=declare-non-slot
+    metadata: HFMetadata # pylint: disable=declare-non-slot
+    context: Optional[HFContext] # pylint: disable=declare-non-slot
+
+    def __init__(
+            self,
+            text: str,
+            id: str, # pylint: disable=redefined-builtin
+            created_at: Optional[datetime.datetime] = None,
+            intents: Union[List[HFIntentRef],List[HFIntent],List[str]] = None,
+            tags: List[HFTagReference] = None,
+            metadata: HFMetadata = None,
+            context: Optional[HFContext] = None
+        ):
+
+        self.id = id
+        self.text = text
+        self._intents = None
+        self._tags = tags
+        self._metadata = metadata
+        self._context = context
+
+        if created_at is not None:
+            if isinstance(created_at, str):
+                self.created_at = created_at
+            else:
+                self.created_at = created_at.isoformat() + 'Z'
+
+        if intents:
+            if isinstance(intents[0],HFIntentRef):
+                self._intents = [HFIntentRef(intent.intent_id)
+                                 for intent in intents]
+            elif isinstance(intents[0],HFIntent):
+                self._intents = [HFIntentRef(intent.id)
+                                 for intent in intents]
+            elif isinstance(intents[0],str):
+                self._intents = [HFIntentRef(intent)
+                                 for intent in intents]
+            else:
+                raise HFInvlaidIntentTypeException(
+                    "Intents can be provided as a list of HFIntentRef, HFIntent or str (intent_id) objects only")
+        elif intents is not None:
+            self._intents = intents
+
+
+# set after the class is created so the dataclass doesn't take the descriptors for field defaults
+HFExample.intents = _LazyContainer("_intents", list)
+HFExample.tags = _LazyContainer("_tags", list)
+HFExample.metadata = _LazyContainer("_metadata", dict)
+HFExample.context = _LazyContainer("_context", dict)
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    '''Pause the cyclic garbage collector while building many objects
+
+    The HF objects hold no reference cycles, but allocating hundreds of thousands of them
+    triggers full collections that rescan everything already built, more than doubling the time'''
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def generate_random_color() -> str:
+    """Generates random colour"""
+    return '#' + ''.join([random.choice('0123456789ABCDEF') for j in range(6)])
+
+class InvalidFilterLevel(Exception):
+    """Exception raised when tag filter value is invalid"""
+class InvalidFilterType(Exception):
+    """Exception raised when tag filter type is invalid"""
+class InvalidTagFilterListFormat(Exception):
+    """Exception raised when tag filter list is invalid"""
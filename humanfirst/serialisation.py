@@ -0,0 +1,445 @@
+"""
+
+serialisation.py
+
+Reading and writing a HFWorkspace as HF JSON, streamed HF JSON and Parquet
+
+Behind HFWorkspace.from_json, from_json_stream, get_hf_json, write_json, write_parquet and read_parquet
+
+"""
+# ***************************************************************************80**************************************120
+
+# standard imports
+import codecs
+import functools
+import json
+import operator
+import os
+from typing import IO, TYPE_CHECKING, Callable, Iterator, List, Optional, Union
+
+# third party imports
+try:
+    import orjson
+except ImportError: # pragma: no cover
+    orjson = None
+
+# custom imports
+from .schema import (HF_JSON_SCHEMA, HFContext, HFExample, HFIncompatibleOptionException, HFIntent, HFIntentRef,
+                     HFInvalidWorkspaceInputTypeException, HFTag, HFTagReference, _gc_paused)
+from .records import DOWNLOAD_CHUNK_SIZE, _JsonRecordStream
+
+if TYPE_CHECKING: # pragma: no cover
+    # objects builds on this module, the workspaces are passed in
+    from .objects import HFWorkspace
+
+# examples serialised before each write by HFWorkspace.write_json
+WRITE_JSON_BATCH_SIZE = 1000
+
+# examples in each row group written by HFWorkspace.write_parquet, read_parquet reads a row group at a time
+PARQUET_BATCH_SIZE = 100000
+
+# the lists of objects read from HF JSON
+_HF_JSON_SECTIONS = ("examples", "intents", "tags")
+
+
+def from_json(workspace: "HFWorkspace", workspace_input: Union[IO, dict]):
+    '''Add the objects of a parsed HF JSON dict or a HF JSON file object to workspace, see HFWorkspace.from_json'''
+    if not isinstance(workspace_input, dict) and not hasattr(workspace_input, "read"):
+        raise HFInvalidWorkspaceInputTypeException(f"What is this thing of type: {type(workspace_input)}")
+
+    decoder = _HFJsonDecoder(workspace)
+    with _gc_paused():
+        obj = workspace_input if isinstance(workspace_input, dict) else json.load(workspace_input)
+        for section in _HF_JSON_SECTIONS:
+            for item in obj.get(section) or []:
+                decoder.add(section, item)
+
+
+def from_json_stream(workspace: "HFWorkspace", workspace_input: Union[IO, str], chunk_size: int = None):
+    '''Add the objects of a HF JSON file parsed chunk_size characters at a time to workspace,
+    see HFWorkspace.from_json_stream'''
+    if isinstance(workspace_input, str):
+        with open(workspace_input, mode="rb") as file_in:
+            from_json_stream(workspace, file_in, chunk_size)
+        return
+    if not hasattr(workspace_input, "read"):
+        raise HFInvalidWorkspaceInputTypeException(f"What is this thing of type: {type(workspace_input)}")
+
+    if chunk_size is None:
+        chunk_size = DOWNLOAD_CHUNK_SIZE
+
+    decoder = _HFJsonDecoder(workspace)
+    records = _JsonRecordStream(keyed=True)
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    with _gc_paused():
+        while True:
+            chunk = workspace_input.read(chunk_size)
+            if isinstance(chunk, bytes):
+                chunk = text_decoder.decode(chunk)
+            if not chunk:
+                break
+            for section, item in records.feed(chunk):
+                decoder.add(section, item)
+        for section, item in records.feed(text_decoder.decode(b"", final=True), final=True):
+            decoder.add(section, item)
+
+
+def get_hf_json(workspace: "HFWorkspace") -> dict:
+    '''The HF JSON dict of a workspace, see HFWorkspace.get_hf_json'''
+    hf_json = {
+        "$schema": HF_JSON_SCHEMA,
+        "examples": [_example_json(ex, copy_values=True) for ex in _sorted_examples(workspace)],
+    }
+
+    if len(workspace.tags) > 0:
+        hf_json['tags'] = [_tag_json(tag) for tag in workspace.tags.values()]
+
+    # by id, intents keys the intents by path or name and two intents can share one
+    if len(workspace.intents_by_id) > 0:
+        hf_json['intents'] = [_intent_json(intent, copy_values=True) for intent in workspace.intents_by_id.values()]
+
+    return hf_json
+
+
+def write_json(workspace: "HFWorkspace", output: Union[IO, str], jsonl=False, indent=2, json_backend: str = "json"):
+    '''Write a workspace as HF JSON a batch of examples at a time, see HFWorkspace.write_json'''
+    if isinstance(output, str):
+        with open(output, mode="w", encoding="utf8") as file_out:
+            write_json(workspace, file_out, jsonl=jsonl, indent=indent, json_backend=json_backend)
+        return
+
+    if jsonl:
+        indent = None
+
+    dumps = _json_dumps(json_backend, indent)
+    sections = {}
+    if len(workspace.tags) > 0:
+        sections["tags"] = [_tag_json(tag) for tag in workspace.tags.values()]
+    if len(workspace.intents_by_id) > 0:
+        sections["intents"] = [_intent_json(intent) for intent in workspace.intents_by_id.values()]
+    _write_hf_json_document(output,
+                            examples=(_example_json(ex) for ex in _sorted_examples(workspace)),
+                            sections=sections,
+                            indent=indent,
+                            dumps=dumps)
+
+    if jsonl:
+        output.write('\n')
+
+
+def write_parquet(workspace: "HFWorkspace", output_dir: str, compression: str, batch_size: int):
+    '''Write a workspace as examples.parquet, intents.parquet and tags.parquet, see HFWorkspace.write_parquet'''
+    pyarrow, parquet = _import_pyarrow()
+    schemas = _parquet_schemas(pyarrow)
+    os.makedirs(output_dir, exist_ok=True)
+
+    with parquet.ParquetWriter(os.path.join(output_dir, "examples.parquet"), schemas["examples"],
+                               compression=compression) as writer:
+        examples = list(workspace.examples.values())
+        for start in range(0, len(examples), batch_size):
+            columns = _parquet_example_columns(examples[start:start + batch_size])
+            writer.write_table(pyarrow.Table.from_pydict(columns, schema=schemas["examples"]))
+        if not examples:
+            writer.write_table(schemas["examples"].empty_table())
+
+    intents = list(workspace.intents_by_id.values())
+    parquet.write_table(pyarrow.Table.from_pydict({
+        "id": [intent.id for intent in intents],
+        "name": [intent.name for intent in intents],
+        "parent_intent_id": [intent.parent_intent_id for intent in intents],
+        "metadata": [_metadata_json(intent.metadata) for intent in intents],
+        "tags": [[_reference_json(tag) for tag in intent.tags] for intent in intents],
+    }, schema=schemas["intents"]), os.path.join(output_dir, "intents.parquet"), compression=compression)
+
+    tags = list(workspace.tags.values())
+    parquet.write_table(pyarrow.Table.from_pydict({
+        "id": [tag.id for tag in tags],
+        "name": [tag.name for tag in tags],
+        "color": [tag.color for tag in tags],
+    }, schema=schemas["tags"]), os.path.join(output_dir, "tags.parquet"), compression=compression)
+
+
+def read_parquet(workspace: "HFWorkspace", input_dir: str):
+    '''Add the objects of the Parquet files written by write_parquet to workspace, see HFWorkspace.read_parquet'''
+    _, parquet = _import_pyarrow()
+
+    decoder = _HFJsonDecoder(workspace)
+    with _gc_paused():
+        for row in parquet.read_table(os.path.join(input_dir, "tags.parquet")).to_pylist():
+            decoder.add("tags", row)
+        for row in parquet.read_table(os.path.join(input_dir, "intents.parquet")).to_pylist():
+            row["metadata"] = _metadata_from_json(row["metadata"])
+            decoder.add("intents", row)
+        # a row group at a time, pyarrow can't iter_batches over the nested dictionary intent ids
+        examples = parquet.ParquetFile(os.path.join(input_dir, "examples.parquet"))
+        for row_group in range(examples.num_row_groups):
+            for row in examples.read_row_group(row_group).to_pylist():
+                example = _parquet_example(row, decoder)
+                workspace.examples[example.id] = example
+
+
+def _sorted_examples(workspace: "HFWorkspace") -> list:
+    '''The examples of a workspace in created_at order'''
+    return sorted(workspace.examples.values(), key=operator.attrgetter("created_at"))
+
+
+class _HFJsonDecoder:
+    '''Adds the objects of parsed HF JSON to a workspace
+
+    Builds each object directly from its dict rather than through HFWorkspaceJson, which
+    decodes every nested object reflectively and needs the dict serialised again first.
+    Fields are read as HFWorkspaceJson.from_json with infer_missing=True reads them,
+    unknown keys are ignored. Tag references with the same id and name are shared'''
+
+    def __init__(self, workspace: "HFWorkspace"):
+        self.workspace = workspace
+        self.tag_references = {}
+
+    def add(self, section: str, obj: dict):
+        """Add obj from the section examples, intents or tags of the HF JSON, ignoring other sections"""
+        if section == "examples":
+            example = self.example(obj)
+            self.workspace.examples[example.id] = example
+        elif section == "intents":
+            intent = self.intent(obj)
+            self.workspace.intents[intent.name] = intent
+            self.workspace.intents_by_id[intent.id] = intent
+        elif section == "tags":
+            tag = HFTag(id=obj.get("id"), name=obj.get("name"), color=obj.get("color"))
+            self.workspace.tags[tag.id] = tag
+
+    def tag_reference(self, obj: dict) -> HFTagReference:
+        """The shared HFTagReference for a tag reference dict"""
+        key = (obj.get("id"), obj.get("name"))
+        reference = self.tag_references.get(key)
+        if reference is None:
+            reference = HFTagReference(id=key[0], name=key[1])
+            self.tag_references[key] = reference
+        return reference
+
+    def example(self, obj: dict) -> HFExample:
+        """HFExample from its HF JSON dict"""
+        intents = obj.get("intents")
+        tags = obj.get("tags")
+        context = obj.get("context")
+        if context is not None:
+            context = HFContext(context_id=context.get("context_id"),
+                                type=context.get("type"),
+                                role=context.get("role"))
+        return HFExample(text=obj.get("text"),
+                         id=obj.get("id"),
+                         created_at=obj.get("created_at"),
+                         intents=[intent.get("intent_id") for intent in intents] if intents else None,
+                         tags=[self.tag_reference(tag) for tag in tags] if tags else None,
+                         metadata=obj.get("metadata") or None,
+                         context=context)
+
+    def intent(self, obj: dict) -> HFIntent:
+        """HFIntent from its HF JSON dict"""
+        tags = obj.get("tags")
+        return HFIntent(id=obj.get("id"),
+                        name=obj.get("name"),
+                        metadata=obj.get("metadata"),
+                        tags=[self.tag_reference(tag) for tag in tags] if tags else None,
+                        parent_intent_id=obj.get("parent_intent_id"))
+
+
+def _copy_json(value):
+    '''Copy the dicts and lists of a JSON value as dataclasses_json to_dict does'''
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _reference_json(reference, copy_values: bool = False):
+    '''A tag or intent reference of an example or intent as HF JSON'''
+    if isinstance(reference, HFTagReference):
+        return {"id": reference.id, "name": reference.name}
+    if isinstance(reference, HFIntentRef):
+        return {"intent_id": reference.intent_id}
+    if hasattr(reference, "to_dict"):
+        return reference.to_dict()
+    return _copy_json(reference) if copy_values else reference
+
+
+def _example_json(example: HFExample, copy_values: bool = False) -> dict:
+    '''HF JSON of an example, the same dict as example.to_dict()
+
+    copy_values copies the metadata and context so the dict can be changed without changing the example,
+    when the dict is serialised straight away there is no need.
+    Reads the slots behind the lazy containers so serialising doesn't create the empty ones'''
+    # pylint: disable=protected-access
+    context = example._context
+    if context is None:
+        context = {}
+    elif isinstance(context, HFContext):
+        context = {"context_id": context.context_id, "type": context.type, "role": context.role}
+    elif copy_values:
+        context = _copy_json(context)
+    metadata = example._metadata
+    if not metadata:
+        metadata = {} if metadata is None else metadata
+    elif copy_values:
+        metadata = _copy_json(metadata)
+    return {
+        "id": example.id,
+        "text": example.text,
+        "created_at": example.created_at,
+        "intents": [_reference_json(intent, copy_values) for intent in example._intents or ()],
+        "tags": [_reference_json(tag, copy_values) for tag in example._tags or ()],
+        "metadata": metadata,
+        "context": context,
+    }
+
+
+def _intent_json(intent: HFIntent, copy_values: bool = False) -> dict:
+    '''HF JSON of an intent, intent.to_dict() without a null parent_intent_id which the schema does not accept'''
+    obj = {
+        "id": intent.id,
+        "name": intent.name,
+        "metadata": _copy_json(intent.metadata) if copy_values and intent.metadata else intent.metadata,
+        "tags": [_reference_json(tag, copy_values) for tag in intent.tags],
+    }
+    if intent.parent_intent_id is not None:
+        obj["parent_intent_id"] = intent.parent_intent_id
+    return obj
+
+
+def _tag_json(tag: HFTag) -> dict:
+    '''HF JSON of a tag'''
+    return {"id": tag.id, "name": tag.name, "color": tag.color}
+
+
+def _json_dumps(json_backend: str, indent) -> Callable:
+    '''Function serialising a value to a JSON string with json_backend, see HFWorkspace.write_json'''
+    if json_backend == "json":
+        return functools.partial(json.dumps, indent=indent)
+    if json_backend == "orjson":
+        if orjson is None:
+            raise HFIncompatibleOptionException("json_backend orjson requires orjson - pip install orjson")
+        if indent not in (None, 2):
+            raise HFIncompatibleOptionException(f"json_backend orjson can only indent by 2 or not at all not {indent}")
+        # pylint: disable=no-member # orjson is a compiled extension
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+        return lambda value: orjson.dumps(value, option=option).decode("utf-8")
+    raise HFIncompatibleOptionException(f"Unknown json_backend {json_backend} - use json or orjson")
+
+
+def _write_hf_json_document(output: IO, examples: Iterator[dict], sections: dict, indent, dumps: Callable):
+    '''Write a HF JSON document laid out as json.dump lays it out, serialising the examples one at a time
+
+    Examples are written WRITE_JSON_BATCH_SIZE at a time, sections are the lists after the examples'''
+    if indent is None:
+        newline, pad, separator = "", "", ", "
+    else:
+        newline, pad, separator = "\n", " " * indent if isinstance(indent, int) else indent, ","
+    item_indent = newline + pad * 2
+
+    output.write(f'{{{newline}{pad}"$schema": {dumps(HF_JSON_SCHEMA)}{separator}{newline}{pad}"examples": [')
+    batch = []
+    written = 0
+    for example in examples:
+        batch.append(("" if written == 0 else separator) + item_indent + dumps(example).replace("\n", item_indent))
+        written = written + 1
+        if len(batch) >= WRITE_JSON_BATCH_SIZE:
+            output.write("".join(batch))
+            batch.clear()
+    output.write("".join(batch))
+    output.write(f"{newline}{pad}]" if written else "]")
+
+    for key, value in sections.items():
+        value = dumps(value).replace("\n", newline + pad)
+        output.write(f'{separator}{newline}{pad}{dumps(key)}: {value}')
+    output.write(f"{newline}}}")
+
+
+def _import_pyarrow() -> tuple:
+    '''pyarrow and pyarrow.parquet, deferred as slow to import and optional'''
+    try:
+        import pyarrow # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet # pylint: disable=import-outside-toplevel
+    except ImportError as e: # pragma: no cover
+        raise HFIncompatibleOptionException("Parquet support requires pyarrow - pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+
+def _parquet_schemas(pyarrow) -> dict:
+    '''Arrow schemas of the examples, intents and tags Parquet files'''
+    dictionary = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+    references = pyarrow.list_(pyarrow.struct([("id", pyarrow.string()), ("name", pyarrow.string())]))
+    return {
+        "examples": pyarrow.schema([
+            ("id", pyarrow.string()),
+            ("text", pyarrow.string()),
+            ("created_at", pyarrow.string()),
+            ("intent_ids", pyarrow.list_(dictionary)),
+            ("tags", references),
+            ("metadata", pyarrow.string()),
+            ("context_id", pyarrow.string()),
+            ("context_type", dictionary),
+            ("context_role", dictionary),
+        ]),
+        "intents": pyarrow.schema([
+            ("id", pyarrow.string()),
+            ("name", pyarrow.string()),
+            ("parent_intent_id", pyarrow.string()),
+            ("metadata", pyarrow.string()),
+            ("tags", references),
+        ]),
+        "tags": pyarrow.schema([
+            ("id", pyarrow.string()),
+            ("name", pyarrow.string()),
+            ("color", pyarrow.string()),
+        ]),
+    }
+
+
+def _metadata_json(metadata: Optional[dict]) -> Optional[str]:
+    '''Metadata as JSON text for a Parquet column, None when empty'''
+    return json.dumps(metadata, ensure_ascii=False) if metadata else None
+
+
+def _metadata_from_json(value: Optional[str]) -> Optional[dict]:
+    '''Metadata from a Parquet JSON text column'''
+    return json.loads(value) if value else None
+
+
+def _parquet_example_columns(examples: List[HFExample]) -> dict:
+    '''Columns of the examples Parquet file for a batch of examples
+
+    Reads the slots behind the lazy containers so empty ones aren't created'''
+    # pylint: disable=protected-access
+    columns = {name: [] for name in ("id", "text", "created_at", "intent_ids", "tags", "metadata",
+                                     "context_id", "context_type", "context_role")}
+    for example in examples:
+        columns["id"].append(example.id)
+        columns["text"].append(example.text)
+        columns["created_at"].append(getattr(example, "created_at", None))
+        columns["intent_ids"].append([intent.intent_id for intent in example._intents or ()])
+        columns["tags"].append([_reference_json(tag) for tag in example._tags or ()])
+        columns["metadata"].append(_metadata_json(example._metadata))
+        context = example._context
+        if isinstance(context, HFContext):
+            context = {"context_id": context.context_id, "type": context.type, "role": context.role}
+        context = context or {}
+        columns["context_id"].append(context.get("context_id"))
+        columns["context_type"].append(context.get("type"))
+        columns["context_role"].append(context.get("role"))
+    return columns
+
+
+def _parquet_example(row: dict, decoder: _HFJsonDecoder) -> HFExample:
+    '''HFExample from a row of the examples Parquet file'''
+    context = None
+    if row["context_id"] is not None or row["context_type"] is not None or row["context_role"] is not None:
+        context = HFContext(context_id=row["context_id"], type=row["context_type"], role=row["context_role"])
+    tags = row["tags"]
+    return HFExample(text=row["text"],
+                     id=row["id"],
+                     created_at=row["created_at"],
+                     intents=row["intent_ids"] or None,
+                     tags=[decoder.tag_reference(tag) for tag in tags] if tags else None,
+                     metadata=_metadata_from_json(row["metadata"]),
+                     context=context)
@@ -0,0 +1,404 @@
+"""
+transport.py
+
+Pooled, keep-alive HTTP transport shared by the HumanFirst API clients
+
+Transient failures are retried with exponential backoff and jitter according to a RetryPolicy
+
+"""
+# *********************************************************************************************************************
+
+# standard imports
+import os
+from configparser import ConfigParser
+import logging
+import time
+import random
+import datetime
+import threading
+import contextlib
+import contextvars
+import collections
+import email.utils
+
+# third party imports
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+# custom imports
+from .ratelimit import RateLimiter
+from .metrics import RequestEvent, call_hooks, body_size
+
+# locate where we are
+here = os.path.abspath(os.path.dirname(__file__))
+
+# CONSTANTS
+constants = ConfigParser()
+path_to_config_file = os.path.join(here,'config','setup.cfg')
+constants.read(path_to_config_file)
+
+# connection pool defaults
+POOL_CONNECTIONS = int(constants.get("humanfirst.CONSTANTS","POOL_CONNECTIONS"))
+POOL_MAXSIZE = int(constants.get("humanfirst.CONSTANTS","POOL_MAXSIZE"))
+
+# retry defaults
+RETRY_MAX_RETRIES = int(constants.get("humanfirst.CONSTANTS","RETRY_MAX_RETRIES"))
+RETRY_BACKOFF = float(constants.get("humanfirst.CONSTANTS","RETRY_BACKOFF"))
+RETRY_MAX_BACKOFF = float(constants.get("humanfirst.CONSTANTS","RETRY_MAX_BACKOFF"))
+RETRY_MAX_RETRY_AFTER = float(constants.get("humanfirst.CONSTANTS","RETRY_MAX_RETRY_AFTER"))
+
+# 429 means the server refused the request without acting on it so it is retried for any method,
+# the others only for idempotent requests
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+ALWAYS_RETRY_STATUSES = frozenset([429])
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# create logger
+logger = logging.getLogger('humanfirst.transport')
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request
+
+    A request is retried when it
+    - got a 429, which the server sends without acting on the request
+    - could not connect, so never reached the server
+    - is idempotent and got one of the other retry statuses, timed out or lost its connection
+
+    A request is idempotent if its method is one of methods or the call marks it idempotent,
+    like predict which is a POST that changes nothing. POSTs that create things like
+    create_playbook are therefore never retried after they may have reached the server.
+
+    Waits grow exponentially from backoff up to max_backoff with full jitter so many clients
+    hitting the same limit spread out. A Retry-After header from the server is honoured
+    up to max_retry_after seconds.
+    """
+
+    max_retries: int
+    backoff: float
+    max_backoff: float
+    max_retry_after: float
+    statuses: frozenset
+    methods: frozenset
+
+    def __init__(self,
+                 max_retries: int = RETRY_MAX_RETRIES,
+                 backoff: float = RETRY_BACKOFF,
+                 max_backoff: float = RETRY_MAX_BACKOFF,
+                 max_retry_after: float = RETRY_MAX_RETRY_AFTER,
+                 statuses: frozenset = RETRY_STATUSES,
+                 methods: frozenset = IDEMPOTENT_METHODS):
+        """
+        max_retries     - retries after the first attempt, 0 disables retrying
+        backoff         - base wait in seconds, the nth retry waits a random time up to backoff * 2^(n-1)
+        max_backoff     - cap on the exponential wait
+        max_retry_after - cap on a wait asked for by a Retry-After header
+        statuses        - response status codes that may be retried
+        methods         - HTTP methods treated as idempotent
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def is_idempotent(self, method: str, idempotent: bool = None) -> bool:
+        """Whether the request can safely be sent twice, idempotent overrides the method check"""
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.methods
+
+    def should_retry(self,
+                     attempt: int,
+                     method: str,
+                     idempotent: bool = None,
+                     status_code: int = None,
+                     connect_error: bool = False) -> bool:
+        """Whether to retry after attempt retries have already been made
+
+        status_code   - status of the failed response, None if no response was received
+        connect_error - True when the request failed before reaching the server"""
+        if attempt >= self.max_retries:
+            return False
+        if status_code is not None:
+            if status_code not in self.statuses:
+                return False
+            return status_code in ALWAYS_RETRY_STATUSES or self.is_idempotent(method, idempotent)
+        return connect_error or self.is_idempotent(method, idempotent)
+
+    def wait(self, attempt: int, retry_after: str = None) -> float:
+        """Seconds to wait before retry number attempt (counting from 1)
+
+        Full jitter on the exponential backoff unless the server sent a usable Retry-After"""
+        seconds = parse_retry_after(retry_after)
+        if seconds is not None:
+            return min(seconds, self.max_retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+# never retries, pass as retry to a single call or use for the whole transport
+NO_RETRY = RetryPolicy(max_retries=0)
+
+# overrides the transport's policy for the calls made inside retry_policy()
+_retry_policy_override = contextvars.ContextVar("humanfirst_retry_policy", default=None)
+
+
+@contextlib.contextmanager
+def retry_policy(policy: RetryPolicy = None, **kwargs):
+    """Use a different retry policy for the calls made inside the with block
+
+    Works for HFAPI and AsyncHFAPI, accepts a RetryPolicy or the RetryPolicy arguments
+
+        with humanfirst.transport.retry_policy(max_retries=0):
+            hf_api.get_playbook(...)
+    """
+    if policy is None:
+        policy = RetryPolicy(**kwargs)
+    token = _retry_policy_override.set(policy)
+    try:
+        yield policy
+    finally:
+        _retry_policy_override.reset(token)
+
+
+def resolve_retry_policy(default: RetryPolicy, retry=None) -> RetryPolicy:
+    """The policy for one call
+
+    retry may be a RetryPolicy, a number of retries, False for none or None to use
+    any retry_policy() in force and otherwise default"""
+    if retry is None:
+        override = _retry_policy_override.get()
+        return override if override is not None else default
+    if isinstance(retry, RetryPolicy):
+        return retry
+    if retry is False:
+        return NO_RETRY
+    return RetryPolicy(max_retries=int(retry), backoff=default.backoff, max_backoff=default.max_backoff,
+                       max_retry_after=default.max_retry_after, statuses=default.statuses, methods=default.methods)
+
+
+def parse_retry_after(retry_after: str) -> float:
+    """Seconds asked for by a Retry-After header in either delta-seconds or HTTP-date form, None if not usable"""
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class RetryCounters:
+    """Thread safe counts of requests, retries and requests that ran out of retries
+
+    Keys are "requests", "retries", "retries_exhausted" and "retries_<status>" or "retries_<exception>"
+    for what caused each retry"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+
+    def increment(self, key: str, value: int = 1):
+        """Add value to key"""
+        with self.lock:
+            self.counts[key] += value
+
+    def snapshot(self) -> dict:
+        """A copy of the current counts"""
+        with self.lock:
+            return dict(self.counts)
+
+
+class HFTransport:
+    """Pooled HTTP transport
+
+    Owns a single requests.Session so every call made through it reuses
+    already established TCP+TLS connections to the HumanFirst API instead of
+    opening a fresh connection per request.
+
+    Failed requests are retried according to retry_policy and counted in counters.
+    """
+
+    session: requests.Session
+    adapter: BaseAdapter
+    keep_alive: bool
+    retry_policy: RetryPolicy
+    counters: RetryCounters
+    rate_limiter: RateLimiter
+    hooks: list
+
+    def __init__(self,
+                 pool_connections: int = POOL_CONNECTIONS,
+                 pool_maxsize: int = POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 adapter: BaseAdapter = None,
+                 session: requests.Session = None,
+                 retry_policy: RetryPolicy = None, # pylint: disable=redefined-outer-name
+                 rate_limiter: RateLimiter = None,
+                 hooks: list = None):
+        """
+        pool_connections - number of per host connection pools to keep (one per host contacted)
+        pool_maxsize     - maximum number of connections kept open to any single host.
+                           Set this to at least the number of threads sharing the transport
+        pool_block       - if True when all connections to a host are busy wait for one to free up,
+                           otherwise open an extra connection that is discarded after use
+        keep_alive       - if False sends Connection: close so no connection is reused
+        adapter          - a custom requests adapter mounted for http:// and https://
+                           when provided the pool_* settings are ignored
+        session          - an existing requests.Session to reuse
+        retry_policy     - default RetryPolicy for requests, NO_RETRY disables retrying
+        rate_limiter     - a humanfirst.ratelimit.RateLimiter pacing requests per endpoint family,
+                           may be shared with other transports and async clients
+        hooks            - humanfirst.metrics.HFHooks called on every request attempt, response and error
+        """
+
+        if session is None:
+            session = requests.Session()
+        self.session = session
+
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=pool_connections,
+                                  pool_maxsize=pool_maxsize,
+                                  pool_block=pool_block)
+        self.adapter = adapter
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self.keep_alive = keep_alive
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+        self.counters = RetryCounters()
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks) if hooks else []
+
+        logger.debug("Transport created pool_connections: %s pool_maxsize: %s keep_alive: %s",
+                     pool_connections, pool_maxsize, keep_alive)
+
+    def request(self, method: str, url: str, retry=None, idempotent: bool = None, **kwargs) -> requests.Response:
+        """Send a request through the pooled session, retrying transient failures
+
+        Each attempt first waits for the rate_limiter if there is one
+
+        retry      - a RetryPolicy, a number of retries or False for this call only, see resolve_retry_policy
+        idempotent - mark a call safe to repeat regardless of its method, e.g. True for a POST that only reads
+
+        Accepts the same keyword arguments as requests.request.
+        The last response or exception is returned or raised once the retries run out.
+        A data stream is consumed by the first attempt, so a requests_toolbelt MultipartEncoder is
+        serialised once up front to be resent whole, and any other stream is never retried.
+        With stream=True the rate_limiter slot is held until the response is closed, so the body
+        transfer counts towards the concurrency limit - close it or use it as a context manager"""
+        policy = resolve_retry_policy(self.retry_policy, retry)
+        data = kwargs.get("data")
+        if hasattr(data, "read") and policy.max_retries > 0:
+            if hasattr(data, "to_string"):
+                kwargs["data"] = data.to_string()
+            else:
+                policy = NO_RETRY
+        limiter = self.rate_limiter.for_url(url) if self.rate_limiter is not None else None
+        attempt = 0
+        while True:
+            self.counters.increment("requests")
+            ticket = limiter.acquire() if limiter is not None else None
+            event = None
+            if self.hooks:
+                event = RequestEvent(method, url, attempt=attempt, bytes_sent=body_size(kwargs.get("data")))
+                call_hooks(self.hooks, "on_request", event)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._request_failed(limiter, ticket, event, e)
+                if not policy.should_retry(attempt, method, idempotent, connect_error=_is_connect_error(e)):
+                    self._count_exhausted(attempt)
+                    raise
+                reason = type(e).__name__
+                retry_after = None
+            except BaseException as e:
+                # interrupted or cancelled, free the slot for the other callers
+                self._request_failed(limiter, ticket, event, e)
+                raise
+            else:
+                if limiter is not None:
+                    if kwargs.get("stream"):
+                        _release_on_close(response, limiter, ticket)
+                    else:
+                        limiter.release(ticket, response.status_code)
+                if event is not None:
+                    if kwargs.get("stream"):
+                        received = int(response.headers.get("Content-Length") or 0)
+                    else:
+                        received = len(response.content)
+                    event.finish(status_code=response.status_code, bytes_received=received)
+                    call_hooks(self.hooks, "on_response", event)
+                if not policy.should_retry(attempt, method, idempotent, status_code=response.status_code):
+                    if response.status_code in policy.statuses:
+                        self._count_exhausted(attempt)
+                    return response
+                reason = str(response.status_code)
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+
+            attempt = attempt + 1
+            wait = policy.wait(attempt, retry_after)
+            self.counters.increment("retries")
+            self.counters.increment(f'retries_{reason}')
+            logger.warning("Retrying %s %s after %s in %.2fs (retry %s of %s)",
+                           method, url, reason, wait, attempt, policy.max_retries)
+            time.sleep(wait)
+
+    def _request_failed(self, limiter, ticket: int, event: RequestEvent, exception: BaseException):
+        """Free the rate limiter slot and report an attempt that got no response"""
+        if limiter is not None:
+            limiter.release(ticket)
+        if event is not None:
+            event.finish(exception=exception)
+            call_hooks(self.hooks, "on_error", event)
+
+    def _count_exhausted(self, attempt: int):
+        """Count a request that failed after being retried"""
+        if attempt > 0:
+            self.counters.increment("retries_exhausted")
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+def _release_on_close(response: requests.Response, limiter, ticket: int):
+    """Free the rate limiter slot of a streamed response when it is closed, once however often close is called"""
+    close = response.close
+    released = []
+
+    def close_and_release():
+        try:
+            close()
+        finally:
+            if not released:
+                released.append(True)
+                limiter.release(ticket, response.status_code)
+
+    response.close = close_and_release
+
+
+def _is_connect_error(exception: Exception) -> bool:
+    """Whether a requests ConnectionError or Timeout happened while connecting, before anything was sent"""
+    if isinstance(exception, requests.ConnectTimeout):
+        return True
+    if isinstance(exception, requests.Timeout):
+        return False
+    # urllib3 wraps connection failures in a NewConnectionError inside the MaxRetryError it raises
+    reason = exception.args[0] if exception.args else None
+    reason = getattr(reason, "reason", reason)
+    return type(reason).__name__ in ("NewConnectionError", "ConnectTimeoutError", "NameResolutionError")
@@ -34,7 +34,7 @@ setup(
     long_description=long_description,
     packages=find_packages(),
     package_data={
-        'humanfirst': ['config/*.conf', 'config/*.cfg'],
+        'humanfirst': ['config/*.conf', 'config/*.cfg', 'data/*.txt'],
     },
     # Libraries used in code
     install_requires=[
@@ -58,6 +58,15 @@ setup(
     license='MIT',
     python_requires=">=3.8",
     extras_require={
+        "async": [
+            "httpx"
+        ],
+        "fast": [
+            "orjson"
+        ],
+        "parquet": [
+            "pyarrow"
+        ],
         "dev": [
             "twine==5.1.1",
             "wheel==0.41.2",
@@ -76,7 +85,10 @@ setup(
             "python-dotenv",
             "pytest-cov",
             "ntplib",
-            "PyJWT[crypto]"
+            "PyJWT[crypto]",
+            "httpx",
+            "orjson",
+            "pyarrow"
         ]
     }
 )
@@ -12,8 +12,16 @@ import os
 import json
 import logging
 from configparser import ConfigParser
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import uuid
+import io
+import importlib.util
+import asyncio
+import subprocess
+import sys
+import concurrent.futures
+import threading
+import email.utils
 from dateutil import parser
 
 
@@ -21,6 +29,11 @@ from dateutil import parser
 import numpy
 import pandas
 import pytest
+import requests
+import httpx
+import jwt
+from jwt.algorithms import RSAAlgorithm
+from cryptography.hazmat.primitives.asymmetric import rsa
 from dotenv import load_dotenv, find_dotenv
 import humanfirst
 from humanfirst.apis import HFAPIResponseValidationException
@@ -102,6 +115,87 @@ def _del_playbook(hf_api: humanfirst.apis.HFAPI,
                         namespace=TEST_NAMESPACE,
                         playbook_id=playbook_id) is False
 
+class _StubAdapter(requests.adapters.BaseAdapter):
+    """Offline requests adapter returning canned responses, records every request sent
+
+    responses is a list of (status_code, body, headers) tuples served in order, the last one repeating
+    body may be a callable taking the request and returning the body"""
+
+    def __init__(self, responses: list = None):
+        super().__init__()
+        if responses is None:
+            responses = [(200, {}, {})]
+        self.responses = responses
+        self.sent = []
+
+    def send(self, request, **_kwargs): # pylint: disable=arguments-differ
+        self.sent.append(request)
+        status_code, body, headers = self.responses[min(len(self.sent), len(self.responses)) - 1]
+        if callable(body):
+            body = body(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        if isinstance(body, (bytes, str)):
+            # pylint: disable-next=protected-access
+            response._content = body.encode("utf8") if isinstance(body, str) else body
+        else:
+            response.headers.setdefault("Content-Type", "application/json")
+            response._content = json.dumps(body).encode("utf8") # pylint: disable=protected-access
+        response._content_consumed = True # pylint: disable=protected-access
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+class _FirebaseStub:
+    """Offline stand in for the HumanFirst config endpoint, Google sign in, token refresh and public keys
+
+    Signs its own RS256 tokens so Authorization can run its full validation without network"""
+
+    def __init__(self, audience: str = "zia-firebase", api_key: str = "", max_age: int = 600):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.private_key = private_key
+        self.audience = audience
+        self.api_key = api_key
+        self.max_age = max_age
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk["kid"] = "stub-kid"
+        self.jwks = {"keys": [jwk]}
+        self.sign_ins = 0
+        self.refreshes = 0
+        self.iat = None
+        self.adapter = _StubAdapter([(200, self.route, {"Cache-Control": f"public, max-age={max_age}"})])
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def token(self) -> str:
+        """A freshly signed id token"""
+        iat = self.iat if self.iat is not None else int(time.time())
+        claims = {"aud": self.audience, "iss": f"https://securetoken.google.com/{self.audience}",
+                  "iat": iat, "exp": iat + 3600, "sub": f"user-{self.sign_ins}-{self.refreshes}",
+                  "jti": str(uuid.uuid4())}
+        return jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": "stub-kid"})
+
+    def route(self, request):
+        """Body for each endpoint"""
+        if "config/environment" in request.url:
+            return {"firebase": {"apiKey": self.api_key, "audience": self.audience}}
+        if "signInWithPassword" in request.url:
+            self.sign_ins = self.sign_ins + 1
+            return {"idToken": self.token(), "refreshToken": "refresh-token"}
+        if "securetoken.googleapis.com" in request.url:
+            self.refreshes = self.refreshes + 1
+            return {"id_token": self.token(), "refresh_token": "refresh-token"}
+        return self.jwks
+
+    def count(self, fragment: str) -> int:
+        """Number of requests sent to urls containing fragment"""
+        return len([request for request in self.adapter.sent if fragment in request.url])
+
 def test_get_conversation_set_list():
     """Test filtering conversation set with conversation source id"""
 
@@ -491,6 +585,135 @@ def test_get_fully_qualified_intent_name():
                                 namespace=TEST_NAMESPACE,
                                 playbook_id=playbook_id) is False
 
+def test_intent_index_cache():
+    """Test the fully qualified name indexes follow intent() and are rebuilt after other changes"""
+    workspace = humanfirst.objects.HFWorkspace()
+    workspace.delimiter = "/"
+    late = workspace.intent(["billing", "issues", "payment_late"])
+    assert workspace.get_intent_index("-") == {"intent-0": "billing", "intent-1": "billing-issues",
+                                               "intent-2": "billing-issues-payment_late"}
+    assert workspace.get_fully_qualified_intent_name(late.id) == "billing/issues/payment_late"
+
+    # intent() adds to the cached indexes without rebuilding them
+    stamp = workspace._intent_cache_stamp # pylint: disable=protected-access
+    lost = workspace.intent(["billing", "issues", "card_lost"])
+    assert workspace._intent_cache_stamp != stamp # pylint: disable=protected-access
+    assert workspace.get_intent_index("-")[lost.id] == "billing-issues-card_lost"
+    assert workspace.get_intent_id("billing/issues/card_lost") == lost.id
+    assert workspace.get_intent_id("billing-issues-card_lost", delimiter="-") == lost.id
+    assert workspace.get_intent_id("billing/missing") is None
+
+    # the index returned is a copy
+    workspace.get_intent_index("-")[lost.id] = "changed"
+    assert workspace.get_fully_qualified_intent_name(lost.id) == "billing/issues/card_lost"
+
+    # renaming or moving an intent in place invalidates them
+    workspace.intents_by_id["intent-1"].name = "problems"
+    assert workspace.get_fully_qualified_intent_name(late.id) == "billing/problems/payment_late"
+    assert workspace.get_intent_id("billing/issues/payment_late") is None
+    assert workspace.intent(["billing", "problems", "payment_late"]) is late
+    late.parent_intent_id = "intent-0"
+    assert workspace.get_intent_id("billing/payment_late") == late.id
+
+    # only for the workspace holding the intent
+    other = humanfirst.objects.HFWorkspace()
+    other.intent(["billing"])
+    stamp = other._intent_hierarchy_stamp() # pylint: disable=protected-access
+    late.name = "late"
+    assert other._intent_hierarchy_stamp() == stamp # pylint: disable=protected-access
+    assert workspace.get_intent_id("billing/late") == late.id
+
+    # changing intents_by_id directly invalidates them
+    workspace.intents_by_id["intent-9"] = humanfirst.objects.HFIntent(id="intent-9", name="greeting")
+    assert workspace.get_intent_index("/")["intent-9"] == "greeting"
+    del workspace.intents_by_id["intent-9"]
+    assert workspace.get_intent_id("greeting") is None
+
+    # as do workspaces read from HF JSON
+    read = humanfirst.objects.HFWorkspace.from_json(workspace.get_hf_json(), delimiter="/")
+    assert read.get_intent_index("/") == workspace.get_intent_index("/")
+
+
+def test_intents_from_paths():
+    """Test intents_from_paths creates the same hierarchy as intent() in one pass"""
+    paths = [["billing", "issues", "payment_late"], ["billing"], ["billing-issues"], ["greeting", "hello"],
+             ["billing", "issues", "card_lost"], ["greeting", "hello"], [""]]
+    one_by_one = humanfirst.objects.HFWorkspace()
+    expected = [one_by_one.intent(path) for path in paths]
+    bulk = humanfirst.objects.HFWorkspace()
+    leaves = bulk.intents_from_paths(paths)
+    assert [leaf.id if leaf else None for leaf in leaves] == [leaf.id if leaf else None for leaf in expected]
+    assert bulk.get_hf_json() == one_by_one.get_hf_json()
+    assert list(bulk.intents) == list(one_by_one.intents)
+    # a name with the delimiter in it is its own top level intent, not billing's child
+    assert bulk.get_intent_id("billing-issues", delimiter="/") == leaves[2].id != leaves[0].parent_intent_id
+
+    assert bulk.intents_from_paths(["billing/issues/card_lost", "sales"], delimiter="/") == [leaves[4],
+                                                                                             bulk.intent("sales")]
+
+    # existing children are found by name in a workspace read from HF JSON, which keys intents by name
+    read = humanfirst.objects.HFWorkspace.from_json(bulk.get_hf_json(), delimiter="-")
+    assert read.intent(["billing", "issues", "card_lost"]).id == leaves[4].id
+    assert len(read.intents_by_id) == len(bulk.intents_by_id)
+    assert read.intent(["billing", "refund"]).id == f"intent-{len(bulk.intents_by_id)}"
+
+
+def test_examples_from_columns():
+    """Test the bulk example methods build the same workspace as example() row by row"""
+    texts = ["pay my bill", "refund please", "hello", "pay my bill", "no intent"]
+    paths = [["billing"], "billing-refund", ["greeting"], ["billing"], None]
+    tags = [["train"], "test", None, None, None]
+    metadata = [{"source": "email"}, None, {}, None, {"source": "chat"}]
+    created_at = [datetime(2024, 1, 1, 9), "2024-01-02T00:00:00Z", None, None, datetime(2024, 1, 3)]
+
+    one_by_one = humanfirst.objects.HFWorkspace()
+    one_by_one.tag("train")
+    one_by_one.tag("test")
+    for text, path, tag, example_metadata, created in zip(texts, paths, tags, metadata, created_at):
+        if isinstance(path, str):
+            path = path.split("-")
+        tag = [tag] if isinstance(tag, str) else tag
+        one_by_one.example(text, created_at=created if created else datetime(2024, 1, 4),
+                           intents=[one_by_one.intent(path)] if path else None,
+                           tags=[one_by_one.tag(name) for name in tag] if tag else None, metadata=example_metadata)
+
+    bulk = humanfirst.objects.HFWorkspace()
+    bulk.tag_reference = one_by_one.tag_reference
+    bulk.tags = one_by_one.tags
+    added = bulk.examples_from_columns(texts, intents=paths, tags=tags, metadata=metadata,
+                                       created_at=[created if created else datetime(2024, 1, 4)
+                                                   for created in created_at],
+                                       delimiter="-")
+    assert bulk.get_hf_json() == one_by_one.get_hf_json()
+    assert added[3] is added[0]
+    assert added[4].intents == []
+    # examples with the same intent share its reference
+    shared = bulk.examples_from_columns(["my bill", "the bill"], intents=[["billing"], "billing"])
+    assert shared[0].intents[0] is shared[1].intents[0]
+    assert shared[0].intents[0].intent_id == added[0].intents[0].intent_id
+    with pytest.raises(humanfirst.objects.HFIncompatibleOptionException):
+        bulk.examples_from_columns(texts, intents=paths[:2])
+
+    df = pandas.DataFrame({"utterance": texts,
+                           "intent": ["billing", "billing-refund", "greeting", "billing", numpy.nan],
+                           "source": ["email", None, None, None, "chat"],
+                           "id": ["ex-0", None, None, None, None]})
+    from_df = humanfirst.objects.HFWorkspace()
+    added = from_df.examples_from_table(df, text="utterance", intent="intent", metadata=["source"], id="id",
+                                        delimiter="-")
+    assert [example.id for example in added][:2] == ["ex-0", humanfirst.objects.hash_string("refund please", "ex")]
+    assert added[0].metadata == {"source": "email"} and added[1].metadata == {}
+    assert from_df.get_intent_index("-")[added[1].intents[0].intent_id] == "billing-refund"
+    assert added[4].intents == [] and len(from_df.examples) == 5
+
+    pyarrow = pytest.importorskip("pyarrow")
+    from_arrow = humanfirst.objects.HFWorkspace()
+    added = from_arrow.examples_from_table(pyarrow.Table.from_pandas(df), text="utterance", intent="intent",
+                                           metadata=["source"], id="id", delimiter="-")
+    assert [example.to_dict()["intents"] for example in added] == [
+        example.to_dict()["intents"] for example in from_df.examples.values()]
+
+
 def test_create_intent_second_time():
     """test_create_intent_second_time"""
 
@@ -557,7 +780,40 @@ def test_tag_reference():
     tag = labelled.tag(tag='exclude')
     assert isinstance(tag, humanfirst.objects.HFTagReference)
     # check if color is not present in the HFTagReference
-    assert "color" not in list(tag.__dict__.keys())
+    assert "color" not in humanfirst.objects.HFTagReference.__slots__
+    assert not hasattr(tag, "color")
+
+
+def test_slotted_objects():
+    """test_slotted_objects"""
+
+    workspace = humanfirst.objects.HFWorkspace()
+    intent = workspace.intent(["billing", "refund"])
+    tag = workspace.tag("urgent")
+    labelled = workspace.example("I want my money back", created_at="2024-01-01T00:00:00Z",
+                                 intents=[intent], tags=[tag], metadata={"source": "email"})
+    unlabelled = workspace.example("hello there", created_at="2024-01-01T00:00:01Z")
+
+    for obj in [intent, tag, labelled, labelled.intents[0]]:
+        assert not hasattr(obj, "__dict__")
+
+    # ids are interned so every reference shares the one string
+    assert labelled.intents[0].intent_id is sys.intern(intent.id)
+    assert humanfirst.objects.HFTagReference(id="".join(["tag-", "x"]), name="x").id is sys.intern("tag-x")
+
+    # empty containers are only created when read, serialising doesn't create them
+    assert unlabelled._intents is None and unlabelled._metadata is None # pylint: disable=protected-access
+    hf_json = workspace.get_hf_json()["examples"][1]
+    assert unlabelled._intents is None # pylint: disable=protected-access
+    assert hf_json == unlabelled.to_dict() == {"id": unlabelled.id, "text": "hello there",
+                                               "created_at": "2024-01-01T00:00:01Z",
+                                               "intents": [], "tags": [], "metadata": {}, "context": {}}
+    unlabelled.metadata["source"] = "chat"
+    assert unlabelled.to_dict()["metadata"] == {"source": "chat"}
+    assert humanfirst.objects.HFExample(text="a", id="b").metadata is not unlabelled.metadata
+
+    assert labelled.to_dict()["intents"] == [{"intent_id": intent.id}]
+    assert repr(labelled.intents[0]) == f"HFIntentRef(intent_id='{intent.id}')"
 
 
 def test_write_csv():
@@ -658,6 +914,123 @@ def test_write_json():
         os.remove(output_file)
 
 
+def test_from_json_decoder(tmp_path):
+    """Test from_json and from_json_stream build the same objects as the dataclasses_json decoding"""
+    hf_json = {
+        "$schema": "https://docs.humanfirst.ai/hf-json-schema.json",
+        "examples": [
+            {"id": "example-0", "text": "cannot pay my bill", "created_at": "2024-01-01T00:00:00Z",
+             "intents": [{"intent_id": "intent-1"}], "tags": [{"id": "tag-0", "name": "billing"}],
+             "metadata": {"source": "chat"}, "unknown_key": 1,
+             "context": {"context_id": "convo-0", "type": "conversation", "role": "client"}},
+            {"id": "example-1", "text": "an unlabelled éxample", "created_at": "2024-01-02T00:00:00Z",
+             "context": {"context_id": "convo-1"}},
+            {"id": "example-2", "text": "nulls", "created_at": "2024-01-03T00:00:00Z",
+             "tags": None, "metadata": None, "context": None},
+        ],
+        "intents": [
+            {"id": "intent-0", "name": "billing", "metadata": {"owner": "finance"},
+             "tags": [{"id": "tag-0", "name": "billing"}]},
+            {"id": "intent-1", "name": "cannot_pay", "parent_intent_id": "intent-0"},
+        ],
+        "tags": [{"id": "tag-0", "name": "billing", "color": "#ff33da"}],
+        "entities": [{"id": "entity-0"}],
+    }
+    # pylint: disable-next=no-member # from_json is added by dataclass_json
+    expected = humanfirst.objects.HFWorkspaceJson.from_json(json.dumps(hf_json), infer_missing=True)
+
+    path = tmp_path / "workspace.json"
+    path.write_text(json.dumps(hf_json, indent=2), encoding="utf8")
+    with open(path, mode="r", encoding="utf8") as file_in:
+        from_file = humanfirst.objects.HFWorkspace.from_json(file_in, "-")
+    workspaces = [
+        humanfirst.objects.HFWorkspace.from_json(hf_json, "-"),
+        from_file,
+        humanfirst.objects.HFWorkspace.from_json_stream(str(path), "-", chunk_size=7),
+    ]
+    for workspace in workspaces:
+        assert workspace.delimiter == "-"
+        assert [repr(example) for example in workspace.examples.values()] == [repr(ex) for ex in expected.examples]
+        assert [repr(intent) for intent in workspace.intents_by_id.values()] == [repr(i) for i in expected.intents]
+        assert [repr(tag) for tag in workspace.tags.values()] == [repr(tag) for tag in expected.tags]
+        assert workspace.examples["example-2"].context == {}
+        assert workspace.get_fully_qualified_intent_name("intent-1") == "billing-cannot_pay"
+        # tag references are shared
+        assert workspace.examples["example-0"].tags[0] is workspace.intents["billing"].tags[0]
+
+    with pytest.raises(humanfirst.objects.HFInvalidWorkspaceInputTypeException):
+        humanfirst.objects.HFWorkspace.from_json([], "-")
+
+    # streaming a local file needs none of the API client
+    script = ("import sys, humanfirst.objects\n"
+              f"humanfirst.objects.HFWorkspace.from_json_stream({str(path)!r}, '-')\n"
+              "print([m for m in ('humanfirst.apis', 'requests') if m in sys.modules])\n")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_write_json_streamed(tmp_path):
+    """Test write_json streams the same document json.dump writes of get_hf_json, with either backend"""
+    workspace = humanfirst.generators.HFGEN(seed=5).generate_workspace(50, n_intents=12, n_tags=3)
+    examples = list(workspace.examples.values())
+    examples[0].metadata = {"nested": {"values": [1, "é"]}}
+    examples[1].context = humanfirst.objects.HFContext("convo-0", "conversation", "client")
+
+    hf_json = workspace.get_hf_json()
+    for indent in (2, None, 0, 4):
+        output = io.StringIO()
+        workspace.write_json(output, indent=indent, json_backend="json")
+        assert output.getvalue() == json.dumps(hf_json, indent=indent)
+    output = io.StringIO()
+    workspace.write_json(output, jsonl=True, json_backend="json")
+    assert output.getvalue() == json.dumps(hf_json) + "\n"
+
+    if humanfirst.serialisation.orjson is not None:
+        output = io.StringIO()
+        workspace.write_json(output, json_backend="orjson")
+        assert json.loads(output.getvalue()) == hf_json
+        with pytest.raises(humanfirst.objects.HFIncompatibleOptionException):
+            workspace.write_json(io.StringIO(), indent=4, json_backend="orjson")
+    with pytest.raises(humanfirst.objects.HFIncompatibleOptionException):
+        workspace.write_json(io.StringIO(), json_backend="simplejson")
+
+    # the default output is the same whether or not orjson is installed
+    path = tmp_path / "workspace.json"
+    workspace.write_json(str(path))
+    assert path.read_text(encoding="utf8") == json.dumps(hf_json, indent=2)
+    assert humanfirst.objects.HFWorkspace().get_hf_json() == {"$schema": humanfirst.objects.HF_JSON_SCHEMA,
+                                                               "examples": []}
+
+    # get_hf_json is a copy, changing it leaves the workspace alone
+    hf_json["examples"][0]["metadata"]["nested"]["values"].append(2)
+    assert examples[0].metadata == {"nested": {"values": [1, "é"]}}
+    assert hf_json["examples"][0] == {**examples[0].to_dict(), "metadata": {"nested": {"values": [1, "é", 2]}}}
+
+
+def test_parquet_round_trip(tmp_path):
+    """Test read_parquet reads back the workspace write_parquet wrote"""
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    workspace = humanfirst.generators.HFGEN(seed=6).generate_workspace(250, n_intents=12, n_tags=3)
+    examples = list(workspace.examples.values())
+    examples[0].metadata = {"nested": {"values": [1, "é"]}}
+    examples[1].context = humanfirst.objects.HFContext("convo-0", "conversation", "client")
+    workspace.intent(["billing", "refund"], metadata={"owner": "finance"})
+
+    workspace.write_parquet(str(tmp_path), batch_size=100)
+    assert sorted(os.listdir(tmp_path)) == ["examples.parquet", "intents.parquet", "tags.parquet"]
+    examples_file = pyarrow_parquet.ParquetFile(tmp_path / "examples.parquet")
+    assert examples_file.num_row_groups == 3
+    assert str(examples_file.schema_arrow.field("intent_ids").type.value_type).startswith("dictionary")
+
+    read = humanfirst.objects.HFWorkspace.read_parquet(str(tmp_path), "-")
+    assert read.get_hf_json() == workspace.get_hf_json()
+    assert list(read.examples) == list(workspace.examples)
+
+    empty = tmp_path / "empty"
+    humanfirst.objects.HFWorkspace().write_parquet(str(empty))
+    assert humanfirst.objects.HFWorkspace.read_parquet(str(empty), "-").get_hf_json()["examples"] == []
+
+
 def test_tag_filter_validation():
     """test_tag_filter_validation"""
 
@@ -708,6 +1081,47 @@ def test_tag_filters():
         assert str(
             e.value) == "Accepted types are ['incldue', 'exclude'] level was: both"
 
+def test_write_csv_tag_filters(tmp_path):
+    """Test write_csv filters on utterance and intent tags"""
+    workspace = humanfirst.objects.HFWorkspace()
+    billing = workspace.intent(["billing"])
+    refund = workspace.intent(["billing", "refund"])
+    greeting = workspace.intent(["greeting"])
+    workspace.tag_intent(refund.id, workspace.tag("release-1"))
+    workspace.tag_intent(greeting.id, workspace.tag("deprecated"))
+    test, train = workspace.tag("test"), workspace.tag("train")
+    workspace.example("pay my bill", intents=[billing], tags=[train])
+    workspace.example("refund please", intents=[refund], tags=[test])
+    workspace.example("money back", intents=[refund], tags=[test, train])
+    workspace.example("hello", intents=[greeting], tags=[test])
+    workspace.example("hi", intents=[greeting])
+
+    def utterances(tag_filters: humanfirst.objects.HFTagFilters) -> list:
+        path = tmp_path / "filtered.csv"
+        workspace.write_csv(str(path), tag_filters=tag_filters)
+        return sorted(pandas.read_csv(path, encoding="utf8")["utterance"].to_list())
+
+    tag_filters = humanfirst.objects.HFTagFilters()
+    assert utterances(tag_filters) == ["hello", "hi", "money back", "pay my bill", "refund please"]
+    tag_filters.set_tag_filter("utterance", "include", "test")
+    assert utterances(tag_filters) == ["hello", "money back", "refund please"]
+    tag_filters.set_tag_filter("utterance", "exclude", ["train"])
+    assert utterances(tag_filters) == ["hello", "refund please"]
+    tag_filters.set_tag_filter("intent", "exclude", ["deprecated"])
+    assert utterances(tag_filters) == ["refund please"]
+    tag_filters.set_tag_filter("utterance", "exclude", [])
+    tag_filters.set_tag_filter("intent", "include", ["release-1", "deprecated"])
+    tag_filters.set_tag_filter("intent", "exclude", [])
+    assert utterances(tag_filters) == ["hello", "money back", "refund please"]
+    assert [example.text for example in workspace.filter_examples(tag_filters)] == ["refund please", "money back",
+                                                                                   "hello"]
+
+    # nothing passing still writes the header
+    tag_filters.set_tag_filter("utterance", "include", ["missing"])
+    assert not workspace.filter_examples(tag_filters)
+    assert utterances(tag_filters) == []
+
+
 def test_conversation_set_functionalities():
     """Test Upload,link,unlink,delete a conversation set"""
 
@@ -1170,6 +1584,665 @@ def test_refresh_minimnum_expiry():
     _ = hf_api.list_playbooks(namespace=TEST_NAMESPACE)
 
 
+def test_pooled_transport():
+    """Test every call goes through the single pooled transport owned by HFAPI"""
+    adapter = _StubAdapter([(200, {"intents": [{"id": "intent-0"}]}, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    assert isinstance(hf_api.transport, humanfirst.transport.HFTransport)
+    assert hf_api.transport.session.get_adapter("https://api.humanfirst.ai") is adapter
+
+    for _ in range(3):
+        intents = hf_api.get_intents(namespace="ns", playbook="playbook-1")
+        assert intents == [{"id": "intent-0"}]
+    assert len(adapter.sent) == 3
+    assert adapter.sent[0].headers["Authorization"] == "Bearer offline-key"
+
+    # default adapter honours the pool settings and can opt out of keep alive
+    transport = humanfirst.transport.HFTransport(pool_maxsize=64, keep_alive=False)
+    assert transport.adapter._pool_maxsize == 64 # pylint: disable=protected-access
+    assert transport.session.headers["Connection"] == "close"
+    transport.close()
+
+def test_batch_predict_chunked(monkeypatch):
+    """Test chunked batch prediction keeps input order and retries a failed chunk"""
+
+    def echo_predictions(request):
+        return {"predictions": [{"input": sentence} for sentence in json.loads(request.body)["input_utterances"]]}
+
+    adapter = _StubAdapter([(503, "unavailable", {}), (200, echo_predictions, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    monkeypatch.setattr(humanfirst.apis, "BATCH_PREDICT_RETRY_WAIT", 0)
+    progress = []
+
+    sentences = [f"utterance {i}" for i in range(25)]
+    predictions = hf_api.batch_predict_chunked(sentences, namespace="ns", playbook="playbook-1",
+                                               chunk_size=10, max_workers=3,
+                                               progress_callback=lambda done, total, rate: progress.append(done))
+    assert [prediction["input"] for prediction in predictions] == sentences
+    assert len(adapter.sent) == 4
+    assert sorted(progress)[-1] == 25
+
+    # a chunk is retried max_retries times, not again for each attempt
+    adapter = _StubAdapter([(503, "unavailable", {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+        hf_api.batch_predict_chunked(sentences[:5], namespace="ns", playbook="playbook-1", max_retries=2)
+    assert len(adapter.sent) == 3
+
+    # waiting as long as a 429 asks
+    waits = []
+    monkeypatch.setattr(humanfirst.transport.time, "sleep", waits.append)
+    adapter = _StubAdapter([(429, "slow down", {"Retry-After": "7"}), (200, echo_predictions, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    assert len(hf_api.batch_predict_chunked(sentences[:5], namespace="ns", playbook="playbook-1")) == 5
+    assert waits == [7.0]
+
+    # a chunk that can never succeed is not retried and the chunks still queued are not sent
+    adapter = _StubAdapter([(400, "bad request", {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+        hf_api.batch_predict_chunked(sentences, namespace="ns", playbook="playbook-1", chunk_size=5, max_workers=1)
+    assert len(adapter.sent) == 1
+
+    sent = []
+
+    async def bad_request(request):
+        sent.append(request)
+        return httpx.Response(400, text="bad request")
+
+    async def run():
+        async with humanfirst.async_apis.AsyncHFAPI(api_key="offline-key",
+                                                    transport=httpx.MockTransport(bad_request)) as async_api:
+            with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+                await async_api.batch_predict_chunked(sentences, namespace="ns", playbook="playbook-1",
+                                                      chunk_size=5, max_workers=1)
+
+    asyncio.run(run())
+    assert len(sent) == 1
+
+def test_iter_query_conversation_set(tmp_path):
+    """Test the conversation query generator follows page tokens and streams to JSONL"""
+
+    def paged_results(request):
+        predicates = json.loads(request.body)["predicates"]
+        tokens = [predicate["PageTokenData"]["PageToken"] for predicate in predicates if "PageTokenData" in predicate]
+        page = int(tokens[0]) if tokens else 0
+        results = {"results": [{"conversation": {"id": f"convo-{page}-{i}"}} for i in range(2)]}
+        if page < 2:
+            results["nextPageToken"] = str(page + 1)
+        return results
+
+    adapter = _StubAdapter([(200, paged_results, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+
+    ids = [result["conversation"]["id"] for result in hf_api.iter_query_conversation_set(namespace="ns",
+                                                                                         workspace="playbook-1")]
+    assert ids == ["convo-0-0", "convo-0-1", "convo-1-0", "convo-1-1", "convo-2-0", "convo-2-1"]
+
+    pages = list(hf_api.iter_query_conversation_set(namespace="ns", workspace="playbook-1",
+                                                    yield_pages=True, prefetch=False, max_pages=2))
+    assert len(pages) == 2
+
+    output_path = tmp_path / "query.jsonl"
+    assert hf_api.query_conversation_set_to_jsonl(str(output_path), namespace="ns", workspace="playbook-1") == 6
+    with open(output_path, mode="r", encoding="utf8") as file_in:
+        assert json.loads(file_in.readlines()[-1])["conversation"]["id"] == "convo-2-1"
+
+def test_streamed_export_query_conversation_inputs(tmp_path):
+    """Test exports stream to a file and parse record by record in small chunks"""
+    export = {"examples": [{"id": f"example-{i}", "text": f"utterance [{i}], \"quoted\""} for i in range(5)]}
+    csv_export = 'id,text\r\nexample-0,"multi\nline"\r\nexample-1,plain\u2028text\x85end\x0c\r\n'
+    adapter = _StubAdapter([(200, {"exportUrlPath": "/export/1"}, {}), (200, export, {}),
+                            (200, {"exportUrlPath": "/export/1"}, {}), (200, export, {}),
+                            (200, {"exportUrlPath": "/export/2"}, {}), (200, csv_export, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+
+    output_path = tmp_path / "export.json"
+    written = hf_api.export_query_conversation_inputs(namespace="ns", playbook_id="playbook-1",
+                                                      output=str(output_path), chunk_size=16)
+    assert written == len(json.dumps(export))
+    with open(output_path, mode="r", encoding="utf8") as file_in:
+        assert json.load(file_in) == export
+
+    records = list(hf_api.iter_export_query_conversation_inputs(namespace="ns", playbook_id="playbook-1",
+                                                                chunk_size=7))
+    assert records == export["examples"]
+
+    rows = list(hf_api.iter_export_query_conversation_inputs(namespace="ns", playbook_id="playbook-1",
+                                                             download_format=2, chunk_size=5))
+    assert rows == [{"id": "example-0", "text": "multi\nline"},
+                    {"id": "example-1", "text": "plain\u2028text\x85end\x0c"}]
+
+def test_async_streamed_export(tmp_path):
+    """Test the async client streams exports through the retries, rate limiter and hooks of its other requests
+    and leaves its concurrency slot free while the caller handles each record"""
+    export = {"examples": [{"id": f"example-{i}", "text": f"utterance {i}"} for i in range(3)]}
+    attempts = []
+
+    async def handler(request):
+        if request.url.path.endswith("/export"):
+            return httpx.Response(200, json={"exportUrlPath": "/export/1"})
+        if request.url.path == "/export/1":
+            attempts.append(1)
+            if len(attempts) % 2:
+                return httpx.Response(503, text="unavailable", headers={"Retry-After": "0"})
+            return httpx.Response(200, json=export)
+        return httpx.Response(200, json={"intents": []})
+
+    collector = humanfirst.metrics.MetricsCollector()
+    rate_limiter = humanfirst.ratelimit.RateLimiter()
+
+    async def run(output_path):
+        async with humanfirst.async_apis.AsyncHFAPI(api_key="offline-key", max_concurrency=1,
+                                                    rate_limiter=rate_limiter, hooks=[collector],
+                                                    transport=httpx.MockTransport(handler)) as async_api:
+            records = []
+            async for record in async_api.iter_export_query_conversation_inputs(namespace="ns",
+                                                                                playbook_id="playbook-1",
+                                                                                chunk_size=7):
+                # another request per record needs the only concurrency slot
+                await async_api.get_intents(namespace="ns", playbook="playbook-1")
+                records.append(record)
+            written = await async_api.export_query_conversation_inputs(namespace="ns", playbook_id="playbook-1",
+                                                                       output=str(output_path), chunk_size=16)
+            return records, written, async_api.counters.snapshot()
+
+    output_path = tmp_path / "export.json"
+    records, written, counters = asyncio.run(asyncio.wait_for(run(output_path), timeout=10))
+    with open(output_path, mode="r", encoding="utf8") as file_in:
+        assert json.load(file_in) == export
+    assert records == export["examples"]
+    assert written == os.path.getsize(output_path)
+    assert len(attempts) == 4
+    assert counters["retries_503"] == 2
+    assert collector.summary()["endpoints"]["GET /export/{id}"]["statuses"] == {"503": 2, "200": 2}
+    assert all(limiter.concurrency.in_flight == 0 for limiter in rate_limiter.limiters.values())
+
+def test_jwks_cache():
+    """Test Google's public keys are fetched once and reused until their max-age passes"""
+    stub = _FirebaseStub(api_key=humanfirst.authorization.PROD_SIGN_IN_API_KEY)
+    jwks_cache = humanfirst.authorization.JWKSCache()
+    auth = humanfirst.authorization.Authorization(username="user", password="password", environment="prod",
+                                                  session=stub.session, jwks_cache=jwks_cache)
+    for _ in range(5):
+        auth.validate_jwt(force=True)
+    assert stub.count("metadata/jwk") == 1
+    assert jwks_cache.fetch_count == 1
+
+    # expired keys are fetched again
+    jwks_cache.expires_at = 0.0
+    auth.validate_jwt(force=True)
+    assert stub.count("metadata/jwk") == 2
+
+def test_validate_jwt_fast_path(monkeypatch):
+    """Test an already verified token is not decoded again until it nears expiry or changes"""
+    stub = _FirebaseStub(api_key=humanfirst.authorization.PROD_SIGN_IN_API_KEY)
+    auth = humanfirst.authorization.Authorization(username="user", password="password", environment="prod",
+                                                  session=stub.session,
+                                                  jwks_cache=humanfirst.authorization.JWKSCache())
+    assert auth.seconds_to_expiry() > 3500
+
+    decodes = []
+    decode = jwt.decode
+    monkeypatch.setattr(jwt, "decode",
+                        lambda *args, **kwargs: decodes.append(1) or decode(*args, **kwargs))
+    for _ in range(100):
+        auth.validate_jwt()
+    assert not decodes
+
+    # nearing expiry the token is checked again
+    auth.verified_until = time.monotonic() + 10
+    auth.validate_jwt()
+    assert len(decodes) == 1
+    assert auth.seconds_to_expiry() > 3500
+
+    # a different token is always checked
+    auth.bearer_token_dict["token"] = stub.token()
+    assert auth.seconds_to_expiry() == 0.0
+    auth.validate_jwt()
+    assert len(decodes) == 2
+
+def test_async_headers_fast_path(monkeypatch):
+    """Test the async client only validates a firebase token in a thread when it needs checking"""
+    stub = _FirebaseStub(api_key=humanfirst.authorization.PROD_SIGN_IN_API_KEY)
+    auth = humanfirst.authorization.Authorization(username="user", password="password", environment="prod",
+                                                  session=stub.session,
+                                                  jwks_cache=humanfirst.authorization.JWKSCache())
+    threads = []
+    to_thread = asyncio.to_thread
+    monkeypatch.setattr(asyncio, "to_thread", lambda *args, **kwargs: threads.append(1) or to_thread(*args, **kwargs))
+
+    async def run():
+        async with humanfirst.async_apis.AsyncHFAPI(api_key="offline-key") as async_api:
+            async_api.auth_type = humanfirst.apis.FIREBASE
+            async_api.firebase_auth = auth
+            for _ in range(100):
+                headers = await async_api._aget_headers() # pylint: disable=protected-access
+            assert not threads
+            auth.verified_until = time.monotonic() + 10
+            await async_api._aget_headers() # pylint: disable=protected-access
+            assert len(threads) == 1
+            return headers
+
+    assert asyncio.run(run())["Authorization"] == f'Bearer {auth.bearer_token_dict["token"]}'
+
+def test_single_flight_token_refresh(monkeypatch):
+    """Test threads sharing an expiring token trigger exactly one refresh, and background refresh"""
+    stub = _FirebaseStub(api_key=humanfirst.authorization.PROD_SIGN_IN_API_KEY)
+    auth = humanfirst.authorization.Authorization(username="user", password="password", environment="prod",
+                                                  session=stub.session,
+                                                  jwks_cache=humanfirst.authorization.JWKSCache())
+
+    # swap in a token already past the pre-emptive refresh point
+    stub.iat = int(time.time()) - 2000
+    auth.bearer_token_dict["token"] = stub.token()
+    stub.iat = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda _: auth.validate_jwt(), range(64)))
+    assert stub.refreshes == 1
+    assert auth.seconds_to_expiry() > 3500
+
+    # background refresh keeps the token fresh without any caller validating
+    auth.start_background_refresh(margin_seconds=auth.seconds_to_expiry() - auth.min_expires_in_seconds)
+    deadline = time.monotonic() + 10
+    while stub.refreshes < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    auth.stop_background_refresh()
+    assert stub.refreshes >= 2
+    assert auth.refresh_thread is None
+
+    # a margin leaving no time before the next refresh does not refresh continuously
+    monkeypatch.setattr(humanfirst.authorization, "TOKEN_REVALIDATE_WAIT_TIME", 0.01)
+    refreshes = stub.refreshes
+    auth.start_background_refresh(margin_seconds=humanfirst.authorization.HUMANFIRST_TOKEN_TTL_SECONDS)
+    deadline = time.monotonic() + 10
+    while stub.refreshes == refreshes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.3)
+    auth.stop_background_refresh()
+    assert stub.refreshes == refreshes + 1
+
+def test_token_file_cache(tmp_path):
+    """Test processes sharing a token cache file sign in once and adopt each other's refreshed tokens"""
+    stub = _FirebaseStub(api_key=humanfirst.authorization.PROD_SIGN_IN_API_KEY)
+    token_cache_path = str(tmp_path / "hf_token.json")
+
+    def worker():
+        return humanfirst.authorization.Authorization(username="user", password="password", environment="prod",
+                                                      session=stub.session,
+                                                      jwks_cache=humanfirst.authorization.JWKSCache(),
+                                                      token_cache_path=token_cache_path)
+
+    first = worker()
+    second = worker()
+    assert stub.count("signInWithPassword") == 1
+    assert stub.count("config/environment") == 1
+    assert second.bearer_token_dict["token"] == first.bearer_token_dict["token"]
+    assert oct(os.stat(token_cache_path).st_mode & 0o777) == oct(0o600)
+
+    # a refresh by one worker is picked up by the other instead of refreshing again
+    first.refresh()
+    second.refresh()
+    assert stub.refreshes == 1
+    assert second.bearer_token_dict["token"] == first.bearer_token_dict["token"]
+
+def test_import_time():
+    """Test import humanfirst is lazy and the API client does not load the heavy optional dependencies"""
+    heavy = ["pandas", "numpy", "jwt", "cryptography", "google.protobuf", "requests_toolbelt",
+             "dataclasses_json", "httpx"]
+    script = (
+        "import sys, time, json\n"
+        "start = time.perf_counter()\n"
+        "import humanfirst\n"
+        "lazy = sorted(m for m in sys.modules if m.startswith('humanfirst.'))\n"
+        "import humanfirst.apis\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps([lazy, [m for m in {heavy!r} if m in sys.modules], elapsed]))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    lazy, loaded, elapsed = json.loads(result.stdout)
+    assert lazy == []
+    assert loaded == []
+    assert elapsed < 2.0
+
+def test_shared_word_list():
+    """Test the generator word list is loaded once and shared by all HFGEN objects"""
+    first = humanfirst.generators.HFGEN().get_large_word_list()
+    second = humanfirst.generators.HFGEN().word_list
+    assert first is second
+    assert len(first) > 20000
+    assert first[0] == "AEneas"
+    assert "Abbé" in first
+
+def test_synthetic_workspace_generator(tmp_path):
+    """Test synthetic workspaces and conversations are repeatable and valid HF JSON"""
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    workspace = humanfirst.generators.HFGEN(seed=7).write_workspace(str(first), 2500, n_intents=40, chunk_size=1000)
+    humanfirst.generators.HFGEN(seed=7).write_workspace(str(second), 2500, n_intents=40, chunk_size=1000)
+    assert first.read_text(encoding="utf8") == second.read_text(encoding="utf8")
+
+    with open(first, mode="r", encoding="utf8") as file_in:
+        hf_json = json.load(file_in)
+    assert hf_json["intents"] == workspace["intents"]
+    assert len(hf_json["examples"]) == 2500
+    assert len({example["id"] for example in hf_json["examples"]}) == 2500
+    intent_ids = {intent["id"] for intent in hf_json["intents"]}
+    parent_ids = {intent.get("parent_intent_id") for intent in hf_json["intents"]}
+    assert parent_ids - {None} <= intent_ids
+    for example in hf_json["examples"]:
+        for intent in example["intents"]:
+            assert intent["intent_id"] in intent_ids
+            assert intent["intent_id"] not in parent_ids
+    labelled = humanfirst.objects.HFWorkspace.from_json(hf_json, "-")
+    assert len(labelled.examples) == 2500
+
+    conversations = tmp_path / "conversations.jsonl"
+    written = humanfirst.generators.HFGEN(seed=7).write_conversations(str(conversations), 30, jsonl=True)
+    with open(conversations, mode="r", encoding="utf8") as file_in:
+        lines = [json.loads(line) for line in file_in]
+    assert len(lines) == written
+    assert len({line["context"]["context_id"] for line in lines}) == 30
+    for line in lines:
+        turn = int(line["metadata"]["conversation_turn"])
+        assert line["context"]["role"] == ("client" if turn % 2 == 0 else "expert")
+
+    in_memory = humanfirst.generators.HFGEN(seed=7).generate_workspace(100, n_intents=10)
+    assert len(in_memory.examples) == 100
+    assert len(in_memory.intents_by_id) == 10
+
+def test_retry_policy(monkeypatch):
+    """Test transient failures are retried with backoff, honouring Retry-After and idempotency"""
+    waits = []
+    monkeypatch.setattr(humanfirst.transport.time, "sleep", waits.append)
+
+    adapter = _StubAdapter([(503, "unavailable", {}), (429, "slow down", {"Retry-After": "7"}),
+                            (200, {"intents": []}, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    assert hf_api.get_intents(namespace="ns", playbook="playbook-1") == []
+    assert len(adapter.sent) == 3
+    assert 0 <= waits[0] <= humanfirst.transport.RETRY_BACKOFF
+    assert waits[1] == 7
+    assert hf_api.transport.counters.snapshot() == {"requests": 3, "retries": 2, "retries_503": 1, "retries_429": 1}
+
+    # a POST that creates something is not repeated after a 503 but is after a 429
+    adapter = _StubAdapter([(503, "unavailable", {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+        hf_api.create_playbook(namespace="ns", playbook_name="new")
+    assert len(adapter.sent) == 1
+    adapter = _StubAdapter([(429, "slow down", {}), (200, {"id": "playbook-1"}, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    assert hf_api.create_playbook(namespace="ns", playbook_name="new") == {"id": "playbook-1"}
+    assert len(adapter.sent) == 2
+
+    # predict only reads so it is retried, unless retries are switched off for the call
+    adapter = _StubAdapter([(503, "unavailable", {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter,
+                                   retry_policy=humanfirst.transport.RetryPolicy(max_retries=2))
+    with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+        hf_api.predict(sentence="hello", namespace="ns", playbook="playbook-1")
+    assert len(adapter.sent) == 3
+    assert hf_api.transport.counters.snapshot()["retries_exhausted"] == 1
+    with humanfirst.transport.retry_policy(max_retries=0):
+        with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+            hf_api.predict(sentence="hello", namespace="ns", playbook="playbook-1")
+    assert len(adapter.sent) == 4
+
+    # a multipart upload sends its whole body again when retried after a 429
+    bodies = []
+
+    def read_body(request):
+        body = request.body.read() if hasattr(request.body, "read") else request.body
+        bodies.append(body)
+        return "slow down" if len(bodies) == 1 else {"ok": True}
+
+    adapter = _StubAdapter([(429, read_body, {}), (200, read_body, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter)
+    upload = os.path.join(here, '..', 'examples', 'write_csv_example.json')
+    assert hf_api.upload_json_file_to_conversation_source(namespace="ns", conversation_source_id="src-1",
+                                                          upload_name="upload", fqfp=upload) == {"ok": True}
+    assert len(bodies) == 2 and bodies[0] and bodies[1] == bodies[0]
+    assert int(adapter.sent[1].headers["Content-Length"]) == len(bodies[1])
+
+    # a streamed response holds its concurrency slot until the body has been read and the response closed
+    rate_limiter = humanfirst.ratelimit.RateLimiter()
+    transport = humanfirst.transport.HFTransport(adapter=_StubAdapter([(200, "body", {})]), rate_limiter=rate_limiter)
+    concurrency = rate_limiter.for_url("https://example.com/export").concurrency
+    with transport.request("GET", "https://example.com/export", stream=True) as response:
+        assert concurrency.in_flight == 1
+        assert response.content == b"body"
+    assert concurrency.in_flight == 0
+    response.close()
+    assert concurrency.in_flight == 0
+
+    # any other stream can only be sent once so is not retried
+    adapter = _StubAdapter([(429, "slow down", {}), (200, {}, {})])
+    transport = humanfirst.transport.HFTransport(adapter=adapter)
+    assert transport.request("PUT", "https://example.com/upload", data=io.BytesIO(b"body")).status_code == 429
+    assert len(adapter.sent) == 1
+
+    # waits grow exponentially up to the cap and Retry-After also accepts an HTTP date
+    policy = humanfirst.transport.RetryPolicy(backoff=1, max_backoff=4)
+    assert max(policy.wait(10) for _ in range(100)) <= 4
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < humanfirst.transport.parse_retry_after(email.utils.format_datetime(retry_at)) <= 30
+
+    # AsyncHFAPI follows the same policy
+    statuses = [503, 200, 503, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}, json={"id": request.url.path})
+
+    async def run():
+        async with humanfirst.async_apis.AsyncHFAPI(api_key="offline-key",
+                                                    transport=httpx.MockTransport(handler)) as async_api:
+            await async_api.predict(sentence="hello", namespace="ns", playbook="playbook-1")
+            with pytest.raises(humanfirst.apis.HFAPIResponseValidationException):
+                await async_api.create_playbook(namespace="ns", playbook_name="new")
+            return async_api.counters.snapshot()
+
+    assert asyncio.run(run()) == {"requests": 3, "retries": 1, "retries_503": 1}
+    assert statuses == [200]
+
+def test_rate_limiter():
+    """Test the token bucket and AIMD concurrency limit shared by threads and asyncio tasks"""
+    base = "https://api.humanfirst.ai/v1alpha1"
+    assert humanfirst.ratelimit.endpoint_family(f"{base}/nlu/predict/ns/playbook-1") == "nlu"
+    assert humanfirst.ratelimit.endpoint_family(f"{base}/workspaces/ns/playbook-1/nlu:train") == "nlu"
+    assert humanfirst.ratelimit.endpoint_family(f"{base}/conversations/ns/playbook-1/query") == "conversations"
+    assert humanfirst.ratelimit.endpoint_family(f"{base}/files/ns/src-1/export") == "files"
+    assert humanfirst.ratelimit.endpoint_family(f"{base}/workspaces/ns/playbook-1/intents") == "workspaces"
+    assert humanfirst.ratelimit.endpoint_family(f"{base}/subscriptions/plan") == "default"
+
+    bucket = humanfirst.ratelimit.TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+    # grows by one per round of requests while in use and backs off once per round when throttled
+    limiter = humanfirst.ratelimit.AIMDLimiter(initial=2, minimum=1, maximum=4)
+    tickets = [limiter.acquire(), limiter.acquire()]
+    limiter.release(tickets[0])
+    assert limiter.limit == 2.5
+    limiter.release(tickets[1])
+    tickets = [limiter.acquire(), limiter.acquire()]
+    limiter.release(tickets[0], throttled=True)
+    limiter.release(tickets[1], throttled=True)
+    assert limiter.limit == 1.25
+
+    # a waiter cancelled after a slot was handed to it gives the slot back exactly once
+    async def cancel_waiter(resolve_first):
+        limiter = humanfirst.ratelimit.AIMDLimiter(initial=1, minimum=1, maximum=1)
+        ticket = await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        limiter.release(ticket)
+        if resolve_first:
+            await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+        return limiter.in_flight
+
+    assert asyncio.run(cancel_waiter(resolve_first=False)) == 0
+    assert asyncio.run(cancel_waiter(resolve_first=True)) == 0
+
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def slow_prediction(request): # pylint: disable=unused-argument
+        with lock:
+            in_flight["now"] = in_flight["now"] + 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] = in_flight["now"] - 1
+        return {"matches": []}
+
+    rate_limiter = humanfirst.ratelimit.RateLimiter({"nlu": {"initial_concurrency": 2, "max_concurrency": 2}})
+    adapter = _StubAdapter([(200, slow_prediction, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter, pool_maxsize=8, rate_limiter=rate_limiter)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: hf_api.predict(sentence=f"utterance {i}", namespace="ns", playbook="playbook-1"),
+                          range(8)))
+    assert in_flight["max"] == 2
+
+    # the same limiter paces an async client
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request): # pylint: disable=unused-argument
+        in_flight["now"] = in_flight["now"] + 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] = in_flight["now"] - 1
+        return httpx.Response(200, json={"matches": []})
+
+    async def run():
+        async with humanfirst.async_apis.AsyncHFAPI(api_key="offline-key", rate_limiter=rate_limiter,
+                                                    transport=httpx.MockTransport(handler)) as async_api:
+            await asyncio.gather(*[async_api.predict(sentence=f"utterance {i}", namespace="ns",
+                                                     playbook="playbook-1") for i in range(8)])
+
+    asyncio.run(run())
+    assert in_flight["max"] == 2
+    assert rate_limiter.limiters["nlu"].concurrency.in_flight == 0
+
+def test_metrics_hooks():
+    """Test hooks see every request attempt and token refresh and the collector summarises them per endpoint"""
+    collector = humanfirst.metrics.MetricsCollector()
+    seen = []
+
+    class RecordingHooks(humanfirst.metrics.HFHooks):
+        """Records the hook calls"""
+
+        def on_request(self, event):
+            seen.append(("request", event.endpoint, event.attempt))
+
+        def on_response(self, event):
+            seen.append(("response", event.endpoint, event.status_code))
+
+        def on_error(self, event):
+            raise RuntimeError("a failing hook never fails the request")
+
+    adapter = _StubAdapter([(503, "unavailable", {"Retry-After": "0"}), (200, {"intents": [{"id": "intent-0"}]}, {})])
+    hf_api = humanfirst.apis.HFAPI(api_key="offline-key", adapter=adapter, hooks=[collector, RecordingHooks()])
+    for playbook in ["playbook-1", "playbook-2", "playbook-3"]:
+        hf_api.get_intents(namespace="ns", playbook=playbook)
+    hf_api.predict(sentence="hello", namespace="ns", playbook="playbook-1")
+
+    intents_endpoint = "GET /v1alpha1/workspaces/{id}/{id}/intents"
+    assert seen[:3] == [("request", intents_endpoint, 0), ("response", intents_endpoint, 503),
+                        ("request", intents_endpoint, 1)]
+    summary = collector.summary()
+    assert set(summary["endpoints"]) == {intents_endpoint, "POST /v1alpha1/nlu/predict/{id}/{id}"}
+    intents = summary["endpoints"][intents_endpoint]
+    assert intents["count"] == 4 and intents["retries"] == 1 and intents["errors"] == 1
+    assert intents["statuses"] == {"503": 1, "200": 3}
+    assert intents["bytes_received"] == len("unavailable") + 3 * len(json.dumps({"intents": [{"id": "intent-0"}]}))
+    assert 0 < intents["p50"] <= intents["p99"] <= intents["max"]
+
+    prometheus = collector.to_prometheus()
+    label = 'endpoint="GET /v1alpha1/workspaces/{id}/{id}/intents"'
+    assert f'humanfirst_request_duration_seconds_count{{{label}}} 4' in prometheus
+    assert f'humanfirst_requests_total{{{label},status="503"}} 1' in prometheus
+    assert f'humanfirst_request_duration_seconds_bucket{{{label},le="+Inf"}} 4' in prometheus
+
+    server = humanfirst.metrics.start_prometheus_server(collector, port=0, addr="127.0.0.1")
+    try:
+        scraped = requests.get(f"http://127.0.0.1:{server.server_address[1]}/metrics", timeout=5)
+        assert scraped.status_code == 200
+        assert f'humanfirst_requests_total{{{label},status="200"}} 3' in scraped.text
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # firebase sign in and refresh are timed too
+    stub = _FirebaseStub(api_key=humanfirst.authorization.PROD_SIGN_IN_API_KEY)
+    auth = humanfirst.authorization.Authorization(username="user", password="password", environment="prod",
+                                                  session=stub.session,
+                                                  jwks_cache=humanfirst.authorization.JWKSCache(),
+                                                  hooks=[collector])
+    auth.refresh()
+    token_refreshes = collector.summary()["token_refreshes"]
+    assert token_refreshes["sign_in"]["count"] == 1 and token_refreshes["refresh"]["count"] == 1
+    assert token_refreshes["refresh"]["failures"] == 0
+    assert 'humanfirst_token_refreshes_total{kind="refresh",result="success"} 1' in collector.to_prometheus()
+
+def test_benchmark_suite():
+    """Test the offline benchmarks run every scenario and mode against the mock server"""
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "bench_hfapi.py")
+    result = subprocess.run([sys.executable, script, "--requests", "3", "--concurrency", "2",
+                             "--error-rate", "0.2", "--json", "-"],
+                            capture_output=True, text=True, check=True, timeout=300)
+    document = json.loads(result.stdout)
+    rows = {(row["scenario"], row["mode"]): row for row in document["results"]}
+    assert len(rows) == 24
+    assert all(row["requests"] == 3 and row["throughput_rps"] > 0 for row in rows.values())
+    assert all(row["p50_ms"] <= row["p99_ms"] <= row["max_ms"] for row in rows.values())
+    assert sum(row["retries"] for row in rows.values()) > 0
+
+def test_objects_benchmark():
+    """Test the objects.py micro-benchmarks record time and peak memory of every operation"""
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "bench_objects.py")
+    result = subprocess.run([sys.executable, script, "--sizes", "50,80", "--intents", "20", "--memory-max-size", "50",
+                             "--json", "-"],
+                            capture_output=True, text=True, check=True, timeout=300)
+    document = json.loads(result.stdout)
+    assert document["settings"]["sizes"] == [50, 80]
+    rows = {(row["operation"], row["examples"]): row for row in document["results"]}
+    # the two Parquet operations are skipped without pyarrow
+    assert len(rows) == (11 if importlib.util.find_spec("pyarrow") else 9) * 2
+    assert all(rows[(operation, 50)]["peak_mb"] > 0 for operation in ("build", "build_bulk", "get_hf_json",
+                                                                       "from_json"))
+    assert all(rows[(operation, 80)]["peak_mb"] is None for operation in ("build", "get_hf_json", "from_json"))
+    assert all(row["seconds"] >= 0 for row in rows.values())
+
+def test_async_hfapi():
+    """Test AsyncHFAPI mirrors HFAPI over a pooled client and respects max_concurrency"""
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request):
+        in_flight["now"] = in_flight["now"] + 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] = in_flight["now"] - 1
+        payload = json.loads(request.content)
+        assert request.headers["Authorization"] == "Bearer offline-key"
+        return httpx.Response(200, json={"matches": [{"name": payload["input_utterance"]}]})
+
+    async def run():
+        async with humanfirst.async_apis.AsyncHFAPI(api_key="offline-key",
+                                                    max_concurrency=2,
+                                                    transport=httpx.MockTransport(handler)) as hf_api:
+            return await asyncio.gather(*[hf_api.predict(sentence=f"utterance {i}",
+                                                         namespace="ns",
+                                                         playbook="playbook-1") for i in range(6)])
+
+    results = asyncio.run(run())
+    assert [result["matches"][0]["name"] for result in results] == [f"utterance {i}" for i in range(6)]
+    assert in_flight["max"] == 2
 
 # This test is for a legacy piece of functionality and very slow so commenting for speed.
 # TODO: decommission this function